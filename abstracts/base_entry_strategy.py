@@ -64,6 +64,27 @@ class BaseEntryStrategy(ABC):
         """
         pass
 
+    def is_near_signal(
+        self,
+        klines_df: pd.DataFrame,
+        position_handler: PositionHandler
+    ) -> bool:
+        """
+        Report that an entry signal is likely soon, so the bot can pre-stage
+        the entry order (quantity, connection) off the hot path.
+        
+        Default is False (no pre-staging); strategies override it with a
+        cheap check of how close their conditions are.
+        
+        Args:
+            klines_df: DataFrame containing klines data
+            position_handler: Handler for position state management
+        
+        Returns:
+            True if an entry signal may fire within the next ticks
+        """
+        return False
+
     @abstractmethod
     def calculate_tp_sl(
         self,
@@ -2,12 +2,13 @@
 Base class for exit strategy implementations.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 import pandas as pd
 
 from commons.custom_logger import CustomLogger
 from models.position_signal import PositionSignal
 from models.position import Position
+from models.price_trigger import PriceTrigger
 
 
 class BaseExitStrategy(ABC):
@@ -62,6 +63,23 @@ class BaseExitStrategy(ABC):
         """
         return 0.0
 
+    def get_price_triggers(self, position_handler) -> List[PriceTrigger]:
+        """
+        Get price levels of the open position to watch between bot ticks.
+        
+        Override this method in exit strategies with price thresholds (targets,
+        stops, trailing levels). The bot arms them in the process-wide
+        `PriceTriggerEngine` and closes as soon as one is crossed instead of on
+        its next tick. Levels are re-armed every tick, so they may move.
+        
+        Args:
+            position_handler: Position handler with current position state
+        
+        Returns:
+            Price triggers to arm, or empty list for none
+        """
+        return []
+
     @abstractmethod
     def should_close(
         self,
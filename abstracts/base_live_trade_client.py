@@ -1,9 +1,25 @@
-from typing import Optional
+from typing import List, Optional
 from abstracts.base_trade_client import BaseTradeClient
 from commons.custom_logger import CustomLogger
+from models.order_leg import OrderLeg
 
 class BaseLiveTradeClient(BaseTradeClient):
     def __init__(self, logger: Optional[CustomLogger] = None) -> None:
         super().__init__(logger=logger)
 
+    def place_batch_orders(self, symbol: str, legs: List[OrderLeg]) -> List[OrderLeg]:
+        """
+        Place several orders as one all-or-nothing unit, every leg sent
+        concurrently, so the batch takes about as long as its slowest leg.
+        
+        Raises:
+            RuntimeError: If any leg fails; placed legs are cancelled first
+        """
+        self._place_legs_concurrently(
+            symbol=symbol,
+            units=[(lambda leg=leg: self._place_leg(symbol=symbol, leg=leg), [leg]) for leg in legs]
+        )
+        self._raise_if_batch_failed(symbol=symbol, legs=legs)
+        return legs
+
 # EOF
@@ -3,12 +3,18 @@ Base class for trade client implementations.
 """
 from abc import ABC, abstractmethod
 from time import sleep
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
+import asyncio
 import pandas as pd
 import random
+import threading
+import time
 
 from commons.custom_logger import CustomLogger
-from commons.constants import JITTER_SECONDS
+from commons.constants import JITTER_SECONDS, ASYNC_WAKE_POLL_SECONDS, ORDER_BATCH_DEADLINE_SECONDS
+from commons.io_executor import IOExecutor
+from models.order_leg import OrderLeg
+from models.symbol_filters import SymbolFilters
 
 
 class BaseTradeClient(ABC):
@@ -36,6 +42,7 @@ class BaseTradeClient(ABC):
             self.logger = logger
         else:
             self.logger = CustomLogger(name=self.__class__.__name__)
+        self._wake_event = threading.Event()
         self.logger.debug(message=f'Initializing {self.__class__.__name__}')
 
     @abstractmethod
@@ -66,12 +73,13 @@ class BaseTradeClient(ABC):
         pass
 
     @abstractmethod
-    def fetch_price(self, symbol: str) -> float:
+    def fetch_price(self, symbol: str, use_cache: bool = True) -> float:
         """
         Fetch current market price for a symbol.
         
         Args:
             symbol: Trading pair symbol
+            use_cache: Whether a recently cached price may be returned
         
         Returns:
             Current market price
@@ -121,7 +129,8 @@ class BaseTradeClient(ABC):
         quantity: float,
         price: float = 0,
         reduce_only: bool = False,
-        time_in_force: str = "GTC"
+        time_in_force: str = "GTC",
+        client_order_id: str = ''
     ) -> Dict[str, Any]:
         """
         Place a new order.
@@ -134,6 +143,8 @@ class BaseTradeClient(ABC):
             price: Limit price (required for LIMIT orders)
             reduce_only: If True, order will only reduce position
             time_in_force: Time in force (default 'GTC')
+            client_order_id: Deterministic client order id (optional); a retry
+                with the same id returns the existing order instead of a new one
         
         Returns:
             Dictionary containing order response
@@ -154,6 +165,30 @@ class BaseTradeClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def modify_order(
+        self,
+        symbol: str,
+        order_id: str,
+        order_side: str,
+        quantity: float,
+        price: float
+    ) -> Dict[str, Any]:
+        """
+        Amend the price of a resting LIMIT order in place, keeping its order ID.
+        
+        Args:
+            symbol: Trading pair symbol
+            order_id: Order ID to amend
+            order_side: 'BUY' or 'SELL' (must match the order)
+            quantity: Total order quantity (not the remaining quantity)
+            price: New limit price
+        
+        Returns:
+            Dictionary containing the amended order, or empty dict if rejected
+        """
+        pass
+
     @abstractmethod
     def fetch_algorithmic_order(self, order_id: str) -> Dict[str, Any]:
         """
@@ -176,6 +211,7 @@ class BaseTradeClient(ABC):
         quantity: float,
         trigger_price: float,
         close_position: bool = False,
+        client_order_id: str = ''
     ) -> Dict[str, Any]:
         """
         Place an algorithmic order (TP/SL).
@@ -186,6 +222,7 @@ class BaseTradeClient(ABC):
             order_type: 'STOP_MARKET' or 'TAKE_PROFIT_MARKET'
             quantity: Order quantity
             trigger_price: Price at which order triggers
+            client_order_id: Deterministic client order id (optional)
         
         Returns:
             Dictionary containing order response
@@ -294,6 +331,319 @@ class BaseTradeClient(ABC):
         """
         pass
 
+    def get_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        """
+        Get the integer-scaled filters of a symbol built by `fetch_exchange_info`.
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Cached SymbolFilters or None if exchange info is not cached
+        """
+        return None
+
+    def place_batch_orders(self, symbol: str, legs: List[OrderLeg]) -> List[OrderLeg]:
+        """
+        Place several orders as one all-or-nothing unit.
+        
+        Default implementation places the legs one by one in order (backtest
+        fills depend on it). Live clients send the legs concurrently instead
+        (`_place_legs_concurrently`). Each leg's `result` / `error` /
+        `elapsed` is filled in either way.
+        
+        Args:
+            symbol: Trading pair symbol
+            legs: Orders to place
+        
+        Returns:
+            The legs, all placed
+        
+        Raises:
+            RuntimeError: If any leg fails; legs already placed are cancelled first
+        """
+        for leg in legs:
+            self._place_leg(symbol=symbol, leg=leg)
+            if not leg.placed:
+                break
+        self._raise_if_batch_failed(symbol=symbol, legs=legs)
+        return legs
+
+    def _place_legs_concurrently(
+        self,
+        symbol: str,
+        units: List[Tuple[Callable[[], None], List[OrderLeg]]],
+        deadline: float = ORDER_BATCH_DEADLINE_SECONDS
+    ) -> None:
+        """
+        Send independent units of legs at once through the shared I/O executor.
+        
+        A batch then takes about as long as its slowest unit. A unit still
+        running at `deadline` marks its legs failed. Any of its legs that are
+        placed afterwards are cancelled as soon as the response arrives.
+        
+        Args:
+            symbol: Trading pair symbol
+            units: (callable placing its legs, legs it fills in)
+            deadline: Seconds to wait for the slowest unit
+        """
+        futures = IOExecutor.get_instance().run_all([function for function, _ in units], timeout=deadline)
+        for future, (_, unit_legs) in zip(futures, units):
+            if future.done():
+                continue
+            for leg in unit_legs:
+                leg.error = f'no response within {deadline}s'
+            self.logger.warning(message=f"Order legs {[leg.name for leg in unit_legs]} not answered within {deadline}s, cancelling them on arrival")
+            future.add_done_callback(lambda _, unit_legs=unit_legs: self._cancel_late_legs(symbol=symbol, legs=unit_legs))
+
+    def _cancel_late_legs(self, symbol: str, legs: List[OrderLeg]) -> None:
+        """Compensating cancel of legs placed after their batch gave up on them."""
+        for leg in legs:
+            if leg.placed:
+                self._cancel_leg(symbol=symbol, leg=leg)
+
+    def _cancel_leg(self, symbol: str, leg: OrderLeg) -> None:
+        try:
+            if leg.is_algo:
+                self.cancel_algorithmic_order(order_id=leg.order_id)
+            else:
+                self.cancel_order(symbol=symbol, order_id=leg.order_id)
+            self.logger.warning(message=f"Rolled back {leg.name} order {leg.order_id}")
+        except Exception as e:
+            self.logger.error_e(message=f"Failed to roll back {leg.name} order {leg.order_id}", e=e)
+
+    def _place_leg(self, symbol: str, leg: OrderLeg) -> None:
+        """Place one leg through `place_order` / `place_algorithmic_order`, recording its result or error."""
+        started = time.perf_counter()
+        try:
+            if leg.is_algo:
+                result = self.place_algorithmic_order(
+                    symbol=symbol,
+                    order_side=leg.order_side,
+                    order_type=leg.order_type,
+                    quantity=leg.quantity,
+                    trigger_price=leg.trigger_price,
+                    close_position=leg.close_position,
+                    client_order_id=leg.client_order_id
+                )
+            else:
+                result = self.place_order(
+                    symbol=symbol,
+                    order_side=leg.order_side,
+                    order_type=leg.order_type,
+                    quantity=leg.quantity,
+                    price=leg.price,
+                    reduce_only=leg.reduce_only,
+                    time_in_force=leg.time_in_force,
+                    client_order_id=leg.client_order_id
+                )
+            leg.result = result or {}
+            if not leg.placed:
+                leg.error = 'rejected'
+        except Exception as e:
+            leg.error = str(e)
+        leg.elapsed = time.perf_counter() - started
+
+    def _raise_if_batch_failed(self, symbol: str, legs: List[OrderLeg]) -> None:
+        """Cancel the placed legs of a batch and raise if any leg failed."""
+        failed = [leg for leg in legs if leg.failed]
+        if not failed:
+            return
+
+        for leg in legs:
+            if not leg.failed:
+                self._cancel_leg(symbol=symbol, leg=leg)
+
+        reasons = ', '.join(f"{leg.name}: {leg.error or 'not placed'}" for leg in failed)
+        raise RuntimeError(f"Batch order placement failed ({reasons})")
+
+    def is_order_open(self, order_id: str, algo: bool = False) -> Optional[bool]:
+        """
+        Check whether an order still rests on the book, from account-wide
+        state shared across bots instead of a per-order request.
+        
+        Default is None (not tracked): callers fetch the order itself.
+        
+        Args:
+            order_id: orderId, or algoId of an algo order
+            algo: Whether the order is an algo (conditional) order
+        
+        Returns:
+            True if open, False if it left the book (fetch it to learn how), None if unknown
+        """
+        return None
+
+    def warm_connection(self) -> None:
+        """
+        Keep the connection to the exchange warm so the next order skips
+        connection setup. Default: nothing to warm (backtest, offline).
+        """
+        pass
+
+    def fetch_order_by_client_id(self, symbol: str, client_order_id: str, algo: bool = False) -> Dict[str, Any]:
+        """
+        Fetch an order by the client order id it was placed with.
+        
+        Used to reconcile an order whose placement outcome is unknown (e.g. a
+        workflow resumed after a restart) without placing it again. Default
+        is {} (client ids not tracked).
+        
+        Args:
+            symbol: Trading pair symbol
+            client_order_id: newClientOrderId, or clientAlgoId if `algo`
+            algo: Whether the order is an algo (conditional) order
+        
+        Returns:
+            Order details, or empty dict if no such order exists
+        """
+        return {}
+
+    def get_last_error_code(self) -> Optional[int]:
+        """
+        Get the exchange error code of the calling thread's last failed request.
+        
+        Lets callers tell rejections apart (e.g. a post-only order that would
+        take) when an order method only reports failure by its return value.
+        Default is None (not tracked).
+        
+        Returns:
+            Exchange error code, or None if the last request succeeded or codes are not tracked
+        """
+        return None
+
+    def last_order_outcome_unknown(self) -> bool:
+        """
+        Whether the calling thread's last order placement failed without a verdict.
+        
+        An order placement that returns empty after timeouts or 5xx responses
+        may still land on the book. Callers should then look it up by its
+        client order id before placing again with a new id.
+        Default is False (placements always get a definite answer).
+        
+        Returns:
+            True if the last placement's outcome is unknown
+        """
+        return False
+
+    def watch_symbol(self, symbol: str) -> None:
+        """
+        Register interest in account events (fills, cancels, liquidations) for a symbol.
+        
+        Clients backed by an event stream override this to call `wake()` when
+        something changes. Default is a no-op (polling only).
+        
+        Args:
+            symbol: Trading pair symbol
+        """
+        pass
+
+    def watch_price(self, symbol: str, listener: Callable[[str, float], None]) -> None:
+        """
+        Deliver price updates of a symbol to `listener` as they arrive.
+        
+        Clients with a price feed override this to call `listener(symbol, price)`
+        on every update. Default is a no-op (prices only on `fetch_price`).
+        
+        Args:
+            symbol: Trading pair symbol
+            listener: Callable receiving (symbol, price)
+        """
+        pass
+
+    def wait_for_order_update(self, symbol: str, order_id: str, timeout: float) -> Dict[str, Any]:
+        """
+        Wait up to `timeout` seconds for an order to change state, then return its details.
+        
+        Default implementation sleeps for the full timeout and polls `fetch_order`.
+        Event-driven clients return as soon as an update arrives.
+        
+        Args:
+            symbol: Trading pair symbol
+            order_id: Order ID to watch
+            timeout: Maximum seconds to wait (0 = fetch immediately)
+        
+        Returns:
+            Dictionary containing order details
+        """
+        if timeout > 0:
+            sleep(timeout)
+        return self.fetch_order(symbol=symbol, order_id=order_id)
+
+    def has_live_order_book(self, symbol: str) -> bool:
+        """
+        Check whether `fetch_order_book` is served from a locally maintained book.
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            True if `wait_for_book_change` can report top-of-book changes
+        """
+        return False
+
+    def wait_for_book_change(self, symbol: str, timeout: float) -> bool:
+        """
+        Wait up to `timeout` seconds for the best bid or ask to change.
+        
+        Default implementation sleeps for the full timeout.
+        Clients with a live order book return as soon as the top of book moves.
+        
+        Args:
+            symbol: Trading pair symbol
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if the top of book changed, False on timeout
+        """
+        if timeout > 0:
+            sleep(timeout)
+        return False
+
+    def wake(self) -> None:
+        """
+        Interrupt the current `wait()` so the bot runs its next iteration immediately.
+        """
+        self._wake_event.set()
+
+    # ========== Async interface ==========
+    # Defaults run the blocking methods in the event loop's executor so every
+    # client works in async run mode; clients with native async I/O override them.
+
+    async def fetch_klines_async(
+        self,
+        symbol: str,
+        timeframe: str,
+        timeframe_limit: int = 100
+    ) -> pd.DataFrame:
+        """Async variant of `fetch_klines`."""
+        return await asyncio.to_thread(self.fetch_klines, symbol, timeframe, timeframe_limit)
+
+    async def fetch_position_async(self, symbol: str) -> Dict[str, Any]:
+        """Async variant of `fetch_position`."""
+        return await asyncio.to_thread(self.fetch_position, symbol)
+
+    async def fetch_price_async(self, symbol: str, use_cache: bool = True) -> float:
+        """Async variant of `fetch_price`."""
+        return await asyncio.to_thread(self.fetch_price, symbol, use_cache)
+
+    async def wait_async(self) -> None:
+        """
+        Async variant of `wait`: sleeps without holding a thread and returns
+        early (within ASYNC_WAKE_POLL_SECONDS) if `wake()` is called.
+        """
+        _min_wait_time = max(0, self.wait_time - JITTER_SECONDS)
+        _deadline = time.monotonic() + random.randint(a=_min_wait_time, b=self.wait_time)
+        while not self._wake_event.is_set():
+            _remaining = _deadline - time.monotonic()
+            if _remaining <= 0:
+                break
+            await asyncio.sleep(min(_remaining, ASYNC_WAKE_POLL_SECONDS))
+        self._wake_event.clear()
+
+    async def close_async(self) -> None:
+        """Release async resources (HTTP sessions). Default is a no-op."""
+        pass
+
     def set_wait_time(self, wait_time_sec: int) -> None:
         """
         Set wait time between bot iterations.
@@ -316,9 +666,11 @@ class BaseTradeClient(ABC):
         """
         Wait for a randomized duration before next iteration.
         Adds jitter to prevent synchronized API calls.
+        Returns early if `wake()` is called.
         """
         _min_wait_time = max(0, self.wait_time - JITTER_SECONDS)
         _wait_time = random.randint(a=_min_wait_time, b=self.wait_time)
-        sleep(_wait_time)
+        self._wake_event.wait(timeout=_wait_time)
+        self._wake_event.clear()
 
 # EOF
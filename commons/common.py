@@ -3,7 +3,9 @@ Common utility functions for datetime operations and formatting.
 """
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any
-from commons.constants import DATETIME_FORMAT_GMT7
+import re
+import zlib
+from commons.constants import DATETIME_FORMAT_GMT7, CLIENT_ORDER_ID_MAX_LENGTH
 
 
 def get_datetime_now_gmt_plus_7() -> datetime:
@@ -147,6 +149,43 @@ def calculate_roi_metrics(
     return daily_roi * 100, annual_roi * 100
 
 
+def client_order_id_prefix(run_id: int, position: str, leg: str) -> str:
+    """
+    Build the client order id prefix shared by the attempts of one order leg.
+    
+    Args:
+        run_id: Bot run identifier
+        position: Position key, the open candle ('2025-01-01 07:00:00+07:00' -> '202501010700')
+        leg: Short leg name ('o1', 'c2', 'tp', 'tpb', 'sl', ...)
+    
+    Returns:
+        str: Prefix completed by `make_client_order_id`
+    """
+    position_key = re.sub(r'\D', '', str(position))[:12] or '0'
+    return re.sub(r'[^.A-Za-z0-9:/_-]', '', f"b{run_id}-{position_key}-{leg}")
+
+
+def make_client_order_id(prefix: str, attempt: int) -> str:
+    """
+    Get the deterministic client order id of one placement attempt.
+    
+    Resubmitting the same attempt reuses its id, so the order can be looked
+    up by client id instead of being placed twice. Ids longer than Binance
+    allows (36 characters) get a CRC32 digest of the prefix instead.
+    
+    Args:
+        prefix: Prefix from `client_order_id_prefix`
+        attempt: Placement attempt number of the leg
+    
+    Returns:
+        str: newClientOrderId / clientAlgoId
+    """
+    client_order_id = f"{prefix}-{attempt}"
+    if len(client_order_id) > CLIENT_ORDER_ID_MAX_LENGTH:
+        client_order_id = f"b{zlib.crc32(prefix.encode()):08x}-{attempt}"
+    return client_order_id
+
+
 if __name__ == "__main__":
     pass
 
@@ -161,6 +161,12 @@ class ConfigValidator:
                     f"Valid: {', '.join(valid_types)}"
                 )
         
+        # Validate execution_config
+        if 'execution_config' in config and not isinstance(config['execution_config'], dict):
+            errors.append(
+                f"execution_config must be an object, got {type(config['execution_config']).__name__}"
+            )
+        
         return errors
     
     @classmethod
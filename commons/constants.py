@@ -6,6 +6,7 @@ Constants and configuration values used across the trading bot application.
 POSITION_RECORDS_DIR = "position_records"
 POSITION_STATES_DIR = "position_states"
 LOGS_DIR = "logs"
+CACHE_DIR = "cache"
 
 # File name templates
 POSITION_RECORD_FILENAME_TEMPLATE = "runid_{run_id}_record_{dt}.json"
@@ -20,6 +21,19 @@ ORDER_STATUS_CHECK_INTERVAL = 1  # Interval to check order status
 LIMIT_ORDER_PRICE_CHECK_INTERVAL = 5  # Interval to check price changes for limit orders
 JITTER_SECONDS = 5  # Random jitter to prevent synchronized API calls
 
+# Async run mode
+ASYNC_WAKE_POLL_SECONDS = 0.5  # How often an idle async bot checks for wake-up events
+ASYNC_EXECUTOR_WORKERS = 32  # Threads for strategy computation and order placement
+IO_EXECUTOR_WORKERS = 16  # Threads of the shared I/O executor for concurrent order legs (override: IO_EXECUTOR_WORKERS)
+ORDER_BATCH_DEADLINE_SECONDS = 10  # Legs of an order batch not answered by then count as failed and are cancelled
+
+# Market data sharing (seconds)
+MARKET_DATA_HUB_REFRESH_SECONDS = 10  # Max age of shared klines before the hub refetches
+ACCOUNT_SNAPSHOT_TTL_SECONDS = 5  # Max age of the shared positionRisk snapshot (override: ACCOUNT_SNAPSHOT_TTL_SECONDS)
+OPEN_ORDERS_SNAPSHOT_TTL_SECONDS = 5  # Max age of the shared open (algo) orders snapshot (override: OPEN_ORDERS_SNAPSHOT_TTL_SECONDS)
+PRICE_CACHE_MAX_AGE_SECONDS = 2  # Max age of a cached REST price (override: PRICE_CACHE_MAX_AGE_SECONDS)
+EXCHANGE_INFO_CACHE_TTL_SECONDS = 24 * 60 * 60  # Max age of the on-disk exchangeInfo copy (override: EXCHANGE_INFO_CACHE_TTL_SECONDS)
+
 # Technical indicator defaults
 MACD_12 = 12
 MACD_26 = 26
@@ -32,6 +46,31 @@ ATR_14 = 14
 ORDER_STATUS_FILLED = "FILLED"
 ALGO_ORDER_STATUS_FINISHED = "FINISHED"
 
+# Entry pre-staging (seconds)
+ENTRY_PRESTAGE_REFRESH_SECONDS = 10  # Re-stage quantity and warm the connection at most this often while near a signal
+ENTRY_PRESTAGE_MAX_AGE_SECONDS = 30  # A staged entry older than this is recomputed when the signal fires
+
+# Order submission
+ORDER_SUBMIT_MAX_RETRIES = 2  # Immediate resubmissions of an order whose POST outcome is unknown (after a client id lookup)
+ORDER_LOOKUP_SKEW_MS = 1000  # Clock tolerance when matching an order found by client id to the submission
+CLIENT_ORDER_ID_MAX_LENGTH = 36  # Binance newClientOrderId / clientAlgoId limit
+
+# Post-only execution (defaults of BotConfig.execution_config)
+POST_ONLY_REJECTED_ERROR_CODE = -5022  # Binance: GTX order would immediately match
+POST_ONLY_MAX_RETRIES = 5  # Immediate re-quotes after consecutive post-only rejections
+POST_ONLY_TAKER_FALLBACK = False  # Send the remainder as MARKET once the retry budget is spent
+
+# Maker chase (defaults of BotConfig.execution_config)
+MAKER_CHASE_REPRICE_THRESHOLD_TICKS = 1  # Min maker price move (ticks) that triggers a reprice
+MAKER_CHASE_MAX_SECONDS = 0  # Give up (cancel) after this long; 0 = chase until filled
+MAKER_CHASE_MAX_SLIPPAGE_TICKS = 0  # Max chase distance from the first quote (ticks); 0 = no cap
+
+# Adaptive execution (defaults of BotConfig.execution_config)
+ADAPTIVE_LATENCY_BUDGET_SECONDS = 30  # A passive order must be expected to fill within this long; also caps its chase
+ADAPTIVE_MIN_FILL_PROBABILITY = 0.7  # Min estimated fill probability within the budget to rest a post-only order
+ADAPTIVE_WIDE_SPREAD_TICKS = 3  # Spread (ticks) from which a LIMIT inside the spread is preferred to crossing with MARKET
+ADAPTIVE_TRADE_FLOW_CANDLES = 5  # Closed candles the traded volume rate is estimated from
+
 # Time format
 DATETIME_FORMAT_GMT7 = "%Y-%m-%d %H:%M:%S"
 DATETIME_FORMAT_FILE = "%Y%m%d_%H%M%S"
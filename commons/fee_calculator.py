@@ -2,7 +2,9 @@
 Fee calculator for trading operations.
 Calculates fees based on order type and Binance fee structure.
 """
-from typing import Dict
+from typing import Dict, Optional
+
+from models.symbol_filters import SymbolFilters
 
 # Binance futures fee structure (as of 2024)
 BINANCE_FEES = {
@@ -10,21 +12,33 @@ BINANCE_FEES = {
     'TAKER': 0.0002,   # 0.04% - for market orders that take liquidity
 }
 
+# Execution modes that only ever add liquidity (post-only)
+MAKER_ONLY_ORDER_TYPES = ('MAKER_ONLY', 'POST_ONLY')
+
+
+def _position_value(price: float, quantity: float, symbol_filters: Optional[SymbolFilters]) -> float:
+    """Position value, computed on the symbol's integer grid when filters are given."""
+    if symbol_filters is None:
+        return price * quantity
+    return symbol_filters.notional(price=price, quantity=quantity)
+
 
 def calculate_open_fee(
     order_type: str,
     entry_price: float,
     quantity: float,
-    leverage: int = 1
+    leverage: int = 1,
+    symbol_filters: Optional[SymbolFilters] = None
 ) -> float:
     """
     Calculate fee for opening a position.
     
     Args:
-        order_type: Order type ('MAKER_ONLY', 'MARKET', 'LIMIT')
+        order_type: Order type ('MAKER_ONLY', 'POST_ONLY', 'MARKET', 'LIMIT')
         entry_price: Entry price of the position
         quantity: Position quantity
         leverage: Position leverage (default 1)
+        symbol_filters: Symbol filters for an exact position value (default: float product)
     
     Returns:
         Fee amount in quote currency
@@ -37,9 +51,9 @@ def calculate_open_fee(
         >>> calculate_open_fee('LIMIT', 100.0, 10, 10)
         0.2
     """
-    position_value = entry_price * quantity
+    position_value = _position_value(price=entry_price, quantity=quantity, symbol_filters=symbol_filters)
     
-    if order_type == 'MAKER_ONLY':
+    if order_type in MAKER_ONLY_ORDER_TYPES:
         return 0.0  # Emitted fee for maker-only orders
     elif order_type == 'MARKET':
         return position_value * BINANCE_FEES['TAKER']
@@ -51,16 +65,18 @@ def calculate_close_fee(
     order_type: str,
     close_price: float,
     quantity: float,
-    leverage: int = 1
+    leverage: int = 1,
+    symbol_filters: Optional[SymbolFilters] = None
 ) -> float:
     """
     Calculate fee for closing a position.
     
     Args:
-        order_type: Order type ('MAKER_ONLY', 'MARKET', 'LIMIT')
+        order_type: Order type ('MAKER_ONLY', 'POST_ONLY', 'MARKET', 'LIMIT')
         close_price: Close price of the position
         quantity: Position quantity
         leverage: Position leverage (default 1)
+        symbol_filters: Symbol filters for an exact position value (default: float product)
     
     Returns:
         Fee amount in quote currency
@@ -71,9 +87,9 @@ def calculate_close_fee(
         >>> calculate_close_fee('MARKET', 105.0, 10, 10)
         0.42
     """
-    position_value = close_price * quantity
+    position_value = _position_value(price=close_price, quantity=quantity, symbol_filters=symbol_filters)
     
-    if order_type == 'MAKER_ONLY':
+    if order_type in MAKER_ONLY_ORDER_TYPES:
         return 0.0  # Emitted fee for maker-only orders
     elif order_type == 'MARKET':
         return position_value * BINANCE_FEES['TAKER']
@@ -92,7 +108,7 @@ def calculate_total_fees(
     Calculate total fees for a complete trade (open + close).
     
     Args:
-        order_type: Order type ('MAKER_ONLY', 'MARKET', 'LIMIT')
+        order_type: Order type ('MAKER_ONLY', 'POST_ONLY', 'MARKET', 'LIMIT')
         entry_price: Entry price of the position
         close_price: Close price of the position
         quantity: Position quantity
@@ -136,7 +152,7 @@ def calculate_pnl_with_fees(
         close_price: Close price of the position
         quantity: Position quantity
         leverage: Position leverage
-        order_type: Order type ('MAKER_ONLY', 'MARKET', 'LIMIT')
+        order_type: Order type ('MAKER_ONLY', 'POST_ONLY', 'MARKET', 'LIMIT')
     
     Returns:
         Dictionary with 'gross_pnl', 'open_fee', 'close_fee', 'net_pnl'
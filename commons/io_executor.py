@@ -0,0 +1,59 @@
+"""
+I/O Executor
+Process-wide thread pool for blocking exchange calls sent side by side,
+such as the legs of a protective order batch.
+
+It is kept apart from the async bot worker pool. A bot thread waiting on
+its legs therefore never holds a slot that its own legs need.
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Sequence
+
+from commons.constants import IO_EXECUTOR_WORKERS
+
+
+class IOExecutor:
+    """Shared thread pool plus a run-all-with-deadline helper."""
+
+    _instance: Optional['IOExecutor'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = IO_EXECUTOR_WORKERS) -> None:
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Threads shared by every caller in the process
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='io')
+
+    @classmethod
+    def get_instance(cls) -> 'IOExecutor':
+        """Get the process-wide executor, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(max_workers=int(os.getenv('IO_EXECUTOR_WORKERS', IO_EXECUTOR_WORKERS)))
+            return cls._instance
+
+    def submit(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Run `function(*args, **kwargs)` on the pool."""
+        return self._executor.submit(function, *args, **kwargs)
+
+    def run_all(self, functions: Sequence[Callable[[], Any]], timeout: float) -> List[Future]:
+        """
+        Start every function at once and wait until all finish or `timeout` passes.
+
+        Args:
+            functions: Callables without arguments
+            timeout: Seconds to wait for the slowest one
+
+        Returns:
+            Futures in the order of `functions`; those not `done()` are still running
+        """
+        futures = [self._executor.submit(function) for function in functions]
+        wait(futures, timeout=timeout)
+        return futures
+
+# EOF
@@ -0,0 +1,59 @@
+"""
+Latency Stats
+Rolling latency samples with percentile summaries (e.g. signal-to-ack per bot).
+"""
+from collections import deque
+from typing import Any, Deque, Dict
+
+# Samples kept per tracker
+LATENCY_STATS_WINDOW = 100
+
+
+class LatencyStats:
+    """Keeps the last `window` latency samples of one measurement."""
+
+    def __init__(self, window: int = LATENCY_STATS_WINDOW) -> None:
+        """
+        Initialize latency stats.
+
+        Args:
+            window: Number of most recent samples summarized
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0  # samples recorded since start (not only the window)
+
+    def add(self, seconds: float) -> None:
+        """Record one latency sample in seconds."""
+        self._samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the window in seconds (0 without samples)."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Any]:
+        """Window summary in milliseconds."""
+        if not self._samples:
+            return {'count': self.count}
+        return {
+            'count': self.count,
+            'last_ms': self._samples[-1] * 1000,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'max_ms': max(self._samples) * 1000
+        }
+
+    def __str__(self) -> str:
+        summary = self.summary()
+        if 'last_ms' not in summary:
+            return 'no samples'
+        return (
+            f"{summary['last_ms']:.1f}ms (p50 {summary['p50_ms']:.1f}ms, p95 {summary['p95_ms']:.1f}ms, "
+            f"max {summary['max_ms']:.1f}ms, n={summary['count']})"
+        )
+
+# EOF
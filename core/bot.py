@@ -1,4 +1,5 @@
-from time import sleep
+import asyncio
+from time import monotonic, sleep
 from typing import Optional, Dict, Any, Tuple
 
 from abstracts.base_trade_client import BaseTradeClient
@@ -6,10 +7,15 @@ from commons.custom_logger import CustomLogger
 from core.position_handler import PositionHandler
 from core.trade_handler import TradeHandler
 from core.backtest_metrics import BacktestMetrics
+from core.market_data_hub import MarketDataHub
+from core.order_workflow import WORKFLOW_OPEN
+from core.price_trigger_engine import PriceTriggerEngine
 from models.bot_config import BotConfig
 from models.enum.position_side import PositionSide
 from models.enum.run_mode import RunMode
 from models.enum.trade_client import TradeClient
+from models.position_signal import PositionSignal
+from models.price_trigger import PriceTrigger
 from trade_clients.get_trade_client import get_trade_client
 import strategies.get_strategy as get_strategy
 
@@ -19,7 +25,12 @@ class Bot:
     Main trading bot class that manages position lifecycle and strategy execution.
     """
 
-    def __init__(self, bot_config: BotConfig):
+    def __init__(
+        self,
+        bot_config: BotConfig,
+        market_data_hub: Optional[MarketDataHub] = None,
+        async_mode: bool = False
+    ):
         # Extract bot_id from bot_name (e.g., 'bot_32' -> '32')
         bot_id = bot_config.bot_name.replace('bot_', '').replace(' ', '_')
         
@@ -31,6 +42,15 @@ class Bot:
 
         self.bot_config: BotConfig = bot_config
 
+        # Shared kline feed (live mode only); None means fetch through own client
+        self.market_data_hub: Optional[MarketDataHub] = market_data_hub
+        if self.market_data_hub:
+            self.market_data_hub.subscribe(
+                symbol=bot_config.symbol,
+                timeframe=bot_config.timeframe,
+                limit=bot_config.timeframe_limit
+            )
+
         self.logger.debug(message=f'Initializing position handler')
         self.position_handler: PositionHandler = PositionHandler(
             bot_config=bot_config,
@@ -39,9 +59,13 @@ class Bot:
 
         self.trade_client = self._init_trade_client(
             run_mode=bot_config.run_mode,
-            trade_client=bot_config.trade_client
+            trade_client=bot_config.trade_client,
+            async_mode=async_mode
         )
         self._set_leverage()
+
+        # Let event-driven clients wake the bot on fills, TP/SL hits and liquidations
+        self.trade_client.watch_symbol(symbol=bot_config.symbol)
         
         # Pre-fetch and cache exchange info for the symbol
         self.logger.debug(message=f'Fetching exchange info for {bot_config.symbol}')
@@ -68,6 +92,16 @@ class Bot:
         self.logger.info(
                 message=f'Exit Strategy: {self.exit_strategy.__class__.__name__}')
         
+        # Client-side exit levels fired from streamed prices (live mode only)
+        self.price_trigger_engine: Optional[PriceTriggerEngine] = None
+        self._fired_trigger: Optional[Tuple[PriceTrigger, float, float]] = None
+        if self.bot_config.run_mode != RunMode.BACKTEST:
+            self.price_trigger_engine = PriceTriggerEngine.get_instance()
+            self.trade_client.watch_price(
+                symbol=bot_config.symbol,
+                listener=self.price_trigger_engine.on_price
+            )
+        
         # Initialize backtest metrics and preload data for backtest mode
         self.backtest_metrics: Optional[BacktestMetrics] = None
         if self.bot_config.run_mode == RunMode.BACKTEST:
@@ -111,13 +145,19 @@ class Bot:
         
         self.logger.debug(f"Backtest will start from candle {candle_for_indicator} (index {candle_for_indicator - 1})")
 
-    def _init_trade_client(self, run_mode: RunMode, trade_client: TradeClient) -> BaseTradeClient:
+    def _init_trade_client(
+        self,
+        run_mode: RunMode,
+        trade_client: TradeClient,
+        async_mode: bool = False
+    ) -> BaseTradeClient:
         """
         Initialize trade client with proper error handling.
         
         Args:
             run_mode: Trading mode (LIVE, BACKTEST)
             trade_client: Client type (BINANCE, OFFLINE)
+            async_mode: Prefer a native asyncio client
             
         Returns:
             Initialized trade client instance
@@ -130,7 +170,8 @@ class Bot:
             _trade_client: BaseTradeClient = get_trade_client(
                 run_mode=run_mode,
                 trade_client=trade_client,
-                logger=self.logger
+                logger=self.logger,
+                async_mode=async_mode
             )
             _trade_client.set_running(running=True)
             self.logger.debug(
@@ -161,6 +202,10 @@ class Bot:
         Returns:
             The remote position dictionary (may be None)
         """
+        # Local state is settled when the working open/close order finishes
+        if self.trade_handler.has_pending_order():
+            return remote_position_dict
+
         # CASE 1: No position on remote but has position in memory
         if not remote_position_dict and self.position_handler.is_open():
             if not (self.bot_config.tp_enabled or self.bot_config.sl_enabled):
@@ -202,12 +247,20 @@ class Bot:
         return remote_position_dict
 
     def _fetch_market_data(self):
-        """Fetch klines data from exchange."""
-        klines_df = self.trade_client.fetch_klines(
-            symbol=self.bot_config.symbol,
-            timeframe=self.bot_config.timeframe,
-            timeframe_limit=self.bot_config.timeframe_limit
-        )
+        """Fetch klines data from exchange (through the shared hub if available)."""
+        if self.market_data_hub:
+            klines_df = self.market_data_hub.get_klines(
+                trade_client=self.trade_client,
+                symbol=self.bot_config.symbol,
+                timeframe=self.bot_config.timeframe,
+                limit=self.bot_config.timeframe_limit
+            )
+        else:
+            klines_df = self.trade_client.fetch_klines(
+                symbol=self.bot_config.symbol,
+                timeframe=self.bot_config.timeframe,
+                timeframe_limit=self.bot_config.timeframe_limit
+            )
         
         if klines_df is None or klines_df.empty:
             self.logger.error(f"Failed to fetch klines data for {self.bot_config.symbol}")
@@ -249,28 +302,60 @@ class Bot:
         try:
             entry_signal = self.entry_strategy.should_open(
                 klines_df=klines_df, position_handler=self.position_handler)
+            signal_at = monotonic()
             self.logger.debug(message=f"Entry signal: {entry_signal.position_side} - {entry_signal.reason}")
         except Exception as e:
             self.logger.error_e(message='Error while checking entry signal', e=e)
             return None
         
         if entry_signal.position_side == PositionSide.ZERO:
+            self._prestage_entry(klines_df)
             return None
         
         # Open new position
         self.logger.info(message=f'{self.bot_config.symbol} Entry signal triggered')
         
         try:
-            new_position_dict = self.trade_handler.place_order_to_open_position(
-                position_side=entry_signal.position_side)
+            self.trade_handler.update_trade_flow(klines_df=klines_df)
+            self.trade_handler.start_order_to_open_position(
+                position_side=entry_signal.position_side,
+                context={'open_candle': current_candle_open_time, 'open_reason': entry_signal.reason},
+                signal_at=signal_at,
+                reference_price=float(klines_df.iloc[-1]['close'])
+            )
+        except Exception as e:
+            self.logger.error_e(message='Error while opening position', e=e)
+            return None
+        
+        return self._advance_entry_order(klines_df)
+    
+    def _prestage_entry(self, klines_df) -> None:
+        """Pre-stage the entry order while the strategy reports a signal is near (live only)."""
+        if self.bot_config.run_mode == RunMode.BACKTEST:
+            return
+        try:
+            if self.entry_strategy.is_near_signal(klines_df=klines_df, position_handler=self.position_handler):
+                self.trade_handler.prestage_entry()
+        except Exception as e:
+            self.logger.warning_e(message='Error while pre-staging entry', e=e)
+    
+    def _advance_entry_order(self, klines_df) -> Optional[Dict[str, Any]]:
+        """Advance the working entry order; open the position and place TP/SL once it is filled."""
+        try:
+            workflow = self.trade_handler.advance_order_workflow()
+            if workflow is None:
+                self.logger.debug(message='Entry order still working')
+                return None
+            
+            new_position_dict = self.trade_handler.finish_order_to_open_position(workflow=workflow)
             
             new_position_dict['run_id'] = self.bot_config.run_id
-            new_position_dict['open_candle'] = current_candle_open_time
-            new_position_dict['open_reason'] = entry_signal.reason
+            new_position_dict['open_candle'] = workflow.context['open_candle']
+            new_position_dict['open_reason'] = workflow.context['open_reason']
             
             # For backtest mode, explicitly set open_time to candle open time
             if self.bot_config.run_mode == RunMode.BACKTEST:
-                new_position_dict['open_time'] = current_candle_open_time
+                new_position_dict['open_time'] = workflow.context['open_candle']
             
             self.position_handler.open_position(position_dict=new_position_dict)
             
@@ -286,14 +371,17 @@ class Bot:
             self.position_handler.set_sl_price(price=sl_price)
             self.logger.debug(message=f'Calculated TP: {tp_price}, SL: {sl_price}')
 
-            # Place TP/SL orders on exchange only if enabled
+            # Place TP/SL orders on exchange only if enabled, in one batch
             position = self.position_handler.position
-            if self.bot_config.tp_enabled:
-                self.logger.info(message=f'Placing TP order at {tp_price}')
-                self.trade_handler.place_tp_order(position_side=position.position_side, tp_price=tp_price)
-            if self.bot_config.sl_enabled:
-                self.logger.info(message=f'Placing SL order at {sl_price}')
-                self.trade_handler.place_sl_order(position_side=position.position_side, sl_price=sl_price)
+            if self.bot_config.tp_enabled or self.bot_config.sl_enabled:
+                self.logger.info(message=f'Placing TP/SL orders (TP {tp_price if self.bot_config.tp_enabled else "off"}, SL {sl_price if self.bot_config.sl_enabled else "off"})')
+                self.trade_handler.place_tp_sl_orders(
+                    position_side=position.position_side,
+                    tp_price=tp_price,
+                    sl_price=sl_price,
+                    tp_enabled=self.bot_config.tp_enabled,
+                    sl_enabled=self.bot_config.sl_enabled
+                )
             
             return new_position_dict
         except Exception as e:
@@ -333,25 +421,85 @@ class Bot:
         self.position_handler.update_pnl(pnl=pnl)
         self.position_handler.update_last_known_price(price=mark_price)
         
-        # Check exit signal
-        try:
-            exit_signal = self.exit_strategy.should_close(
-                klines_df=klines_df, position_handler=self.position_handler)
-            self.logger.debug(message=f"Exit signal: {exit_signal.reason}")
-        except Exception as e:
-            self.logger.error_e(message='Error while checking exit signal', e=e)
-            return False
+        # Check exit signal (a price trigger crossed since the last tick closes right away)
+        fired_trigger = self._fired_trigger
+        if fired_trigger is not None:
+            trigger, reference_price, signal_at = fired_trigger
+            exit_signal = PositionSignal(position_side=PositionSide.ZERO, reason=f"{trigger.reason} | price {reference_price}")
+        else:
+            try:
+                exit_signal = self.exit_strategy.should_close(
+                    klines_df=klines_df, position_handler=self.position_handler)
+                signal_at = monotonic()
+                reference_price = float(klines_df.iloc[-1]['close'])
+                self.logger.debug(message=f"Exit signal: {exit_signal.reason}")
+            except Exception as e:
+                self.logger.error_e(message='Error while checking exit signal', e=e)
+                return False
         
         if exit_signal.position_side != PositionSide.ZERO:
+            self._arm_price_triggers()
             return False
+        self._disarm_price_triggers()
         
         # Close position
         self.logger.info(message=f'{self.bot_config.symbol} Exit signal triggered')
         self.logger.debug(message=f'Active position: {active_position_dict}')
         
         try:
-            closed_position_dict = self.trade_handler.place_order_to_close_position(
-                position_dict=active_position_dict)
+            self.trade_handler.update_trade_flow(klines_df=klines_df)
+            self.trade_handler.start_order_to_close_position(
+                position_dict=active_position_dict,
+                context={'close_reason': exit_signal.reason},
+                signal_at=signal_at,
+                reference_price=reference_price
+            )
+        except ValueError as e:
+            self._on_position_already_closed(e)
+            return False
+        except Exception as e:
+            self.logger.error_e(message='Error while closing position', e=e)
+            return False
+        
+        return self._advance_exit_order(current_candle_open_time)
+    
+    def _arm_price_triggers(self) -> None:
+        """Arm the exit strategy's price levels for the open position (live mode only)."""
+        if self.price_trigger_engine is None:
+            return
+        try:
+            triggers = self.exit_strategy.get_price_triggers(position_handler=self.position_handler)
+        except Exception as e:
+            self.logger.error_e(message='Error while getting price triggers', e=e)
+            triggers = []
+        self.price_trigger_engine.set_triggers(
+            owner=self.bot_config.bot_name,
+            symbol=self.bot_config.symbol,
+            triggers=triggers,
+            callback=self._on_price_trigger
+        )
+
+    def _disarm_price_triggers(self) -> None:
+        """Drop armed price levels and any trigger fired for the previous position."""
+        self._fired_trigger = None
+        if self.price_trigger_engine is not None:
+            self.price_trigger_engine.clear(owner=self.bot_config.bot_name)
+
+    def _on_price_trigger(self, trigger: PriceTrigger, price: float) -> None:
+        """Price stream thread: record the crossed level and wake the bot to close on its own thread."""
+        self.logger.info(message=f'{self.bot_config.symbol} price trigger fired: {trigger.reason} (price {price})')
+        self._fired_trigger = (trigger, price, monotonic())
+        self.trade_client.wake()
+
+    def _advance_exit_order(self, current_candle_open_time: str) -> bool:
+        """Advance the working exit order; close the position once it is filled."""
+        try:
+            workflow = self.trade_handler.advance_order_workflow()
+            if workflow is None:
+                self.logger.debug(message='Exit order still working')
+                return False
+            
+            closed_position_dict = self.trade_handler.finish_order_to_close_position(workflow=workflow)
             
             # Cancel any active TP/SL orders
             # if self.bot_config.tp_enabled:
@@ -361,7 +509,8 @@ class Bot:
             
             self.position_handler.clear_tp_sl_orders()
             
-            closed_position_dict['close_reason'] = exit_signal.reason
+            close_reason = workflow.context['close_reason']
+            closed_position_dict['close_reason'] = close_reason
             closed_position_dict['current_candle_open_time'] = current_candle_open_time
             
             # For backtest mode, explicitly set close_time to candle open time
@@ -375,13 +524,13 @@ class Bot:
             # Pass close_reason and pnl so strategies can apply conditional cooldown
             pnl = closed_position_dict.get('pnl', 0.0)
             cooldown_seconds = self.exit_strategy.get_cooldown_seconds(
-                close_reason=exit_signal.reason,
+                close_reason=close_reason,
                 pnl=pnl
             )
             if cooldown_seconds and cooldown_seconds > 0:
                 self.position_handler.set_cooldown(
                     cooldown_seconds=cooldown_seconds,
-                    reason=exit_signal.reason
+                    reason=close_reason
                 )
 
             # Track trade for backtest
@@ -390,19 +539,23 @@ class Bot:
             
             return True
         except ValueError as e:
-            # Position already closed (likely by TP/SL)
-            self.logger.warning(f'Position already closed: {e}')
-            self.position_handler.clear_position()
-            self.position_handler.clear_tp_sl_orders()
+            self._on_position_already_closed(e)
             return False
         except Exception as e:
             self.logger.error_e(message='Error while closing position', e=e)
             return False
     
+    def _on_position_already_closed(self, e: Exception) -> None:
+        """Position already closed (likely by TP/SL): drop local state."""
+        self.logger.warning(f'Position already closed: {e}')
+        self.position_handler.clear_position()
+        self.position_handler.clear_tp_sl_orders()
+        self._disarm_price_triggers()
+    
     def _save_position_state(self) -> None:
         """Save position state to disk if position exists."""
         try:
-            if self.position_handler.position is not None:
+            if self.position_handler.position is not None or self.position_handler.pending_order:
                 self.position_handler.dump_position_state()
         except Exception as e:
             self.logger.error_e(message='Error while dumping position state', e=e)
@@ -411,7 +564,7 @@ class Bot:
         """
         Main execution loop for the bot.
         
-        Handles three main states:
+        Handles three main states, after advancing any working open/close order:
         1. Looking for entry (no position, no TP/SL)
         2. Monitoring TP/SL (TP/SL active, no position on exchange)
         3. Looking for exit (active position)
@@ -425,6 +578,26 @@ class Bot:
         # Get position state
         active_position_dict, current_candle_open_time = self._get_position_state(klines_df)
         
+        self._process_tick(klines_df, active_position_dict, current_candle_open_time)
+
+    def _process_tick(
+        self,
+        klines_df,
+        active_position_dict: Optional[Dict[str, Any]],
+        current_candle_open_time: str
+    ) -> None:
+        """Run strategies and trade actions for one iteration on fetched data."""
+        # STATE 0: Open/close order still working from an earlier tick
+        # Advance it without blocking; strategies resume once it is settled
+        workflow = self.trade_handler.get_order_workflow()
+        if workflow is not None:
+            if workflow.kind == WORKFLOW_OPEN:
+                self._advance_entry_order(klines_df)
+            else:
+                self._advance_exit_order(current_candle_open_time)
+            self._save_position_state()
+            return
+        
         # Cache state flags
         have_position = bool(active_position_dict)
         have_tp = bool(self.position_handler.tp_order_id)
@@ -456,10 +629,118 @@ class Bot:
             if self._handle_exit_signal(klines_df, active_position_dict, current_candle_open_time):
                 have_position = False
         
-        # Save position state
-        if have_position:
+        # No position left to protect: disarm its price levels
+        if not have_position:
+            self._disarm_price_triggers()
+        
+        # Save position state (and the order still working, if any)
+        if have_position or self.trade_handler.has_pending_order():
             self._save_position_state()
 
+    async def _fetch_market_data_async(self):
+        """Async variant of `_fetch_market_data`."""
+        if self.market_data_hub:
+            klines_df = await self.market_data_hub.get_klines_async(
+                trade_client=self.trade_client,
+                symbol=self.bot_config.symbol,
+                timeframe=self.bot_config.timeframe,
+                limit=self.bot_config.timeframe_limit
+            )
+        else:
+            klines_df = await self.trade_client.fetch_klines_async(
+                symbol=self.bot_config.symbol,
+                timeframe=self.bot_config.timeframe,
+                timeframe_limit=self.bot_config.timeframe_limit
+            )
+        
+        if klines_df is None or klines_df.empty:
+            self.logger.error(f"Failed to fetch klines data for {self.bot_config.symbol}")
+            return None
+        
+        return klines_df
+
+    async def execute_async(self) -> None:
+        """
+        Async variant of `execute`.
+        
+        Market data and position are fetched on the event loop; position
+        sync (which writes the state file), strategy computation and any
+        order placement run in the loop's executor so existing sync
+        strategies and TradeHandler work unchanged and no file I/O blocks
+        the other bots' coroutines.
+        """
+        klines_df = await self._fetch_market_data_async()
+        if klines_df is None:
+            self.logger.error(message=f'Failed to fetch market data for {self.bot_config.symbol}')
+            return
+        
+        current_candle_open_time = str(klines_df.iloc[-1]["open_time"])
+        position_fetched = True
+        try:
+            remote_position_dict = await self.trade_client.fetch_position_async(
+                symbol=self.bot_config.symbol)
+        except Exception as e:
+            self.logger.critical_e(message='Failed to fetch or sync position', e=e)
+            remote_position_dict = None
+            position_fetched = False
+        
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._sync_and_process_tick,
+            klines_df,
+            remote_position_dict,
+            position_fetched,
+            current_candle_open_time
+        )
+
+    def _sync_and_process_tick(
+        self,
+        klines_df,
+        remote_position_dict: Optional[Dict[str, Any]],
+        position_fetched: bool,
+        current_candle_open_time: str
+    ) -> None:
+        """Executor side of `execute_async`: sync the fetched position, then run the tick."""
+        active_position_dict = None
+        if position_fetched:
+            try:
+                active_position_dict = self._sync_position_state(
+                    remote_position_dict=remote_position_dict,
+                    candle_open_time=current_candle_open_time
+                )
+            except Exception as e:
+                self.logger.critical_e(message='Failed to fetch or sync position', e=e)
+        
+        self._process_tick(klines_df, active_position_dict, current_candle_open_time)
+
+    async def run_async(self) -> None:
+        """Async bot execution loop - one coroutine per bot on a shared event loop."""
+
+        while self.trade_client.running:
+            try:
+                await self.execute_async()
+            except (ConnectionError, TimeoutError) as e:
+                self.logger.error_e(message='Network error in bot execution', e=e)
+                await asyncio.sleep(30)  # Wait before retry on network errors
+            except Exception as e:
+                self.logger.error_e(message='Unexpected error executing bot', e=e)
+                await asyncio.sleep(10)  # Brief pause before continuing
+
+            # For backtest mode, advance to next candle
+            if self.bot_config.run_mode == RunMode.BACKTEST:
+                if not self.trade_client.advance_candle():  # type: ignore
+                    self.logger.info("Backtest completed - reached end of data")
+                    break
+            elif self.trade_handler.has_pending_order():
+                # Step a working order again as soon as the book or the order moves
+                await asyncio.get_running_loop().run_in_executor(None, self.trade_handler.wait_order_workflow)
+            else:
+                # For live mode, wait between iterations without holding a thread
+                await self.trade_client.wait_async()
+        
+        await self.trade_client.close_async()
+        self._report_backtest_results()
+
     def run(self) -> None:
         """Main bot execution loop - handles both live and backtest modes."""
 
@@ -481,11 +762,17 @@ class Bot:
                 if not self.trade_client.advance_candle():  # type: ignore
                     self.logger.info("Backtest completed - reached end of data")
                     break
+            elif self.trade_handler.has_pending_order():
+                # Step a working order again as soon as the book or the order moves
+                self.trade_handler.wait_order_workflow()
             else:
                 # For live mode, wait between iterations
                 self.trade_client.wait()
         
-        # For backtest mode, print and save results
+        self._report_backtest_results()
+
+    def _report_backtest_results(self) -> None:
+        """Print and save backtest results (backtest mode only)."""
         if self.bot_config.run_mode == RunMode.BACKTEST and self.backtest_metrics:
             self.logger.info("BACKTEST COMPLETED - Generating results...")
             
@@ -1,11 +1,15 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread
 from typing import List, Optional
 
-from commons.constants import BOT_CONFIG_PATH
+from commons.constants import BOT_CONFIG_PATH, ASYNC_EXECUTOR_WORKERS
 from commons.custom_logger import CustomLogger
 from models.bot_config import BotConfig
+from models.enum.run_mode import RunMode
 import core.bot_config_loader as bot_config_loader
 from core.bot import Bot
+from core.market_data_hub import MarketDataHub
 
 
 class BotManager:
@@ -14,9 +18,15 @@ class BotManager:
     
     Handles bot initialization and thread management.
     Supports running all bots or specific bots by ID.
+    In async mode all bots run as coroutines on a single event loop instead.
     """
     
-    def __init__(self, bot_ids: Optional[List[str]] = None, config_dir: str = "config"):
+    def __init__(
+        self,
+        bot_ids: Optional[List[str]] = None,
+        config_dir: str = "config",
+        async_mode: bool = False
+    ):
         """
         Initialize BotManager.
         
@@ -24,12 +34,15 @@ class BotManager:
             bot_ids: Optional list of bot IDs to run (e.g., ['25', 'aa'])
                     If None, runs all enabled bots
             config_dir: Directory containing bot config files
+            async_mode: Run bots on one asyncio event loop instead of one thread each
         """
         self.logger = CustomLogger(name=self.__class__.__name__)
         self.bot_ids = bot_ids
         self.config_dir = config_dir
+        self.async_mode = async_mode
         self.bots: List[Bot] = []
         self.threads: List[Thread] = []
+        self.market_data_hub = MarketDataHub()
 
     def _load_bots_config(self) -> List[BotConfig]:
         """
@@ -93,7 +106,13 @@ class BotManager:
                 
                 self.logger.debug(message=f'Loading 🤖  [{bot_config.bot_name}] ...')
                 self.logger.debug(message=f'config: {bot_config}')
-                bot = Bot(bot_config=bot_config)
+                # Live bots share kline fetches; backtests replay their own preloaded data
+                market_data_hub = self.market_data_hub if bot_config.run_mode == RunMode.LIVE else None
+                bot = Bot(
+                    bot_config=bot_config,
+                    market_data_hub=market_data_hub,
+                    async_mode=self.async_mode
+                )
                 self.bots.append(bot)
                 enabled_count += 1
                 
@@ -116,6 +135,13 @@ class BotManager:
             return
         
         self.logger.info(message=f"Starting {len(self.bots)} bot(s)...")
+        self.market_data_hub.log_startup_summary()
+        
+        if self.async_mode:
+            asyncio.run(self._execute_async())
+            self.market_data_hub.log_summary()
+            self.logger.info(message="All bots completed.")
+            return
         
         # Start all bot threads
         for bot in self.bots:
@@ -138,8 +164,26 @@ class BotManager:
         # Wait for all threads to complete
         self._wait_for_threads()
         
+        self.market_data_hub.log_summary()
         self.logger.info(message="All bots completed.")
 
+    async def _execute_async(self) -> None:
+        """Run all bots as coroutines on the current event loop."""
+        # Strategy computation and order placement run here, off the event loop
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=ASYNC_EXECUTOR_WORKERS, thread_name_prefix='bot-worker')
+        )
+        
+        tasks = []
+        for bot in self.bots:
+            self.logger.info(message=f'Starting 🤖  [{bot.bot_config.bot_name}] (async) ...')
+            tasks.append(asyncio.create_task(bot.run_async(), name=bot.bot_config.bot_name))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for task, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                self.logger.error_e(message=f"Bot [{task.get_name()}] stopped with error", e=result)
+
     def _wait_for_threads(self) -> None:
         """Wait for all bot threads to complete."""
         for thread in self.threads:
@@ -0,0 +1,232 @@
+"""
+Execution Metrics
+Decision-to-fill latency and slippage of every open/close order.
+
+`TradeHandler` keeps one `ExecutionRecord` per order workflow: the monotonic
+time of each lifecycle stage (signal, order built, first order sent, first
+order acknowledged, first fill, fully filled) and the reference price at
+signal time. Once the order is filled the record is completed with the
+average fill price, stored in the position record and added to rolling
+histograms per bot and per symbol, split by order type, so execution modes
+(MARKET, LIMIT, MAKER_ONLY, POST_ONLY) can be compared from data.
+"""
+import bisect
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from commons.custom_logger import CustomLogger
+from models.enum.order_side import OrderSide
+
+# Samples kept per histogram
+EXECUTION_METRICS_WINDOW = 200
+
+# Histogram bucket upper bounds (a last bucket collects everything above)
+LATENCY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 5000, 30000)
+SLIPPAGE_BUCKETS_BPS = (-10, -5, -2, -1, 0, 1, 2, 5, 10)
+
+# Lifecycle stages measured from the signal, in order
+EXECUTION_STAGES = ('built', 'sent', 'acked', 'first_fill', 'filled')
+
+
+class RollingHistogram:
+    """Last `window` samples of one measurement, bucketed on demand."""
+
+    def __init__(self, bounds: Tuple[float, ...], window: int = EXECUTION_METRICS_WINDOW) -> None:
+        """
+        Initialize histogram.
+
+        Args:
+            bounds: Ascending bucket upper bounds (inclusive)
+            window: Number of most recent samples kept
+        """
+        self.bounds = bounds
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0  # samples recorded since start (not only the window)
+
+    def add(self, value: float) -> None:
+        """Record one sample."""
+        self._samples.append(value)
+        self.count += 1
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the window (0 without samples)."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def buckets(self) -> Dict[str, int]:
+        """Sample count per bucket of the window ('<=b' labels, '>last' for the overflow)."""
+        counts = [0] * (len(self.bounds) + 1)
+        for value in self._samples:
+            counts[bisect.bisect_left(self.bounds, value)] += 1
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return dict(zip(labels, counts))
+
+    def summary(self) -> Dict[str, Any]:
+        """Window summary: count, p50, p95, max and bucket counts."""
+        if not self._samples:
+            return {'count': self.count}
+        return {
+            'count': self.count,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': max(self._samples),
+            'buckets': self.buckets()
+        }
+
+
+@dataclass
+class ExecutionRecord:
+    """
+    Lifecycle of one open/close order, from strategy signal to full fill.
+
+    Times are monotonic seconds of this process; None if a stage was not
+    observed (e.g. the order was resumed after a restart, which also loses
+    the signal time).
+
+    Attributes:
+        kind: WORKFLOW_OPEN or WORKFLOW_CLOSE
+        order_type: Execution mode (MARKET, LIMIT, MAKER_ONLY, POST_ONLY)
+        order_side: 'BUY' or 'SELL'
+        reference_price: Price the strategy saw when it signalled
+        signal_at: Signal time (None if unknown)
+        built_at: Order workflow built
+        sent_at: First order sent to the exchange
+        acked_at: First order acknowledged
+        first_fill_at: First (partial) fill seen
+        filled_at: Fully filled
+        fill_price: Average fill price from `fetch_order_trade`
+    """
+    kind: str
+    order_type: str
+    order_side: str
+    reference_price: float
+    signal_at: Optional[float]
+    built_at: Optional[float] = None
+    sent_at: Optional[float] = None
+    acked_at: Optional[float] = None
+    first_fill_at: Optional[float] = None
+    filled_at: Optional[float] = None
+    fill_price: float = 0.0
+
+    def stage_latencies(self) -> Dict[str, Optional[float]]:
+        """Seconds from signal to each stage (None if not observed)."""
+        if self.signal_at is None:
+            return {stage: None for stage in EXECUTION_STAGES}
+        return {
+            stage: None if (at := getattr(self, f"{stage}_at")) is None else at - self.signal_at
+            for stage in EXECUTION_STAGES
+        }
+
+    @property
+    def slippage_bps(self) -> Optional[float]:
+        """Fill price vs reference price in basis points; positive = worse than the signal price."""
+        if self.reference_price <= 0 or self.fill_price <= 0:
+            return None
+        difference = self.fill_price - self.reference_price
+        if self.order_side == OrderSide.SELL.value:
+            difference = -difference
+        return difference / self.reference_price * 10000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary stored in the position record (latencies in ms)."""
+        record: Dict[str, Any] = {
+            'order_type': self.order_type,
+            'order_side': self.order_side,
+            'reference_price': self.reference_price,
+            'fill_price': self.fill_price,
+            'slippage_bps': None if self.slippage_bps is None else round(self.slippage_bps, 3)
+        }
+        for stage, latency in self.stage_latencies().items():
+            record[f"signal_to_{stage}_ms"] = None if latency is None else round(latency * 1000, 1)
+        return record
+
+
+class ExecutionMetrics:
+    """
+    Rolling execution histograms per bot and per symbol, split by order type.
+
+    Each scope key ('bot:<name>' / 'symbol:<symbol>') and order type holds
+    one latency histogram per lifecycle stage plus a slippage histogram.
+    """
+
+    _instance: Optional['ExecutionMetrics'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, window: int = EXECUTION_METRICS_WINDOW, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Initialize execution metrics.
+
+        Args:
+            window: Samples kept per histogram
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.window = window
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._histograms: Dict[Tuple[str, str], Dict[str, RollingHistogram]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'ExecutionMetrics':
+        """Get the process-wide metrics, creating them on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _get_histograms(self, scope: str, order_type: str) -> Dict[str, RollingHistogram]:
+        key = (scope, order_type)
+        histograms = self._histograms.get(key)
+        if histograms is None:
+            histograms = {f"{stage}_ms": RollingHistogram(bounds=LATENCY_BUCKETS_MS, window=self.window) for stage in EXECUTION_STAGES}
+            histograms['slippage_bps'] = RollingHistogram(bounds=SLIPPAGE_BUCKETS_BPS, window=self.window)
+            self._histograms[key] = histograms
+        return histograms
+
+    def record(self, bot_name: str, symbol: str, execution: ExecutionRecord) -> None:
+        """
+        Add a completed order to the bot's and the symbol's histograms.
+
+        Args:
+            bot_name: Bot that placed the order
+            symbol: Trading pair symbol
+            execution: Completed execution record
+        """
+        latencies = execution.stage_latencies()
+        slippage_bps = execution.slippage_bps
+        with self._lock:
+            for scope in (f"bot:{bot_name}", f"symbol:{symbol}"):
+                histograms = self._get_histograms(scope=scope, order_type=execution.order_type)
+                for stage, latency in latencies.items():
+                    if latency is not None:
+                        histograms[f"{stage}_ms"].add(latency * 1000)
+                if slippage_bps is not None:
+                    histograms['slippage_bps'].add(slippage_bps)
+
+    def summary(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Histogram summaries of one scope per order type.
+
+        Args:
+            scope: 'bot:<name>' or 'symbol:<symbol>'
+
+        Returns:
+            {order_type: {metric: summary}}
+        """
+        with self._lock:
+            return {
+                order_type: {metric: histogram.summary() for metric, histogram in histograms.items()}
+                for (key, order_type), histograms in self._histograms.items()
+                if key == scope
+            }
+
+    def scopes(self) -> List[str]:
+        """Scope keys with recorded orders."""
+        with self._lock:
+            return sorted({key for key, _ in self._histograms})
+
+# EOF
@@ -0,0 +1,271 @@
+"""
+Execution Mode Selector
+Picks MARKET, LIMIT or POST_ONLY per order for bots configured as ADAPTIVE.
+
+A post-only order joins the queue at the touch (what `calculate_maker_price`
+quotes with no offset), so it fills once the volume traded against its side
+has consumed the queue ahead of it plus its own quantity. With a traded
+volume rate `r` estimated from recent closed candles (half of it hitting
+each side) and the queue `q` read from the order book, the expected time to
+fill is (q + quantity) / r and the probability of filling within the
+latency budget T is taken as 1 - exp(-T * r / (q + quantity)).
+
+- Fill probability >= `min_fill_probability`: POST_ONLY (maker fee, no spread paid)
+- Otherwise, spread >= `wide_spread_ticks`: LIMIT one tick better than the touch, inside the spread
+- Otherwise: MARKET (the book is tight, crossing costs little)
+- No book or no trade flow: MARKET
+
+Every decision and the realised outcome of its order are logged and kept
+with the order, so the estimates can be checked against live fills. The
+backtest book is a single level at the candle close (zero spread), so
+backtests never choose LIMIT and do not validate the fill model.
+"""
+import math
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from commons.constants import (
+    ADAPTIVE_LATENCY_BUDGET_SECONDS,
+    ADAPTIVE_MIN_FILL_PROBABILITY,
+    ADAPTIVE_WIDE_SPREAD_TICKS,
+    ADAPTIVE_TRADE_FLOW_CANDLES
+)
+from commons.custom_logger import CustomLogger
+from models.enum.order_side import OrderSide
+from models.enum.order_type import OrderType
+from models.symbol_filters import SymbolFilters
+
+# Share of the traded volume assumed to hit each side of the book
+TRADE_FLOW_SIDE_SHARE = 0.5
+
+
+@dataclass
+class ExecutionEstimate:
+    """
+    Book and flow snapshot an execution decision was made from.
+
+    Attributes:
+        best_bid: Best bid price
+        best_ask: Best ask price
+        spread_ticks: Best ask - best bid in ticks
+        queue_ahead: Quantity resting at the touch on the order's side
+        depth: Quantity on the order's side within the fetched book levels
+        trade_rate: Traded volume per second against one side of the book
+        fill_probability: Estimated probability a post-only order fills within the budget
+        expected_time_to_fill: Estimated seconds for a post-only order to fill (None = no flow)
+    """
+    best_bid: float
+    best_ask: float
+    spread_ticks: int
+    queue_ahead: float
+    depth: float
+    trade_rate: float
+    fill_probability: float
+    expected_time_to_fill: Optional[float]
+
+
+@dataclass
+class ExecutionDecision:
+    """
+    Execution mode chosen for one order.
+
+    Attributes:
+        order_type: Chosen mode (MARKET, LIMIT or POST_ONLY)
+        reason: Why it was chosen
+        latency_budget: Latency budget in seconds the decision was made for
+        estimate: Book and flow snapshot (None if the book was unavailable)
+    """
+    order_type: OrderType
+    reason: str
+    latency_budget: float
+    estimate: Optional[ExecutionEstimate] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decision kept in the workflow context and the position record."""
+        return {
+            'order_type': self.order_type.value,
+            'reason': self.reason,
+            'latency_budget': self.latency_budget,
+            **({key: round(value, 6) if isinstance(value, float) else value
+                for key, value in asdict(self.estimate).items()} if self.estimate else {})
+        }
+
+
+class ExecutionModeSelector:
+    """
+    Fill-probability model choosing the execution mode of one bot's orders.
+
+    The bot feeds recent klines with `update_trade_flow`; `select` reads the
+    order book and returns the decision; `record_outcome` logs how the order
+    actually filled and keeps per-mode counts of fills within the budget.
+    """
+
+    def __init__(
+        self,
+        latency_budget: float = ADAPTIVE_LATENCY_BUDGET_SECONDS,
+        min_fill_probability: float = ADAPTIVE_MIN_FILL_PROBABILITY,
+        wide_spread_ticks: int = ADAPTIVE_WIDE_SPREAD_TICKS,
+        trade_flow_candles: int = ADAPTIVE_TRADE_FLOW_CANDLES,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize selector.
+
+        Args:
+            latency_budget: Seconds a passive order is expected to fill within
+            min_fill_probability: Min fill probability within the budget to choose POST_ONLY
+            wide_spread_ticks: Spread in ticks from which LIMIT is preferred to MARKET
+            trade_flow_candles: Closed candles the traded volume rate is estimated from
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.latency_budget = latency_budget
+        self.min_fill_probability = min_fill_probability
+        self.wide_spread_ticks = wide_spread_ticks
+        self.trade_flow_candles = trade_flow_candles
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self.trade_rate = 0.0  # Traded volume per second against one side of the book
+
+        # Outcome counters per chosen mode: orders, fills within the budget, summed predicted probability
+        self._outcomes: Dict[str, Dict[str, float]] = {}
+
+    def update_trade_flow(self, klines_df: pd.DataFrame) -> None:
+        """
+        Estimate the traded volume rate from the last closed candles.
+
+        The last row is the candle in progress and is skipped.
+
+        Args:
+            klines_df: Klines with 'volume', 'open_time' and 'close_time' columns
+        """
+        candles = klines_df.iloc[-(self.trade_flow_candles + 1):-1]
+        if candles.empty:
+            return
+        seconds = (candles['close_time'] - candles['open_time']).dt.total_seconds().sum()
+        if seconds > 0:
+            self.trade_rate = float(candles['volume'].sum()) / seconds * TRADE_FLOW_SIDE_SHARE
+
+    def estimate(
+        self,
+        order_book: Dict[str, Any],
+        order_side: str,
+        quantity: float,
+        symbol_filters: SymbolFilters
+    ) -> ExecutionEstimate:
+        """
+        Estimate how a post-only order at the touch would fill.
+
+        Args:
+            order_book: Order book with 'bids' and 'asks' levels ([price, quantity])
+            order_side: 'BUY' or 'SELL'
+            quantity: Order quantity
+            symbol_filters: Filters of the symbol (tick size)
+
+        Returns:
+            Book and flow snapshot with fill estimates
+        """
+        best_bid = float(order_book['bids'][0][0])
+        best_ask = float(order_book['asks'][0][0])
+        levels = order_book['bids'] if order_side == OrderSide.BUY.value else order_book['asks']
+        queue_ahead = float(levels[0][1])
+        depth = sum(float(level[1]) for level in levels)
+        spread_ticks = max(round((best_ask - best_bid) / symbol_filters.tick_size), 0)
+
+        if self.trade_rate > 0:
+            expected_time_to_fill: Optional[float] = (queue_ahead + quantity) / self.trade_rate
+            fill_probability = 1 - math.exp(-self.latency_budget / expected_time_to_fill)
+        else:
+            expected_time_to_fill = None
+            fill_probability = 0.0
+
+        return ExecutionEstimate(
+            best_bid=best_bid,
+            best_ask=best_ask,
+            spread_ticks=spread_ticks,
+            queue_ahead=queue_ahead,
+            depth=depth,
+            trade_rate=self.trade_rate,
+            fill_probability=fill_probability,
+            expected_time_to_fill=expected_time_to_fill
+        )
+
+    def select(
+        self,
+        order_book: Dict[str, Any],
+        order_side: str,
+        quantity: float,
+        symbol_filters: Optional[SymbolFilters]
+    ) -> ExecutionDecision:
+        """
+        Choose the execution mode of one order.
+
+        Args:
+            order_book: Order book with 'bids' and 'asks' levels ([price, quantity])
+            order_side: 'BUY' or 'SELL'
+            quantity: Order quantity
+            symbol_filters: Filters of the symbol (None if exchange info is not cached)
+
+        Returns:
+            The decision
+        """
+        if not order_book.get('bids') or not order_book.get('asks') or symbol_filters is None:
+            return ExecutionDecision(order_type=OrderType.MARKET, reason='no order book', latency_budget=self.latency_budget)
+
+        estimate = self.estimate(order_book=order_book, order_side=order_side, quantity=quantity, symbol_filters=symbol_filters)
+        if estimate.expected_time_to_fill is None:
+            order_type, reason = OrderType.MARKET, 'no trade flow'
+        elif estimate.fill_probability >= self.min_fill_probability:
+            order_type, reason = OrderType.POST_ONLY, 'likely to fill passively within budget'
+        elif estimate.spread_ticks >= self.wide_spread_ticks:
+            order_type, reason = OrderType.LIMIT, 'wide spread, unlikely to fill at the touch'
+        else:
+            order_type, reason = OrderType.MARKET, 'tight spread, unlikely to fill passively'
+
+        return ExecutionDecision(order_type=order_type, reason=reason, latency_budget=self.latency_budget, estimate=estimate)
+
+    def record_outcome(self, decision: Dict[str, Any], execution: Dict[str, Any]) -> str:
+        """
+        Count how an order chosen by `select` filled.
+
+        Args:
+            decision: `ExecutionDecision.to_dict()` of the order
+            execution: `ExecutionRecord.to_dict()` of the filled order
+
+        Returns:
+            Outcome message comparing the estimate with the fill
+        """
+        filled_ms = execution.get('signal_to_filled_ms')
+        within_budget = filled_ms is not None and filled_ms <= decision['latency_budget'] * 1000
+        outcome = self._outcomes.setdefault(decision['order_type'], {'orders': 0, 'within_budget': 0, 'predicted': 0.0})
+        outcome['orders'] += 1
+        outcome['within_budget'] += int(within_budget)
+        outcome['predicted'] += decision.get('fill_probability', 0.0)
+
+        expected = decision.get('expected_time_to_fill')
+        slippage = execution.get('slippage_bps')
+        return (
+            f"ADAPTIVE {decision['order_type']} ({decision['reason']}) | "
+            f"predicted p={decision.get('fill_probability', 0.0):.2f}, "
+            f"ttf {'n/a' if expected is None else f'{expected:.1f}s'} | "
+            f"filled in {'n/a' if filled_ms is None else f'{filled_ms / 1000:.1f}s'}, "
+            f"slippage {'n/a' if slippage is None else f'{slippage}bps'}"
+        )
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-mode outcome counts.
+
+        Returns:
+            {order_type: {'orders', 'within_budget', 'mean_predicted'}}
+        """
+        return {
+            order_type: {
+                'orders': outcome['orders'],
+                'within_budget': outcome['within_budget'],
+                'mean_predicted': outcome['predicted'] / outcome['orders']
+            }
+            for order_type, outcome in self._outcomes.items()
+        }
+
+# EOF
@@ -0,0 +1,492 @@
+"""
+Maker Chase Engine
+Keeps one post-only order at the maker price until it fills.
+
+The engine is a small state machine advanced by `step()`: every step reads
+the order and the book once, then places, amends or cancel/replaces the
+order without sleeping. `run()` drives it to completion, blocking between
+steps only until the top of book moves (local order book) or the order
+changes (user-data stream), bounded by the poll interval.
+"""
+from dataclasses import dataclass
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Optional
+
+from abstracts.base_trade_client import BaseTradeClient
+from commons.common import make_client_order_id
+from commons.constants import (
+    POST_ONLY_REJECTED_ERROR_CODE,
+    ORDER_STATUS_FILLED,
+    ORDER_STATUS_CHECK_INTERVAL,
+    MAKER_CHASE_REPRICE_THRESHOLD_TICKS,
+    MAKER_CHASE_MAX_SECONDS,
+    MAKER_CHASE_MAX_SLIPPAGE_TICKS
+)
+from commons.custom_logger import CustomLogger
+from models.enum.order_side import OrderSide
+from models.enum.order_type import OrderType
+
+# Chase states
+CHASE_PENDING = 'PENDING'  # no order placed yet
+CHASE_WORKING = 'WORKING'  # order resting on the book
+CHASE_FILLED = 'FILLED'  # target quantity filled
+CHASE_EXPIRED = 'EXPIRED'  # max chase duration reached; order cancelled
+CHASE_ABORTED = 'ABORTED'  # reduce-only order with no position left to reduce
+
+CHASE_FINAL_STATES = (CHASE_FILLED, CHASE_EXPIRED, CHASE_ABORTED)
+
+# Re-quotes `run()` sends back to back before waiting (bounds a persistent rejection)
+MAX_IMMEDIATE_RETRIES = 10
+
+# Price function: () -> current maker price (raises ValueError if the book is unavailable)
+PriceFunction = Callable[[], float]
+
+
+@dataclass
+class ChaseMetrics:
+    """Counters of one chase."""
+    started_at: float = 0.0
+    first_sent_at: Optional[float] = None  # first placement sent
+    first_order_at: Optional[float] = None  # first placement acknowledged
+    first_fill_at: Optional[float] = None
+    filled_at: Optional[float] = None
+    orders: int = 0  # orders placed
+    reprices: int = 0  # amends + cancel/replaces
+    amends: int = 0
+    replaces: int = 0
+    rejections: int = 0  # placements rejected (post-only would take, ...)
+
+    @property
+    def time_to_fill(self) -> Optional[float]:
+        """Seconds from start to full fill, None if not filled."""
+        return None if self.filled_at is None else self.filled_at - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'time_to_fill': self.time_to_fill,
+            'time_to_first_fill': None if self.first_fill_at is None else self.first_fill_at - self.started_at,
+            'orders': self.orders,
+            'reprices': self.reprices,
+            'amends': self.amends,
+            'replaces': self.replaces,
+            'rejections': self.rejections
+        }
+
+
+class MakerChaseEngine:
+    """
+    Chases the maker price with a single post-only LIMIT order.
+
+    - Reprices only when the maker price moved at least `reprice_threshold_ticks`
+    - Never chases more than `max_slippage_ticks` away from the first maker price
+      (the order rests at the cap instead); 0 disables the cap
+    - Cancels and stops after `max_chase_seconds`; 0 chases until filled
+    - Reprices amend the order in place, cancel/replace if the amend is rejected
+    """
+
+    def __init__(
+        self,
+        trade_client: BaseTradeClient,
+        symbol: str,
+        order_side: str,
+        quantity: float,
+        tick_size: float,
+        price_function: PriceFunction,
+        reduce_only: bool = False,
+        time_in_force: str = 'GTX',
+        reprice_threshold_ticks: int = MAKER_CHASE_REPRICE_THRESHOLD_TICKS,
+        max_chase_seconds: float = MAKER_CHASE_MAX_SECONDS,
+        max_slippage_ticks: int = MAKER_CHASE_MAX_SLIPPAGE_TICKS,
+        poll_interval: float = 0,
+        client_order_prefix: str = '',
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize chase.
+
+        Args:
+            trade_client: Client to trade through
+            symbol: Trading pair symbol
+            order_side: 'BUY' or 'SELL'
+            quantity: Target quantity
+            tick_size: Minimum price increment
+            price_function: Callable returning the current maker price
+            reduce_only: Whether orders should only reduce position
+            time_in_force: Time in force of the orders ('GTX' = post-only)
+            reprice_threshold_ticks: Minimum maker price move (ticks) that triggers a reprice
+            max_chase_seconds: Give up after this many seconds (0 = no limit)
+            max_slippage_ticks: Max ticks the price may chase away from the first quote (0 = no cap)
+            poll_interval: Max seconds `run()` waits between steps (0 = no wait, backtest)
+            client_order_prefix: Client order id prefix; each placement attempt gets its own id ('' = none)
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.trade_client = trade_client
+        self.symbol = symbol
+        self.order_side = order_side
+        self.quantity = quantity
+        self.tick_size = float(tick_size)
+        self.price_function = price_function
+        self.reduce_only = reduce_only
+        self.time_in_force = time_in_force
+        self.reprice_threshold_ticks = max(1, int(reprice_threshold_ticks))
+        self.max_chase_seconds = max_chase_seconds
+        self.max_slippage_ticks = max_slippage_ticks
+        self.poll_interval = poll_interval
+        self.client_order_prefix = client_order_prefix
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+
+        self.state = CHASE_PENDING
+        self.order_id = ''
+        self.last_order_id = ''  # last order placed (for trade history)
+        self.ordered_price: Optional[float] = None
+        self.order_quantity = 0.0
+        self.closed_filled_quantity = 0.0  # fills of orders no longer working
+        self.working_filled_quantity = 0.0  # fills of the working order
+        self.anchor_price: Optional[float] = None  # first maker price, base of the slippage cap
+        self.metrics = ChaseMetrics()
+        self.consecutive_rejections = 0  # post-only rejections (-5022) since the last accepted placement
+        self._order_update: Optional[Dict[str, Any]] = None  # order state delivered by wait()
+        self._retry_now = False
+        self._reconcile = False  # look the next placement up by client id first (resumed chase, unknown outcome)
+
+    @property
+    def filled_quantity(self) -> float:
+        return self.closed_filled_quantity + self.working_filled_quantity
+
+    @property
+    def remaining_quantity(self) -> float:
+        return self.quantity - self.filled_quantity
+
+    @property
+    def done(self) -> bool:
+        return self.state in CHASE_FINAL_STATES
+
+    @property
+    def attempts(self) -> int:
+        """Placement attempts so far (accepted or rejected); numbers the next client order id."""
+        return self.metrics.orders + self.metrics.rejections
+
+    def _finish(self, state: str) -> bool:
+        self.state = state
+        if state == CHASE_FILLED:
+            self.metrics.filled_at = monotonic()
+        return True
+
+    def _record_fill(self, executed_qty: float) -> None:
+        if executed_qty > 0 and self.metrics.first_fill_at is None:
+            self.metrics.first_fill_at = monotonic()
+        self.working_filled_quantity = executed_qty
+
+    def _close_working_order(self) -> None:
+        """Move the working order's fills to the closed total and forget it."""
+        self.closed_filled_quantity += self.working_filled_quantity
+        self.working_filled_quantity = 0.0
+        self.order_id = ''
+        self.ordered_price = None
+
+    def _target_price(self) -> float:
+        """Maker price, clamped to the slippage cap."""
+        price = self.price_function()
+        if self.anchor_price is None:
+            self.anchor_price = price
+        if self.max_slippage_ticks > 0:
+            cap = self.max_slippage_ticks * self.tick_size
+            if self.order_side == OrderSide.BUY.value:
+                price = min(price, round(self.anchor_price + cap, 12))
+            else:
+                price = max(price, round(self.anchor_price - cap, 12))
+        return price
+
+    def step(self) -> bool:
+        """
+        Advance the chase by one non-blocking pass.
+
+        Returns:
+            True once the chase reached a final state
+        """
+        if self.done:
+            return True
+        self._retry_now = False
+        if not self.metrics.started_at:
+            self.metrics.started_at = monotonic()
+
+        # 1. Working order: filled, gone, or still resting?
+        if self.order_id:
+            order = self._order_update or self.trade_client.fetch_order(symbol=self.symbol, order_id=self.order_id)
+            self._order_update = None
+            status = order.get('status', '')
+            self._record_fill(float(order.get('executedQty', 0) or 0))
+            if status == ORDER_STATUS_FILLED:
+                # Exchanges that omit executedQty on fill (backtest) filled the whole order
+                self.working_filled_quantity = self.working_filled_quantity or self.order_quantity
+                self._close_working_order()
+                return self._finish(CHASE_FILLED)
+            if status in ['CANCELED', 'EXPIRED']:
+                self.logger.debug(f"Chase order {self.order_id} {status.lower()}, re-quoting")
+                self._close_working_order()
+
+        # 2. Out of time: cancel and stop
+        if self.max_chase_seconds and monotonic() - self.metrics.started_at >= self.max_chase_seconds:
+            if self.order_id and not self._cancel_working_order():
+                return self._finish(CHASE_FILLED)
+            self.logger.warning(f"Maker chase expired after {self.max_chase_seconds}s, filled {self.filled_quantity}/{self.quantity}")
+            return self._finish(CHASE_EXPIRED)
+
+        try:
+            price = self._target_price()
+        except ValueError as e:
+            self.logger.warning(f"Maker price unavailable: {e}")
+            return False
+
+        # 3. Reprice a resting order that fell behind by at least the threshold
+        if self.order_id and self.ordered_price is not None:
+            if abs(price - self.ordered_price) < self.reprice_threshold_ticks * self.tick_size - 1e-12:
+                return False
+            if self._amend(price=price):
+                return False
+            if not self._cancel_working_order():
+                return self._finish(CHASE_FILLED)
+            self.metrics.replaces += 1
+            self.metrics.reprices += 1
+
+        # 4. No working order: place one for the remaining quantity
+        if self.remaining_quantity <= 0:
+            return self._finish(CHASE_FILLED)
+        return self._place(price=price)
+
+    def _amend(self, price: float) -> bool:
+        """Amend the working order to `price`. Returns False if rejected."""
+        try:
+            amended = self.trade_client.modify_order(
+                symbol=self.symbol,
+                order_id=self.order_id,
+                order_side=self.order_side,
+                quantity=self.order_quantity,
+                price=price
+            )
+        except Exception as e:
+            self.logger.debug(f"Amend of order {self.order_id} failed: {e}")
+            return False
+        if not amended or not amended.get('orderId') or amended.get('status') in ['CANCELED', 'EXPIRED']:
+            return False
+        self.logger.debug(f"Maker price {self.ordered_price} → {price}  |  Amended order {self.order_id}")
+        self.ordered_price = price
+        self.metrics.amends += 1
+        self.metrics.reprices += 1
+        if amended.get('status') == ORDER_STATUS_FILLED:
+            self._order_update = amended
+            self._retry_now = True
+        return True
+
+    def _cancel_working_order(self) -> bool:
+        """
+        Cancel the working order and book its fills.
+
+        Returns:
+            False if the order turned out to be fully filled
+        """
+        self.logger.debug(f"Canceling order {self.order_id} at {self.ordered_price}")
+        cancelled = self.trade_client.cancel_order(symbol=self.symbol, order_id=self.order_id)
+        if not cancelled or cancelled.get('status') != 'CANCELED':
+            # Cancel rejected (filled meanwhile) or no details returned: ask the order itself
+            cancelled = self.trade_client.fetch_order(symbol=self.symbol, order_id=self.order_id)
+        self._record_fill(float(cancelled.get('executedQty', 0) or 0))
+        if cancelled.get('status') == ORDER_STATUS_FILLED:
+            self.working_filled_quantity = self.working_filled_quantity or self.order_quantity
+            self._close_working_order()
+            return False
+        self._close_working_order()
+        return True
+
+    def _adopt(self, client_order_id: str, price: float) -> bool:
+        """
+        Take over an order placed before the chase was resumed, found by client id.
+
+        Returns:
+            True if the order exists; the next step checks it right away
+        """
+        order = self.trade_client.fetch_order_by_client_id(symbol=self.symbol, client_order_id=client_order_id)
+        if not order.get('orderId'):
+            return False
+        self.logger.info(f"Order {client_order_id} was placed before resuming, continuing with it")
+        self.order_id = order['orderId']
+        self.last_order_id = self.order_id
+        self.ordered_price = float(order.get('price') or price)
+        self.order_quantity = float(order.get('origQty') or self.remaining_quantity)
+        self.state = CHASE_WORKING
+        self.consecutive_rejections = 0
+        self.metrics.orders += 1
+        self._order_update = order
+        self._retry_now = True
+        return True
+
+    def _place(self, price: float) -> bool:
+        quantity = self.remaining_quantity
+        client_order_id = make_client_order_id(self.client_order_prefix, self.attempts) if self.client_order_prefix else ''
+        if self._reconcile:
+            self._reconcile = False
+            if client_order_id and self._adopt(client_order_id=client_order_id, price=price):
+                return False
+
+        self.logger.debug(f"Placing MAKER order at price: {price} for quantity: {quantity}")
+        if self.metrics.first_sent_at is None:
+            self.metrics.first_sent_at = monotonic()
+        error_code: Optional[int] = None
+        outcome_unknown = False
+        try:
+            order = self.trade_client.place_order(
+                symbol=self.symbol,
+                order_side=self.order_side,
+                order_type=OrderType.LIMIT.value,
+                quantity=quantity,
+                price=price,
+                reduce_only=self.reduce_only,
+                time_in_force=self.time_in_force,
+                client_order_id=client_order_id
+            )
+            if not order or not order.get('orderId'):
+                error_code = self.trade_client.get_last_error_code()
+                outcome_unknown = bool(client_order_id) and self.trade_client.last_order_outcome_unknown()
+        except Exception as e:
+            self.logger.warning(f"Maker order placement failed: {e}")
+            order = {}
+
+        if not order or not order.get('orderId'):
+            if outcome_unknown:
+                # The order may still land: keep its client id and look it up before placing again
+                self.logger.warning(f"Outcome of order {client_order_id} is unknown, looking it up on the next step")
+                self._reconcile = True
+                return False
+            self.metrics.rejections += 1
+            # Only post-only rejections count toward the POST_ONLY retry budget / taker fallback
+            if error_code == POST_ONLY_REJECTED_ERROR_CODE:
+                self.consecutive_rejections += 1
+            if self.reduce_only and not self.trade_client.fetch_position(symbol=self.symbol):
+                self.logger.error("Position no longer exists on exchange - stopping order placement")
+                return self._finish(CHASE_ABORTED)
+            if error_code == POST_ONLY_REJECTED_ERROR_CODE:
+                # The book moved under a post-only order: re-quote right away from fresh data
+                self._retry_now = True
+            else:
+                # Anything else (margin, timestamp, network) is retried on the next step, after the poll interval
+                self.logger.warning(f"Maker order placement failed (error {error_code}), retrying on the next step")
+            return False
+
+        self.order_id = order.get('orderId', '')
+        self.last_order_id = self.order_id
+        self.ordered_price = price
+        self.order_quantity = quantity
+        self.state = CHASE_WORKING
+        self.consecutive_rejections = 0
+        self.metrics.orders += 1
+        if self.metrics.first_order_at is None:
+            self.metrics.first_order_at = monotonic()
+        self.logger.debug(f"Maker order placed: ID={self.order_id}, Price={price}")
+        return False
+
+    @property
+    def retry_now(self) -> bool:
+        """Whether the last step asks for another step right away (post-only rejection, fill on amend)."""
+        return self._retry_now
+
+    def backoff(self) -> None:
+        """Drop a pending immediate retry so the next step waits first."""
+        self._retry_now = False
+        self.consecutive_rejections = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot of the chase progress for persistence.
+
+        Monotonic timestamps are stored as elapsed seconds so the chase can be
+        resumed in another process with `restore()`.
+        """
+        now = monotonic()
+        started_at = self.metrics.started_at
+        return {
+            'state': self.state,
+            'order_id': self.order_id,
+            'last_order_id': self.last_order_id,
+            'ordered_price': self.ordered_price,
+            'order_quantity': self.order_quantity,
+            'closed_filled_quantity': self.closed_filled_quantity,
+            'working_filled_quantity': self.working_filled_quantity,
+            'anchor_price': self.anchor_price,
+            'consecutive_rejections': self.consecutive_rejections,
+            'elapsed': now - started_at if started_at else 0.0,
+            'metrics': {
+                'orders': self.metrics.orders,
+                'amends': self.metrics.amends,
+                'replaces': self.metrics.replaces,
+                'rejections': self.metrics.rejections
+            }
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """
+        Resume from a `to_dict()` snapshot.
+
+        Without a working order in the snapshot, the next placement is looked
+        up by client id first: it may have been sent before the snapshot was
+        saved.
+        """
+        self.state = data.get('state', CHASE_PENDING)
+        self.order_id = data.get('order_id', '')
+        self.last_order_id = data.get('last_order_id', '')
+        self.ordered_price = data.get('ordered_price')
+        self.order_quantity = data.get('order_quantity', 0.0)
+        self.closed_filled_quantity = data.get('closed_filled_quantity', 0.0)
+        self.working_filled_quantity = data.get('working_filled_quantity', 0.0)
+        self.anchor_price = data.get('anchor_price')
+        self.consecutive_rejections = data.get('consecutive_rejections', 0)
+        elapsed = data.get('elapsed', 0.0)
+        if elapsed:
+            self.metrics.started_at = monotonic() - elapsed
+        metrics = data.get('metrics', {})
+        self.metrics.orders = metrics.get('orders', 0)
+        self.metrics.amends = metrics.get('amends', 0)
+        self.metrics.replaces = metrics.get('replaces', 0)
+        self.metrics.reprices = self.metrics.amends + self.metrics.replaces
+        self.metrics.rejections = metrics.get('rejections', 0)
+        self._reconcile = not self.order_id and not self.done
+
+    def wait(self) -> None:
+        """
+        Block until something may need a step: the top of book moved (local
+        order book) or the working order changed (user-data stream), at most
+        `poll_interval` seconds and never past the chase deadline.
+        """
+        timeout = self.poll_interval
+        if self.max_chase_seconds:
+            timeout = min(timeout, self.metrics.started_at + self.max_chase_seconds - monotonic())
+        if timeout <= 0:
+            return
+
+        if self.trade_client.has_live_order_book(symbol=self.symbol):
+            self.trade_client.wait_for_book_change(symbol=self.symbol, timeout=timeout)
+        elif self.order_id:
+            self._order_update = self.trade_client.wait_for_order_update(
+                symbol=self.symbol,
+                order_id=self.order_id,
+                timeout=timeout
+            )
+        else:
+            sleep(min(timeout, ORDER_STATUS_CHECK_INTERVAL))
+
+    def run(self) -> str:
+        """
+        Drive the chase to a final state.
+
+        Returns:
+            Final state (CHASE_FILLED, CHASE_EXPIRED or CHASE_ABORTED)
+        """
+        immediate_retries = 0
+        while not self.step():
+            if self._retry_now and immediate_retries < MAX_IMMEDIATE_RETRIES:
+                immediate_retries += 1
+                continue
+            immediate_retries = 0
+            self.wait()
+        return self.state
+
+# EOF
@@ -0,0 +1,214 @@
+"""
+Market Data Hub
+Process-wide kline cache that fans one fetch out to all bots on the same feed.
+"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Any
+
+import pandas as pd
+
+from abstracts.base_trade_client import BaseTradeClient
+from commons.constants import MARKET_DATA_HUB_REFRESH_SECONDS
+from commons.custom_logger import CustomLogger
+
+FeedKey = Tuple[str, str, int]  # (symbol, timeframe, limit)
+
+
+@dataclass
+class _FeedEntry:
+    """Cached klines and counters for one feed."""
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    async_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    klines_df: Optional[pd.DataFrame] = None
+    fetched_at: float = 0.0
+    subscribers: int = 0
+    requests: int = 0
+    fetches: int = 0
+
+
+class MarketDataHub:
+    """
+    Shares kline fetches between bots keyed by (symbol, timeframe, limit).
+
+    - Fetches each feed at most once per refresh interval
+    - Coalesces concurrent requests: bots arriving while a fetch is in flight
+      wait for it and reuse its result instead of fetching again
+    - Hands every bot its own copy so strategies can add indicator columns
+      without touching the shared frame
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = MARKET_DATA_HUB_REFRESH_SECONDS,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize market data hub.
+
+        Args:
+            refresh_interval: Seconds a fetched frame is served before refetching
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.refresh_interval = refresh_interval
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._feeds: Dict[FeedKey, _FeedEntry] = {}
+        self._lock = threading.Lock()
+
+    def _get_entry(self, key: FeedKey) -> _FeedEntry:
+        with self._lock:
+            entry = self._feeds.get(key)
+            if entry is None:
+                entry = _FeedEntry()
+                self._feeds[key] = entry
+            return entry
+
+    def subscribe(self, symbol: str, timeframe: str, limit: int) -> None:
+        """
+        Register a bot as a consumer of a feed.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe interval
+            limit: Number of candles
+        """
+        entry = self._get_entry((symbol, timeframe, limit))
+        with entry.lock:
+            entry.subscribers += 1
+
+    def get_klines(
+        self,
+        trade_client: BaseTradeClient,
+        symbol: str,
+        timeframe: str,
+        limit: int
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get klines for a feed, fetching through `trade_client` only when stale.
+
+        Args:
+            trade_client: Client used if this call has to fetch
+            symbol: Trading pair symbol
+            timeframe: Timeframe interval
+            limit: Number of candles
+
+        Returns:
+            Private copy of the klines DataFrame, or None if fetch failed
+        """
+        entry = self._get_entry((symbol, timeframe, limit))
+
+        # Holding the feed lock across the fetch is what coalesces duplicates
+        with entry.lock:
+            entry.requests += 1
+            is_stale = (
+                entry.klines_df is None
+                or time.time() - entry.fetched_at >= self.refresh_interval
+            )
+            if is_stale:
+                klines_df = trade_client.fetch_klines(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    timeframe_limit=limit
+                )
+                entry.fetches += 1
+                if klines_df is None or klines_df.empty:
+                    return None
+                entry.klines_df = klines_df
+                entry.fetched_at = time.time()
+            klines_df = entry.klines_df
+
+        return klines_df.copy()
+
+    async def get_klines_async(
+        self,
+        trade_client: BaseTradeClient,
+        symbol: str,
+        timeframe: str,
+        limit: int
+    ) -> Optional[pd.DataFrame]:
+        """
+        Async variant of `get_klines` for bots sharing one event loop.
+
+        Coalesces on an asyncio lock so waiting bots yield to the loop instead
+        of blocking it.
+
+        Args:
+            trade_client: Client used if this call has to fetch
+            symbol: Trading pair symbol
+            timeframe: Timeframe interval
+            limit: Number of candles
+
+        Returns:
+            Private copy of the klines DataFrame, or None if fetch failed
+        """
+        entry = self._get_entry((symbol, timeframe, limit))
+
+        async with entry.async_lock:
+            entry.requests += 1
+            is_stale = (
+                entry.klines_df is None
+                or time.time() - entry.fetched_at >= self.refresh_interval
+            )
+            if is_stale:
+                klines_df = await trade_client.fetch_klines_async(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    timeframe_limit=limit
+                )
+                entry.fetches += 1
+                if klines_df is None or klines_df.empty:
+                    return None
+                entry.klines_df = klines_df
+                entry.fetched_at = time.time()
+            klines_df = entry.klines_df
+
+        return klines_df.copy()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hub usage counters.
+
+        Returns:
+            Dictionary with feed, subscriber, request, fetch and saved-fetch counts
+        """
+        with self._lock:
+            entries = list(self._feeds.values())
+        requests = sum(e.requests for e in entries)
+        fetches = sum(e.fetches for e in entries)
+        return {
+            'feeds': len(entries),
+            'subscribers': sum(e.subscribers for e in entries),
+            'requests': requests,
+            'fetches': fetches,
+            'saved_fetches': requests - fetches
+        }
+
+    def log_startup_summary(self) -> None:
+        """Log how many kline fetches per interval are saved by sharing feeds."""
+        stats = self.get_stats()
+        if not stats['feeds']:
+            return
+        saved_per_interval = stats['subscribers'] - stats['feeds']
+        self.logger.info(
+            message=f"Market data hub: {stats['subscribers']} bot(s) share {stats['feeds']} kline feed(s), "
+            f"saving {saved_per_interval} fetch(es) per {self.refresh_interval}s interval"
+        )
+        for (symbol, timeframe, limit), entry in self._feeds.items():
+            if entry.subscribers > 1:
+                self.logger.debug(
+                    message=f"Feed {symbol} {timeframe} x{limit}: {entry.subscribers} subscribers"
+                )
+
+    def log_summary(self) -> None:
+        """Log cumulative request and fetch counts."""
+        stats = self.get_stats()
+        if not stats['requests']:
+            return
+        self.logger.info(
+            message=f"Market data hub: {stats['requests']} kline request(s) served with "
+            f"{stats['fetches']} fetch(es), {stats['saved_fetches']} saved"
+        )
+
+# EOF
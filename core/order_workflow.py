@@ -0,0 +1,455 @@
+"""
+Order Workflow
+Resumable state machine for the order that opens or closes a position.
+
+A workflow never sleeps: `step()` does one pass (place, check, reprice) and
+returns, so the bot can advance it once per tick or per order event while it
+keeps monitoring and saving state. `to_dict()` / `from_dict()` persist it with
+the position, so a restarted bot resumes the working order instead of
+placing a new one. Every order carries a client order id derived from the
+workflow's prefix and attempt number; a resumed workflow looks its next
+order up by that id before placing it, in case it was sent before the
+state was saved.
+
+Phases:
+- CHASE: LIMIT, MAKER_ONLY and POST_ONLY orders, driven by a MakerChaseEngine
+- MARKET: MARKET orders, and the remainder of a chase that falls back to taker
+"""
+from time import monotonic
+from typing import Any, Callable, Dict, Optional
+
+from abstracts.base_trade_client import BaseTradeClient
+from commons.common import make_client_order_id
+from commons.constants import (
+    ORDER_STATUS_FILLED,
+    ORDER_STATUS_CHECK_INTERVAL,
+    POST_ONLY_MAX_RETRIES,
+    POST_ONLY_TAKER_FALLBACK
+)
+from commons.custom_logger import CustomLogger
+from core.maker_chase_engine import (
+    MakerChaseEngine,
+    MAX_IMMEDIATE_RETRIES,
+    CHASE_ABORTED,
+    CHASE_EXPIRED,
+    CHASE_FILLED
+)
+from models.enum.order_type import OrderType
+
+# Workflow kinds
+WORKFLOW_OPEN = 'OPEN'
+WORKFLOW_CLOSE = 'CLOSE'
+
+# Phases
+PHASE_CHASE = 'CHASE'  # limit / maker order working through the chase engine
+PHASE_MARKET = 'MARKET'  # market order
+
+# Workflow states
+WORKFLOW_WORKING = 'WORKING'
+WORKFLOW_FILLED = 'FILLED'  # order(s) filled; result_order_id holds the last one
+WORKFLOW_ABORTED = 'ABORTED'  # reduce-only order with no position left to reduce
+WORKFLOW_FAILED = 'FAILED'  # unrecoverable error, see `error`
+
+WORKFLOW_FINAL_STATES = (WORKFLOW_FILLED, WORKFLOW_ABORTED, WORKFLOW_FAILED)
+
+# Reduce-only rejection markers (-2022 ReduceOnly rejected, -4118 ReduceOnly margin check)
+REDUCE_ONLY_ERROR_MARKERS = ('reduceonly', '-2022', '-4118')
+
+# Chase factory: (order_type, order_side, reduce_only, quantity, client_order_prefix) -> chase engine
+ChaseFactory = Callable[[str, str, bool, float, str], MakerChaseEngine]
+
+
+class OrderWorkflow:
+    """
+    Non-blocking execution of one open or close order.
+
+    - MARKET places once and checks the order on every step until filled
+    - LIMIT / MAKER_ONLY / POST_ONLY step a chase engine (amend first,
+      cancel/replace fallback, partial fills carried over)
+    - POST_ONLY: after `post_only_max_retries` consecutive rejections the
+      remainder goes out as MARKET if `post_only_taker_fallback`, otherwise
+      the chase backs off until the next step
+    - An expired chase closes the rest of a reduce-only order with MARKET;
+      an entry keeps what filled, or fails if nothing did (or sends the rest
+      as MARKET with `expired_taker_fallback`, the ADAPTIVE latency budget)
+    """
+
+    def __init__(
+        self,
+        trade_client: BaseTradeClient,
+        symbol: str,
+        kind: str,
+        order_type: str,
+        order_side: str,
+        reduce_only: bool,
+        quantity: float,
+        create_chase: ChaseFactory,
+        context: Optional[Dict[str, Any]] = None,
+        client_order_prefix: str = '',
+        post_only_max_retries: int = POST_ONLY_MAX_RETRIES,
+        post_only_taker_fallback: bool = POST_ONLY_TAKER_FALLBACK,
+        expired_taker_fallback: bool = False,
+        poll_interval: float = 0,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize workflow.
+
+        Args:
+            trade_client: Client to trade through
+            symbol: Trading pair symbol
+            kind: WORKFLOW_OPEN or WORKFLOW_CLOSE
+            order_type: OrderType value (MARKET, LIMIT, MAKER_ONLY, POST_ONLY)
+            order_side: 'BUY' or 'SELL'
+            reduce_only: Whether orders should only reduce position
+            quantity: Target quantity
+            create_chase: Builds the chase engine of LIMIT / MAKER_ONLY / POST_ONLY orders
+            context: Caller data kept with the workflow (signal reason, candle, ...)
+            client_order_prefix: Client order id prefix of the workflow's orders ('' = none)
+            post_only_max_retries: Consecutive POST_ONLY rejections before falling back or backing off
+            post_only_taker_fallback: Send the POST_ONLY remainder as MARKET once retries are spent
+            expired_taker_fallback: Send the remainder of an expired entry chase as MARKET
+            poll_interval: Max seconds `wait()` blocks (0 = no wait, backtest)
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.trade_client = trade_client
+        self.symbol = symbol
+        self.kind = kind
+        self.order_type = order_type
+        self.order_side = order_side
+        self.reduce_only = reduce_only
+        self.quantity = quantity
+        self.context: Dict[str, Any] = context if context is not None else {}
+        self.client_order_prefix = client_order_prefix
+        self.post_only_max_retries = post_only_max_retries
+        self.post_only_taker_fallback = post_only_taker_fallback
+        self.expired_taker_fallback = expired_taker_fallback
+        self.poll_interval = poll_interval
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+
+        self.state = WORKFLOW_WORKING
+        self.error = ''
+        self.market_order_id = ''
+        self.market_quantity = 0.0
+        self.result_order_id = ''  # order whose trade history describes the fill
+        self.built_at: Optional[float] = monotonic()  # monotonic time the workflow was built (None if resumed)
+        self.market_sent_at: Optional[float] = None  # monotonic time the market order was sent
+        self.market_acked_at: Optional[float] = None  # monotonic time the market order was acknowledged
+        self.market_filled_at: Optional[float] = None  # monotonic time the market order was seen filled
+        self.chase: Optional[MakerChaseEngine] = None
+        self._order_update: Optional[Dict[str, Any]] = None  # order state delivered by wait()
+        self._reconcile = False  # look the market order up by client id first (resumed workflow)
+
+        if order_type == OrderType.MARKET.value:
+            self.phase = PHASE_MARKET
+            self.market_quantity = quantity
+        else:
+            self.phase = PHASE_CHASE
+            self.chase = create_chase(order_type, order_side, reduce_only, quantity, client_order_prefix)
+
+    @property
+    def done(self) -> bool:
+        return self.state in WORKFLOW_FINAL_STATES
+
+    @property
+    def acked_at(self) -> Optional[float]:
+        """Monotonic time the workflow's first order was acknowledged by the exchange (this process only)."""
+        if self.chase is not None and self.chase.metrics.first_order_at is not None:
+            return self.chase.metrics.first_order_at
+        return self.market_acked_at
+
+    @property
+    def sent_at(self) -> Optional[float]:
+        """Monotonic time the workflow's first order was sent (this process only)."""
+        if self.chase is not None and self.chase.metrics.first_sent_at is not None:
+            return self.chase.metrics.first_sent_at
+        return self.market_sent_at
+
+    @property
+    def first_fill_at(self) -> Optional[float]:
+        """Monotonic time the first fill was seen (this process only)."""
+        if self.chase is not None and self.chase.metrics.first_fill_at is not None:
+            return self.chase.metrics.first_fill_at
+        return self.market_filled_at
+
+    @property
+    def filled_at(self) -> Optional[float]:
+        """Monotonic time the workflow was seen fully filled (this process only)."""
+        if self.market_filled_at is not None:
+            return self.market_filled_at
+        return self.chase.metrics.filled_at if self.chase is not None else None
+
+    @property
+    def retry_now(self) -> bool:
+        """Whether the last step asks for another step right away."""
+        return self.phase == PHASE_CHASE and self.chase is not None and self.chase.retry_now
+
+    def _finish(self, state: str) -> bool:
+        self.state = state
+        return True
+
+    def step(self) -> bool:
+        """
+        Advance the workflow by one non-blocking pass.
+
+        Returns:
+            True once the workflow reached a final state
+
+        Raises:
+            Exception: Errors of the underlying order calls; the workflow is FAILED
+        """
+        if self.done:
+            return True
+        try:
+            if self.phase == PHASE_CHASE:
+                return self._step_chase()
+            return self._step_market()
+        except Exception as e:
+            self.state = WORKFLOW_FAILED
+            self.error = str(e)
+            raise
+
+    def _step_chase(self) -> bool:
+        chase: MakerChaseEngine = self.chase  # type: ignore[assignment]
+        if not chase.step():
+            if self.order_type == OrderType.POST_ONLY.value and chase.consecutive_rejections > self.post_only_max_retries:
+                if self.post_only_taker_fallback:
+                    self.logger.warning(f"Post-only rejected {chase.consecutive_rejections} times, sending remaining {chase.remaining_quantity} as MARKET")
+                    return self._start_market(quantity=chase.remaining_quantity)
+                self.logger.warning(f"Post-only rejected {chase.consecutive_rejections} times, backing off")
+                chase.backoff()
+            return False
+
+        self.result_order_id = chase.last_order_id
+        self._log_chase()
+
+        if chase.state == CHASE_ABORTED:
+            return self._finish(WORKFLOW_ABORTED)
+        if chase.state == CHASE_EXPIRED and chase.remaining_quantity > 0:
+            if self.reduce_only or self.expired_taker_fallback:
+                self.logger.warning(f"Chase expired, sending remaining {chase.remaining_quantity} as MARKET")
+                return self._start_market(quantity=chase.remaining_quantity)
+            if chase.filled_quantity <= 0:
+                raise ValueError("Maker chase expired without a fill")
+        return self._finish(WORKFLOW_FILLED)
+
+    def _log_chase(self) -> None:
+        chase: MakerChaseEngine = self.chase  # type: ignore[assignment]
+        metrics = chase.metrics
+        if metrics.reprices or metrics.rejections or chase.state != CHASE_FILLED:
+            time_to_fill = f"{metrics.time_to_fill:.2f}s" if metrics.time_to_fill is not None else "n/a"
+            self.logger.info(
+                f"{self.order_type} chase {chase.state}: filled {chase.filled_quantity}/{chase.quantity}, time to fill {time_to_fill}, "
+                f"{metrics.reprices} reprices ({metrics.amends} amended, {metrics.replaces} cancel/replace), "
+                f"{metrics.rejections} rejections"
+            )
+
+    def _start_market(self, quantity: float) -> bool:
+        self.phase = PHASE_MARKET
+        self.market_quantity = quantity
+        return self._step_market()
+
+    def _position_gone(self) -> bool:
+        """Check whether the position a reduce-only order targets no longer exists."""
+        try:
+            return not self.trade_client.fetch_position(symbol=self.symbol)
+        except Exception as e:
+            self.logger.error_e("Error checking position status, assuming position is closed", e=e)
+            return True
+
+    def _step_market(self) -> bool:
+        if not self.market_order_id:
+            return self._place_market()
+
+        order = self._order_update or self.trade_client.fetch_order(symbol=self.symbol, order_id=self.market_order_id)
+        self._order_update = None
+        if order.get('status') == ORDER_STATUS_FILLED:
+            self.market_filled_at = monotonic()
+            self.logger.info(message="Market Order filled")
+            return self._finish(WORKFLOW_FILLED)
+        self.logger.debug(message="Market Order still pending. Waiting...")
+        return False
+
+    def _market_client_order_id(self) -> str:
+        """Client id of the market order; numbered after the chase attempts it takes over from."""
+        if not self.client_order_prefix:
+            return ''
+        return make_client_order_id(self.client_order_prefix, self.chase.attempts if self.chase is not None else 0)
+
+    def _place_market(self) -> bool:
+        client_order_id = self._market_client_order_id()
+        order: Dict[str, Any] = {}
+        if self._reconcile and client_order_id:
+            order = self.trade_client.fetch_order_by_client_id(symbol=self.symbol, client_order_id=client_order_id)
+            if order:
+                self.logger.info(message=f"Market order {client_order_id} was placed before resuming, continuing with it")
+        self._reconcile = False
+
+        if not order:
+            self.logger.debug(message='Placing market order')
+            if self.market_sent_at is None:
+                self.market_sent_at = monotonic()
+            try:
+                order = self.trade_client.place_order(
+                    symbol=self.symbol,
+                    order_side=self.order_side,
+                    order_type=OrderType.MARKET.value,
+                    quantity=self.market_quantity,
+                    reduce_only=self.reduce_only,
+                    client_order_id=client_order_id
+                )
+            except Exception as e:
+                if self.reduce_only and any(marker in str(e).lower() for marker in REDUCE_ONLY_ERROR_MARKERS):
+                    self.logger.warning("ReduceOnly order rejected - checking if position still exists")
+                    if self._position_gone():
+                        self.logger.error("Position no longer exists on exchange")
+                        return self._finish(WORKFLOW_ABORTED)
+                raise
+
+        # place_order returns an empty result on HTTP errors
+        if not order or not order.get('orderId'):
+            if self.reduce_only:
+                self.logger.warning("Market order placement failed with reduce_only=True - checking if position still exists")
+                if self._position_gone():
+                    self.logger.error("Position no longer exists on exchange")
+                    return self._finish(WORKFLOW_ABORTED)
+            self.logger.error("Market order placement failed - no order ID returned")
+            raise ValueError("Market order placement failed")
+
+        self.market_order_id = str(order.get('orderId'))
+        self.result_order_id = self.market_order_id
+        self.market_acked_at = monotonic()
+        if order.get('status') == ORDER_STATUS_FILLED:
+            self.market_filled_at = self.market_acked_at
+            self.logger.info(message="Market Order filled")
+            return self._finish(WORKFLOW_FILLED)
+        return False
+
+    def wait(self) -> None:
+        """
+        Block until the workflow may need a step: book or order events for a
+        chase, an order update for a market order, at most `poll_interval`.
+        """
+        if self.done or self.poll_interval <= 0:
+            return
+        if self.phase == PHASE_CHASE and self.chase is not None:
+            self.chase.wait()
+        elif self.market_order_id:
+            self._order_update = self.trade_client.wait_for_order_update(
+                symbol=self.symbol,
+                order_id=self.market_order_id,
+                timeout=min(self.poll_interval, ORDER_STATUS_CHECK_INTERVAL)
+            )
+
+    def advance(self) -> bool:
+        """
+        Step without blocking, repeating only the steps that ask for an
+        immediate retry (post-only rejection, fill on amend).
+
+        Returns:
+            True once the workflow reached a final state
+        """
+        for _ in range(MAX_IMMEDIATE_RETRIES + 1):
+            if self.step():
+                return True
+            if not self.retry_now:
+                break
+        return False
+
+    def run(self) -> str:
+        """
+        Drive the workflow to a final state, waiting between steps.
+
+        Returns:
+            Final state
+        """
+        while not self.advance():
+            self.wait()
+        return self.state
+
+    def order_trade(self) -> Dict[str, Any]:
+        """
+        Trade details of the filled order.
+
+        Raises:
+            ValueError: If the workflow was aborted (position already closed) or failed
+        """
+        if self.state == WORKFLOW_ABORTED:
+            raise ValueError("Position already closed, cannot place reduce_only order")
+        if self.state == WORKFLOW_FAILED:
+            raise ValueError(self.error or "Order workflow failed")
+        return self.trade_client.fetch_order_trade(symbol=self.symbol, order_id=self.result_order_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot for persistence with the position state."""
+        return {
+            'kind': self.kind,
+            'order_type': self.order_type,
+            'order_side': self.order_side,
+            'reduce_only': self.reduce_only,
+            'quantity': self.quantity,
+            'context': self.context,
+            'client_order_prefix': self.client_order_prefix,
+            'state': self.state,
+            'error': self.error,
+            'phase': self.phase,
+            'market_order_id': self.market_order_id,
+            'market_quantity': self.market_quantity,
+            'result_order_id': self.result_order_id,
+            'chase': self.chase.to_dict() if self.chase is not None else {}
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        trade_client: BaseTradeClient,
+        symbol: str,
+        create_chase: ChaseFactory,
+        post_only_max_retries: int = POST_ONLY_MAX_RETRIES,
+        post_only_taker_fallback: bool = POST_ONLY_TAKER_FALLBACK,
+        expired_taker_fallback: bool = False,
+        poll_interval: float = 0,
+        logger: Optional[CustomLogger] = None
+    ) -> 'OrderWorkflow':
+        """
+        Resume a workflow from a `to_dict()` snapshot.
+
+        Args:
+            data: Snapshot
+            trade_client, symbol, create_chase, post_only_max_retries,
+            post_only_taker_fallback, expired_taker_fallback, poll_interval, logger: As in `__init__`
+
+        Returns:
+            Workflow continuing where the snapshot left off
+        """
+        workflow = cls(
+            trade_client=trade_client,
+            symbol=symbol,
+            kind=data['kind'],
+            order_type=data['order_type'],
+            order_side=data['order_side'],
+            reduce_only=data.get('reduce_only', False),
+            quantity=data['quantity'],
+            create_chase=create_chase,
+            context=data.get('context', {}),
+            client_order_prefix=data.get('client_order_prefix', ''),
+            post_only_max_retries=post_only_max_retries,
+            post_only_taker_fallback=post_only_taker_fallback,
+            expired_taker_fallback=expired_taker_fallback,
+            poll_interval=poll_interval,
+            logger=logger
+        )
+        workflow.built_at = None
+        workflow.state = data.get('state', WORKFLOW_WORKING)
+        workflow.error = data.get('error', '')
+        workflow.phase = data.get('phase', workflow.phase)
+        workflow.market_order_id = data.get('market_order_id', '')
+        workflow.market_quantity = data.get('market_quantity', workflow.market_quantity)
+        workflow.result_order_id = data.get('result_order_id', '')
+        workflow._reconcile = workflow.phase == PHASE_MARKET and not workflow.market_order_id and not workflow.done
+        if workflow.chase is not None and data.get('chase'):
+            workflow.chase.restore(data['chase'])
+        return workflow
+
+# EOF
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from commons.constants import (
     POSITION_RECORDS_DIR,
@@ -53,6 +53,9 @@ class PositionHandler:
         self.cooldown_until: str = ''  # Timestamp when cooldown expires (GMT+7 format)
         self.cooldown_reason: str = ''  # Reason for cooldown (e.g., "SL_HIT", "EXIT_STRATEGY")
 
+        # Snapshot of the open/close order workflow still working (see core.order_workflow)
+        self.pending_order: Dict[str, Any] = {}
+
         # Ensure directories exist
         self._ensure_directories()
         
@@ -159,6 +162,18 @@ class PositionHandler:
         """Get SL order ID (legacy method)."""
         return self.sl_order_id
     
+    def next_protective_sequence(self) -> int:
+        """
+        Number the next TP/SL placement of the position (persisted with it).
+        
+        Returns:
+            Sequence number starting at 1, or 0 without a position
+        """
+        if not self.position:
+            return 0
+        self.position.protective_sequence += 1
+        return self.position.protective_sequence
+    
     def update_last_known_price(self, price: float) -> None:
         """Update the last known market price for the position."""
         self._last_known_price = price
@@ -303,7 +318,7 @@ class PositionHandler:
         
         Args:
             position_dict: Dictionary with close_fee, close_reason, close_price, pnl,
-                          current_candle_open_time (current candle when closing),
+                          close_execution, current_candle_open_time (current candle when closing),
                           and optionally close_time (for backtest mode)
         
         Returns:
@@ -316,6 +331,7 @@ class PositionHandler:
         self.position.close_fee = position_dict.get('close_fee', 0.0)
         self.position.close_reason = position_dict.get('close_reason', '')
         self.position.close_price = position_dict.get('close_price', 0.0)
+        self.position.close_execution = position_dict.get('close_execution', {})
         
         # Use close_time from dict if provided (backtest mode), otherwise use current time
         if 'close_time' in position_dict:
@@ -421,8 +437,19 @@ class PositionHandler:
         self._dump_position(file_path=file_path)
 
     def dump_position_state(self) -> None:
-        """Save current position state to file."""
-        self._dump_position(file_path=self.position_state_file_path)
+        """Save current position state, and the working order workflow if any, to file."""
+        if not self.pending_order:
+            self._dump_position(file_path=self.position_state_file_path)
+            return
+        
+        # An entry order may be working before any position exists
+        state = self.position.to_dict() if self.position else {}
+        state['pending_order'] = self.pending_order
+        try:
+            with open(file=self.position_state_file_path, mode="w", encoding="utf-8") as f:
+                json.dump(obj=state, fp=f, indent=4)
+        except IOError as e:
+            self.logger.error_e(message=f"Failed to dump position state to {self.position_state_file_path}", e=e)
 
     def read_position_state(self) -> None:
         """Restore position state from file if it exists."""
@@ -432,6 +459,11 @@ class PositionHandler:
         try:
             with open(file=self.position_state_file_path, mode='r', encoding="utf-8") as f:
                 data = json.load(fp=f)
+                self.pending_order = data.pop('pending_order', {})
+                if self.pending_order:
+                    self.logger.info(message=f"Restored working {self.pending_order.get('kind', '')} order workflow")
+                if 'position_side' not in data:
+                    return
                 self.position = Position.from_dict(data=data)
                 self.position.run_id = self.bot_config.run_id
                 
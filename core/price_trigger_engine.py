@@ -0,0 +1,206 @@
+"""
+Price Trigger Engine
+Process-wide index of client-side exit levels, fired from price updates.
+
+Exit strategies evaluate price thresholds once per bot tick, so a target can
+be crossed and crossed back between two ticks. Bots arm the levels of their
+open position here (`set_triggers`); each price update fires only the crossed
+levels and calls their owner, which wakes the bot to run its close path.
+
+Levels are kept per symbol in two sorted lists laid out so that the crossed
+levels are always a tail: ABOVE levels keyed by -price, BELOW levels keyed by
+price. A price update costs one bisect per side plus the fired tail,
+O(log n + k), however many bots watch the symbol.
+"""
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from commons.custom_logger import CustomLogger
+from models.enum.trigger_direction import TriggerDirection
+from models.price_trigger import PriceTrigger
+
+# Callback: (fired trigger, price that crossed it) -> None
+TriggerCallback = Callable[[PriceTrigger, float], None]
+
+
+@dataclass
+class _ArmedTrigger:
+    owner: str
+    symbol: str
+    trigger: PriceTrigger
+    callback: TriggerCallback
+
+    @property
+    def key(self) -> float:
+        return -self.trigger.price if self.trigger.direction == TriggerDirection.ABOVE else self.trigger.price
+
+
+@dataclass
+class _SortedLevels:
+    """Armed triggers of one side of a symbol, sorted by key (crossed ones form the tail)."""
+    keys: List[float] = field(default_factory=list)
+    triggers: List[_ArmedTrigger] = field(default_factory=list)
+
+    def add(self, armed: _ArmedTrigger) -> None:
+        index = bisect.bisect_right(self.keys, armed.key)
+        self.keys.insert(index, armed.key)
+        self.triggers.insert(index, armed)
+
+    def remove(self, armed: _ArmedTrigger) -> None:
+        start = bisect.bisect_left(self.keys, armed.key)
+        end = bisect.bisect_right(self.keys, armed.key)
+        for index in range(start, end):
+            if self.triggers[index] is armed:
+                del self.keys[index]
+                del self.triggers[index]
+                return
+
+    def pop_from(self, key: float) -> List[_ArmedTrigger]:
+        """Remove and return every trigger with key >= `key`."""
+        index = bisect.bisect_left(self.keys, key)
+        fired = self.triggers[index:]
+        del self.keys[index:]
+        del self.triggers[index:]
+        return fired
+
+
+@dataclass
+class _SymbolLevels:
+    above: _SortedLevels = field(default_factory=_SortedLevels)
+    below: _SortedLevels = field(default_factory=_SortedLevels)
+
+    def side(self, direction: TriggerDirection) -> _SortedLevels:
+        return self.above if direction == TriggerDirection.ABOVE else self.below
+
+
+class PriceTriggerEngine:
+    """
+    Sorted per-symbol trigger index shared by every bot in the process.
+
+    - Each owner (bot) has one set of armed triggers; arming replaces it
+    - A trigger fires once; the first crossed trigger of an owner disarms
+      the rest, so one price update closes a position at most once
+    - Callbacks run on the thread delivering the price, outside the lock
+    """
+
+    _instance: Optional['PriceTriggerEngine'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Initialize price trigger engine.
+
+        Args:
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._levels: Dict[str, _SymbolLevels] = {}
+        self._owners: Dict[str, List[_ArmedTrigger]] = {}
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self._updates = 0
+        self._fired = 0
+
+    @classmethod
+    def get_instance(cls) -> 'PriceTriggerEngine':
+        """Get the process-wide engine, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _disarm(self, owner: str) -> None:
+        for armed in self._owners.pop(owner, []):
+            self._levels[armed.symbol].side(armed.trigger.direction).remove(armed)
+
+    def set_triggers(
+        self,
+        owner: str,
+        symbol: str,
+        triggers: List[PriceTrigger],
+        callback: TriggerCallback
+    ) -> None:
+        """
+        Arm an owner's triggers, replacing the ones it armed before.
+
+        Args:
+            owner: Owner id (bot name)
+            symbol: Trading pair symbol the levels apply to
+            triggers: Levels to watch (empty disarms the owner)
+            callback: Called once with (trigger, price) when a level is crossed
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            self._disarm(owner=owner)
+            if not triggers:
+                return
+            levels = self._levels.setdefault(symbol, _SymbolLevels())
+            armed_triggers = []
+            for trigger in triggers:
+                armed = _ArmedTrigger(owner=owner, symbol=symbol, trigger=trigger, callback=callback)
+                levels.side(trigger.direction).add(armed)
+                armed_triggers.append(armed)
+            self._owners[owner] = armed_triggers
+
+    def clear(self, owner: str) -> None:
+        """Disarm every trigger of an owner."""
+        with self._lock:
+            self._disarm(owner=owner)
+
+    def on_price(self, symbol: str, price: float) -> None:
+        """
+        Fire the triggers a price update crossed.
+
+        Args:
+            symbol: Trading pair symbol
+            price: Latest trade / quote price
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            self._updates += 1
+            levels = self._levels.get(symbol)
+            if levels is None:
+                return
+            crossed = levels.above.pop_from(-price) + levels.below.pop_from(price)
+            if not crossed:
+                return
+
+            # First crossed trigger per owner fires; the owner's other levels are disarmed
+            crossed_ids = {id(armed) for armed in crossed}
+            fired: Dict[str, _ArmedTrigger] = {}
+            for armed in crossed:
+                if armed.owner in fired:
+                    continue
+                fired[armed.owner] = armed
+                self._owners[armed.owner] = [
+                    other for other in self._owners.get(armed.owner, []) if id(other) not in crossed_ids
+                ]
+                self._disarm(owner=armed.owner)
+            self._fired += len(fired)
+
+        for armed in fired.values():
+            self.logger.debug(message=f"{symbol} price {price} crossed {armed.trigger.direction.value} {armed.trigger.price} ({armed.owner})")
+            try:
+                armed.callback(armed.trigger, price)
+            except Exception as e:
+                self.logger.error_e(message=f"Price trigger callback failed for {armed.owner}", e=e)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get engine counters.
+
+        Returns:
+            Dictionary with symbol, armed trigger, price update and fired counts
+        """
+        with self._lock:
+            return {
+                'symbols': len(self._levels),
+                'armed': sum(len(armed) for armed in self._owners.values()),
+                'updates': self._updates,
+                'fired': self._fired
+            }
+
+# EOF
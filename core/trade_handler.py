@@ -1,28 +1,47 @@
-from time import sleep
-from typing import Dict, Any
-from decimal import Decimal, ROUND_UP
+from typing import Dict, Any, List, Optional, Tuple
+
+import pandas as pd
+from time import monotonic, perf_counter
 
 from abstracts.base_trade_client import BaseTradeClient
+from commons.common import client_order_id_prefix, make_client_order_id
 from commons.constants import (
-    ORDER_PLACEMENT_WAIT,
-    ORDER_STATUS_CHECK_INTERVAL,
+    ENTRY_PRESTAGE_REFRESH_SECONDS,
+    ENTRY_PRESTAGE_MAX_AGE_SECONDS,
     LIMIT_ORDER_PRICE_CHECK_INTERVAL,
     ORDER_STATUS_FILLED,
-    ALGO_ORDER_STATUS_FINISHED
+    ALGO_ORDER_STATUS_FINISHED,
+    POST_ONLY_MAX_RETRIES,
+    POST_ONLY_TAKER_FALLBACK,
+    MAKER_CHASE_REPRICE_THRESHOLD_TICKS,
+    MAKER_CHASE_MAX_SECONDS,
+    MAKER_CHASE_MAX_SLIPPAGE_TICKS,
+    ADAPTIVE_LATENCY_BUDGET_SECONDS,
+    ADAPTIVE_MIN_FILL_PROBABILITY,
+    ADAPTIVE_WIDE_SPREAD_TICKS,
+    ADAPTIVE_TRADE_FLOW_CANDLES
 )
 from commons.custom_logger import CustomLogger
+from commons.latency_stats import LatencyStats
+from core.execution_metrics import ExecutionMetrics, ExecutionRecord
+from core.execution_mode_selector import ExecutionModeSelector
+from core.maker_chase_engine import MakerChaseEngine
+from core.order_workflow import OrderWorkflow, WORKFLOW_OPEN, WORKFLOW_CLOSE
 from core.position_handler import PositionHandler
 from models.bot_config import BotConfig
 from models.enum.order_side import OrderSide
 from models.enum.order_type import OrderType
 from models.enum.position_side import PositionSide
 from models.enum.run_mode import RunMode
+from models.order_leg import OrderLeg
+from models.staged_entry import StagedEntry
+from models.symbol_filters import SymbolFilters
 
 
 class TradeHandler:
     """
     Handles all trading execution logic including:
-    - Order placement (market, limit, maker-only)
+    - Order placement (market, limit, maker-only, post-only, adaptive) as resumable workflows
     - TP/SL placement & cancellation
     - TP/SL monitoring
     - Position open/close execution
@@ -42,7 +61,22 @@ class TradeHandler:
         self.logger = logger
         self.position_handler = position_handler
         self._cached_quantity: float = 0.0  # Cache calculated quantity for current position
-    
+        self.order_workflow: Optional[OrderWorkflow] = None  # Open/close order still working
+        self._order_sequence: int = 0  # Numbers open/close workflows in client order ids
+        self._staged_entry: Optional[StagedEntry] = None  # Entry prepared while near a signal
+        self._entry_signal_at: Optional[float] = None  # Monotonic time of the entry signal being executed
+        self.entry_latency = LatencyStats()  # Signal-to-ack latency of entry orders
+        self._execution: Optional[ExecutionRecord] = None  # Lifecycle of the working open/close order
+        self.execution_metrics = ExecutionMetrics.get_instance()  # Rolling per-bot / per-symbol execution histograms
+        self.execution_mode_selector: Optional[ExecutionModeSelector] = (
+            self._create_execution_mode_selector() if bot_config.order_type == OrderType.ADAPTIVE else None
+        )  # Picks each order's execution mode (ADAPTIVE only)
+
+    @property
+    def symbol_filters(self) -> Optional[SymbolFilters]:
+        """Integer-scaled filters of the bot's symbol (None until exchange info is cached)."""
+        return self.trade_client.get_symbol_filters(self.bot_config.symbol)
+
     def calculate_quantity_from_margin(self, current_price: float) -> float:
         """
         Calculate position quantity from fixed margin amount.
@@ -73,19 +107,17 @@ class TradeHandler:
         # Calculate raw quantity
         raw_quantity = (self.bot_config.position_margin * self.bot_config.leverage) / current_price
         
-        # Get exchange info for quantity precision
-        exchange_info = self.trade_client.get_cached_exchange_info(self.bot_config.symbol)
-        if not exchange_info:
+        # Get symbol filters for quantity precision
+        symbol_filters = self.symbol_filters
+        if symbol_filters is None:
             self.logger.warning("Exchange info not cached, using raw quantity")
             return raw_quantity
         
-        # Round to step size (quantity precision)
-        step_size = exchange_info.get('stepSize', 0.001)
-        quantity_decimal = Decimal(str(raw_quantity))
-        step_decimal = Decimal(str(step_size))
-        
         # Round down to nearest step size
-        rounded_quantity = float((quantity_decimal // step_decimal) * step_decimal)
+        rounded_quantity = symbol_filters.floor_quantity(raw_quantity)
+        rejection = symbol_filters.validate(quantity=rounded_quantity, price=current_price)
+        if rejection:
+            self.logger.warning(message=f"Calculated quantity would be rejected: {rejection}")
         
         self.logger.debug(
             f"Calculated quantity: {rounded_quantity} "
@@ -136,6 +168,131 @@ class TradeHandler:
         self._cached_quantity = abs(quantity)
         self.logger.debug(message=f"Updated cached quantity to {quantity}")
 
+    def prestage_entry(self) -> StagedEntry:
+        """
+        Prepare the entry order while the strategy reports a signal is near.
+        
+        Computes the rounded trade quantity (fetching the price in fixed
+        margin mode) and warms the exchange connection, so once the signal
+        fires the order only needs its timestamp, signature and send.
+        Refreshed at most every ENTRY_PRESTAGE_REFRESH_SECONDS.
+        
+        Returns:
+            The staged entry
+        """
+        staged = self._staged_entry
+        if staged is not None and staged.age < ENTRY_PRESTAGE_REFRESH_SECONDS:
+            return staged
+        
+        if self.bot_config.uses_fixed_margin():
+            price = self.trade_client.fetch_price(symbol=self.bot_config.symbol)
+            quantity = self.calculate_quantity_from_margin(price)
+        else:
+            price = 0.0
+            quantity = self.get_trade_quantity()
+        self.trade_client.warm_connection()
+        
+        self._staged_entry = StagedEntry(quantity=quantity, price=price, staged_at=monotonic())
+        self.logger.debug(message=f"Entry pre-staged: quantity {quantity} @ {price}")
+        return self._staged_entry
+
+    def _use_staged_entry(self) -> None:
+        """Adopt a fresh staged entry's quantity for the entry order; stale ones are dropped."""
+        staged = self._staged_entry
+        self._staged_entry = None
+        if staged is None or staged.age > ENTRY_PRESTAGE_MAX_AGE_SECONDS:
+            return
+        if self.bot_config.uses_fixed_margin() and self._cached_quantity <= 0:
+            self._cached_quantity = staged.quantity
+
+    def _record_entry_latency(self, workflow: OrderWorkflow) -> None:
+        """Record signal-to-ack latency once the entry's first order is acknowledged."""
+        if self._entry_signal_at is None or workflow.kind != WORKFLOW_OPEN:
+            return
+        acked_at = workflow.acked_at
+        if acked_at is None:
+            if workflow.done:
+                self._entry_signal_at = None
+            return
+        self.entry_latency.add(acked_at - self._entry_signal_at)
+        self._entry_signal_at = None
+        self.logger.info(message=f"{self.bot_config.symbol} | signal-to-ack {self.entry_latency}")
+
+    def _start_execution(self, workflow: OrderWorkflow, signal_at: Optional[float], reference_price: float) -> None:
+        """Start the lifecycle record of a new open/close order."""
+        self._execution = ExecutionRecord(
+            kind=workflow.kind,
+            order_type=workflow.order_type,
+            order_side=workflow.order_side,
+            reference_price=reference_price,
+            signal_at=signal_at if signal_at is not None else workflow.built_at,
+            built_at=workflow.built_at
+        )
+
+    def _finish_execution(self, workflow: OrderWorkflow, fill_price: float) -> Dict[str, Any]:
+        """
+        Complete the order's lifecycle record with its fill and add it to the histograms.
+        
+        A workflow resumed after a restart has no signal time; only its
+        slippage against the persisted reference price is recorded.
+        
+        Returns:
+            Execution summary stored in the position record
+        """
+        execution = self._execution
+        self._execution = None
+        if execution is None:
+            execution = ExecutionRecord(
+                kind=workflow.kind,
+                order_type=workflow.order_type,
+                order_side=workflow.order_side,
+                reference_price=float(workflow.context.get('reference_price', 0.0)),
+                signal_at=None
+            )
+        execution.sent_at = workflow.sent_at
+        execution.acked_at = workflow.acked_at
+        execution.first_fill_at = workflow.first_fill_at
+        execution.filled_at = workflow.filled_at
+        execution.fill_price = fill_price
+        self.execution_metrics.record(
+            bot_name=self.bot_config.bot_name,
+            symbol=self.bot_config.symbol,
+            execution=execution
+        )
+        
+        summary = execution.to_dict()
+        self._log_execution(
+            f"{self.bot_config.symbol} | {workflow.kind} {workflow.order_type} execution | "
+            f"signal-to-fill {summary['signal_to_filled_ms']}ms (ack {summary['signal_to_acked_ms']}ms) | "
+            f"slippage {'n/a' if summary['slippage_bps'] is None else str(summary['slippage_bps']) + 'bps'} "
+            f"({execution.reference_price} -> {fill_price})"
+        )
+        
+        decision = workflow.context.get('execution_decision')
+        if decision and self.execution_mode_selector is not None:
+            summary['decision'] = decision
+            self._log_execution(
+                f"{self.bot_config.symbol} | {workflow.kind} "
+                f"{self.execution_mode_selector.record_outcome(decision=decision, execution=summary)}"
+            )
+        return summary
+
+    def _log_execution(self, message: str) -> None:
+        """Log an execution report (debug in backtest, where every order produces one)."""
+        if self.bot_config.run_mode == RunMode.BACKTEST:
+            self.logger.debug(message=message)
+        else:
+            self.logger.info(message=message)
+
+    def get_execution_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Rolling execution histograms of this bot per order type.
+        
+        Returns:
+            {order_type: {metric: summary}} (latencies in ms, slippage in bps)
+        """
+        return self.execution_metrics.summary(scope=f"bot:{self.bot_config.bot_name}")
+
     def round_to_tick_size(self, price: float, tick_size: float, order_side: str) -> float:
         """
         Round price to valid tick size with proper precision.
@@ -148,15 +305,21 @@ class TradeHandler:
         Returns:
             Rounded price
         """
-        price_decimal = Decimal(str(price))
-        tick_decimal = Decimal(str(tick_size))
+        symbol_filters = self._filters_for_tick_size(tick_size=tick_size)
         
         if order_side == OrderSide.BUY.value:
             # Round DOWN for BUY to ensure price < best_bid (maker)
-            return float((price_decimal // tick_decimal) * tick_decimal)
+            return symbol_filters.floor_price(price)
         else:
             # Round UP for SELL to ensure price > best_ask (maker)
-            return float((price_decimal / tick_decimal).to_integral_value(rounding=ROUND_UP) * tick_decimal)
+            return symbol_filters.ceil_price(price)
+
+    def _filters_for_tick_size(self, tick_size: float) -> SymbolFilters:
+        """The symbol's filters, or price-only filters for a tick size other than the symbol's."""
+        symbol_filters = self.symbol_filters
+        if symbol_filters is not None and symbol_filters.has_tick_size(tick_size):
+            return symbol_filters
+        return SymbolFilters.create(symbol=self.bot_config.symbol, tick_size=tick_size, step_size=tick_size)
 
     def calculate_maker_price(self, order_side: str, tick_size: float, offset_ticks: int = 1) -> float:
         """
@@ -176,23 +339,22 @@ class TradeHandler:
             self.logger.error("Failed to fetch order book")
             raise ValueError("Failed to fetch order book")
         
-        best_bid = Decimal(str(order_book['bids'][0][0]))
-        best_ask = Decimal(str(order_book['asks'][0][0]))
-        tick = Decimal(str(tick_size))
-        offset = Decimal(str(offset_ticks)) * tick
+        best_bid = float(order_book['bids'][0][0])
+        best_ask = float(order_book['asks'][0][0])
+        symbol_filters = self._filters_for_tick_size(tick_size=tick_size)
         
         self.logger.debug(f"Order book: Best Bid={best_bid}, Best Ask={best_ask}")
         
         if order_side == OrderSide.BUY.value:
             # For BUY: price must be < best_bid to be maker
-            maker_price = best_bid - offset
+            maker_price = symbol_filters.add_ticks(best_bid, -offset_ticks)
         else:
             # For SELL: price must be > best_ask to be maker
-            maker_price = best_ask + offset
+            maker_price = symbol_filters.add_ticks(best_ask, offset_ticks)
         
         # Round to tick size
         rounded_price = self.round_to_tick_size(
-            price=float(maker_price),
+            price=maker_price,
             tick_size=tick_size,
             order_side=order_side
         )
@@ -200,149 +362,381 @@ class TradeHandler:
         self.logger.debug(f"Calculated maker price: {rounded_price} (offset={offset_ticks} ticks)")
         return rounded_price
 
-    def place_tp_order(self, position_side: PositionSide, tp_price: float) -> Dict[str, Any]:
+    def calculate_inside_spread_price(self, order_side: str, tick_size: float) -> float:
         """
-        Place hybrid take profit orders: LIMIT (0% fee) + STOP_MARKET backup.
+        Calculate a price one tick better than the touch, inside the spread.
         
-        Strategy:
-        1. Primary: LIMIT order at exact TP price (maker, 0% fee)
-        2. Backup: STOP_MARKET slightly beyond TP (taker, small fee if triggered)
+        BUY quotes best bid + 1 tick, SELL best ask - 1 tick. On a one-tick
+        spread there is no room inside, so the order joins the touch instead
+        of crossing.
         
         Args:
-            position_side: Current position side (LONG/SHORT)
-            tp_price: Take profit trigger price
+            order_side: 'BUY' or 'SELL'
+            tick_size: Minimum price increment
         
         Returns:
-            Primary TP order details (LIMIT order)
+            Price on the tick grid
         """
-        self.logger.debug(message='Placing hybrid TP orders (LIMIT + STOP_MARKET backup)')
-        order_side = OrderSide.SELL.value if position_side == PositionSide.LONG else OrderSide.BUY.value
-        self.position_handler.set_tp_price(price=tp_price)
+        order_book = self.trade_client.fetch_order_book(self.bot_config.symbol, limit=5)
+        if not order_book.get('bids') or not order_book.get('asks'):
+            self.logger.error("Failed to fetch order book")
+            raise ValueError("Failed to fetch order book")
         
-        # Use cached quantity for TP/SL orders
-        quantity = self.get_trade_quantity()
+        best_bid = float(order_book['bids'][0][0])
+        best_ask = float(order_book['asks'][0][0])
+        symbol_filters = self._filters_for_tick_size(tick_size=tick_size)
         
-        # 1. Place primary LIMIT order at exact TP price (0% maker fee)
-        try:
-            tp_limit_order = self.trade_client.place_order(
-                symbol=self.bot_config.symbol,
-                order_side=order_side,
-                order_type=OrderType.LIMIT.value,
-                quantity=quantity,
-                price=tp_price,
-                reduce_only=True,
-                time_in_force='GTC'  # Good Till Cancel
-            )
-            _limit_order_id = tp_limit_order.get('orderId', '')
-            self.logger.info(message=f"TP LIMIT order placed at {tp_price} (0% fee), order id: {_limit_order_id}")
-            self.position_handler.set_tp_order_id(id=_limit_order_id)
-        except Exception as e:
-            self.logger.error_e(message="Failed to place TP LIMIT order", e=e)
-            raise
+        if order_side == OrderSide.BUY.value:
+            price = symbol_filters.add_ticks(best_bid, 1)
+            price = price if price < best_ask else best_bid
+        else:
+            price = symbol_filters.add_ticks(best_ask, -1)
+            price = price if price > best_bid else best_ask
         
-        # 2. Place backup STOP_MARKET slightly beyond TP (safety net)
-        # For LONG: stop price slightly above TP (price goes up past TP)
-        # For SHORT: stop price slightly below TP (price goes down past TP)
+        rounded_price = self.round_to_tick_size(price=price, tick_size=tick_size, order_side=order_side)
+        self.logger.debug(f"Calculated inside-spread price: {rounded_price} (bid={best_bid}, ask={best_ask})")
+        return rounded_price
+
+    def _position_key(self) -> str:
+        """Open candle of the current position, the position part of client order ids."""
+        return self.position_handler.position.open_candle if self.position_handler.position else ''
+
+    def _next_client_order_prefix(self, kind: str, position: str) -> str:
+        """Client order id prefix of a new open/close workflow (leg 'o1', 'c2', ...)."""
+        self._order_sequence += 1
+        return client_order_id_prefix(
+            run_id=self.bot_config.run_id,
+            position=position,
+            leg=f"{kind[0].lower()}{self._order_sequence}"
+        )
+
+    def _protective_client_order_id(self, leg: str, sequence: int) -> str:
+        """Client order id of a TP/SL order ('tp', 'tpb' or 'sl') of the current position."""
+        return make_client_order_id(
+            client_order_id_prefix(run_id=self.bot_config.run_id, position=self._position_key(), leg=leg),
+            sequence
+        )
+
+    def _round_trigger_price(self, price: float, order_side: str) -> float:
+        """Round a trigger price to the symbol's tick size (unchanged if exchange info is not cached)."""
+        symbol_filters = self.symbol_filters
+        if symbol_filters is None:
+            return price
+        return symbol_filters.floor_price(price) if order_side == OrderSide.BUY.value else symbol_filters.ceil_price(price)
+
+    def _calculate_tp_backup_price(self, position_side: PositionSide, tp_price: float) -> float:
+        """
+        Trigger price of the TP backup: 0.1% beyond TP, rounded to tick size.
+        
+        For LONG the backup sits slightly above TP (price goes up past TP),
+        for SHORT slightly below (price goes down past TP).
+        """
+        order_side = OrderSide.SELL.value if position_side == PositionSide.LONG else OrderSide.BUY.value
         backup_offset_pct = 0.001  # 0.1% beyond TP
         if position_side == PositionSide.LONG:
             backup_stop_price = tp_price * (1 + backup_offset_pct)
         else:
             backup_stop_price = tp_price * (1 - backup_offset_pct)
+        return self._round_trigger_price(price=backup_stop_price, order_side=order_side)
+
+    def place_tp_sl_orders(
+        self,
+        position_side: PositionSide,
+        tp_price: float,
+        sl_price: float,
+        tp_enabled: bool = True,
+        sl_enabled: bool = True
+    ) -> List[OrderLeg]:
+        """
+        Place the protective orders of a new position as one batch.
         
-        # Round backup price to tick size to avoid precision errors
-        exchange_info = self.trade_client.get_cached_exchange_info(self.bot_config.symbol)
-        if exchange_info:
-            tick_size = float(exchange_info.get('tickSize', 0.01))
-            backup_stop_price = self.round_to_tick_size(
-                price=backup_stop_price,
-                tick_size=tick_size,
-                order_side=order_side
-            )
+        Legs:
+        1. TP LIMIT at the exact TP price (maker, 0% fee)
+        2. TP TAKE_PROFIT_MARKET backup slightly beyond TP (taker, only if the LIMIT is skipped)
+        3. SL STOP_MARKET at the SL price. SL is not hybrid: a LIMIT on the
+           losing side of the market would fill immediately.
         
-        try:
-            tp_stop_order = self.trade_client.place_algorithmic_order(
-                symbol=self.bot_config.symbol,
+        The legs are submitted together through `place_batch_orders`, so the
+        position is protected after about one round trip. Live clients send
+        independent legs concurrently through the shared I/O executor; per-leg
+        timings and the time to protected are logged. All-or-nothing: if any
+        leg fails or is not answered by the deadline, the others are cancelled
+        and the error is raised.
+        
+        Client order ids carry the position's protective sequence number, so
+        each placement (e.g. a re-placement after a failed batch) gets its own
+        ids while retries of one placement reuse them.
+        
+        Args:
+            position_side: Current position side (LONG/SHORT)
+            tp_price: Take profit price
+            sl_price: Stop loss trigger price
+            tp_enabled: Place the TP LIMIT and its backup
+            sl_enabled: Place the SL STOP_MARKET
+        
+        Returns:
+            Placed legs
+        """
+        order_side = OrderSide.SELL.value if position_side == PositionSide.LONG else OrderSide.BUY.value
+        quantity = self.get_trade_quantity()
+        legs: List[OrderLeg] = []
+        if not (tp_enabled or sl_enabled):
+            return legs
+        sequence = self.position_handler.next_protective_sequence()
+
+        if tp_enabled:
+            self.position_handler.set_tp_price(price=tp_price)
+            legs.append(OrderLeg(
+                name='tp_limit',
+                order_side=order_side,
+                order_type=OrderType.LIMIT.value,
+                quantity=quantity,
+                price=tp_price,
+                reduce_only=True,
+                time_in_force='GTC',
+                client_order_id=self._protective_client_order_id('tp', sequence)
+            ))
+            legs.append(OrderLeg(
+                name='tp_backup',
                 order_side=order_side,
                 order_type=OrderType.TAKE_PROFIT_MARKET.value,
-                trigger_price=backup_stop_price,
                 quantity=quantity,
-                close_position=True
-            )
-            _stop_order_id = tp_stop_order.get('algoId', '')
-            self.logger.info(message=f"TP TAKE_PROFIT_MARKET backup placed at {backup_stop_price} (taker fee), order id: {_stop_order_id}")
-            self.position_handler.set_tp_backup_order_id(id=_stop_order_id)
+                trigger_price=self._calculate_tp_backup_price(position_side=position_side, tp_price=tp_price),
+                close_position=True,
+                client_order_id=self._protective_client_order_id('tpb', sequence)
+            ))
+        if sl_enabled:
+            self.position_handler.set_sl_price(price=sl_price)
+            legs.append(OrderLeg(
+                name='sl',
+                order_side=order_side,
+                order_type=OrderType.STOP_MARKET.value,
+                quantity=quantity,
+                trigger_price=self._round_trigger_price(price=sl_price, order_side=order_side),
+                close_position=True,
+                client_order_id=self._protective_client_order_id('sl', sequence)
+            ))
+
+        self.logger.debug(message=f"Placing TP/SL batch: {[leg.name for leg in legs]}")
+        started = perf_counter()
+        try:
+            self.trade_client.place_batch_orders(symbol=self.bot_config.symbol, legs=legs)
         except Exception as e:
-            # If backup fails, cancel the LIMIT order and re-raise
-            self.logger.error_e(message="Failed to place TP STOP_MARKET backup, canceling LIMIT order", e=e)
-            try:
-                self.trade_client.cancel_order(symbol=self.bot_config.symbol, order_id=_limit_order_id)
-            except:
-                pass
+            self.logger.error_e(message="Failed to place TP/SL orders", e=e)
+            self.logger.info(message=f"TP/SL leg timings: {self._format_leg_timings(legs)}")
             raise
-        
-        return tp_limit_order
+        self.logger.info(message=f"Protected in {(perf_counter() - started) * 1000:.0f}ms ({self._format_leg_timings(legs)})")
+
+        for leg in legs:
+            if leg.name == 'tp_limit':
+                self.logger.info(message=f"TP LIMIT order placed at {leg.price} (0% fee), order id: {leg.order_id}")
+                self.position_handler.set_tp_order_id(id=leg.result.get('orderId', ''))
+            elif leg.name == 'tp_backup':
+                self.logger.info(message=f"TP TAKE_PROFIT_MARKET backup placed at {leg.trigger_price} (taker fee), order id: {leg.order_id}")
+                self.position_handler.set_tp_backup_order_id(id=leg.result.get('algoId', ''))
+            else:
+                self.logger.info(message=f"SL STOP_MARKET order placed at {leg.trigger_price} (taker fee), order id: {leg.order_id}")
+                self.position_handler.set_sl_order_id(id=leg.result.get('algoId', ''))
+        return legs
 
-    def place_sl_order(self, position_side: PositionSide, sl_price: float) -> Dict[str, Any]:
+    @staticmethod
+    def _format_leg_timings(legs: List[OrderLeg]) -> str:
+        return ', '.join(f"{leg.name} {leg.elapsed * 1000:.0f}ms" for leg in legs)
+
+    def create_maker_chase(
+        self,
+        order_side: str,
+        reduce_only: bool,
+        quantity: Optional[float] = None,
+        client_order_prefix: str = ''
+    ) -> MakerChaseEngine:
         """
-        Place stop loss order using STOP_MARKET only.
-        
-        Strategy:
-        - STOP_MARKET order at SL price (triggers when price reaches SL level)
+        Build a maker chase for the bot's symbol, tuned by `execution_config`.
         
         Args:
-            position_side: Current position side (LONG/SHORT)
-            sl_price: Stop loss trigger price
+            order_side: 'BUY' or 'SELL'
+            reduce_only: Whether orders should only reduce position
+            quantity: Target quantity (default: trade quantity)
+            client_order_prefix: Client order id prefix of the chase orders
         
         Returns:
-            SL order details (STOP_MARKET order)
+            Chase ready for `step()` / `run()`
         
-        IMPORTANT NOTE:
-        - SL is Not hybrid because SL limit will trigger immediately after placing limit order
-        - This make constantly SL hit, so need to use stop_market or stop_limit.
+        Raises:
+            ValueError: If exchange info is not cached
         """
-        self.logger.debug(message='Placing STOP_MARKET SL order')
-        order_side = OrderSide.SELL.value if position_side == PositionSide.LONG else OrderSide.BUY.value
-        self.position_handler.set_sl_price(price=sl_price)
+        # Get exchange info from cache (pre-fetched in __init__)
+        exchange_info = self.trade_client.get_cached_exchange_info(self.bot_config.symbol)
+        if not exchange_info:
+            self.logger.error("Exchange info not cached. This should not happen.")
+            raise ValueError("Exchange info not available in cache")
         
-        # Use cached quantity for TP/SL orders
-        quantity = self.get_trade_quantity()
+        tick_size = exchange_info.get('tickSize', 0.01)
+        offset_ticks = 0  # Can be made configurable in bot_config if needed
+        execution_config = self.bot_config.execution_config
+        return MakerChaseEngine(
+            trade_client=self.trade_client,
+            symbol=self.bot_config.symbol,
+            order_side=order_side,
+            quantity=self.get_trade_quantity() if quantity is None else quantity,
+            tick_size=tick_size,
+            price_function=lambda: self.calculate_maker_price(
+                order_side=order_side,
+                tick_size=tick_size,
+                offset_ticks=offset_ticks
+            ),
+            reduce_only=reduce_only,
+            time_in_force='GTX',  # Post-only to ensure maker
+            reprice_threshold_ticks=int(execution_config.get('chase_reprice_threshold_ticks', MAKER_CHASE_REPRICE_THRESHOLD_TICKS)),
+            max_chase_seconds=self._chase_max_seconds(),
+            max_slippage_ticks=int(execution_config.get('chase_max_slippage_ticks', MAKER_CHASE_MAX_SLIPPAGE_TICKS)),
+            poll_interval=LIMIT_ORDER_PRICE_CHECK_INTERVAL if self.bot_config.run_mode != RunMode.BACKTEST else 0,
+            client_order_prefix=client_order_prefix,
+            logger=self.logger
+        )
+
+    def create_limit_chase(
+        self,
+        order_side: str,
+        reduce_only: bool,
+        quantity: Optional[float] = None,
+        client_order_prefix: str = ''
+    ) -> MakerChaseEngine:
+        """
+        Build a LIMIT chase: a GTC order at the last price, repriced whenever it moves.
         
-        # Round SL price to tick size to avoid precision errors
-        exchange_info = self.trade_client.get_cached_exchange_info(self.bot_config.symbol)
-        if exchange_info:
-            tick_size = float(exchange_info.get('tickSize', 0.01))
-            sl_price = self.round_to_tick_size(
-                price=sl_price,
+        The last price is snapped to the tick grid (down for BUY, up for SELL)
+        so a price source that is off-tick never produces a rejected order.
+        ADAPTIVE bots only choose LIMIT on a wide spread, so theirs quotes one
+        tick better than the touch instead (`calculate_inside_spread_price`).
+        
+        Args:
+            order_side: 'BUY' or 'SELL'
+            reduce_only: Whether orders should only reduce position
+            quantity: Target quantity (default: trade quantity)
+            client_order_prefix: Client order id prefix of the chase orders
+        
+        Returns:
+            Chase ready for `step()` / `run()`
+        """
+        exchange_info = self.trade_client.get_cached_exchange_info(self.bot_config.symbol) or {}
+        tick_size = exchange_info.get('tickSize', 0.01)
+        if self.execution_mode_selector is not None:
+            price_function = lambda: self.calculate_inside_spread_price(order_side=order_side, tick_size=tick_size)
+        else:
+            price_function = lambda: self.round_to_tick_size(
+                price=self.trade_client.fetch_price(symbol=self.bot_config.symbol),
                 tick_size=tick_size,
                 order_side=order_side
             )
+        return MakerChaseEngine(
+            trade_client=self.trade_client,
+            symbol=self.bot_config.symbol,
+            order_side=order_side,
+            quantity=self.get_trade_quantity() if quantity is None else quantity,
+            tick_size=tick_size,
+            price_function=price_function,
+            reduce_only=reduce_only,
+            time_in_force='GTC',
+            max_chase_seconds=self._chase_max_seconds(),
+            poll_interval=LIMIT_ORDER_PRICE_CHECK_INTERVAL if self.bot_config.run_mode != RunMode.BACKTEST else 0,
+            client_order_prefix=client_order_prefix,
+            logger=self.logger
+        )
+
+    def _create_order_chase(
+        self,
+        order_type: str,
+        order_side: str,
+        reduce_only: bool,
+        quantity: float,
+        client_order_prefix: str = ''
+    ) -> MakerChaseEngine:
+        """Chase factory of order workflows."""
+        if order_type == OrderType.LIMIT.value:
+            return self.create_limit_chase(order_side=order_side, reduce_only=reduce_only, quantity=quantity, client_order_prefix=client_order_prefix)
+        return self.create_maker_chase(order_side=order_side, reduce_only=reduce_only, quantity=quantity, client_order_prefix=client_order_prefix)
+
+    def _order_workflow_options(self) -> Dict[str, Any]:
+        """Workflow settings taken from the bot config (not persisted with the workflow)."""
+        execution_config = self.bot_config.execution_config
+        return {
+            'trade_client': self.trade_client,
+            'symbol': self.bot_config.symbol,
+            'create_chase': self._create_order_chase,
+            'post_only_max_retries': int(execution_config.get('post_only_max_retries', POST_ONLY_MAX_RETRIES)),
+            'post_only_taker_fallback': bool(execution_config.get('post_only_taker_fallback', POST_ONLY_TAKER_FALLBACK)),
+            'expired_taker_fallback': self.execution_mode_selector is not None,
+            'poll_interval': LIMIT_ORDER_PRICE_CHECK_INTERVAL if self.bot_config.run_mode != RunMode.BACKTEST else 0,
+            'logger': self.logger
+        }
+
+    def create_order_workflow(
+        self,
+        kind: str,
+        order_type: OrderType,
+        order_side: str,
+        reduce_only: bool,
+        quantity: Optional[float] = None,
+        context: Optional[Dict[str, Any]] = None,
+        position_key: Optional[str] = None
+    ) -> OrderWorkflow:
+        """
+        Build an order workflow for the bot's symbol.
         
-        # Place STOP_MARKET order
-        try:
-            sl_stop_order = self.trade_client.place_algorithmic_order(
-                symbol=self.bot_config.symbol,
-                order_side=order_side,
-                order_type=OrderType.STOP_MARKET.value,
-                trigger_price=sl_price,
-                quantity=quantity,
-                close_position=True
-            )
-            _stop_order_id = sl_stop_order.get('algoId', '')
-            self.logger.info(message=f"SL STOP_MARKET order placed at {sl_price} (taker fee), order id: {_stop_order_id}")
-            self.position_handler.set_sl_order_id(id=_stop_order_id)
-        except Exception as e:
-            self.logger.error_e(message="Failed to place SL STOP_MARKET order", e=e)
-            raise
+        Its orders carry client order ids (run id, position, workflow, attempt),
+        so retries and a resumed workflow find orders already sent instead of
+        placing them again.
+        
+        Args:
+            kind: WORKFLOW_OPEN or WORKFLOW_CLOSE
+            order_type: MARKET, LIMIT, MAKER_ONLY or POST_ONLY
+            order_side: 'BUY' or 'SELL'
+            reduce_only: Whether orders should only reduce position
+            quantity: Quantity to trade (default: trade quantity)
+            context: Caller data persisted with the workflow
+            position_key: Open candle of the position traded (default: current position)
         
-        return sl_stop_order
+        Returns:
+            Workflow ready for `step()` / `advance()` / `run()`
+        
+        Raises:
+            ValueError: If exchange info is not cached (maker orders)
+        """
+        return OrderWorkflow(
+            kind=kind,
+            order_type=order_type.value,
+            order_side=order_side,
+            reduce_only=reduce_only,
+            quantity=self.get_trade_quantity() if quantity is None else quantity,
+            context=context,
+            client_order_prefix=self._next_client_order_prefix(
+                kind=kind,
+                position=self._position_key() if position_key is None else position_key
+            ),
+            **self._order_workflow_options()
+        )
 
-    def place_market_order(self, order_side: str, reduce_only: bool) -> Dict[str, Any]:
+    def _run_order_workflow(self, order_type: OrderType, order_side: str, reduce_only: bool, quantity: Optional[float] = None) -> Dict[str, Any]:
+        """Drive a standalone workflow to completion and return the trade details."""
+        workflow = self.create_order_workflow(
+            kind=WORKFLOW_CLOSE if reduce_only else WORKFLOW_OPEN,
+            order_type=order_type,
+            order_side=order_side,
+            reduce_only=reduce_only,
+            quantity=quantity
+        )
+        workflow.run()
+        return workflow.order_trade()
+
+    def place_market_order(self, order_side: str, reduce_only: bool, quantity: Optional[float] = None) -> Dict[str, Any]:
         """
-        Place a market order.
+        Place a market order and wait until it is filled.
         
         Args:
             order_side: 'BUY' or 'SELL'
             reduce_only: Whether order should only reduce position
+            quantity: Quantity to trade (default: trade quantity)
         
         Returns:
             Trade details dictionary
@@ -350,79 +744,15 @@ class TradeHandler:
         Raises:
             ValueError: If reduce_only order is rejected (no position exists)
         """
-        self.logger.debug(message='Placing market order')
-        
-        # Get quantity (calculated or fixed)
-        quantity = self.get_trade_quantity()
-        
-        try:
-            _order = self.trade_client.place_order(
-                symbol=self.bot_config.symbol,
-                order_side=order_side,
-                order_type=OrderType.MARKET.value,
-                quantity=quantity,
-                reduce_only=reduce_only,
-            )
-            
-            # Check if order placement failed (place_order returns False on HTTP errors)
-            if not _order or not _order.get('orderId'):
-                # Check if this is a reduce-only rejection
-                if reduce_only:
-                    self.logger.warning("Market order placement failed with reduce_only=True - checking if position still exists")
-                    # Verify position still exists
-                    remote_position = self.trade_client.fetch_position(symbol=self.bot_config.symbol)
-                    if not remote_position:
-                        self.logger.error("Position no longer exists on exchange")
-                        raise ValueError("Position already closed, cannot place reduce_only order")
-                
-                self.logger.error("Market order placement failed - no order ID returned")
-                raise ValueError("Market order placement failed")
-                
-        except Exception as e:
-            # Check if it's a reduce_only rejection error (-2022 or -4118)
-            error_msg = str(e).lower()
-            if reduce_only and ('reduceonly' in error_msg or '-2022' in error_msg or '-4118' in error_msg):
-                self.logger.warning("ReduceOnly order rejected - checking if position still exists")
-                # Verify position still exists
-                try:
-                    remote_position = self.trade_client.fetch_position(symbol=self.bot_config.symbol)
-                    if not remote_position:
-                        self.logger.error("Position no longer exists on exchange")
-                        raise ValueError("Position already closed, cannot place reduce_only order") from e
-                except Exception as check_error:
-                    self.logger.error_e("Error checking position status, assuming position is closed", e=check_error)
-                    raise ValueError("Position already closed, cannot place reduce_only order") from e
-            raise
-        
-        # Skip waits in backtest mode
-        if self.bot_config.run_mode != RunMode.BACKTEST:
-            sleep(ORDER_PLACEMENT_WAIT)  # wait for binance to process order
-
-        _order_id = _order.get('orderId', '')
-        _order_filled = False
-        while not _order_filled:
-            _check_order = self.trade_client.fetch_order(symbol=self.bot_config.symbol, order_id=_order_id)
-            _order_filled = _check_order.get('status') == ORDER_STATUS_FILLED
-
-            if not _order_filled:
-                self.logger.debug(message="Market Order still pending. Waiting...")
-            else:
-                self.logger.info(message="Market Order filled")
-                break
-            
-            # Skip waits in backtest mode
-            if self.bot_config.run_mode != RunMode.BACKTEST:
-                sleep(ORDER_STATUS_CHECK_INTERVAL)  # wait before checking again
-
-        self.logger.debug(message=f'Getting trade history order_id: {_order_id}')
-        return self.trade_client.fetch_order_trade(symbol=self.bot_config.symbol, order_id=_order_id)
+        return self._run_order_workflow(OrderType.MARKET, order_side=order_side, reduce_only=reduce_only, quantity=quantity)
 
     def place_limit_order(self, order_side: str, reduce_only: bool) -> Dict[str, Any]:
         """
-        Place a limit order with automatic repricing.
+        Place a limit order at the last price and reprice it until filled.
         
-        Handles partial fills by tracking filled quantity and only placing
-        orders for the remaining unfilled quantity.
+        Reprices amend the resting order in place; cancel/replace is only
+        used when the amend is rejected. Replacement orders only carry the
+        quantity not filled yet.
         
         Args:
             order_side: 'BUY' or 'SELL'
@@ -431,171 +761,21 @@ class TradeHandler:
         Returns:
             Trade details dictionary
         """
-        _order_filled = False
-        _order_id = ''
-        _ordered_price = None  # Track the price at which order was placed
-        _total_filled_qty = 0.0  # Track total filled quantity across all orders
-        _target_quantity = self.get_trade_quantity()  # Total quantity we want to fill
-        _error_count = 0  # Track consecutive errors
-        _max_errors = 3  # Maximum consecutive errors before resetting
-        
-        while not _order_filled:
-            # Calculate remaining quantity to fill
-            _remaining_quantity = _target_quantity - _total_filled_qty
-            
-            if _remaining_quantity <= 0:
-                self.logger.info(f"All quantity filled: {_total_filled_qty}/{_target_quantity}")
-                break
-            
-            current_price = self.trade_client.fetch_price(symbol=self.bot_config.symbol)
-
-            # Place order if no active order OR price changed from ordered price
-            if _ordered_price != current_price:
-                # Check for partial fill before canceling
-                if _order_id:
-                    try:
-                        _check_order = self.trade_client.fetch_order(symbol=self.bot_config.symbol, order_id=_order_id)
-                        _order_status = _check_order.get('status', '')
-                        _executed_qty = float(_check_order.get('executedQty', 0))
-                        
-                        # If order is already filled, update total and break out
-                        if _order_status == ORDER_STATUS_FILLED:
-                            _total_filled_qty += _executed_qty
-                            self.logger.info(f"Order already filled: {_executed_qty}, total: {_total_filled_qty}/{_target_quantity}")
-                            _order_filled = True
-                            break
-                        
-                        # Track partial fills
-                        if _executed_qty > 0:
-                            _total_filled_qty += _executed_qty
-                            self.logger.info(f"Partial fill detected: {_executed_qty} filled, total: {_total_filled_qty}/{_target_quantity}")
-                        
-                        # Cancel existing order if not fully filled
-                        if _order_status not in [ORDER_STATUS_FILLED, 'CANCELED', 'EXPIRED']:
-                            self.trade_client.cancel_order(symbol=self.bot_config.symbol, order_id=_order_id)
-                            self.logger.debug(f"Price {_ordered_price} -> {current_price}  |  Canceling order {_order_id}...")
-                            
-                            # Skip waits in backtest mode
-                            if self.bot_config.run_mode != RunMode.BACKTEST:
-                                sleep(ORDER_STATUS_CHECK_INTERVAL)  # wait for binance to cancel order
-                        
-                        # Reset error count on successful operation
-                        _error_count = 0
-                        
-                    except Exception as e:
-                        _error_count += 1
-                        self.logger.error_e(message=f"Error checking/canceling order (attempt {_error_count}/{_max_errors})", e=e)
-                        
-                        # If too many consecutive errors, reset order_id to force new order
-                        if _error_count >= _max_errors:
-                            self.logger.warning(f"Max errors reached, resetting order state")
-                            _order_id = ''
-                            _ordered_price = None
-                            _error_count = 0
-                        
-                        if self.bot_config.run_mode != RunMode.BACKTEST:
-                            sleep(1)
-                        continue
-                
-                # Recalculate remaining quantity
-                _remaining_quantity = _target_quantity - _total_filled_qty
-                
-                if _remaining_quantity <= 0:
-                    self.logger.info(f"All quantity filled after partial fills: {_total_filled_qty}/{_target_quantity}")
-                    break
-                
-                # Place new order at current price for remaining quantity
-                self.logger.debug(message=f"Placing LIMIT order at price: {current_price} for quantity: {_remaining_quantity}")
-                try:
-                    _order = self.trade_client.place_order(
-                        symbol=self.bot_config.symbol,
-                        order_side=order_side,
-                        order_type=OrderType.LIMIT.value,
-                        quantity=_remaining_quantity,
-                        price=current_price,
-                        reduce_only=reduce_only,
-                    )
-                    
-                    # Check if order placement failed
-                    if not _order or not _order.get('orderId'):
-                        # Check if this is a reduce-only rejection
-                        if reduce_only:
-                            self.logger.warning("Limit order placement failed with reduce_only=True - checking if position still exists")
-                            # Verify position still exists before retrying
-                            remote_position = self.trade_client.fetch_position(symbol=self.bot_config.symbol)
-                            if not remote_position:
-                                self.logger.error("Position no longer exists on exchange - stopping order placement")
-                                break  # Exit the loop, position is already closed
-                        
-                        self.logger.error("Order placement failed - no order ID returned")
-                        raise ValueError("Order placement failed")
-                    
-                    _order_id = _order.get('orderId', '')
-                    _ordered_price = current_price  # Remember the price we ordered at
-                except Exception as e:
-                    # Check if it's a reduce_only rejection error (-2022 or -4118)
-                    error_msg = str(e).lower()
-                    if reduce_only and ('reduceonly' in error_msg or '-2022' in error_msg or '-4118' in error_msg):
-                        self.logger.warning("ReduceOnly order rejected - checking if position still exists")
-                        # Verify position still exists before retrying
-                        try:
-                            remote_position = self.trade_client.fetch_position(symbol=self.bot_config.symbol)
-                            if not remote_position:
-                                self.logger.error("Position no longer exists on exchange - stopping order placement")
-                                break  # Exit the loop, position is already closed
-                        except Exception as check_error:
-                            self.logger.error_e("Error checking position status, assuming position is closed", e=check_error)
-                            break  # Exit the loop on error
-                    
-                    # For other errors, re-raise to exit the loop
-                    self.logger.error_e(message="Error placing limit order", e=e)
-                    raise
-            else:
-                self.logger.debug(message="Price unchanged. Keep monitoring order.")
-
-            # Skip waits in backtest mode
-            if self.bot_config.run_mode != RunMode.BACKTEST:
-                sleep(LIMIT_ORDER_PRICE_CHECK_INTERVAL)  # wait before checking order status
-
-            # Check if order filled
-            _check_order = self.trade_client.fetch_order(symbol=self.bot_config.symbol, order_id=_order_id)
-            _order_status = _check_order.get('status', '')
-            _executed_qty = float(_check_order.get('executedQty', 0))
-            
-            if _order_status == ORDER_STATUS_FILLED:
-                _total_filled_qty += _executed_qty
-                self.logger.info(f"Limit Order filled: {_executed_qty}, total: {_total_filled_qty}/{_target_quantity}")
-                _order_filled = True
-                break
-            elif _order_status == 'PARTIALLY_FILLED':
-                self.logger.debug(f"Limit Order partially filled: {_executed_qty}/{_remaining_quantity}")
-                # Continue loop to check if price changed and handle partial fill
-            else:
-                self.logger.debug(message="Limit Order still pending. Waiting...")
-    
-        self.logger.debug(message=f'Getting trade history for symbol: {self.bot_config.symbol}')
-        return self.trade_client.fetch_order_trade(symbol=self.bot_config.symbol, order_id=_order_id)
+        return self._run_order_workflow(OrderType.LIMIT, order_side=order_side, reduce_only=reduce_only)
 
     def place_maker_only_order(self, order_side: str, reduce_only: bool) -> Dict[str, Any]:
         """
-        Place a maker-only limit order with automatic repricing.
+        Place a maker-only limit order and chase the maker price until filled.
         
-        Uses order book data to calculate maker price and automatically
-        reprices if market moves. Ensures orders are always placed as maker
-        (adding liquidity) to get reduced fees.
+        Runs a MakerChaseEngine: one post-only (GTX) order priced from the
+        order book, repriced (amend first, cancel/replace as fallback) when the
+        maker price moves by `chase_reprice_threshold_ticks`, re-quoted at once
+        after a post-only rejection. Between steps it waits for top-of-book or
+        order events rather than fixed sleeps.
         
-        Handles partial fills by tracking filled quantity and only placing
-        orders for the remaining unfilled quantity.
-        
-        Expected behavior:
-        1. Get maker price from order book
-        2. Place order with maker price (GTX - post-only)
-        3. If placement fails (-5022), re-calculate and retry
-        4. If placement succeeds, wait before checking status
-        5. If order filled, return trade details
-        6. If partially filled, track filled quantity and continue with remaining
-        7. If not filled and price unchanged, keep monitoring
-        8. If not filled and price changed, cancel and place new order for remaining quantity
+        If `chase_max_seconds` runs out, the remainder of a reduce-only order
+        is closed with MARKET; an entry keeps what filled, or raises if nothing
+        did.
         
         Args:
             order_side: 'BUY' or 'SELL'
@@ -603,207 +783,214 @@ class TradeHandler:
         
         Returns:
             Trade details dictionary
+        
+        Raises:
+            ValueError: If exchange info is missing or an entry chase expired unfilled
         """
-        # Get exchange info from cache (pre-fetched in __init__)
-        exchange_info = self.trade_client.get_cached_exchange_info(self.bot_config.symbol)
-        if not exchange_info:
-            self.logger.error("Exchange info not cached. This should not happen.")
-            raise ValueError("Exchange info not available in cache")
+        return self._run_order_workflow(OrderType.MAKER_ONLY, order_side=order_side, reduce_only=reduce_only)
+
+    def place_post_only_order(self, order_side: str, reduce_only: bool) -> Dict[str, Any]:
+        """
+        Place a post-only (GTX) limit order at the touch.
         
-        tick_size = exchange_info.get('tickSize', 0.01)
-        offset_ticks = 0  # Can be made configurable in bot_config if needed
+        A post-only rejection (-5022, the book moved and the price would take)
+        is re-quoted immediately from fresh book data. Consecutive rejections
+        are bounded by `execution_config['post_only_max_retries']`; once spent,
+        the remaining quantity goes out as MARKET if `post_only_taker_fallback`
+        is set, otherwise the chase backs off until its next step.
         
-        _order_filled = False
-        _order_id = ''
-        _ordered_maker_price = None
-        _total_filled_qty = 0.0  # Track total filled quantity across all orders
-        _target_quantity = self.get_trade_quantity()  # Total quantity we want to fill
-        _error_count = 0  # Track consecutive errors
-        _max_errors = 3  # Maximum consecutive errors before resetting
-        
-        while not _order_filled:
-            # Calculate remaining quantity to fill
-            _remaining_quantity = _target_quantity - _total_filled_qty
-            
-            if _remaining_quantity <= 0:
-                self.logger.info(f"All quantity filled: {_total_filled_qty}/{_target_quantity}")
-                break
-            
-            # Calculate current maker price from order book
+        Args:
+            order_side: 'BUY' or 'SELL'
+            reduce_only: Whether order should only reduce position
+        
+        Returns:
+            Trade details dictionary
+        """
+        return self._run_order_workflow(OrderType.POST_ONLY, order_side=order_side, reduce_only=reduce_only)
+
+    # ========== Resumable position orders ==========
+
+    def get_order_workflow(self) -> Optional[OrderWorkflow]:
+        """
+        Get the working open/close order workflow, resuming it from the
+        persisted position state after a restart.
+        
+        Returns:
+            Pending workflow or None
+        """
+        if self.order_workflow is None and self.position_handler.pending_order:
             try:
-                current_maker_price = self.calculate_maker_price(
-                    order_side=order_side,
-                    tick_size=tick_size,
-                    offset_ticks=offset_ticks
+                self.order_workflow = OrderWorkflow.from_dict(
+                    data=self.position_handler.pending_order,
+                    **self._order_workflow_options()
                 )
-            except ValueError as e:
-                self.logger.error_e(message="Failed to calculate maker price", e=e)
-                
-                # Skip waits in backtest mode
-                if self.bot_config.run_mode != RunMode.BACKTEST:
-                    sleep(ORDER_STATUS_CHECK_INTERVAL)
-                continue
-            
-            # Place or replace order if price changed
-            if _ordered_maker_price != current_maker_price:
-                # Check for partial fill before canceling
-                if _order_id:
-                    try:
-                        _check_order = self.trade_client.fetch_order(symbol=self.bot_config.symbol, order_id=_order_id)
-                        _order_status = _check_order.get('status', '')
-                        _executed_qty = float(_check_order.get('executedQty', 0))
-                        
-                        # If order is already filled, update total and break out
-                        if _order_status == ORDER_STATUS_FILLED:
-                            _total_filled_qty += _executed_qty
-                            self.logger.info(f"Order already filled: {_executed_qty}, total: {_total_filled_qty}/{_target_quantity}")
-                            _order_filled = True
-                            break
-                        
-                        # Track partial fills
-                        if _executed_qty > 0:
-                            _total_filled_qty += _executed_qty
-                            self.logger.info(f"Partial fill detected: {_executed_qty} filled, total: {_total_filled_qty}/{_target_quantity}")
-                        
-                        # Cancel existing order if not fully filled
-                        if _order_status not in [ORDER_STATUS_FILLED, 'CANCELED', 'EXPIRED']:
-                            self.logger.debug(f"Maker price {_ordered_maker_price} → {current_maker_price}  |  Canceling order {_order_id}...")
-                            self.trade_client.cancel_order(symbol=self.bot_config.symbol, order_id=_order_id)
-                            
-                            # Skip waits in backtest mode
-                            if self.bot_config.run_mode != RunMode.BACKTEST:
-                                sleep(ORDER_STATUS_CHECK_INTERVAL)  # Wait for cancellation
-                        
-                        # Reset error count on successful operation
-                        _error_count = 0
-                        
-                    except Exception as e:
-                        _error_count += 1
-                        self.logger.error_e(message=f"Error checking/canceling order (attempt {_error_count}/{_max_errors})", e=e)
-                        
-                        # If too many consecutive errors, reset order_id to force new order
-                        if _error_count >= _max_errors:
-                            self.logger.warning(f"Max errors reached, resetting order state")
-                            _order_id = ''
-                            _ordered_maker_price = None
-                            _error_count = 0
-                        
-                        if self.bot_config.run_mode != RunMode.BACKTEST:
-                            sleep(1)
-                        continue
-                
-                # Recalculate remaining quantity
-                _remaining_quantity = _target_quantity - _total_filled_qty
-                
-                if _remaining_quantity <= 0:
-                    self.logger.info(f"All quantity filled after partial fills: {_total_filled_qty}/{_target_quantity}")
-                    break
-                
-                # Place new order at maker price for remaining quantity
-                self.logger.debug(f"Placing MAKER order at price: {current_maker_price} for quantity: {_remaining_quantity}")
-                try:
-                    _order = self.trade_client.place_order(
-                        symbol=self.bot_config.symbol,
-                        order_side=order_side,
-                        order_type=OrderType.LIMIT.value,
-                        quantity=_remaining_quantity,
-                        price=current_maker_price,
-                        reduce_only=reduce_only,
-                        time_in_force='GTX'  # Post-only to ensure maker
-                    )
-                    
-                    if not _order or not _order.get('orderId'):
-                        # Check if this is a reduce-only rejection
-                        if reduce_only:
-                            self.logger.warning("Maker order placement failed with reduce_only=True - checking if position still exists")
-                            # Verify position still exists before retrying
-                            remote_position = self.trade_client.fetch_position(symbol=self.bot_config.symbol)
-                            if not remote_position:
-                                self.logger.error("Position no longer exists on exchange - stopping order placement")
-                                break  # Exit the loop, position is already closed
-                        
-                        # For other errors (like -5022), retry
-                        self.logger.warning("Maker order placement failed (likely -5022), will retry")
-                        _ordered_maker_price = None
-                        
-                        # Skip waits in backtest mode
-                        if self.bot_config.run_mode != RunMode.BACKTEST:
-                            sleep(1)
-                        continue
-                except Exception as e:
-                    # Check if it's a reduce_only rejection error (-2022 or -4118)
-                    error_msg = str(e).lower()
-                    if reduce_only and ('reduceonly' in error_msg or '-2022' in error_msg or '-4118' in error_msg):
-                        self.logger.warning("ReduceOnly order rejected - checking if position still exists")
-                        # Verify position still exists before retrying
-                        try:
-                            remote_position = self.trade_client.fetch_position(symbol=self.bot_config.symbol)
-                            if not remote_position:
-                                self.logger.error("Position no longer exists on exchange - stopping order placement")
-                                break  # Exit the loop, position is already closed
-                        except Exception as check_error:
-                            self.logger.error_e("Error checking position status, assuming position is closed", e=check_error)
-                            break  # Exit the loop on error
-                    
-                    # For other errors (like -5022), retry
-                    self.logger.warning(f"Maker order placement failed: {e}, will retry")
-                    _ordered_maker_price = None
-                    
-                    # Skip waits in backtest mode
-                    if self.bot_config.run_mode != RunMode.BACKTEST:
-                        sleep(1)
-                    continue
-                
-                _order_id = _order.get('orderId', '')
-                _ordered_maker_price = current_maker_price
-                self.logger.debug(f"Maker order placed: ID={_order_id}, Price={current_maker_price}")
-            else:
-                self.logger.debug("Maker price unchanged. Keep monitoring order.")
-            
-            # Wait before checking order status (skip in backtest mode)
-            if self.bot_config.run_mode != RunMode.BACKTEST:
-                sleep(LIMIT_ORDER_PRICE_CHECK_INTERVAL)
-            
-            # Check if order filled
-            _check_order = self.trade_client.fetch_order(symbol=self.bot_config.symbol, order_id=_order_id)
-            _order_status = _check_order.get('status', '')
-            _executed_qty = float(_check_order.get('executedQty', 0))
-            
-            if _order_status == ORDER_STATUS_FILLED:
-                _total_filled_qty += _executed_qty
-                self.logger.info(f"Maker Order filled: {_executed_qty}, total: {_total_filled_qty}/{_target_quantity}")
-                _order_filled = True
-                break
-            elif _order_status == 'PARTIALLY_FILLED':
-                self.logger.debug(f"Maker Order partially filled: {_executed_qty}/{_remaining_quantity}")
-                # Continue loop to check if price changed and handle partial fill
+                self.logger.info(message=f"Resuming {self.order_workflow.kind} {self.order_workflow.order_type} order workflow")
+            except Exception as e:
+                self.logger.error_e(message="Could not resume order workflow, dropping it", e=e)
+                self.position_handler.pending_order = {}
+        return self.order_workflow
+
+    def has_pending_order(self) -> bool:
+        """Check whether an open/close order is still working."""
+        return self.get_order_workflow() is not None
+
+    def _set_order_workflow(self, workflow: Optional[OrderWorkflow]) -> None:
+        self.order_workflow = workflow
+        self.position_handler.pending_order = workflow.to_dict() if workflow is not None else {}
+
+    def advance_order_workflow(self) -> Optional[OrderWorkflow]:
+        """
+        Advance the pending open/close order without blocking.
+        
+        Backtest orders fill on placement, so there the workflow is driven to
+        completion within the candle.
+        
+        Returns:
+            The workflow once it reached a final state (no longer pending),
+            None while it is still working
+        
+        Raises:
+            Exception: Order errors; the failed workflow is dropped
+        """
+        workflow = self.get_order_workflow()
+        if workflow is None:
+            return None
+        try:
+            if self.bot_config.run_mode == RunMode.BACKTEST:
+                workflow.run()
             else:
-                self.logger.debug("Maker Order still pending")
+                workflow.advance()
+        except Exception:
+            self._entry_signal_at = None
+            self._execution = None
+            self._set_order_workflow(None)
+            raise
+        self._record_entry_latency(workflow)
         
-        # Fetch all trades for all orders to get complete trade history
-        self.logger.debug(f'Getting trade history for symbol: {self.bot_config.symbol}')
-        return self.trade_client.fetch_order_trade(symbol=self.bot_config.symbol, order_id=_order_id)
+        if not workflow.done:
+            self._set_order_workflow(workflow)
+            return None
+        self._set_order_workflow(None)
+        return workflow
 
-    def place_order_to_open_position(self, position_side: PositionSide) -> Dict[str, Any]:
+    def wait_order_workflow(self) -> None:
+        """Block until the pending order may need a step (bounded by the poll interval)."""
+        workflow = self.get_order_workflow()
+        if workflow is not None:
+            workflow.wait()
+
+    def _create_execution_mode_selector(self) -> ExecutionModeSelector:
+        """Build the ADAPTIVE execution mode selector, tuned by `execution_config`."""
+        execution_config = self.bot_config.execution_config
+        return ExecutionModeSelector(
+            latency_budget=float(execution_config.get('adaptive_latency_budget_seconds', ADAPTIVE_LATENCY_BUDGET_SECONDS)),
+            min_fill_probability=float(execution_config.get('adaptive_min_fill_probability', ADAPTIVE_MIN_FILL_PROBABILITY)),
+            wide_spread_ticks=int(execution_config.get('adaptive_wide_spread_ticks', ADAPTIVE_WIDE_SPREAD_TICKS)),
+            trade_flow_candles=int(execution_config.get('adaptive_trade_flow_candles', ADAPTIVE_TRADE_FLOW_CANDLES)),
+            logger=self.logger
+        )
+
+    def update_trade_flow(self, klines_df: pd.DataFrame) -> None:
         """
-        Place an order to open a new position.
+        Feed recent klines to the ADAPTIVE selector's trade flow estimate (no-op for other order types).
+        
+        Args:
+            klines_df: Klines the strategy evaluated
+        """
+        if self.execution_mode_selector is not None:
+            self.execution_mode_selector.update_trade_flow(klines_df=klines_df)
+
+    def _resolve_order_type(self, order_side: str) -> Tuple[OrderType, Dict[str, Any]]:
+        """
+        Execution mode of a new open/close order.
+        
+        ADAPTIVE bots choose per order from the order book and trade flow.
+        
+        Args:
+            order_side: 'BUY' or 'SELL'
+        
+        Returns:
+            (order type, adaptive decision kept with the workflow; {} unless ADAPTIVE)
+        """
+        if self.execution_mode_selector is None:
+            return (self.bot_config.order_type if self.bot_config.order_type in (
+                OrderType.MARKET, OrderType.MAKER_ONLY, OrderType.POST_ONLY
+            ) else OrderType.LIMIT), {}
+        
+        try:
+            order_book = self.trade_client.fetch_order_book(self.bot_config.symbol, limit=5)
+        except Exception as e:
+            self.logger.warning_e(message="Failed to fetch order book for execution mode", e=e)
+            order_book = {}
+        decision = self.execution_mode_selector.select(
+            order_book=order_book,
+            order_side=order_side,
+            quantity=self.get_trade_quantity(),
+            symbol_filters=self.symbol_filters
+        )
+        decision_dict = decision.to_dict()
+        self._log_execution(f"{self.bot_config.symbol} | ADAPTIVE {order_side} -> {decision.order_type.value} ({decision.reason}) | {decision_dict}")
+        return decision.order_type, decision_dict
+
+    def _chase_max_seconds(self) -> float:
+        """Chase duration limit; ADAPTIVE bots also bound it by their latency budget."""
+        max_chase_seconds = float(self.bot_config.execution_config.get('chase_max_seconds', MAKER_CHASE_MAX_SECONDS))
+        if self.execution_mode_selector is None:
+            return max_chase_seconds
+        latency_budget = self.execution_mode_selector.latency_budget
+        return min(max_chase_seconds, latency_budget) if max_chase_seconds else latency_budget
+
+    def start_order_to_open_position(
+        self,
+        position_side: PositionSide,
+        context: Optional[Dict[str, Any]] = None,
+        signal_at: Optional[float] = None,
+        reference_price: float = 0.0
+    ) -> OrderWorkflow:
+        """
+        Start the order that opens a new position; advance it with `advance_order_workflow`.
+        
+        Uses the pre-staged entry if one is fresh (see `prestage_entry`).
         
         Args:
             position_side: Position side to open (LONG/SHORT)
+            context: Caller data persisted with the workflow (signal reason, candle)
+            signal_at: Monotonic time the signal fired, for signal-to-ack latency and execution metrics
+            reference_price: Price the strategy saw at the signal, for slippage
         
         Returns:
-            New position dictionary with entry details
+            The pending workflow
         """
+        self._use_staged_entry()
+        if self.bot_config.run_mode != RunMode.BACKTEST:
+            self._entry_signal_at = signal_at
         _order_side = OrderSide.BUY.value if position_side == PositionSide.LONG else OrderSide.SELL.value
-        _order_trade = None
-
-        if self.bot_config.order_type == OrderType.MARKET:
-            _order_trade = self.place_market_order(order_side=_order_side, reduce_only=False)
-        elif self.bot_config.order_type == OrderType.MAKER_ONLY:
-            _order_trade = self.place_maker_only_order(order_side=_order_side, reduce_only=False)
-        else:  # LIMIT
-            _order_trade = self.place_limit_order(order_side=_order_side, reduce_only=False)
+        order_type, execution_decision = self._resolve_order_type(order_side=_order_side)
+        workflow = self.create_order_workflow(
+            kind=WORKFLOW_OPEN,
+            order_type=order_type,
+            order_side=_order_side,
+            reduce_only=False,
+            context={
+                **(context or {}),
+                'position_side': position_side.name,
+                'reference_price': reference_price,
+                **({'execution_decision': execution_decision} if execution_decision else {})
+            },
+            position_key=(context or {}).get('open_candle', '')
+        )
+        self._start_execution(workflow=workflow, signal_at=signal_at, reference_price=reference_price)
+        self._set_order_workflow(workflow)
+        return workflow
 
+    def finish_order_to_open_position(self, workflow: OrderWorkflow) -> Dict[str, Any]:
+        """
+        Build the new position from a finished open workflow.
+        
+        Returns:
+            New position dictionary with entry details
+        """
+        _order_trade = workflow.order_trade()
         self.logger.debug(message=f'Order Trade: {_order_trade}')
 
         new_position_dict: dict = self.trade_client.fetch_position(
@@ -814,19 +1001,45 @@ class TradeHandler:
             raise Exception('💥 Failed to place order to binance!')
         
         new_position_dict['open_fee'] = _order_trade['fee']
+        new_position_dict['open_execution'] = self._finish_execution(workflow=workflow, fill_price=_order_trade['price'])
+        position_side = PositionSide[workflow.context['position_side']]
         self.logger.info(
             message=f"{self.bot_config.symbol} | {'OPEN':<5} | {position_side.value:<5} | {new_position_dict['quantity']:<10} @ {new_position_dict['entry_price']}")
         return new_position_dict
 
-    def place_order_to_close_position(self, position_dict: dict) -> Dict[str, Any]:
+    def place_order_to_open_position(self, position_side: PositionSide) -> Dict[str, Any]:
+        """
+        Place an order to open a new position and wait until it is filled.
+        
+        Args:
+            position_side: Position side to open (LONG/SHORT)
+        
+        Returns:
+            New position dictionary with entry details
+        """
+        self.start_order_to_open_position(position_side=position_side)
+        while (workflow := self.advance_order_workflow()) is None:
+            self.wait_order_workflow()
+        return self.finish_order_to_open_position(workflow=workflow)
+
+    def start_order_to_close_position(
+        self,
+        position_dict: dict,
+        context: Optional[Dict[str, Any]] = None,
+        signal_at: Optional[float] = None,
+        reference_price: float = 0.0
+    ) -> OrderWorkflow:
         """
-        Place an order to close an existing position.
+        Start the order that closes an existing position; advance it with `advance_order_workflow`.
         
         Args:
             position_dict: Current position details
+            context: Caller data persisted with the workflow (close reason)
+            signal_at: Monotonic time the exit signal fired, for execution metrics
+            reference_price: Price the strategy saw at the signal, for slippage
         
         Returns:
-            Closed position dictionary with exit details
+            The pending workflow
         
         Raises:
             ValueError: If position doesn't exist on exchange
@@ -838,32 +1051,73 @@ class TradeHandler:
             raise ValueError("Position already closed on exchange")
         
         _order_side = OrderSide.BUY.value if position_dict['position_side'] == PositionSide.SHORT else OrderSide.SELL.value
-        _order_trade = None
 
         self.logger.debug(message='Placing order to close position')
-    
-        if self.bot_config.order_type == OrderType.MARKET:
-            _order_trade = self.place_market_order(order_side=_order_side, reduce_only=True)
-        elif self.bot_config.order_type == OrderType.MAKER_ONLY:
-            _order_trade = self.place_maker_only_order(order_side=_order_side, reduce_only=True)
-        else:  # LIMIT
-            _order_trade = self.place_limit_order(order_side=_order_side, reduce_only=True)
+        order_type, execution_decision = self._resolve_order_type(order_side=_order_side)
+        workflow = self.create_order_workflow(
+            kind=WORKFLOW_CLOSE,
+            order_type=order_type,
+            order_side=_order_side,
+            reduce_only=True,
+            context={
+                **(context or {}),
+                'position_side': position_dict['position_side'].name,
+                'entry_price': position_dict['entry_price'],
+                'reference_price': reference_price,
+                **({'execution_decision': execution_decision} if execution_decision else {})
+            },
+            position_key=position_dict.get('open_candle', '')
+        )
+        self._start_execution(workflow=workflow, signal_at=signal_at, reference_price=reference_price)
+        self._set_order_workflow(workflow)
+        return workflow
 
+    def finish_order_to_close_position(self, workflow: OrderWorkflow) -> Dict[str, Any]:
+        """
+        Build the close details from a finished close workflow.
+        
+        Returns:
+            Closed position dictionary with exit details
+        
+        Raises:
+            ValueError: If the position was already closed on exchange
+        """
+        _order_trade = workflow.order_trade()
         self.logger.debug(message=f'Order Trade: {_order_trade}')
 
         closed_position_dict = {
             'close_price': _order_trade['price'],
             'close_fee': _order_trade['fee'],
-            'pnl': _order_trade['pnl']
+            'pnl': _order_trade['pnl'],
+            'close_execution': self._finish_execution(workflow=workflow, fill_price=_order_trade['price'])
         }
         
         # Clear cached quantity after closing position
         self.clear_cached_quantity()
 
+        position_side = PositionSide[workflow.context['position_side']]
         self.logger.info(
-            message=f"{self.bot_config.symbol} | {'CLOSE':<5} | {position_dict['position_side'].value:<5} | {position_dict['entry_price']:.4f} -> {_order_trade['price']:.4f} | {'+' if _order_trade['pnl'] >= 0 else ''}{_order_trade['pnl']:.4f}")
+            message=f"{self.bot_config.symbol} | {'CLOSE':<5} | {position_side.value:<5} | {workflow.context['entry_price']:.4f} -> {_order_trade['price']:.4f} | {'+' if _order_trade['pnl'] >= 0 else ''}{_order_trade['pnl']:.4f}")
         return closed_position_dict
 
+    def place_order_to_close_position(self, position_dict: dict) -> Dict[str, Any]:
+        """
+        Place an order to close an existing position and wait until it is filled.
+        
+        Args:
+            position_dict: Current position details
+        
+        Returns:
+            Closed position dictionary with exit details
+        
+        Raises:
+            ValueError: If position doesn't exist on exchange
+        """
+        self.start_order_to_close_position(position_dict=position_dict)
+        while (workflow := self.advance_order_workflow()) is None:
+            self.wait_order_workflow()
+        return self.finish_order_to_close_position(workflow=workflow)
+
     def cancel_tp_order(self) -> None:
         """Cancel both TP orders (LIMIT and STOP_MARKET backup)."""
         # Cancel primary LIMIT order
@@ -894,12 +1148,24 @@ class TradeHandler:
             except Exception as e:
                 self.logger.warning(f"Failed to cancel SL STOP_MARKET order: {e}")
 
+    def _check_protective_order(self, order_id: str, algo: bool) -> Dict[str, Any]:
+        """
+        Status of a TP/SL order, answered from the shared open orders snapshot
+        while it rests; fetched individually only once it left the book.
+        """
+        if self.trade_client.is_order_open(order_id=order_id, algo=algo):
+            return {'algoStatus': 'NEW'} if algo else {'status': 'NEW'}
+        if algo:
+            return self.trade_client.fetch_algorithmic_order(order_id=order_id)
+        return self.trade_client.fetch_order(symbol=self.bot_config.symbol, order_id=order_id)
+
     def monitor_tp_sl_fill(self, current_candle_open_time: str = '', backtest_metrics=None) -> tuple[bool, bool]:
         """
         Monitor TP/SL orders and close position if any is filled.
         
         Checks both TP orders (LIMIT and STOP_MARKET backup) and SL order.
-        Also detects EXPIRED/CANCELLED orders which indicate liquidation.
+        Orders still resting are resolved from the shared open orders snapshot;
+        only an order that left the book is fetched. Also detects EXPIRED/CANCELLED orders which indicate liquidation.
         
         Scenarios:
         1. Both TP and SL enabled: only one can hit; cancel the others.
@@ -931,7 +1197,7 @@ class TradeHandler:
             if sl_order_id:
                 total_orders += 1
                 try:
-                    _check_sl_order = self.trade_client.fetch_algorithmic_order(order_id=sl_order_id)
+                    _check_sl_order = self._check_protective_order(order_id=sl_order_id, algo=True)
                     sl_status = _check_sl_order.get('algoStatus')
                     self.logger.debug(f"SL Algo order ID={sl_order_id}, Status={sl_status}")
                     
@@ -952,10 +1218,7 @@ class TradeHandler:
             if tp_order_id:
                 total_orders += 1
                 try:
-                    _check_tp_order = self.trade_client.fetch_order(
-                        symbol=self.bot_config.symbol,
-                        order_id=tp_order_id
-                    )
+                    _check_tp_order = self._check_protective_order(order_id=tp_order_id, algo=False)
                     tp_status = _check_tp_order.get('status')
                     self.logger.debug(f"TP Limit Order status: {tp_status}")
                     
@@ -976,7 +1239,7 @@ class TradeHandler:
             if tp_backup_order_id:
                 total_orders += 1
                 try:
-                    _check_tp_backup = self.trade_client.fetch_algorithmic_order(order_id=tp_backup_order_id)
+                    _check_tp_backup = self._check_protective_order(order_id=tp_backup_order_id, algo=True)
                     tp_backup_status = _check_tp_backup.get('algoStatus')
                     self.logger.debug(f"TP Algo order ID={tp_backup_order_id}, Status={tp_backup_status}.")
                     
@@ -1,32 +1,34 @@
 import sys
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from core.bot_manager import BotManager
 from commons.custom_logger import CustomLogger
 
 
-def parse_arguments() -> Optional[List[str]]:
+def parse_arguments() -> Tuple[Optional[List[str]], bool]:
     """
-    Parse command line arguments for bot IDs.
+    Parse command line arguments for bot IDs and run mode.
     
     Returns:
-        List of bot IDs if specified, None to run all bots
+        Tuple of (list of bot IDs or None to run all bots, async_mode)
         
     Examples:
-        python3 main.py          -> None (run all enabled bots)
-        python3 main.py 25       -> ['25']
-        python3 main.py aa bb    -> ['aa', 'bb']
+        python3 main.py               -> (None, False) (run all enabled bots)
+        python3 main.py 25            -> (['25'], False)
+        python3 main.py aa bb         -> (['aa', 'bb'], False)
+        python3 main.py --async 25    -> (['25'], True) (run bots on one event loop)
     """
-    if len(sys.argv) > 1:
-        return sys.argv[1:]
-    return None
+    args = sys.argv[1:]
+    async_mode = '--async' in args
+    bot_ids = [arg for arg in args if arg != '--async']
+    return (bot_ids if bot_ids else None), async_mode
 
 
 def main():
     logger = CustomLogger(name='main')
     
     # Parse command line arguments
-    bot_ids = parse_arguments()
+    bot_ids, async_mode = parse_arguments()
     
     if bot_ids:
         logger.info(message=f'🚀  Starting Trading Bot(s): {", ".join(bot_ids)} 🤖...')
@@ -34,7 +36,7 @@ def main():
         logger.info(message='🚀  Starting All Enabled Trading Bots 🤖...')
     
     # Initialize and run bot manager
-    bot_manager = BotManager(bot_ids=bot_ids)
+    bot_manager = BotManager(bot_ids=bot_ids, async_mode=async_mode)
     bot_manager.run()
     
     logger.info(message='👋  See you next time!')
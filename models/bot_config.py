@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -22,6 +22,15 @@ class BotConfig:
     - Use `quantity` for fixed quantity per trade (legacy mode)
     - Use `position_margin` for fixed margin per trade (recommended)
     - If both are provided, `position_margin` takes precedence
+    
+    Execution:
+    - `execution_config` holds optional order execution tuning, e.g. for POST_ONLY:
+      `post_only_max_retries` (int) and `post_only_taker_fallback` (bool); for the
+      MAKER_ONLY / POST_ONLY chase: `chase_reprice_threshold_ticks`, `chase_max_seconds`,
+      `chase_max_slippage_ticks`
+    - ADAPTIVE picks MARKET, LIMIT or POST_ONLY per order; tuned by
+      `adaptive_latency_budget_seconds`, `adaptive_min_fill_probability`,
+      `adaptive_wide_spread_ticks` and `adaptive_trade_flow_candles`
     """
     is_enabled: bool
     bot_id: int
@@ -43,6 +52,7 @@ class BotConfig:
     created_at: datetime
     position_margin: Optional[float] = None
     cooldown_after_sl_seconds: Optional[float] = None  # Cooldown after SL hit (in seconds)
+    execution_config: Dict[str, Any] = field(default_factory=dict)  # Order execution tuning
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BotConfig':
@@ -109,6 +119,7 @@ class BotConfig:
         data.setdefault('quantity', None)
         data.setdefault('position_margin', None)
         data.setdefault('cooldown_after_sl_seconds', None)
+        data.setdefault('execution_config', {})
         
         return cls(**data)
 
@@ -141,6 +152,8 @@ class BotConfig:
             result['quantity'] = self.quantity
         if self.cooldown_after_sl_seconds is not None:
             result['cooldown_after_sl_seconds'] = self.cooldown_after_sl_seconds
+        if self.execution_config:
+            result['execution_config'] = self.execution_config
             
         return result
     
@@ -4,6 +4,8 @@ class OrderType(Enum):
     MARKET = "MARKET"
     LIMIT = "LIMIT"
     MAKER_ONLY = "MAKER_ONLY"  # Post-only limit order using order book
+    POST_ONLY = "POST_ONLY"  # Post-only (GTX) limit at the touch, retried immediately when it would take
+    ADAPTIVE = "ADAPTIVE"  # MARKET, LIMIT or POST_ONLY chosen per order from spread and fill-probability estimates
     STOP = "STOP"
     STOP_MARKET = "STOP_MARKET"
     TAKE_PROFIT = "TAKE_PROFIT"
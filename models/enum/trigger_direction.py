@@ -0,0 +1,7 @@
+from enum import Enum
+
+class TriggerDirection(Enum):
+    ABOVE = "ABOVE"  # Fires when price >= level
+    BELOW = "BELOW"  # Fires when price <= level
+
+# EOF
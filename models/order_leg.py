@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from models.enum.order_type import OrderType
+
+# Conditional order types, placed through the algo order endpoint
+ALGO_ORDER_TYPES = {
+    OrderType.STOP.value,
+    OrderType.STOP_MARKET.value,
+    OrderType.TAKE_PROFIT.value,
+    OrderType.TAKE_PROFIT_MARKET.value,
+    OrderType.TRAILING_STOP_MARKET.value
+}
+
+
+@dataclass
+class OrderLeg:
+    """
+    One order of a batch placed with `BaseTradeClient.place_batch_orders`.
+
+    Attributes:
+        name: Label used in logs (e.g. 'tp_limit', 'sl')
+        order_side: 'BUY' or 'SELL'
+        order_type: OrderType value; conditional types are algo orders
+        quantity: Order quantity (ignored by algo orders with close_position)
+        price: Limit price (regular LIMIT orders)
+        trigger_price: Trigger price (algo orders)
+        reduce_only: If True, the order will only reduce the position
+        time_in_force: Time in force of LIMIT orders
+        close_position: If True, an algo order closes the whole position
+        client_order_id: Deterministic client order id ('' = exchange-assigned)
+        result: Exchange response once the leg is placed
+        error: Rejection reason if the leg failed
+        elapsed: Seconds from sending the leg to its response
+    """
+    name: str
+    order_side: str
+    order_type: str
+    quantity: float
+    price: float = 0
+    trigger_price: float = 0
+    reduce_only: bool = False
+    time_in_force: str = 'GTC'
+    close_position: bool = False
+    client_order_id: str = ''
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: str = ''
+    elapsed: float = 0.0
+
+    @property
+    def is_algo(self) -> bool:
+        return self.order_type in ALGO_ORDER_TYPES
+
+    @property
+    def order_id(self) -> str:
+        """orderId of a regular order or algoId of an algo order ('' until placed)."""
+        if not self.result:
+            return ''
+        return str(self.result.get('algoId' if self.is_algo else 'orderId') or '')
+
+    @property
+    def placed(self) -> bool:
+        return bool(self.order_id)
+
+    @property
+    def failed(self) -> bool:
+        """Not placed, or given up on (a late response is cancelled on arrival)."""
+        return not self.placed or bool(self.error)
+
+# EOF
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 from models.enum.position_side import PositionSide
 from commons.common import get_datetime_now_string_gmt_plus_7
 
@@ -32,6 +32,9 @@ class Position:
         sl_price: Stop loss price (for persistence across restarts)
         tp_order_id: Take profit order ID (for persistence across restarts)
         sl_order_id: Stop loss order ID (for persistence across restarts)
+        protective_sequence: TP/SL placements so far; numbers their client order ids
+        open_execution: Signal-to-fill latencies and slippage of the open order
+        close_execution: Signal-to-fill latencies and slippage of the close order
     """
     position_id: Optional[int] = None
     run_id: int = 0
@@ -55,6 +58,9 @@ class Position:
     sl_price: float = 0.0
     tp_order_id: str = ''
     sl_order_id: str = ''
+    protective_sequence: int = 0
+    open_execution: Dict[str, Any] = field(default_factory=dict)
+    close_execution: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> dict:
         """Convert position to dictionary for serialization."""
@@ -78,7 +84,10 @@ class Position:
             "tp_price": self.tp_price,
             "sl_price": self.sl_price,
             "tp_order_id": self.tp_order_id,
-            "sl_order_id": self.sl_order_id
+            "sl_order_id": self.sl_order_id,
+            "protective_sequence": self.protective_sequence,
+            "open_execution": self.open_execution,
+            "close_execution": self.close_execution
         }
 
     @classmethod
@@ -117,7 +126,10 @@ class Position:
             tp_price=data.get("tp_price", 0.0),
             sl_price=data.get("sl_price", 0.0),
             tp_order_id=data.get("tp_order_id", ""),
-            sl_order_id=data.get("sl_order_id", "")
+            sl_order_id=data.get("sl_order_id", ""),
+            protective_sequence=data.get("protective_sequence", 0),
+            open_execution=data.get("open_execution") or {},
+            close_execution=data.get("close_execution") or {}
         )
 
 
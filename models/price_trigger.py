@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from models.enum.trigger_direction import TriggerDirection
+
+
+@dataclass(frozen=True)
+class PriceTrigger:
+    """
+    Price level an exit strategy wants watched between bot ticks.
+
+    Returned by `BaseExitStrategy.get_price_triggers` and armed in the
+    process-wide `PriceTriggerEngine`; fires once when the price crosses it.
+
+    Attributes:
+        price: Trigger level
+        direction: ABOVE fires at price >= level, BELOW at price <= level
+        reason: Close reason of the exit when the trigger fires
+    """
+    price: float
+    direction: TriggerDirection
+    reason: str
+
+    def is_crossed(self, price: float) -> bool:
+        """Whether `price` is at or beyond the level."""
+        if self.direction == TriggerDirection.ABOVE:
+            return price >= self.price
+        return price <= self.price
+
+# EOF
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from time import monotonic
+
+
+@dataclass
+class StagedEntry:
+    """
+    Entry order inputs prepared by `TradeHandler.prestage_entry` before the signal fires.
+
+    Attributes:
+        quantity: Trade quantity, already rounded to the symbol's step size
+        price: Price the quantity was computed from (0 for fixed quantity)
+        staged_at: Monotonic time the entry was staged
+    """
+    quantity: float
+    price: float
+    staged_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was staged."""
+        return monotonic() - self.staged_at
+
+# EOF
@@ -0,0 +1,234 @@
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+# Decimal places a filter value is read with (Binance filters use at most 8)
+FILTER_MAX_DECIMALS = 12
+
+# Relative distance within which `value * scale` is taken as the integer it represents
+# (absorbs binary float noise such as 0.29 * 100 == 28.999999999999996)
+SCALE_TOLERANCE = 4.5e-16  # About two float ulps
+
+
+def _decimals(value: Any) -> int:
+    """Decimal places of a filter value given as string or float ('0.00100000' -> 3, 1e-05 -> 5)."""
+    text = f"{float(value):.{FILTER_MAX_DECIMALS}f}".rstrip('0')
+    return len(text.split('.')[1]) if '.' in text else 0
+
+
+def _scaled(value: float, scale: int) -> Tuple[int, bool]:
+    """`value * scale` as (floor, exact); exact when it is within float noise of an integer."""
+    scaled = value * scale
+    nearest = round(scaled)
+    if abs(scaled - nearest) <= abs(scaled) * SCALE_TOLERANCE:
+        return nearest, True
+    return math.floor(scaled), False
+
+
+@dataclass(frozen=True)
+class SymbolFilters:
+    """
+    Trading rules of one symbol as integer scale factors, built once from exchange info.
+
+    Prices are counted in units of 1 / price_scale and quantities in units of
+    1 / quantity_scale, so rounding to tick / step size is integer arithmetic.
+    Results match rounding the decimal representation of the float
+    (what `Decimal(str(value))` did) without allocating Decimals, down to
+    the last digit a float can resolve at the symbol's scale: arithmetic
+    noise past the 15th significant digit is dropped, so 0.1 + 0.2 ceils
+    to 0.3 at tick 0.1 where `Decimal(str(0.1 + 0.2))` gave 0.4.
+
+    Attributes:
+        symbol: Trading pair symbol
+        price_scale: Price units per 1.0 (10 ** tick size decimals)
+        tick: Tick size in price units
+        quantity_scale: Quantity units per 1.0 (10 ** step size decimals)
+        step: Step size in quantity units
+        min_qty: Minimum order quantity in quantity units
+        max_qty: Maximum order quantity in quantity units (0 = no limit)
+        min_notional: Minimum order value in price units * quantity units (0 = no limit)
+    """
+    symbol: str
+    price_scale: int
+    tick: int
+    quantity_scale: int
+    step: int
+    min_qty: int = 0
+    max_qty: int = 0
+    min_notional: int = 0
+
+    @classmethod
+    def create(
+        cls,
+        symbol: str,
+        tick_size: Any,
+        step_size: Any,
+        min_qty: Any = 0,
+        max_qty: Any = 0,
+        min_notional: Any = 0
+    ) -> 'SymbolFilters':
+        """
+        Build filters from decimal values (strings as returned by the exchange, or floats).
+
+        Args:
+            symbol: Trading pair symbol
+            tick_size: Minimum price increment
+            step_size: Minimum quantity increment
+            min_qty: Minimum order quantity
+            max_qty: Maximum order quantity (0 = no limit)
+            min_notional: Minimum order value in quote currency (0 = no limit)
+
+        Returns:
+            SymbolFilters instance
+        """
+        price_scale = 10 ** _decimals(tick_size)
+        quantity_scale = 10 ** max(_decimals(step_size), _decimals(min_qty))
+        return cls(
+            symbol=symbol,
+            price_scale=price_scale,
+            tick=max(round(float(tick_size) * price_scale), 1),
+            quantity_scale=quantity_scale,
+            step=max(round(float(step_size) * quantity_scale), 1),
+            min_qty=round(float(min_qty) * quantity_scale),
+            max_qty=round(float(max_qty) * quantity_scale),
+            min_notional=math.ceil(float(min_notional) * price_scale * quantity_scale)
+        )
+
+    @classmethod
+    def from_symbol_info(cls, symbol_info: Dict[str, Any]) -> 'SymbolFilters':
+        """
+        Build filters from a symbol entry of GET /fapi/v1/exchangeInfo.
+
+        Args:
+            symbol_info: Symbol entry with its 'filters' list
+
+        Returns:
+            SymbolFilters instance
+        """
+        values: Dict[str, Any] = {'tick_size': '0.01', 'step_size': '0.001'}
+        for filter_item in symbol_info.get('filters', []):
+            filter_type = filter_item.get('filterType')
+            if filter_type == 'PRICE_FILTER':
+                values['tick_size'] = filter_item.get('tickSize', '0.01')
+            elif filter_type == 'LOT_SIZE':
+                values['step_size'] = filter_item.get('stepSize', '0.001')
+                values['min_qty'] = filter_item.get('minQty', 0)
+                values['max_qty'] = filter_item.get('maxQty', 0)
+            elif filter_type == 'MIN_NOTIONAL':
+                values['min_notional'] = filter_item.get('notional', 0)
+        return cls.create(symbol=symbol_info.get('symbol', ''), **values)
+
+    @property
+    def tick_size(self) -> float:
+        return self.tick / self.price_scale
+
+    @property
+    def step_size(self) -> float:
+        return self.step / self.quantity_scale
+
+    def to_exchange_info(self) -> Dict[str, Any]:
+        """Exchange info dict served by `get_cached_exchange_info` (floats)."""
+        return {
+            'symbol': self.symbol,
+            'tickSize': self.tick_size,
+            'stepSize': self.step_size,
+            'minQty': self.min_qty / self.quantity_scale,
+            'maxQty': self.max_qty / self.quantity_scale,
+            'minNotional': self.min_notional / (self.price_scale * self.quantity_scale)
+        }
+
+    def has_tick_size(self, tick_size: Any) -> bool:
+        """Whether `tick_size` is this symbol's tick size."""
+        return float(tick_size) == self.tick_size
+
+    # Rounding
+
+    @staticmethod
+    def _floor(value: float, scale: int, increment: int) -> float:
+        units, _ = _scaled(value, scale)
+        return (units // increment) * increment / scale
+
+    @staticmethod
+    def _ceil(value: float, scale: int, increment: int) -> float:
+        units, exact = _scaled(value, scale)
+        count = -(-units // increment) if exact else units // increment + 1
+        return count * increment / scale
+
+    @staticmethod
+    def _nearest(value: float, scale: int, increment: int) -> float:
+        units, exact = _scaled(value, scale)
+        if exact:
+            count = (2 * units + increment) // (2 * increment)  # Half up
+        else:
+            count = math.floor(value * scale / increment + 0.5)
+        return count * increment / scale
+
+    def floor_price(self, price: float) -> float:
+        """Round a price down to the tick size."""
+        return self._floor(price, self.price_scale, self.tick)
+
+    def ceil_price(self, price: float) -> float:
+        """Round a price up to the tick size."""
+        return self._ceil(price, self.price_scale, self.tick)
+
+    def round_price(self, price: float) -> float:
+        """Round a price to the nearest tick (halves up)."""
+        return self._nearest(price, self.price_scale, self.tick)
+
+    def floor_quantity(self, quantity: float) -> float:
+        """Round a quantity down to the step size."""
+        return self._floor(quantity, self.quantity_scale, self.step)
+
+    def ceil_quantity(self, quantity: float) -> float:
+        """Round a quantity up to the step size."""
+        return self._ceil(quantity, self.quantity_scale, self.step)
+
+    def round_quantity(self, quantity: float) -> float:
+        """Round a quantity to the nearest step (halves up)."""
+        return self._nearest(quantity, self.quantity_scale, self.step)
+
+    def add_ticks(self, price: float, ticks: int) -> float:
+        """Price `ticks` ticks away from `price` (negative = below)."""
+        units, exact = _scaled(price, self.price_scale)
+        if not exact:
+            return price + ticks * self.tick_size
+        return (units + ticks * self.tick) / self.price_scale
+
+    def notional(self, price: float, quantity: float) -> float:
+        """Order value price * quantity, exact when both are on the symbol's grid."""
+        price_units, price_exact = _scaled(price, self.price_scale)
+        quantity_units, quantity_exact = _scaled(quantity, self.quantity_scale)
+        if not (price_exact and quantity_exact):
+            return price * quantity
+        return price_units * quantity_units / (self.price_scale * self.quantity_scale)
+
+    # Validation
+
+    def validate(self, quantity: float, price: float = 0) -> str:
+        """
+        Check an order against the symbol's filters.
+
+        Args:
+            quantity: Order quantity
+            price: Order price (0 skips the price and notional checks)
+
+        Returns:
+            Reason the exchange would reject the order, '' if it passes
+        """
+        quantity_units, quantity_exact = _scaled(quantity, self.quantity_scale)
+        if not quantity_exact or quantity_units % self.step:
+            return f"quantity {quantity} is not a multiple of step size {self.step_size}"
+        if quantity_units < self.min_qty:
+            return f"quantity {quantity} is below min qty {self.min_qty / self.quantity_scale}"
+        if self.max_qty and quantity_units > self.max_qty:
+            return f"quantity {quantity} is above max qty {self.max_qty / self.quantity_scale}"
+        if price <= 0:
+            return ''
+        price_units, price_exact = _scaled(price, self.price_scale)
+        if not price_exact or price_units % self.tick:
+            return f"price {price} is not a multiple of tick size {self.tick_size}"
+        if price_units * quantity_units < self.min_notional:
+            return f"notional {self.notional(price, quantity)} is below min notional {self.min_notional / (self.price_scale * self.quantity_scale)}"
+        return ''
+
+# EOF
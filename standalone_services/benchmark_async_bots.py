@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Compare the thread-per-bot model with the asyncio run mode against a local mock exchange.
+
+Usage:
+    python3 standalone_services/benchmark_async_bots.py --bots 200 --seconds 20 --latency-ms 50
+
+A mock Binance Futures REST server is started on localhost and every "bot"
+runs the per-tick I/O of a live bot (klines + price + position) followed by a
+small indicator computation, as fast as it can, for the given duration.
+Each model runs in its own subprocess so peak memory is measured separately.
+No request reaches Binance.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+
+# Allow execution directly from the repository root or any other directory.
+REPOSITORY_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPOSITORY_ROOT)
+
+TIMEFRAME = "1m"
+KLINES_LIMIT = 100
+
+
+# ========== Mock exchange ==========
+
+class MockExchangeHandler(BaseHTTPRequestHandler):
+    """Serves the endpoints a bot hits every tick with synthetic data."""
+
+    latency_seconds = 0.0
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-MBX-USED-WEIGHT-1M", "0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency_seconds)
+        parsed = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+
+        if parsed.path == "/fapi/v1/klines":
+            limit = int(params.get("limit", KLINES_LIMIT))
+            now_ms = int(time.time() // 60 * 60_000)
+            rows = []
+            for i in range(limit):
+                open_time = now_ms - (limit - 1 - i) * 60_000
+                price = 100 + random.random()
+                rows.append([open_time, str(price), str(price + 1), str(price - 1), str(price),
+                             "10", open_time + 59_999, "1000", 10, "5", "500", "0"])
+            self._send_json(rows)
+        elif parsed.path == "/fapi/v1/ticker/price":
+            self._send_json({"symbol": params.get("symbol", ""), "price": str(100 + random.random())})
+        elif parsed.path == "/fapi/v2/positionRisk":
+            self._send_json([{"symbol": "BENCHUSDT", "positionAmt": "0", "entryPrice": "0",
+                              "unRealizedProfit": "0", "markPrice": "100"}])
+        elif parsed.path == "/fapi/v1/time":
+            self._send_json({"serverTime": int(time.time() * 1000)})
+        elif parsed.path == "/fapi/v1/order":
+            self._send_json({"orderId": params.get("orderId", ""), "status": "NEW", "executedQty": "0"})
+        else:
+            self.send_error(404)
+
+
+def start_mock_exchange(latency_seconds: float) -> ThreadingHTTPServer:
+    """Start the mock exchange on a free localhost port in a daemon thread."""
+    MockExchangeHandler.latency_seconds = latency_seconds
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockExchangeHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ========== Bot workloads ==========
+
+def _prepare_client_environment(base_url: str) -> None:
+    """Point the live clients at the mock exchange and lift the weight limit."""
+    os.environ["BINANCE_FAPI_BASE_URL"] = base_url
+    os.environ.setdefault("BINANCE_API_KEY", "benchmark")
+    os.environ.setdefault("BINANCE_SECRET_KEY", "benchmark")
+    os.environ["KLINE_STREAM_ENABLED"] = "false"
+    os.environ["USER_DATA_STREAM_ENABLED"] = "false"
+    os.environ["LOG_LEVELS"] = "ERROR"
+
+    from trade_clients.binance.binance_rate_limiter import BinanceRateLimiter
+    BinanceRateLimiter._instance = BinanceRateLimiter(capacity=10 ** 9)
+
+
+def _compute_indicator(klines_df) -> float:
+    """Stand-in for strategy computation."""
+    return float(klines_df["close"].ewm(span=12).mean().iloc[-1])
+
+
+def run_thread_model(base_url: str, bots: int, seconds: float) -> Dict[str, Any]:
+    """One OS thread per bot, blocking requests (the BotManager default)."""
+    _prepare_client_environment(base_url)
+    from trade_clients.binance.binance_live_trade_client import BinanceLiveTradeClient
+
+    ticks = [0] * bots
+    deadline = time.monotonic() + seconds
+
+    def bot_loop(index: int) -> None:
+        client = BinanceLiveTradeClient()
+        client.init()
+        symbol = f"BOT{index}USDT"
+        while time.monotonic() < deadline:
+            klines_df = client.fetch_klines(symbol=symbol, timeframe=TIMEFRAME, timeframe_limit=KLINES_LIMIT)
+            client.fetch_position(symbol=symbol)
+            if klines_df is not None:
+                _compute_indicator(klines_df)
+            ticks[index] += 1
+
+    threads = [threading.Thread(target=bot_loop, args=(i,)) for i in range(bots)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    peak_threads = threading.active_count()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    return _result(model="thread", ticks=sum(ticks), elapsed=elapsed, peak_threads=peak_threads)
+
+
+def run_async_model(base_url: str, bots: int, seconds: float) -> Dict[str, Any]:
+    """All bots on one event loop with aiohttp; indicators in the executor."""
+    _prepare_client_environment(base_url)
+    from trade_clients.binance.binance_async_live_trade_client import BinanceAsyncLiveTradeClient
+
+    ticks = [0] * bots
+    peak_threads = [0]
+
+    async def bot_loop(index: int, deadline: float) -> None:
+        client = BinanceAsyncLiveTradeClient()
+        client.init()
+        symbol = f"BOT{index}USDT"
+        loop = asyncio.get_running_loop()
+        try:
+            while time.monotonic() < deadline:
+                klines_df = await client.fetch_klines_async(
+                    symbol=symbol, timeframe=TIMEFRAME, timeframe_limit=KLINES_LIMIT)
+                await client.fetch_position_async(symbol=symbol)
+                if klines_df is not None:
+                    await loop.run_in_executor(None, _compute_indicator, klines_df)
+                ticks[index] += 1
+                peak_threads[0] = max(peak_threads[0], threading.active_count())
+        finally:
+            await client.close_async()
+
+    async def main() -> float:
+        deadline = time.monotonic() + seconds
+        started = time.monotonic()
+        await asyncio.gather(*(bot_loop(i, deadline) for i in range(bots)))
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(main())
+    return _result(model="async", ticks=sum(ticks), elapsed=elapsed, peak_threads=peak_threads[0])
+
+
+def _result(model: str, ticks: int, elapsed: float, peak_threads: int) -> Dict[str, Any]:
+    return {
+        "model": model,
+        "ticks": ticks,
+        "ticks_per_second": round(ticks / elapsed, 1) if elapsed > 0 else 0.0,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "peak_threads": peak_threads,
+    }
+
+
+# ========== Driver ==========
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark thread vs asyncio bot models")
+    parser.add_argument("--bots", type=int, default=200, help="Number of simulated bots")
+    parser.add_argument("--seconds", type=float, default=20, help="Duration per model")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Mock exchange latency per request")
+    parser.add_argument("--model", choices=["thread", "async"], help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Child process: run one model and print its result as JSON
+    if args.model:
+        runner = run_thread_model if args.model == "thread" else run_async_model
+        print(json.dumps(runner(base_url=args.base_url, bots=args.bots, seconds=args.seconds)))
+        return
+
+    server = start_mock_exchange(latency_seconds=args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"Mock exchange at {base_url} ({args.latency_ms:.0f}ms latency), "
+          f"{args.bots} bots, {args.seconds:.0f}s per model")
+
+    results: List[Dict[str, Any]] = []
+    for model in ("thread", "async"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--model", model, "--base-url", base_url,
+             "--bots", str(args.bots), "--seconds", str(args.seconds)],
+            capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    server.shutdown()
+
+    print(f"{'model':<8}{'ticks':>10}{'ticks/s':>12}{'peak RSS MB':>14}{'threads':>10}")
+    for r in results:
+        print(f"{r['model']:<8}{r['ticks']:>10}{r['ticks_per_second']:>12}"
+              f"{r['peak_rss_mb']:>14}{r['peak_threads']:>10}")
+
+
+if __name__ == "__main__":
+    main()
+
+# EOF
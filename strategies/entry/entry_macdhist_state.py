@@ -86,6 +86,13 @@ class EntryMacdHistState(BaseEntryStrategy):
         
         return PositionSignal(position_side = new_position_side, reason = reason_message)
 
+    def is_near_signal(self, klines_df, position_handler: PositionHandler) -> bool:
+        # The closed candles already show the histogram flip (+,-); only the
+        # current candle's histogram decides whether the signal fires
+        klines_df = self._process_data(klines_df=klines_df)
+        prev_prev_hist, prev_hist = klines_df.iloc[-3:-1]['histogram'].values
+        return bool(prev_prev_hist > 0 and not prev_hist > 0)
+
     def calculate_tp_sl(self, klines_df, position_handler: PositionHandler):
         return -1, -1
 
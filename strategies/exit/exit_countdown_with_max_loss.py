@@ -12,8 +12,11 @@ from models.bot_config import BotConfig
 from models.enum.position_side import PositionSide
 from models.position_signal import PositionSignal
 from core.position_handler import PositionHandler
+from models.enum.trigger_direction import TriggerDirection
+from models.price_trigger import PriceTrigger
 from commons.common import get_datetime_now_gmt_plus_7
 from datetime import datetime
+from typing import List
 import pandas as pd
 
 
@@ -109,6 +112,30 @@ class ExitCountdownWithMaxLoss(BaseExitStrategy):
         """
         return klines_df
 
+    def get_price_triggers(self, position_handler: PositionHandler) -> List[PriceTrigger]:
+        """
+        Watch the max loss (SL) level between ticks.
+        
+        The reason starts with 'SL Hit' so `get_cooldown_seconds` applies
+        the max loss cooldown.
+        
+        Args:
+            position_handler: Position handler with current position
+            
+        Returns:
+            SL price trigger of the open position (none if SL is not set)
+        """
+        position = position_handler.get_position()
+        sl_price = position_handler.sl_price
+        if position is None or position.position_side == PositionSide.ZERO or sl_price <= 0:
+            return []
+        
+        return [PriceTrigger(
+            price=sl_price,
+            direction=TriggerDirection.BELOW if position.position_side == PositionSide.LONG else TriggerDirection.ABOVE,
+            reason=f"SL Hit - trigger ({sl_price})"
+        )]
+
     def should_close(self, klines_df, position_handler: PositionHandler) -> PositionSignal:
         """
         Determine if position should be closed based on:
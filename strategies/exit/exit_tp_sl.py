@@ -1,8 +1,12 @@
+from typing import List
+
 from abstracts.base_exit_strategy import BaseExitStrategy
 from models.bot_config import BotConfig
 from models.enum.position_side import PositionSide
 from models.position_signal import PositionSignal
 from core.position_handler import PositionHandler
+from models.enum.trigger_direction import TriggerDirection
+from models.price_trigger import PriceTrigger
 
 class ExitTPSL(BaseExitStrategy):
     """
@@ -30,6 +34,36 @@ class ExitTPSL(BaseExitStrategy):
         """
         return klines_df
 
+    def get_price_triggers(self, position_handler: PositionHandler) -> List[PriceTrigger]:
+        """
+        Watch TP and SL levels between ticks.
+        
+        Args:
+            position_handler: Position handler with current position and TP/SL prices
+            
+        Returns:
+            TP/SL price triggers of the open position
+        """
+        position = position_handler.get_position()
+        if position is None or position.position_side == PositionSide.ZERO:
+            return []
+        
+        is_long = position.position_side == PositionSide.LONG
+        triggers = []
+        if position_handler.tp_price > 0.0:
+            triggers.append(PriceTrigger(
+                price=position_handler.tp_price,
+                direction=TriggerDirection.ABOVE if is_long else TriggerDirection.BELOW,
+                reason=f"{position.symbol} TP {position_handler.tp_price} hit"
+            ))
+        if position_handler.sl_price > 0.0:
+            triggers.append(PriceTrigger(
+                price=position_handler.sl_price,
+                direction=TriggerDirection.BELOW if is_long else TriggerDirection.ABOVE,
+                reason=f"{position.symbol} SL {position_handler.sl_price} hit"
+            ))
+        return triggers
+
     def should_close(self, klines_df, position_handler: PositionHandler) -> PositionSignal:
         """
         Determine if position should be closed based on TP/SL levels.
@@ -11,11 +11,15 @@ Based on backtests, exiting at candle close (if target not hit) works better tha
 using a wide stop loss.
 """
 
+from typing import List
+
 from abstracts.base_exit_strategy import BaseExitStrategy
 from models.bot_config import BotConfig
 from models.enum.position_side import PositionSide
 from models.position_signal import PositionSignal
 from core.position_handler import PositionHandler
+from models.enum.trigger_direction import TriggerDirection
+from models.price_trigger import PriceTrigger
 import pandas as pd
 
 
@@ -44,6 +48,27 @@ class ExitWickTarget(BaseExitStrategy):
         """
         return klines_df
 
+    def get_price_triggers(self, position_handler: PositionHandler) -> List[PriceTrigger]:
+        """
+        Watch the TP target between ticks.
+        
+        Args:
+            position_handler: Handler with current position state
+            
+        Returns:
+            TP price trigger of the open position (none if TP is not set)
+        """
+        position = position_handler.get_position()
+        tp_price = position_handler.tp_price
+        if position is None or position.position_side == PositionSide.ZERO or tp_price <= 0.0:
+            return []
+        
+        return [PriceTrigger(
+            price=tp_price,
+            direction=TriggerDirection.ABOVE if position.position_side == PositionSide.LONG else TriggerDirection.BELOW,
+            reason=f"{position.symbol} Wick Target Exit | TP {tp_price} hit"
+        )]
+
     def should_close(self, klines_df: pd.DataFrame, position_handler: PositionHandler) -> PositionSignal:
         """
         Determine if position should be closed.
@@ -0,0 +1,20 @@
+import os
+
+os.environ.setdefault('LOG_LEVELS', 'ERROR')
+
+import pytest
+
+from tests.fakes import FakeTradeClient
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Keep state files and logs written by the code under test out of the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def client() -> FakeTradeClient:
+    return FakeTradeClient()
+
+# EOF
@@ -0,0 +1,234 @@
+"""
+In-memory stand-ins for the exchange, and bot / trade handler factories used by the tests.
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from abstracts.base_trade_client import BaseTradeClient
+from commons.constants import POST_ONLY_REJECTED_ERROR_CODE
+from core.position_handler import PositionHandler
+from core.trade_handler import TradeHandler
+from models.bot_config import BotConfig
+from models.symbol_filters import SymbolFilters
+
+TICK_SIZE = 0.1
+STEP_SIZE = 0.001
+
+
+class FakeTradeClient(BaseTradeClient):
+    """
+    Exchange kept in dicts; tests drive fills and rejections explicitly.
+
+    - Orders rest as NEW until `fill()` is called
+    - `reject_post_only` rejects that many GTX placements (error -5022)
+    - `place_error` rejects every LIMIT placement with that error code while set
+    - `lose_responses` loses that many placement responses (outcome unknown);
+      the order still rests on the book if `lost_orders_land`
+    - `amend_fails` makes `modify_order` fail so the chase cancel/replaces
+    - `algo_delay` blocks algo placements (set `release_algo` to let them through)
+    """
+
+    def __init__(self, price: float = 100.0) -> None:
+        super().__init__()
+        self.price = price
+        self.book: Dict[str, Any] = {'bids': [[price - TICK_SIZE, 5.0]], 'asks': [[price, 5.0]]}
+        self.position: Dict[str, Any] = {}
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.algo_orders: Dict[str, Dict[str, Any]] = {}
+        self.placed: List[Dict[str, Any]] = []  # every place_order call, accepted or not
+        self.cancelled: List[str] = []
+        self.reject_post_only = 0
+        self.place_error: Optional[int] = None
+        self.lose_responses = 0
+        self.lost_orders_land = True
+        self.amend_fails = False
+        self.algo_delay = False
+        self.release_algo = threading.Event()
+        self._last_error_code: Optional[int] = None
+        self._outcome_unknown = False
+        self._next_id = 0
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return str(self._next_id)
+
+    # Test controls
+
+    def fill(self, order_id: str, quantity: Optional[float] = None) -> None:
+        """Fill a resting order, fully or up to `quantity` executed in total."""
+        order = self.orders[order_id]
+        executed = order['origQty'] if quantity is None else quantity
+        order['executedQty'] = executed
+        order['status'] = 'FILLED' if executed >= order['origQty'] else 'PARTIALLY_FILLED'
+
+    def last_order(self) -> Dict[str, Any]:
+        return list(self.orders.values())[-1]
+
+    # BaseTradeClient
+
+    def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
+        return {'leverage': leverage}
+
+    def fetch_position(self, symbol: str) -> Dict[str, Any]:
+        return dict(self.position)
+
+    def fetch_price(self, symbol: str, use_cache: bool = True) -> float:
+        return self.price
+
+    def fetch_klines(self, symbol: str, timeframe: str, timeframe_limit: int = 100) -> pd.DataFrame:
+        return pd.DataFrame()
+
+    def fetch_order(self, symbol: str, order_id: str = '') -> Dict[str, Any]:
+        return dict(self.orders.get(order_id, {}))
+
+    def place_order(
+        self,
+        symbol: str,
+        order_side: str,
+        order_type: str,
+        quantity: float,
+        price: float = 0,
+        reduce_only: bool = False,
+        time_in_force: str = "GTC",
+        client_order_id: str = ''
+    ) -> Dict[str, Any]:
+        self.placed.append({'order_type': order_type, 'price': price, 'quantity': quantity,
+                            'time_in_force': time_in_force, 'client_order_id': client_order_id})
+        self._outcome_unknown = False
+        if self.lose_responses > 0:
+            self.lose_responses -= 1
+            self._last_error_code = None
+            self._outcome_unknown = True
+            if not self.lost_orders_land:
+                return {}
+        if time_in_force == 'GTX' and self.reject_post_only > 0:
+            self.reject_post_only -= 1
+            self._last_error_code = POST_ONLY_REJECTED_ERROR_CODE
+            return {}
+        if self.place_error is not None and order_type != 'MARKET':
+            self._last_error_code = self.place_error
+            return {}
+        self._last_error_code = None
+        order_id = self._new_id()
+        self.orders[order_id] = {
+            'orderId': order_id,
+            'clientOrderId': client_order_id,
+            'symbol': symbol,
+            'side': order_side,
+            'type': order_type,
+            'status': 'FILLED' if order_type == 'MARKET' else 'NEW',
+            'price': price or self.price,
+            'origQty': quantity,
+            'executedQty': quantity if order_type == 'MARKET' else 0.0
+        }
+        return {} if self._outcome_unknown else dict(self.orders[order_id])
+
+    def cancel_order(self, symbol: str, order_id: str = '') -> Dict[str, Any]:
+        order = self.orders[order_id]
+        if order['status'] != 'FILLED':
+            order['status'] = 'CANCELED'
+        self.cancelled.append(order_id)
+        return dict(order)
+
+    def modify_order(self, symbol: str, order_id: str, order_side: str, quantity: float, price: float) -> Dict[str, Any]:
+        if self.amend_fails:
+            return {}
+        self.orders[order_id]['price'] = price
+        return dict(self.orders[order_id])
+
+    def fetch_algorithmic_order(self, order_id: str) -> Dict[str, Any]:
+        return dict(self.algo_orders.get(order_id, {}))
+
+    def place_algorithmic_order(
+        self,
+        symbol: str,
+        order_side: str,
+        order_type: str,
+        quantity: float,
+        trigger_price: float,
+        close_position: bool = False,
+        client_order_id: str = ''
+    ) -> Dict[str, Any]:
+        if self.algo_delay:
+            self.release_algo.wait(timeout=5)
+        algo_id = self._new_id()
+        self.algo_orders[algo_id] = {
+            'algoId': algo_id,
+            'clientAlgoId': client_order_id,
+            'orderType': order_type,
+            'triggerPrice': trigger_price,
+            'algoStatus': 'NEW'
+        }
+        return dict(self.algo_orders[algo_id])
+
+    def cancel_algorithmic_order(self, order_id: str) -> Dict[str, Any]:
+        self.algo_orders[order_id]['algoStatus'] = 'CANCELED'
+        self.cancelled.append(order_id)
+        return dict(self.algo_orders[order_id])
+
+    def fetch_trades(self, symbol: str = '', order_id: str = '') -> Dict[str, Any]:
+        return {}
+
+    def fetch_order_trade(self, symbol: str = '', order_id: str = '') -> Dict[str, Any]:
+        return {'price': float(self.orders[order_id]['price']), 'side': self.orders[order_id]['side'], 'fee': 0.0, 'pnl': 0.0}
+
+    def fetch_order_book(self, symbol: str, limit: int = 5) -> Dict[str, Any]:
+        return self.book
+
+    def fetch_exchange_info(self, symbol: str) -> Dict[str, Any]:
+        return self.get_symbol_filters(symbol).to_exchange_info()
+
+    def has_exchange_info_cached(self, symbol: str) -> bool:
+        return True
+
+    def get_cached_exchange_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self.fetch_exchange_info(symbol)
+
+    def get_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        return SymbolFilters.create(symbol=symbol, tick_size=TICK_SIZE, step_size=STEP_SIZE, min_qty=STEP_SIZE)
+
+    def fetch_order_by_client_id(self, symbol: str, client_order_id: str, algo: bool = False) -> Dict[str, Any]:
+        orders = self.algo_orders.values() if algo else self.orders.values()
+        key = 'clientAlgoId' if algo else 'clientOrderId'
+        return next((dict(order) for order in orders if order[key] == client_order_id), {})
+
+    def get_last_error_code(self) -> Optional[int]:
+        return self._last_error_code
+
+    def last_order_outcome_unknown(self) -> bool:
+        return self._outcome_unknown
+
+
+def make_bot_config(**overrides) -> BotConfig:
+    """Live bot trading 1.0 BTCUSDC per position."""
+    config = {
+        'is_enabled': True,
+        'bot_id': 1,
+        'run_id': 1,
+        'bot_name': 'test bot',
+        'run_mode': 'live',
+        'trade_client': 'binance',
+        'entry_strategy': 'GUARANTEED_SCALP',
+        'exit_strategy': 'CANDLE_CLOSE',
+        'tp_enabled': False,
+        'sl_enabled': False,
+        'symbol': 'BTCUSDC',
+        'leverage': 10,
+        'quantity': 1.0,
+        'timeframe': '1h',
+        'timeframe_limit': 10,
+        'order_type': 'LIMIT',
+        'dynamic_config': {}
+    }
+    config.update(overrides)
+    return BotConfig.from_dict(config)
+
+
+def make_trade_handler(client: FakeTradeClient, bot_config: BotConfig) -> TradeHandler:
+    """Trade handler over a fresh position handler (resumes a persisted pending order, if any)."""
+    position_handler = PositionHandler(bot_config=bot_config, logger=client.logger)
+    return TradeHandler(trade_client=client, bot_config=bot_config, logger=client.logger, position_handler=position_handler)
+
+# EOF
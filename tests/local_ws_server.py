@@ -0,0 +1,82 @@
+"""
+Local websocket stand-in for the Binance stream endpoint.
+
+Runs an aiohttp server on 127.0.0.1 in a background thread; every path is
+accepted as a stream. Tests push JSON events to the connected clients and
+can drop the connections to exercise reconnects.
+"""
+import asyncio
+import json
+import threading
+from typing import Any, Dict, List
+
+from aiohttp import WSMsgType, web
+
+
+class LocalWebSocketServer:
+    """Websocket server serving every path, driven from the test thread."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._clients: List[web.WebSocketResponse] = []
+        self._runner: web.AppRunner
+        self.connections = 0  # connections accepted since start
+        self.port = 0
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}/ws"
+
+    def start(self) -> 'LocalWebSocketServer':
+        self._thread.start()
+        self._call(self._start())
+        return self
+
+    def stop(self) -> None:
+        self._call(self._runner.cleanup())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    def send(self, data: Dict[str, Any]) -> None:
+        """Send one JSON event to every connected client."""
+        self._call(self._send(json.dumps(data)))
+
+    def disconnect_all(self) -> None:
+        """Close every client connection (clients are expected to reconnect)."""
+        self._call(self._close_clients())
+
+    def _call(self, coroutine) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout=5)
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/{tail:.*}', self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._clients.append(ws)
+        self.connections += 1
+        async for message in ws:
+            if message.type == WSMsgType.ERROR:
+                break
+        if ws in self._clients:
+            self._clients.remove(ws)
+        return ws
+
+    async def _send(self, text: str) -> None:
+        for ws in list(self._clients):
+            await ws.send_str(text)
+
+    async def _close_clients(self) -> None:
+        for ws in list(self._clients):
+            self._clients.remove(ws)
+            await ws.close()
+
+# EOF
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from abstracts.base_live_trade_client import BaseLiveTradeClient
+from models.enum.position_side import PositionSide
+from tests.fakes import FakeTradeClient, make_bot_config, make_trade_handler
+
+
+class ConcurrentFakeClient(FakeTradeClient, BaseLiveTradeClient):
+    """Fake exchange placing batches like the live clients (legs sent concurrently) with a short deadline."""
+
+    deadline = 0.2
+
+    def _place_legs_concurrently(self, symbol, units, deadline=0.0):
+        super()._place_legs_concurrently(symbol=symbol, units=units, deadline=self.deadline)
+
+
+@pytest.fixture
+def client():
+    client = ConcurrentFakeClient()
+    yield client
+    client.release_algo.set()
+
+
+def place_tp_sl(client):
+    trade_handler = make_trade_handler(client=client, bot_config=make_bot_config(tp_enabled=True, sl_enabled=True))
+    return trade_handler, lambda: trade_handler.place_tp_sl_orders(position_side=PositionSide.LONG, tp_price=110.0, sl_price=95.0)
+
+
+def test_batch_places_every_leg(client):
+    trade_handler, place = place_tp_sl(client)
+
+    legs = place()
+
+    assert [leg.name for leg in legs] == ['tp_limit', 'tp_backup', 'sl']
+    assert all(leg.placed and not leg.error for leg in legs)
+    assert trade_handler.position_handler.tp_order_id == legs[0].order_id
+    assert client.cancelled == []
+
+
+def test_batch_deadline_cancels_the_late_legs_on_arrival(client):
+    _, place = place_tp_sl(client)
+    client.algo_delay = True  # TP backup and SL are stuck in flight
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match='no response within'):
+        place()
+    assert time.monotonic() - started < 2
+
+    # The leg answered in time is rolled back right away
+    tp_limit = next(order for order in client.orders.values() if order['type'] == 'LIMIT')
+    assert tp_limit['status'] == 'CANCELED'
+    assert client.algo_orders == {}
+
+    # The late legs are cancelled as soon as their placement returns
+    client.release_algo.set()
+    deadline = time.monotonic() + 5
+    while len(client.algo_orders) < 2 or any(order['algoStatus'] != 'CANCELED' for order in list(client.algo_orders.values())):
+        assert time.monotonic() < deadline, client.algo_orders
+        time.sleep(0.01)
+
+# EOF
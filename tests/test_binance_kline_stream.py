@@ -0,0 +1,172 @@
+import time
+from typing import Callable, List
+
+import pytest
+
+import trade_clients.binance.binance_kline_stream as binance_kline_stream
+import trade_clients.binance.binance_websocket as binance_websocket
+from tests.local_ws_server import LocalWebSocketServer
+from trade_clients.binance.binance_kline_stream import BinanceKlineStreamManager
+from trade_clients.binance.binance_live_trade_client import BinanceLiveTradeClient
+
+SYMBOL = 'BTCUSDC'
+TIMEFRAME = '1m'
+INTERVAL_MS = 60_000
+T0 = 1_700_000_040_000  # minute-aligned open time of candle 0
+
+
+def kline_row(index: int, close: float) -> list:
+    """REST klines row of candle `index`."""
+    open_time = T0 + index * INTERVAL_MS
+    return [open_time, '100.0', '110.0', '90.0', str(close), '10.0', open_time + INTERVAL_MS - 1,
+            '1000.0', 5, '5.0', '500.0', '0']
+
+
+def kline_event(index: int, close: float, closed: bool) -> dict:
+    """`<symbol>@kline_1m` event of candle `index`."""
+    open_time = T0 + index * INTERVAL_MS
+    return {
+        'e': 'kline',
+        'E': open_time + 1000,
+        's': SYMBOL,
+        'k': {
+            't': open_time, 'T': open_time + INTERVAL_MS - 1, 's': SYMBOL, 'i': TIMEFRAME,
+            'o': '100.0', 'c': str(close), 'h': '110.0', 'l': '90.0', 'v': '10.0', 'n': 5,
+            'x': closed, 'q': '1000.0', 'V': '5.0', 'Q': '500.0', 'B': '0'
+        }
+    }
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+@pytest.fixture
+def server():
+    server = LocalWebSocketServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def stream(server, monkeypatch):
+    monkeypatch.setattr(binance_websocket, 'WS_RECONNECT_MIN_DELAY', 0.1)
+    manager = BinanceKlineStreamManager(base_url=server.base_url)
+    yield manager
+    manager.stop()
+
+
+@pytest.fixture
+def rest_klines() -> List[list]:
+    """Candles the REST stand-in serves; candle 2 is in progress."""
+    return [kline_row(0, 100.0), kline_row(1, 101.0), kline_row(2, 102.0)]
+
+
+@pytest.fixture
+def client(stream, rest_klines):
+    client = BinanceLiveTradeClient()
+    client._kline_stream = stream
+    client.seed_requests = []
+
+    def fetch_raw_klines(symbol: str, timeframe: str, timeframe_limit: int) -> List[list]:
+        client.seed_requests.append(timeframe_limit)
+        return [list(row) for row in rest_klines[-timeframe_limit:]]
+
+    client._fetch_raw_klines = fetch_raw_klines
+    return client
+
+
+@pytest.fixture
+def connected(client, server):
+    """Client after its first fetch, with the stream accepted by the server."""
+    client.fetch_klines(symbol=SYMBOL, timeframe=TIMEFRAME, timeframe_limit=3)
+    assert wait_until(lambda: server.connections == 1)
+    return client
+
+
+def closes(client: BinanceLiveTradeClient) -> List[float]:
+    return list(client.fetch_klines(symbol=SYMBOL, timeframe=TIMEFRAME, timeframe_limit=3)['close'])
+
+
+def test_first_fetch_seeds_from_rest_snapshot(client, server):
+    df = client.fetch_klines(symbol=SYMBOL, timeframe=TIMEFRAME, timeframe_limit=3)
+
+    assert list(df['close']) == [100.0, 101.0, 102.0]
+    assert df['current_price'].iloc[-1] == 102.0
+    assert client.seed_requests == [3]
+    assert wait_until(lambda: server.connections == 1)
+
+
+def test_stream_updates_in_progress_and_closed_candles(connected, server):
+    client = connected
+
+    server.send(kline_event(2, 103.0, closed=False))
+    assert wait_until(lambda: closes(client) == [100.0, 101.0, 103.0])
+
+    server.send(kline_event(2, 104.0, closed=True))
+    server.send(kline_event(3, 105.0, closed=False))
+    assert wait_until(lambda: closes(client) == [101.0, 104.0, 105.0])
+
+    df = client.fetch_klines(symbol=SYMBOL, timeframe=TIMEFRAME, timeframe_limit=3)
+    assert df['open_time'].iloc[-1].value // 1_000_000 == T0 + 3 * INTERVAL_MS
+    assert client.seed_requests == [3]
+
+
+def test_reseeds_after_disconnect(connected, server, stream, rest_klines):
+    client = connected
+
+    rest_klines.append(kline_row(3, 106.0))  # candle opened while the stream was down
+    server.disconnect_all()
+    assert wait_until(lambda: server.connections == 2)
+    assert wait_until(lambda: stream._connections[(SYMBOL, TIMEFRAME)].is_connected)
+
+    assert closes(client) == [101.0, 102.0, 106.0]
+    assert client.seed_requests == [3, 3]
+
+
+def test_reseeds_after_gap(connected, server, rest_klines):
+    client = connected
+
+    # Candles 3 and 4 never arrive over the stream
+    rest_klines.extend([kline_row(3, 103.0), kline_row(4, 104.0), kline_row(5, 107.0)])
+    server.send(kline_event(5, 107.0, closed=False))
+    assert wait_until(lambda: closes(client) == [103.0, 104.0, 107.0])
+    assert client.seed_requests == [3, 3]
+
+
+def test_reseeds_a_silent_stream(connected, rest_klines, monkeypatch):
+    client = connected
+
+    # No event for longer than the stale limit: the buffer may be behind
+    monkeypatch.setattr(binance_kline_stream, 'KLINE_STREAM_STALE_SECONDS', -1)
+    rest_klines.append(kline_row(3, 108.0))
+
+    assert closes(client) == [101.0, 102.0, 108.0]
+    assert client.seed_requests == [3, 3]
+
+
+def test_falls_back_to_rest_when_the_stream_is_unreachable(monkeypatch):
+    monkeypatch.setattr(binance_kline_stream, 'KLINE_STREAM_READY_TIMEOUT', 0.2)
+    server = LocalWebSocketServer().start()
+    base_url = server.base_url  # nothing listens there any more
+    server.stop()
+    stream = BinanceKlineStreamManager(base_url=base_url)
+    client = BinanceLiveTradeClient()
+    client._kline_stream = stream
+    client._fetch_klines_frame = lambda symbol, timeframe, timeframe_limit: client._klines_to_df([kline_row(0, 100.0), kline_row(1, 101.0)])
+    client.fetch_price = lambda symbol: 101.5
+
+    try:
+        df = client.fetch_klines(symbol=SYMBOL, timeframe=TIMEFRAME, timeframe_limit=2)
+    finally:
+        stream.stop()
+
+    assert list(df['close']) == [100.0, 101.0]
+    assert df['current_price'].iloc[-1] == 101.5
+
+# EOF
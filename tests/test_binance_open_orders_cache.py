@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from trade_clients.binance.binance_open_orders_cache import BinanceOpenOrdersCache
+
+
+@pytest.fixture
+def cache():
+    return BinanceOpenOrdersCache(ttl=60)
+
+
+def no_algo_orders():
+    return []
+
+
+def test_orders_noted_during_a_download_survive_its_result(cache):
+    cache.note_placed(order_id=2)
+    downloading = threading.Event()
+    release = threading.Event()
+
+    def slow_fetch():
+        downloading.set()
+        assert release.wait(timeout=5)
+        return [{'orderId': 2}]  # snapshot taken before the new order landed / the cancel went through
+
+    refresh = threading.Thread(target=cache.is_open, kwargs={
+        'order_id': 1, 'algo': False, 'fetch_orders': slow_fetch, 'fetch_algo_orders': no_algo_orders
+    })
+    refresh.start()
+    assert downloading.wait(timeout=5)
+
+    # Noting an order does not wait for the download in flight
+    noted = threading.Thread(target=lambda: (cache.note_placed(order_id=1), cache.note_closed(order_id=2)))
+    noted.start()
+    noted.join(timeout=5)
+    assert not noted.is_alive()
+
+    release.set()
+    refresh.join(timeout=5)
+
+    assert cache.is_open(order_id=1, algo=False, fetch_orders=slow_fetch, fetch_algo_orders=no_algo_orders)
+    assert not cache.is_open(order_id=2, algo=False, fetch_orders=slow_fetch, fetch_algo_orders=no_algo_orders)
+
+
+def test_failed_download_reports_unknown(cache):
+    assert cache.is_open(order_id=1, algo=True, fetch_orders=lambda: None, fetch_algo_orders=no_algo_orders) is None
+
+# EOF
@@ -0,0 +1,24 @@
+from trade_clients.binance.binance_price_cache import BinancePriceCache
+
+
+def test_streamed_price_is_the_trade_price():
+    cache = BinancePriceCache(stream_enabled=False)
+    received = []
+    cache.add_listener(symbol='BTCUSDC', listener=lambda symbol, price: received.append((symbol, price)))
+
+    # A one-tick spread would put a midpoint off the 0.1 grid; the cache serves the trade price
+    cache._handle_message('BTCUSDC', {'e': 'bookTicker', 'b': '100.0', 'a': '100.1'})
+    cache._handle_message('BTCUSDC', {'e': 'aggTrade', 'p': '100.1', 'q': '0.5'})
+
+    assert cache.get_price(symbol='BTCUSDC') == 100.1
+    assert received == [('BTCUSDC', 100.1)]
+
+
+def test_rest_price_does_not_replace_fresh_streamed_price():
+    cache = BinancePriceCache(stream_enabled=False, max_age=60)
+    cache._handle_message('BTCUSDC', {'e': 'aggTrade', 'p': '100.1', 'q': '0.5'})
+    cache.update(symbol='BTCUSDC', price=99.0)
+
+    assert cache.get_price(symbol='BTCUSDC') == 100.1
+
+# EOF
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+import trade_clients.binance.binance_user_data_stream as user_data_stream
+from trade_clients.binance.binance_user_data_stream import BinanceUserDataStream
+
+
+@pytest.fixture
+def stream():
+    return BinanceUserDataStream(api_key='key')
+
+
+def order_update(order_id, status):
+    return {'e': 'ORDER_TRADE_UPDATE', 'o': {'i': order_id, 's': 'BTCUSDC', 'c': f'c{order_id}', 'X': status}}
+
+
+def algo_update(algo_id, status):
+    return {'e': 'ALGO_UPDATE', 'o': {'aid': algo_id, 's': 'BTCUSDC', 'caid': f'a{algo_id}', 'X': status}}
+
+
+def test_finished_orders_are_dropped_after_the_retention(stream, monkeypatch):
+    stream._handle_message(order_update(1, 'FILLED'))
+    stream._handle_message(algo_update(2, 'FINISHED'))
+    stream._handle_message(order_update(3, 'NEW'))
+    assert stream.get_order('1')['status'] == 'FILLED'
+    assert stream.get_algo_order('2')['algoStatus'] == 'FINISHED'
+
+    monkeypatch.setattr(user_data_stream, 'TERMINAL_ORDER_RETENTION_SECONDS', 0)
+    stream._handle_message(order_update(4, 'NEW'))
+
+    assert stream.get_order('1') is None
+    assert stream.get_algo_order('2') is None
+    assert stream.get_order('3')['status'] == 'NEW'
+    assert stream._versions.keys() == {'3', '4'}
+
+
+def test_concurrent_recreations_open_one_stream(stream, monkeypatch):
+    created = []
+
+    def create_listen_key(method):
+        time.sleep(0.05)
+        created.append(method)
+        return {'listenKey': f'key{len(created)}'}
+
+    class Connection:
+        def __init__(self, url, **kwargs):
+            self.url = url
+
+        def start(self):
+            pass
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(user_data_stream, 'BinanceWebSocketConnection', Connection)
+    monkeypatch.setattr(stream, '_listen_key_request', create_listen_key)
+    stream._listen_key = 'expired'
+
+    # listenKeyExpired (websocket thread) and a failed keepalive (keepalive thread) at once
+    threads = [threading.Thread(target=stream._open_stream, kwargs={'stale_listen_key': 'expired'}) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert created == ['POST']
+    assert stream._connection.url.endswith('/key1')
+
+# EOF
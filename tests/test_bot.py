@@ -0,0 +1,64 @@
+import asyncio
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+import core.bot
+from core.bot import Bot
+from tests.fakes import make_bot_config
+
+
+@pytest.fixture
+def bot(client, monkeypatch):
+    monkeypatch.setattr(core.bot, 'get_trade_client', lambda **kwargs: client)
+    client.fetch_klines = lambda symbol, timeframe, timeframe_limit=100: pd.DataFrame({
+        'open_time': pd.date_range('2024-01-01', periods=3, freq='h'),
+        'close': [100.0, 101.0, 102.0]
+    })
+    return Bot(bot_config=make_bot_config(), async_mode=True)
+
+
+def test_execute_async_syncs_position_off_the_event_loop(bot, client, monkeypatch):
+    # Local position gone on the exchange: the sync clears it and removes its state file
+    bot.position_handler.open_position(position_dict={
+        'symbol': 'BTCUSDC', 'position_side': 'LONG', 'entry_price': 100.0, 'quantity': 1.0, 'open_candle': '2024-01-01 00:00:00'
+    })
+    bot.position_handler.dump_position_state()
+    state_file = bot.position_handler.position_state_file_path
+    assert os.path.exists(state_file)
+    calls = []
+    sync_position_state = bot._sync_position_state
+
+    def record_sync(**kwargs):
+        calls.append(('sync', threading.current_thread()))
+        return sync_position_state(**kwargs)
+
+    monkeypatch.setattr(bot, '_sync_position_state', record_sync)
+    monkeypatch.setattr(bot, '_process_tick', lambda klines_df, active_position_dict, candle: calls.append(('tick', active_position_dict)))
+
+    asyncio.run(bot.execute_async())  # event loop on the main thread
+
+    assert [name for name, _ in calls] == ['sync', 'tick']
+    assert calls[0][1] is not threading.main_thread()
+    assert not bot.position_handler.is_open()
+    assert not os.path.exists(state_file)
+
+
+def test_execute_async_skips_sync_when_the_position_fetch_fails(bot, client, monkeypatch):
+    def fail(symbol):
+        raise ConnectionError('down')
+
+    synced = []
+    ticks = []
+    monkeypatch.setattr(client, 'fetch_position', fail)
+    monkeypatch.setattr(bot, '_sync_position_state', lambda **kwargs: synced.append(kwargs))
+    monkeypatch.setattr(bot, '_process_tick', lambda klines_df, active_position_dict, candle: ticks.append(active_position_dict))
+
+    asyncio.run(bot.execute_async())
+
+    assert synced == []
+    assert ticks == [None]
+
+# EOF
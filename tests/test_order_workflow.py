@@ -0,0 +1,168 @@
+import pytest
+
+from core.order_workflow import PHASE_MARKET, WORKFLOW_FILLED, WORKFLOW_OPEN
+from models.enum.order_side import OrderSide
+from models.enum.order_type import OrderType
+from models.enum.position_side import PositionSide
+from tests.fakes import make_bot_config, make_trade_handler
+
+OPEN_CANDLE = '2024-01-01 07:00:00'
+
+
+def make_workflow(trade_handler, order_type: OrderType):
+    return trade_handler.create_order_workflow(
+        kind=WORKFLOW_OPEN,
+        order_type=order_type,
+        order_side=OrderSide.BUY.value,
+        reduce_only=False,
+        quantity=1.0,
+        position_key=OPEN_CANDLE
+    )
+
+
+@pytest.mark.parametrize('amend_fails', [False, True])
+def test_partial_fill_then_reprice_carries_the_fill_over(client, amend_fails):
+    workflow = make_workflow(make_trade_handler(client=client, bot_config=make_bot_config()), OrderType.LIMIT)
+    workflow.step()
+    first = client.last_order()
+    assert first['price'] == 100.0
+
+    client.fill(first['orderId'], quantity=0.4)
+    client.price = 101.0
+    client.amend_fails = amend_fails
+    assert not workflow.step()
+
+    if amend_fails:
+        # Cancel/replace: the replacement only carries the unfilled quantity
+        assert client.cancelled == [first['orderId']]
+        replacement = client.last_order()
+        assert replacement['orderId'] != first['orderId']
+        assert replacement['price'] == 101.0
+        assert replacement['origQty'] == pytest.approx(0.6)
+        assert replacement['clientOrderId'] != first['clientOrderId']
+        client.fill(replacement['orderId'])
+    else:
+        # Amend in place: same order, new price
+        assert client.cancelled == []
+        assert client.last_order() is client.orders[first['orderId']]
+        assert first['price'] == 101.0
+        client.fill(first['orderId'])
+
+    assert workflow.step()
+    assert workflow.state == WORKFLOW_FILLED
+    assert workflow.chase.filled_quantity == pytest.approx(1.0)
+    assert workflow.chase.metrics.reprices == 1
+
+
+def test_restart_resumes_the_working_order(client):
+    bot_config = make_bot_config()
+    trade_handler = make_trade_handler(client=client, bot_config=bot_config)
+    trade_handler.start_order_to_open_position(position_side=PositionSide.LONG, context={'open_candle': OPEN_CANDLE})
+    assert trade_handler.advance_order_workflow() is None
+    trade_handler.position_handler.dump_position_state()
+    order = client.last_order()
+
+    # Restart: a new handler picks the workflow up from the position state file
+    resumed = make_trade_handler(client=client, bot_config=bot_config)
+    assert resumed.has_pending_order()
+    assert resumed.get_order_workflow().chase.order_id == order['orderId']
+
+    client.fill(order['orderId'])
+    workflow = resumed.advance_order_workflow()
+    assert workflow is not None and workflow.state == WORKFLOW_FILLED
+    assert len(client.placed) == 1
+    assert not resumed.has_pending_order()
+
+
+def test_restart_adopts_an_order_sent_before_the_state_was_saved(client):
+    bot_config = make_bot_config()
+    trade_handler = make_trade_handler(client=client, bot_config=bot_config)
+    workflow = trade_handler.start_order_to_open_position(position_side=PositionSide.LONG, context={'open_candle': OPEN_CANDLE})
+    trade_handler.position_handler.dump_position_state()
+    workflow.step()  # order sent, then the process dies before saving again
+
+    resumed = make_trade_handler(client=client, bot_config=bot_config)
+    assert resumed.advance_order_workflow() is None
+    assert len(client.placed) == 1
+    assert resumed.get_order_workflow().chase.order_id == client.last_order()['orderId']
+
+
+def test_post_only_rejections_fall_back_to_market(client):
+    bot_config = make_bot_config(order_type='POST_ONLY', execution_config={'post_only_max_retries': 2, 'post_only_taker_fallback': True})
+    workflow = make_workflow(make_trade_handler(client=client, bot_config=bot_config), OrderType.POST_ONLY)
+    client.reject_post_only = 10
+
+    assert workflow.advance()
+    assert workflow.state == WORKFLOW_FILLED
+    assert workflow.phase == PHASE_MARKET
+    assert [order['time_in_force'] for order in client.placed] == ['GTX', 'GTX', 'GTX', 'GTC']
+    assert client.placed[-1]['order_type'] == OrderType.MARKET.value
+    assert client.placed[-1]['quantity'] == 1.0
+    # Every attempt, the market order included, has its own client order id
+    assert len({order['client_order_id'] for order in client.placed}) == 4
+
+
+def test_other_placement_errors_never_fall_back_to_market(client):
+    bot_config = make_bot_config(order_type='POST_ONLY', execution_config={'post_only_max_retries': 2, 'post_only_taker_fallback': True})
+    workflow = make_workflow(make_trade_handler(client=client, bot_config=bot_config), OrderType.POST_ONLY)
+    client.place_error = -2019  # margin is insufficient
+
+    for _ in range(5):
+        assert not workflow.advance()
+
+    assert all(order['order_type'] == OrderType.LIMIT.value for order in client.placed)
+    assert workflow.phase != PHASE_MARKET
+    assert workflow.chase.consecutive_rejections == 0
+
+    client.place_error = None
+    assert not workflow.advance()
+    assert workflow.chase.order_id == client.last_order()['orderId']
+
+
+@pytest.mark.parametrize('order_type', [OrderType.LIMIT, OrderType.MAKER_ONLY, OrderType.POST_ONLY])
+def test_persistent_errors_are_retried_once_per_step(client, order_type):
+    workflow = make_workflow(make_trade_handler(client=client, bot_config=make_bot_config(order_type=order_type.value)), order_type)
+    client.place_error = -2019
+
+    for advances in range(1, 4):
+        assert not workflow.advance()
+        assert len(client.placed) == advances
+        assert not workflow.retry_now
+
+
+@pytest.mark.parametrize('lands', [True, False])
+def test_unknown_placement_outcome_keeps_the_client_order_id(client, lands):
+    workflow = make_workflow(make_trade_handler(client=client, bot_config=make_bot_config()), OrderType.LIMIT)
+    client.lose_responses = 1
+    client.lost_orders_land = lands
+
+    assert not workflow.advance()
+    assert not workflow.chase.order_id
+    assert workflow.chase.metrics.rejections == 0
+
+    assert not workflow.advance()
+    if lands:
+        # The lost order is found by its client id and adopted, nothing is placed twice
+        assert len(client.placed) == 1
+    else:
+        # Never reached the book: placed again under the same client id
+        assert [order['client_order_id'] for order in client.placed] == [client.placed[0]['client_order_id']] * 2
+    assert len(client.orders) == 1
+    assert workflow.chase.order_id == client.last_order()['orderId']
+
+
+def test_post_only_rejections_back_off_without_fallback(client):
+    bot_config = make_bot_config(order_type='POST_ONLY', execution_config={'post_only_max_retries': 2, 'post_only_taker_fallback': False})
+    workflow = make_workflow(make_trade_handler(client=client, bot_config=bot_config), OrderType.POST_ONLY)
+    client.reject_post_only = 3
+
+    assert not workflow.advance()
+    assert len(client.placed) == 3
+    assert not workflow.retry_now
+
+    # Next step re-quotes; the book let the order rest this time
+    assert not workflow.advance()
+    assert client.placed[-1]['time_in_force'] == 'GTX'
+    assert workflow.chase.order_id == client.last_order()['orderId']
+
+# EOF
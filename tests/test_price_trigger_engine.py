@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from core.price_trigger_engine import PriceTriggerEngine
+from models.enum.trigger_direction import TriggerDirection
+from models.price_trigger import PriceTrigger
+
+TP = PriceTrigger(price=110.0, direction=TriggerDirection.ABOVE, reason='TP')
+SL = PriceTrigger(price=95.0, direction=TriggerDirection.BELOW, reason='SL')
+
+
+@pytest.fixture
+def engine():
+    return PriceTriggerEngine()
+
+
+@pytest.fixture
+def fired():
+    return []
+
+
+def recorder(fired, owner):
+    return lambda trigger, price: fired.append((owner, trigger.reason, price))
+
+
+def test_fires_once_when_a_level_is_crossed(engine, fired):
+    engine.set_triggers(owner='bot', symbol='btcusdc', triggers=[TP, SL], callback=recorder(fired, 'bot'))
+
+    engine.on_price('BTCUSDC', 109.9)
+    engine.on_price('BTCUSDC', 95.1)
+    assert fired == []
+
+    engine.on_price('BTCUSDC', 110.0)
+    engine.on_price('BTCUSDC', 111.0)
+    assert fired == [('bot', 'TP', 110.0)]
+
+
+def test_first_crossed_level_disarms_the_owners_other_levels(engine, fired):
+    engine.set_triggers(owner='bot', symbol='BTCUSDC', triggers=[TP, SL], callback=recorder(fired, 'bot'))
+
+    engine.on_price('BTCUSDC', 111.0)
+    engine.on_price('BTCUSDC', 90.0)  # SL level of the same position no longer armed
+
+    assert fired == [('bot', 'TP', 111.0)]
+    assert engine.get_stats()['armed'] == 0
+
+
+def test_one_update_crossing_several_levels_fires_once_per_owner(engine, fired):
+    levels = [PriceTrigger(price=price, direction=TriggerDirection.ABOVE, reason=str(price)) for price in (101.0, 102.0, 103.0)]
+    engine.set_triggers(owner='a', symbol='BTCUSDC', triggers=levels, callback=recorder(fired, 'a'))
+    engine.set_triggers(owner='b', symbol='BTCUSDC', triggers=[TP], callback=recorder(fired, 'b'))
+
+    engine.on_price('BTCUSDC', 105.0)
+
+    assert [owner for owner, _, _ in fired] == ['a']
+    assert engine.get_stats()['armed'] == 1  # b's TP is still watched
+
+
+def test_rearming_replaces_and_clear_disarms(engine, fired):
+    engine.set_triggers(owner='bot', symbol='BTCUSDC', triggers=[TP], callback=recorder(fired, 'bot'))
+    engine.set_triggers(owner='bot', symbol='BTCUSDC', triggers=[SL], callback=recorder(fired, 'bot'))
+    engine.on_price('BTCUSDC', 120.0)
+    assert fired == []
+
+    engine.clear(owner='bot')
+    engine.on_price('BTCUSDC', 80.0)
+    assert fired == []
+
+    engine.set_triggers(owner='bot', symbol='BTCUSDC', triggers=[SL], callback=recorder(fired, 'bot'))
+    engine.set_triggers(owner='bot', symbol='BTCUSDC', triggers=[], callback=recorder(fired, 'bot'))
+    engine.on_price('BTCUSDC', 80.0)
+    assert fired == []
+    assert engine.get_stats()['armed'] == 0
+
+
+def test_levels_only_fire_for_their_symbol(engine, fired):
+    engine.set_triggers(owner='bot', symbol='BTCUSDC', triggers=[TP], callback=recorder(fired, 'bot'))
+
+    engine.on_price('ETHUSDC', 200.0)
+
+    assert fired == []
+
+
+def test_failing_callback_does_not_stop_other_owners(engine, fired):
+    def fail(trigger, price):
+        raise RuntimeError('boom')
+
+    engine.set_triggers(owner='a', symbol='BTCUSDC', triggers=[TP], callback=fail)
+    engine.set_triggers(owner='b', symbol='BTCUSDC', triggers=[TP], callback=recorder(fired, 'b'))
+
+    engine.on_price('BTCUSDC', 110.0)
+
+    assert fired == [('b', 'TP', 110.0)]
+    assert engine.get_stats()['fired'] == 2
+
+
+def test_sorted_index_matches_a_linear_scan(engine):
+    rng = random.Random(7)
+    armed = {}
+    fired = []
+    for owner in range(50):
+        triggers = [
+            PriceTrigger(price=round(rng.uniform(90, 110), 1), direction=rng.choice(list(TriggerDirection)), reason=str(index))
+            for index in range(rng.randint(1, 3))
+        ]
+        armed[str(owner)] = triggers
+        engine.set_triggers(owner=str(owner), symbol='BTCUSDC', triggers=triggers, callback=recorder(fired, str(owner)))
+
+    for _ in range(200):
+        price = round(rng.uniform(85, 115), 1)
+        expected = {owner for owner, triggers in armed.items() if any(trigger.is_crossed(price) for trigger in triggers)}
+        fired.clear()
+        engine.on_price('BTCUSDC', price)
+        assert {owner for owner, _, _ in fired} == expected
+        for owner in expected:
+            del armed[owner]
+
+    assert engine.get_stats()['armed'] == sum(len(triggers) for triggers in armed.values())
+
+# EOF
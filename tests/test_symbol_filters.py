@@ -0,0 +1,67 @@
+import random
+from decimal import Decimal, ROUND_UP
+
+import pytest
+
+from models.symbol_filters import SymbolFilters
+
+TICKS = [0.1, 0.01, 1e-5, 0.5]
+
+# Literals that are not the decimal they print as (0.29 * 100 == 28.999999999999996)
+NOISY_LITERALS = [0.29, 0.57, 4.35, 1.15, 2.675, 8.2, 0.00003, 29999.7, 1e-5]
+
+# Arithmetic results carrying float noise past the 15th significant digit
+NOISY_RESULTS = [(0.1 + 0.2, 0.3), (1.1 * 3, 3.3), (0.57 * 100, 57.0), (1e-5 * 3, 3e-5), (7138.4 * 1.0000000000000002, 7138.4)]
+
+
+def decimal_floor(value, increment):
+    """Rounding before SymbolFilters: on the decimal representation of the float."""
+    increment = Decimal(str(increment))
+    return float((Decimal(str(value)) // increment) * increment)
+
+
+def decimal_ceil(value, increment):
+    increment = Decimal(str(increment))
+    return float((Decimal(str(value)) / increment).to_integral_value(rounding=ROUND_UP) * increment)
+
+
+def sample_values(tick):
+    rng = random.Random(str(tick))
+    values = list(NOISY_LITERALS)
+    for _ in range(1000):
+        values.append(float(f"{rng.uniform(0, 10 ** rng.randint(-2, 4)):.15g}"))  # off the grid
+        values.append(round(rng.randint(1, 100000) * tick, 8))  # on the grid
+    return values
+
+
+@pytest.mark.parametrize('tick', TICKS)
+def test_rounding_matches_the_decimal_formulas(tick):
+    filters = SymbolFilters.create(symbol='BTCUSDC', tick_size=tick, step_size=tick)
+
+    for value in sample_values(tick):
+        assert filters.floor_price(value) == decimal_floor(value, tick), value
+        assert filters.ceil_price(value) == decimal_ceil(value, tick), value
+        assert filters.floor_quantity(value) == decimal_floor(value, tick), value
+
+
+@pytest.mark.parametrize('tick', TICKS)
+def test_arithmetic_noise_rounds_as_the_decimal_it_represents(tick):
+    # Decimal(str(0.1 + 0.2)) is 0.30000000000000004 and ceiled to 0.4; the filters see 0.3
+    filters = SymbolFilters.create(symbol='BTCUSDC', tick_size=tick, step_size=tick)
+
+    for value, represented in NOISY_RESULTS:
+        assert filters.floor_price(value) == decimal_floor(represented, tick), value
+        assert filters.ceil_price(value) == decimal_ceil(represented, tick), value
+        assert filters.floor_quantity(value) == decimal_floor(represented, tick), value
+
+
+def test_filter_strings_and_floats_give_the_same_grid():
+    from_strings = SymbolFilters.create(symbol='BTCUSDC', tick_size='0.01000000', step_size='0.00100000')
+    from_floats = SymbolFilters.create(symbol='BTCUSDC', tick_size=0.01, step_size=0.001)
+
+    assert from_strings == from_floats
+    assert from_strings.floor_price(0.29) == 0.29
+    assert from_strings.ceil_price(0.291) == 0.3
+    assert from_strings.floor_quantity(0.1 + 0.2) == 0.3
+
+# EOF
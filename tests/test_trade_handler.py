@@ -0,0 +1,58 @@
+import pytest
+
+from models.enum.order_side import OrderSide
+from models.enum.position_side import PositionSide
+from tests.fakes import make_bot_config, make_trade_handler
+
+
+@pytest.mark.parametrize('order_side, expected', [(OrderSide.BUY.value, 100.0), (OrderSide.SELL.value, 100.1)])
+def test_limit_chase_quotes_off_tick_price_on_tick(client, order_side, expected):
+    trade_handler = make_trade_handler(client=client, bot_config=make_bot_config(order_type='LIMIT'))
+    client.price = 100.05  # e.g. a midpoint between two 0.1 ticks
+
+    chase = trade_handler.create_limit_chase(order_side=order_side, reduce_only=False, quantity=1.0)
+    chase.step()
+
+    assert client.placed[-1]['price'] == expected
+    assert client.get_symbol_filters('BTCUSDC').validate(quantity=1.0, price=client.placed[-1]['price']) == ''
+
+
+@pytest.mark.parametrize('order_side, bid, ask, expected', [
+    (OrderSide.BUY.value, 99.5, 100.0, 99.6),
+    (OrderSide.SELL.value, 99.5, 100.0, 99.9),
+    (OrderSide.BUY.value, 99.9, 100.0, 99.9),  # one-tick spread: join the touch, never cross
+    (OrderSide.SELL.value, 99.9, 100.0, 100.0),
+])
+def test_adaptive_limit_chase_quotes_inside_spread(client, order_side, bid, ask, expected):
+    trade_handler = make_trade_handler(client=client, bot_config=make_bot_config(order_type='ADAPTIVE'))
+    client.book = {'bids': [[bid, 5.0]], 'asks': [[ask, 5.0]]}
+
+    chase = trade_handler.create_limit_chase(order_side=order_side, reduce_only=False, quantity=1.0)
+    chase.step()
+
+    assert client.placed[-1]['price'] == expected
+    assert client.placed[-1]['time_in_force'] == 'GTC'
+
+
+def test_protective_orders_get_new_client_ids_per_placement(client):
+    bot_config = make_bot_config(tp_enabled=True, sl_enabled=True)
+    trade_handler = make_trade_handler(client=client, bot_config=bot_config)
+    trade_handler.position_handler.open_position(position_dict={
+        'symbol': 'BTCUSDC', 'position_side': 'LONG', 'entry_price': 100.0, 'quantity': 1.0, 'open_candle': '2024-01-01 07:00:00'
+    })
+
+    def place(handler):
+        legs = handler.place_tp_sl_orders(position_side=PositionSide.LONG, tp_price=110.0, sl_price=95.0)
+        return [leg.client_order_id for leg in legs]
+
+    first = place(trade_handler)
+    second = place(trade_handler)
+    assert first == ['b1-202401010700-tp-1', 'b1-202401010700-tpb-1', 'b1-202401010700-sl-1']
+    assert second == ['b1-202401010700-tp-2', 'b1-202401010700-tpb-2', 'b1-202401010700-sl-2']
+
+    # The sequence is persisted with the position, so a restart does not reuse ids
+    trade_handler.position_handler.dump_position_state()
+    restarted = make_trade_handler(client=client, bot_config=bot_config)
+    assert place(restarted)[0] == 'b1-202401010700-tp-3'
+
+# EOF
@@ -0,0 +1,90 @@
+"""
+Binance Account Snapshot
+Process-wide positionRisk cache shared by every live client.
+
+/fapi/v2/positionRisk returns all symbols at once, so a single download per
+TTL serves `fetch_position` for every bot. The snapshot is invalidated as soon
+as any client places or cancels an order, or an ACCOUNT_UPDATE is pushed.
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from commons.constants import ACCOUNT_SNAPSHOT_TTL_SECONDS
+from commons.custom_logger import CustomLogger
+
+# Fetch function: () -> raw positionRisk list (empty on error)
+PositionFetchFunction = Callable[[], Any]
+
+
+class BinanceAccountSnapshot:
+    """
+    Indexed positionRisk snapshot with TTL and explicit invalidation.
+
+    - Concurrent callers on a stale snapshot wait for one in-flight download
+    - An invalidation during a download marks its result stale immediately,
+      so a position changed by an order is never served from an older fetch
+    """
+
+    _instance: Optional['BinanceAccountSnapshot'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ttl: float = ACCOUNT_SNAPSHOT_TTL_SECONDS, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Initialize account snapshot.
+
+        Args:
+            ttl: Seconds a snapshot is served before refetching
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.ttl = ttl
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._positions: Dict[str, List[Dict[str, Any]]] = {}
+        self._fetched_at: float = 0.0
+        self._generation: int = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'BinanceAccountSnapshot':
+        """Get the process-wide snapshot, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                ttl = float(os.getenv('ACCOUNT_SNAPSHOT_TTL_SECONDS', ACCOUNT_SNAPSHOT_TTL_SECONDS))
+                cls._instance = cls(ttl=ttl)
+            return cls._instance
+
+    def invalidate(self) -> None:
+        """Force the next read to refetch."""
+        self._generation += 1
+        self._fetched_at = 0.0
+
+    def get_positions(self, symbol: str, fetch_function: PositionFetchFunction) -> List[Dict[str, Any]]:
+        """
+        Get raw positionRisk entries for a symbol.
+
+        Args:
+            symbol: Trading pair symbol
+            fetch_function: Callable that downloads positionRisk for all symbols
+
+        Returns:
+            List of raw position entries for the symbol (one per position side),
+            empty if none or if the download failed
+        """
+        with self._lock:
+            if time.time() - self._fetched_at >= self.ttl:
+                generation = self._generation
+                positions = fetch_function()
+                if not positions:
+                    return []
+
+                indexed: Dict[str, List[Dict[str, Any]]] = {}
+                for pos in positions:
+                    indexed.setdefault(pos['symbol'], []).append(pos)
+                self._positions = indexed
+                # Keep the snapshot stale if an order was placed while downloading
+                self._fetched_at = time.time() if generation == self._generation else 0.0
+                self.logger.debug(message=f"positionRisk snapshot refreshed ({len(indexed)} symbols)")
+            return list(self._positions.get(symbol, []))
+
+# EOF
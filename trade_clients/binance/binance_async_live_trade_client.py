@@ -0,0 +1,150 @@
+"""
+Binance Async Live Trade Client
+aiohttp-backed variant of BinanceLiveTradeClient for the asyncio run mode.
+
+Per-tick reads (klines, price) are issued on the event loop
+with a shared connection pool, so hundreds of bots can poll concurrently
+without one OS thread each. Everything else (order placement and status, cancels, TP/SL)
+is inherited unchanged and runs in the executor via the sync methods.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+import aiohttp
+import pandas as pd
+
+from commons.custom_logger import CustomLogger
+from trade_clients.binance.binance_live_trade_client import (
+    BinanceLiveTradeClient,
+    GET_KLINES_URL,
+    GET_TICKER_PRICE_URL
+)
+from trade_clients.binance.binance_rate_limiter import get_endpoint_weight
+from trade_clients.binance.binance_request_builder import is_timestamp_error
+from trade_clients.binance.binance_kline_decoder import loads
+
+# aiohttp connection pool and timeout
+AIOHTTP_CONNECTION_LIMIT = 100
+AIOHTTP_TIMEOUT_SECONDS = 10
+
+
+class BinanceAsyncLiveTradeClient(BinanceLiveTradeClient):
+    def __init__(self, logger: Optional[CustomLogger] = None) -> None:
+        super().__init__(logger=logger)
+        # Created lazily: an aiohttp session must be bound to the running loop
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+
+    def _get_aio_session(self) -> aiohttp.ClientSession:
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=AIOHTTP_CONNECTION_LIMIT),
+                timeout=aiohttp.ClientTimeout(total=AIOHTTP_TIMEOUT_SECONDS)
+            )
+        return self._aio_session
+
+    async def _make_request_async(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any],
+        operation: str,
+        signed: bool = True
+    ) -> Optional[Any]:
+        """
+        Make request to Binance API on the event loop.
+
+        Encoding and signing go through the shared request builder; a -1021
+        rejection asks the server time tracker to resync in the background.
+
+        Args:
+            method: HTTP method
+            url: API endpoint URL
+            params: Request parameters
+            operation: Description of operation for logging
+            signed: Whether the endpoint requires a signature
+
+        Returns:
+            Decoded JSON response, or None on error
+        """
+        try:
+            headers, request_url = self._request_builder.build_url(url=url, params=params, signed=signed)
+
+            weight, priority = get_endpoint_weight(method=method, url=request_url)
+            await self._rate_limiter.acquire_async(weight=weight, priority=priority, operation=operation)
+
+            async with self._get_aio_session().request(method, request_url, headers=headers) as response:
+                self._rate_limiter.update_from_headers(headers=response.headers, status_code=response.status)
+                if response.status >= 400:
+                    body = await response.text()
+                    if signed and is_timestamp_error(response.status, body):
+                        self._request_builder.server_time.request_sync()
+                    self.logger.error(message=f"HTTP error {response.status} during {operation}")
+                    self.logger.error(message=f"Response: {body}")
+                    return None
+                return loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error_e(message=f"Network error during {operation}", e=e)
+            return None
+        except Exception as e:
+            self.logger.error_e(message=f"Unexpected error during {operation}", e=e)
+            return None
+
+    async def fetch_price_async(self, symbol: str, use_cache: bool = True) -> float:
+        if use_cache:
+            cached_price = self._price_cache.get_price(symbol=symbol)
+            if cached_price is not None:
+                return cached_price
+
+        result = await self._make_request_async('GET', GET_TICKER_PRICE_URL, {'symbol': symbol}, "fetch price", signed=False)
+        if not result:
+            return 0.0
+        current_price = float(result["price"])
+        self._price_cache.update(symbol=symbol, price=current_price)
+        return current_price
+
+    async def _fetch_klines_frame_async(
+        self,
+        symbol: str,
+        timeframe: str,
+        timeframe_limit: int
+    ) -> Optional[pd.DataFrame]:
+        """Async variant of `_fetch_klines_frame`."""
+        params = self._plan_klines_request(symbol=symbol, timeframe=timeframe, timeframe_limit=timeframe_limit)
+        if 'startTime' in params:
+            data = await self._make_request_async('GET', GET_KLINES_URL, params, "fetch klines", signed=False)
+            df = self._merge_klines(symbol, timeframe, timeframe_limit, params, data) if data else None
+            if df is not None:
+                return df
+            params = {'symbol': symbol, 'interval': timeframe, 'limit': timeframe_limit}
+
+        data = await self._make_request_async('GET', GET_KLINES_URL, params, "fetch klines", signed=False)
+        if not data:
+            return None
+        return self._merge_klines(symbol, timeframe, timeframe_limit, params, data)
+
+    async def fetch_klines_async(
+        self,
+        symbol: str,
+        timeframe: str,
+        timeframe_limit: int = 100
+    ) -> Optional[pd.DataFrame]:
+        # Stream buffers may need a blocking REST seed; keep that path in the executor
+        if self._kline_stream is not None:
+            return await super().fetch_klines_async(symbol, timeframe, timeframe_limit)
+
+        df, current_price = await asyncio.gather(
+            self._fetch_klines_frame_async(symbol=symbol, timeframe=timeframe, timeframe_limit=timeframe_limit),
+            self.fetch_price_async(symbol=symbol)
+        )
+        if df is None:
+            return None
+
+        df["current_price"] = df["close"]
+        df.loc[df.index[-1], "current_price"] = current_price
+        return df
+
+    async def close_async(self) -> None:
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+
+# EOF
@@ -57,8 +57,11 @@ def sign_request(params: dict, binance_credential) -> tuple:
 
     Returns:
         tuple:
-            - signed_params (dict): Parameters with 'signature' added.
             - headers (dict): Headers with 'X-MBX-APIKEY'.
+            - signed_params (dict): Copy of params with 'signature' added.
+
+    Note:
+        Clients sign through BinanceRequestBuilder, which keys the HMAC once.
     """
     # logger.debug(f"Signing request with params: {params}")
 
@@ -72,7 +75,7 @@ def sign_request(params: dict, binance_credential) -> tuple:
     ).hexdigest()
     # logger.debug(f"Signature generated: {signature[:2]}***{signature[-2:]}")
 
-    params['signature'] = signature
+    signed_params = {**params, 'signature': signature}
 
     headers = {
         "X-MBX-APIKEY": binance_credential.binance_api_key
@@ -82,15 +85,18 @@ def sign_request(params: dict, binance_credential) -> tuple:
     # params_str = str(params).split('signature')[0] + 'signature' + str(params).split('signature')[1][:6] + '***' + str(params).split('signature')[1][-4:]
     # logger.debug(f"Params set: {params_str}")
 
-    return headers, params
+    return headers, signed_params
 
 
 def test_binance_connection() -> bool:
+    # Imported here: the request builder imports this module
+    from trade_clients.binance.binance_request_builder import FAPI_BASE_URL
+
     logger.info("Checking Binance API connectivity...")
 
     try:
         response = requests.get(
-            'https://fapi.binance.com/fapi/v1/ping', timeout=5)
+            f'{FAPI_BASE_URL}/fapi/v1/ping', timeout=5)
 
         if response.status_code == 200 and response.json() == {}:
             logger.info("Binance connection successful.")
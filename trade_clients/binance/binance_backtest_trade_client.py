@@ -13,8 +13,13 @@ from datetime import datetime
 
 from abstracts.base_backtest_trade_client import BaseBacktestTradeClient
 from commons.custom_logger import CustomLogger
+from models.enum.order_type import OrderType
 from models.enum.position_side import PositionSide
+from models.symbol_filters import SymbolFilters
 import trade_clients.binance.binance_auth as binance_auth
+from trade_clients.binance.binance_request_builder import BinanceRequestBuilder
+from trade_clients.binance.binance_exchange_info_registry import BinanceExchangeInfoRegistry
+from trade_clients.binance.binance_kline_decoder import klines_to_dataframe
 from commons.fee_calculator import calculate_open_fee, calculate_close_fee
 
 GET_KLINES_URL = 'https://fapi.binance.com/fapi/v1/klines'
@@ -38,6 +43,7 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         
         # Exchange info cache
         self._exchange_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._symbol_filters: Dict[str, SymbolFilters] = {}
         
         # Simulated position state
         self.simulated_position: Optional[Dict[str, Any]] = None
@@ -53,13 +59,19 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         # Trading parameters (set during preload)
         self.order_type: str = 'MAKER_ONLY'
         self.leverage: int = 1
+        self._order_fee_types: Dict[str, str] = {}  # Execution mode chosen per order by ADAPTIVE bots
         
         # Credentials for data fetching
         self.__creds = None
+
+        # Klines and exchange info are public; requests go out unsigned
+        self.session = requests.Session()
+        self._request_builder = BinanceRequestBuilder(logger=self.logger)
     
     def init(self):
         """Initialize Binance credentials for data fetching."""
         self.__creds = binance_auth.load_binance_cred()
+        self._request_builder.set_credentials(credentials=self.__creds)
         self.logger.debug(message=f"Initialized {self.__class__.__name__}")
     
     def preload_historical_data(
@@ -93,37 +105,20 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
             'limit': min(limit, 1500)
         }
         
-        headers, signed_params = binance_auth.sign_request(
-            params=params,
-            binance_credential=self.__creds
-        )
-        
         try:
-            response = requests.get(
+            data = self._request_builder.send(
+                session=self.session,
+                method='GET',
                 url=GET_KLINES_URL,
-                headers=headers,
-                params=signed_params
+                params=params,
+                operation="preload klines",
+                signed=False
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Define column names for Binance klines data
-            klines_columns = [
-                'open_time', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'num_trades',
-                'taker_buy_base_volume', 'taker_buy_quote_volume', 'ignore'
-            ]
+            if not data:
+                raise RuntimeError(f"No klines returned for {symbol} {timeframe}")
             
-            # Create DataFrame - pass data as first positional arg, columns as keyword arg
-            df = pd.DataFrame(data, columns=klines_columns)  # type: ignore[call-overload]
-            
-            # Convert timestamps
-            df['open_time'] = pd.to_datetime(df['open_time'], unit='ms').dt.tz_localize('UTC').dt.tz_convert('Asia/Bangkok')
-            df['close_time'] = pd.to_datetime(df['close_time'], unit='ms').dt.tz_localize('UTC').dt.tz_convert('Asia/Bangkok')
-            
-            # Convert price columns to float
-            for col in ['high', 'low', 'close', 'open', 'volume']:
-                df[col] = df[col].astype(float)
+            # Typed columns straight from the raw rows (times tz-aware, prices/volume float)
+            df = klines_to_dataframe(data)
 
             self.klines_cache = df
             self.logger.info(f"Preloaded {len(df)} candles from {df.iloc[0]['open_time']} to {df.iloc[-1]['open_time']}")
@@ -300,8 +295,8 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         
         return self.simulated_position.copy()
     
-    def fetch_price(self, symbol: str) -> float:
-        """Return current candle's close price."""
+    def fetch_price(self, symbol: str, use_cache: bool = True) -> float:
+        """Return current candle's close price (always current; `use_cache` has no effect)."""
         current_candle = self.get_current_candle()
         if current_candle is None:
             return 0.0
@@ -341,7 +336,8 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         quantity: float,
         price: float = 0,
         reduce_only: bool = False,
-        time_in_force: str = "GTC"
+        time_in_force: str = "GTC",
+        client_order_id: str = ''
     ) -> Dict[str, Any]:
         """
         Simulate placing an order.
@@ -353,6 +349,8 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         
         execution_price = price if price > 0 else current_candle['close']
         order_id = f"backtest_{self.current_candle_index}_{order_side}"
+        if self.order_type == OrderType.ADAPTIVE.value:
+            self._order_fee_types[order_id] = OrderType.POST_ONLY.value if time_in_force == 'GTX' else order_type
         
         self.logger.debug(
             f"[BACKTEST] {order_type} {order_side} order: {quantity} @ {execution_price}"
@@ -384,6 +382,7 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         
         return {
             'orderId': order_id,
+            'clientOrderId': client_order_id,
             'symbol': symbol,
             'status': 'FILLED',
             'side': order_side,
@@ -405,6 +404,30 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         self.logger.debug(f"[BACKTEST] Cancel order {order_id}")
         return {'orderId': order_id, 'status': 'CANCELED'}
     
+    def modify_order(
+        self,
+        symbol: str,
+        order_id: str,
+        order_side: str,
+        quantity: float,
+        price: float
+    ) -> Dict[str, Any]:
+        """
+        Simulate amending an order.
+        Orders fill on placement in backtest, so the amend is acknowledged
+        with the order already FILLED.
+        """
+        self.logger.debug(f"[BACKTEST] Modify order {order_id} -> {quantity} @ {price}")
+        return {
+            'orderId': order_id,
+            'symbol': symbol,
+            'status': 'FILLED',
+            'side': order_side,
+            'price': price,
+            'origQty': quantity,
+            'executedQty': quantity
+        }
+    
     def place_algorithmic_order(
         self,
         symbol: str,
@@ -412,7 +435,8 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         order_type: str,
         quantity: float,
         trigger_price: float,
-        close_position: bool = False
+        close_position: bool = False,
+        client_order_id: str = ''
     ) -> Dict[str, Any]:
         """
         Simulate placing TP/SL order.
@@ -422,6 +446,7 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         
         order = {
             'algoId': algo_id,
+            'clientAlgoId': client_order_id,
             'symbol': symbol,
             'side': order_side,
             'type': order_type,
@@ -541,20 +566,23 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
             # Calculate fee based on order type
             # Determine if this is opening or closing
             is_closing = 'close_price' in position_data or self.last_closed_position is not None
+            fee_order_type = self._order_fee_types.get(order_id, self.order_type)
             
             if is_closing:
                 fee = calculate_close_fee(
-                    order_type=self.order_type,
+                    order_type=fee_order_type,
                     close_price=close_price,
                     quantity=quantity,
-                    leverage=self.leverage
+                    leverage=self.leverage,
+                    symbol_filters=self.get_symbol_filters(symbol)
                 )
             else:
                 fee = calculate_open_fee(
-                    order_type=self.order_type,
+                    order_type=fee_order_type,
                     entry_price=execution_price,
                     quantity=quantity,
-                    leverage=self.leverage
+                    leverage=self.leverage,
+                    symbol_filters=self.get_symbol_filters(symbol)
                 )
         
         side = 'SELL' if 'SELL' in order_id or (position_data and position_data['position_side'] == PositionSide.LONG) else 'BUY'
@@ -567,7 +595,7 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         }
     
     def fetch_order_book(self, symbol: str, limit: int = 5) -> Dict[str, Any]:
-        """Simulate order book with current price."""
+        """Simulate order book with current price (one level, zero spread; no queue or depth model)."""
         current_candle = self.get_current_candle()
         if current_candle is None:
             return {'bids': [], 'asks': []}
@@ -579,48 +607,33 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
         }
     
     def fetch_exchange_info(self, symbol: str) -> Dict[str, Any]:
-        """Fetch and cache exchange info."""
+        """Fetch and cache exchange info (served offline from the shared registry once downloaded)."""
         if symbol in self._exchange_info_cache:
             return self._exchange_info_cache[symbol]
         
         self.logger.debug(f"Fetching exchange info for {symbol}")
         
-        params = {'symbol': symbol}
-        headers, signed_params = binance_auth.sign_request(
-            params=params,
-            binance_credential=self.__creds
-        )
-        
         try:
-            response = requests.get(
-                url=GET_EXCHANGE_INFO_URL,
-                headers=headers,
-                params=signed_params
+            symbol_info = BinanceExchangeInfoRegistry.get_instance().get_symbol_info(
+                symbol=symbol,
+                fetch_function=lambda: self._request_builder.send(
+                    session=self.session,
+                    method='GET',
+                    url=GET_EXCHANGE_INFO_URL,
+                    params={},
+                    operation="fetch exchange info",
+                    signed=False
+                )
             )
-            response.raise_for_status()
-            data = response.json()
+            if not symbol_info:
+                return {}
             
-            for symbol_info in data.get('symbols', []):
-                if symbol_info['symbol'] == symbol:
-                    tick_size = 0.01
-                    step_size = 0.01
-                    
-                    for filter_item in symbol_info.get('filters', []):
-                        if filter_item['filterType'] == 'PRICE_FILTER':
-                            tick_size = float(filter_item['tickSize'])
-                        elif filter_item['filterType'] == 'LOT_SIZE':
-                            step_size = float(filter_item['stepSize'])
-                    
-                    exchange_info = {
-                        'symbol': symbol,
-                        'tickSize': tick_size,
-                        'stepSize': step_size
-                    }
-                    
-                    self._exchange_info_cache[symbol] = exchange_info
-                    return exchange_info
+            symbol_filters = SymbolFilters.from_symbol_info(symbol_info=symbol_info)
+            exchange_info = symbol_filters.to_exchange_info()
             
-            return {}
+            self._symbol_filters[symbol] = symbol_filters
+            self._exchange_info_cache[symbol] = exchange_info
+            return exchange_info
             
         except Exception as e:
             self.logger.error_e(message=f"Failed to fetch exchange info", e=e)
@@ -633,6 +646,10 @@ class BinanceBacktestTradeClient(BaseBacktestTradeClient):
     def get_cached_exchange_info(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached exchange info."""
         return self._exchange_info_cache.get(symbol)
+    
+    def get_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        """Get cached symbol filters."""
+        return self._symbol_filters.get(symbol)
 
 
 # EOF
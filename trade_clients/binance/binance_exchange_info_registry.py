@@ -0,0 +1,126 @@
+"""
+Binance Exchange Info Registry
+Process-wide symbol registry built from a single /fapi/v1/exchangeInfo download.
+
+exchangeInfo returns every symbol in one multi-megabyte document, so it is
+downloaded at most once per TTL, indexed by symbol and written to disk. Every
+client in the process (live and backtest) reads symbol rules from the index,
+and later processes start from the disk copy without touching the network.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from commons.constants import CACHE_DIR, EXCHANGE_INFO_CACHE_TTL_SECONDS
+from commons.custom_logger import CustomLogger
+
+EXCHANGE_INFO_CACHE_FILENAME = "binance_futures_exchange_info.json"
+
+# Fetch function: () -> raw exchangeInfo document (empty on error)
+ExchangeInfoFetchFunction = Callable[[], Any]
+
+
+class BinanceExchangeInfoRegistry:
+    """
+    Symbol-indexed exchangeInfo with a disk cache and TTL.
+
+    - Concurrent callers on a cold registry wait for one download
+    - A symbol missing from a disk copy triggers one refresh (new listings)
+    - If a refresh fails, an expired disk copy is still served
+    """
+
+    _instance: Optional['BinanceExchangeInfoRegistry'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_path: str = os.path.join(CACHE_DIR, EXCHANGE_INFO_CACHE_FILENAME),
+        ttl: float = EXCHANGE_INFO_CACHE_TTL_SECONDS,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            cache_path: JSON file holding the indexed symbols
+            ttl: Seconds a download is served before refetching
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._symbols: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: float = 0.0
+        self._downloaded = False  # True once this process fetched a fresh copy
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'BinanceExchangeInfoRegistry':
+        """Get the process-wide registry, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                ttl = float(os.getenv('EXCHANGE_INFO_CACHE_TTL_SECONDS', EXCHANGE_INFO_CACHE_TTL_SECONDS))
+                cls._instance = cls(ttl=ttl)
+            return cls._instance
+
+    def _is_fresh(self) -> bool:
+        return bool(self._symbols) and time.time() - self._fetched_at < self.ttl
+
+    def _load_from_disk(self) -> None:
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            self._symbols = data['symbols']
+            self._fetched_at = float(data['fetched_at'])
+            self.logger.debug(message=f"Loaded exchange info for {len(self._symbols)} symbols from {self.cache_path}")
+        except Exception as e:
+            self.logger.warning_e(message=f"Ignoring unreadable exchange info cache {self.cache_path}", e=e)
+
+    def _save_to_disk(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'fetched_at': self._fetched_at, 'symbols': self._symbols}, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            self.logger.warning_e(message=f"Failed to write exchange info cache {self.cache_path}", e=e)
+
+    def _refresh(self, fetch_function: ExchangeInfoFetchFunction) -> bool:
+        data = fetch_function()
+        if not data or not data.get('symbols'):
+            return False
+        self._symbols = {info['symbol']: info for info in data['symbols']}
+        self._fetched_at = time.time()
+        self._downloaded = True
+        self._save_to_disk()
+        self.logger.info(message=f"Downloaded exchange info for {len(self._symbols)} symbols")
+        return True
+
+    def get_symbol_info(self, symbol: str, fetch_function: ExchangeInfoFetchFunction) -> Optional[Dict[str, Any]]:
+        """
+        Get the raw exchangeInfo entry of a symbol.
+
+        Args:
+            symbol: Trading pair symbol
+            fetch_function: Callable that downloads the full exchangeInfo document
+
+        Returns:
+            Symbol entry (including 'filters'), or None if unknown or unavailable
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            if not self._symbols:
+                self._load_from_disk()
+
+            needs_refresh = not self._is_fresh() or (symbol not in self._symbols and not self._downloaded)
+            if needs_refresh and not self._refresh(fetch_function) and self._symbols:
+                self.logger.warning(message="Exchange info refresh failed, serving cached copy")
+
+            return self._symbols.get(symbol)
+
+# EOF
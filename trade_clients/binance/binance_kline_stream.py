@@ -0,0 +1,236 @@
+"""
+Binance Kline Stream
+Process-wide rolling kline buffers kept current from the futures kline stream.
+
+Each (symbol, timeframe) buffer is seeded once from a REST snapshot and then
+updated in place from `<symbol>@kline_<interval>` events, so bots can read
+klines from memory instead of downloading the full window every tick.
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from commons.custom_logger import CustomLogger
+from trade_clients.binance.binance_websocket import (
+    BinanceWebSocketConnection,
+    FUTURES_STREAM_BASE_URL
+)
+
+# Buffer is considered stale if no stream message arrived for this long (seconds).
+# Kline streams push every 250ms while the market trades, so this is generous.
+KLINE_STREAM_STALE_SECONDS = 60
+
+# Max seconds a caller waits for the first seed/connection before falling back to REST
+KLINE_STREAM_READY_TIMEOUT = 5
+
+TIMEFRAME_MS: Dict[str, int] = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 60 * 60_000,
+    '2h': 2 * 60 * 60_000,
+    '4h': 4 * 60 * 60_000,
+    '6h': 6 * 60 * 60_000,
+    '8h': 8 * 60 * 60_000,
+    '12h': 12 * 60 * 60_000,
+    '1d': 24 * 60 * 60_000,
+    '3d': 3 * 24 * 60 * 60_000,
+    '1w': 7 * 24 * 60 * 60_000,
+}
+
+# Seed function: (symbol, timeframe, limit) -> raw REST klines rows
+SeedFunction = Callable[[str, str, int], Optional[List[list]]]
+
+
+def kline_event_to_row(k: dict) -> list:
+    """
+    Convert a kline stream payload ('k' object) into a REST klines row.
+
+    Args:
+        k: Kline object from a `kline` stream event
+
+    Returns:
+        Row in the same layout as GET /fapi/v1/klines
+    """
+    return [
+        k['t'], k['o'], k['h'], k['l'], k['c'], k['v'],
+        k['T'], k['q'], k['n'], k['V'], k['Q'], k.get('B', '0')
+    ]
+
+
+class KlineBuffer:
+    """Rolling buffer of raw kline rows for one (symbol, timeframe)."""
+
+    def __init__(self, symbol: str, timeframe: str, max_size: int) -> None:
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.max_size = max_size
+        self.rows: List[list] = []
+        self.seeded = False
+        self.needs_reseed = False
+        self.pending_events: List[list] = []  # events received before seed completed
+        self.lock = threading.Lock()
+
+    def seed(self, rows: List[list]) -> None:
+        """Replace buffer content with a REST snapshot and replay queued events."""
+        self.rows = list(rows[-self.max_size:])
+        self.seeded = True
+        self.needs_reseed = False
+        pending, self.pending_events = self.pending_events, []
+        for row in pending:
+            self.apply(row)
+
+    def apply(self, row: list) -> None:
+        """
+        Apply a stream row: replace the in-progress candle or append a new one.
+
+        Marks the buffer for reseed when a gap between candles is detected.
+        """
+        if not self.seeded:
+            self.pending_events.append(row)
+            return
+
+        if not self.rows:
+            self.rows.append(row)
+            return
+
+        last_open_time = self.rows[-1][0]
+        open_time = row[0]
+        if open_time == last_open_time:
+            self.rows[-1] = row
+        elif open_time > last_open_time:
+            interval_ms = TIMEFRAME_MS.get(self.timeframe)
+            if interval_ms and open_time - last_open_time > interval_ms:
+                # Missed at least one closed candle; REST snapshot needed
+                self.needs_reseed = True
+            self.rows.append(row)
+            if len(self.rows) > self.max_size:
+                del self.rows[:len(self.rows) - self.max_size]
+        # Older candles are ignored
+
+
+class BinanceKlineStreamManager:
+    """
+    Process-wide manager of kline stream buffers.
+
+    Shared by every BinanceLiveTradeClient instance so bots trading the same
+    (symbol, timeframe) read the same buffer over a single connection.
+    """
+
+    _instance: Optional['BinanceKlineStreamManager'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, base_url: str = FUTURES_STREAM_BASE_URL, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Initialize kline stream manager.
+
+        Args:
+            base_url: Websocket base URL (override to point at a local stand-in server)
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.base_url = base_url.rstrip('/')
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._buffers: Dict[Tuple[str, str], KlineBuffer] = {}
+        self._connections: Dict[Tuple[str, str], BinanceWebSocketConnection] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'BinanceKlineStreamManager':
+        """Get the process-wide manager, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def get_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        seed_function: SeedFunction
+    ) -> Optional[List[list]]:
+        """
+        Get the last `limit` kline rows from memory.
+
+        Subscribes and seeds on first use, and reseeds after a gap, reconnect
+        or when a caller asks for more candles than the buffer holds.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe interval (e.g., '1h')
+            limit: Number of candles wanted
+            seed_function: Callable that fetches a REST snapshot
+
+        Returns:
+            List of raw kline rows (copy), or None if the stream is not usable
+        """
+        key = (symbol.upper(), timeframe)
+        buffer, connection = self._subscribe(key=key, limit=limit)
+
+        if not connection.wait_connected(timeout=KLINE_STREAM_READY_TIMEOUT):
+            self.logger.warning(message=f"Kline stream {key} not connected")
+            return None
+
+        with buffer.lock:
+            stale = (time.time() - connection.last_message_time) > KLINE_STREAM_STALE_SECONDS
+            too_short = buffer.max_size < limit
+            if not buffer.seeded or buffer.needs_reseed or stale or too_short:
+                buffer.max_size = max(buffer.max_size, limit)
+                rows = seed_function(symbol, timeframe, buffer.max_size)
+                if not rows:
+                    return None
+                buffer.seed(rows)
+                self.logger.debug(message=f"Seeded kline buffer {key} with {len(buffer.rows)} candles")
+            return [list(row) for row in buffer.rows[-limit:]]
+
+    def _subscribe(self, key: Tuple[str, str], limit: int) -> Tuple[KlineBuffer, BinanceWebSocketConnection]:
+        """Create buffer and connection for a key on first use."""
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = KlineBuffer(symbol=key[0], timeframe=key[1], max_size=limit)
+                self._buffers[key] = buffer
+
+            connection = self._connections.get(key)
+            if connection is None:
+                stream_name = f"{key[0].lower()}@kline_{key[1]}"
+                connection = BinanceWebSocketConnection(
+                    url=f"{self.base_url}/{stream_name}",
+                    on_message=lambda data, k=key: self._handle_message(k, data),
+                    on_open=lambda k=key: self._handle_open(k),
+                    name=stream_name,
+                    logger=self.logger
+                )
+                self._connections[key] = connection
+                connection.start()
+                self.logger.info(message=f"Subscribed kline stream {stream_name}")
+            return buffer, connection
+
+    def _handle_open(self, key: Tuple[str, str]) -> None:
+        """Events may have been missed while disconnected; force a reseed."""
+        buffer = self._buffers.get(key)
+        if buffer:
+            with buffer.lock:
+                buffer.needs_reseed = buffer.seeded
+
+    def _handle_message(self, key: Tuple[str, str], data: dict) -> None:
+        """Apply a kline event to its buffer."""
+        if data.get('e') != 'kline' or 'k' not in data:
+            return
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            return
+        with buffer.lock:
+            buffer.apply(kline_event_to_row(data['k']))
+
+    def stop(self) -> None:
+        """Close all stream connections."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.stop()
+            self._connections.clear()
+            self._buffers.clear()
+
+# EOF
@@ -1,29 +1,61 @@
+import json
+import os
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import threading
 import time
+from urllib3.util.retry import Retry
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable
 
 from abstracts.base_live_trade_client import BaseLiveTradeClient
+from commons.constants import ORDER_SUBMIT_MAX_RETRIES, ORDER_LOOKUP_SKEW_MS
 from commons.custom_logger import CustomLogger
 from models.enum.position_side import PositionSide
 import trade_clients.binance.binance_auth as binance_auth
 from models.enum.order_type import OrderType
+from models.order_leg import OrderLeg
+from models.symbol_filters import SymbolFilters
+from trade_clients.binance.binance_kline_stream import BinanceKlineStreamManager, TIMEFRAME_MS
+from trade_clients.binance.binance_user_data_stream import BinanceUserDataStream
+from trade_clients.binance.binance_account_snapshot import BinanceAccountSnapshot
+from trade_clients.binance.binance_open_orders_cache import BinanceOpenOrdersCache, OPEN_ORDER_STATUSES
+from trade_clients.binance.binance_price_cache import BinancePriceCache
+from trade_clients.binance.binance_order_book import BinanceOrderBookManager
+from trade_clients.binance.binance_exchange_info_registry import BinanceExchangeInfoRegistry
+from trade_clients.binance.binance_kline_decoder import klines_to_dataframe
+from trade_clients.binance.binance_rate_limiter import (
+    API_WEIGHT_LIMIT,
+    BinanceRateLimiter,
+    BinanceRateLimitAdapter
+)
+from trade_clients.binance.binance_request_builder import FAPI_BASE_URL, BinanceRequestBuilder
+
+SET_LEVERAGE_URL = f'{FAPI_BASE_URL}/fapi/v1/leverage'
+GET_POSITION_URL = f'{FAPI_BASE_URL}/fapi/v2/positionRisk'
+SET_ORDER_URL = f'{FAPI_BASE_URL}/fapi/v1/order'
+SET_ALGO_ORDER_URL = f'{FAPI_BASE_URL}/fapi/v1/algoOrder'
+GET_OPEN_ORDERS_URL = f'{FAPI_BASE_URL}/fapi/v1/openOrders'
+GET_OPEN_ALGO_ORDERS_URL = f'{FAPI_BASE_URL}/fapi/v1/openAlgoOrders'
+SET_BATCH_ORDERS_URL = f'{FAPI_BASE_URL}/fapi/v1/batchOrders'
+GET_KLINES_URL = f'{FAPI_BASE_URL}/fapi/v1/klines'
+GET_TICKER_PRICE_URL = f'{FAPI_BASE_URL}/fapi/v1/ticker/price'
+GET_ORDER = f'{FAPI_BASE_URL}/fapi/v1/order'
+GET_TRADE = f'{FAPI_BASE_URL}/fapi/v1/userTrades'
+GET_ORDER_BOOK_URL = f'{FAPI_BASE_URL}/fapi/v1/depth'
+GET_EXCHANGE_INFO_URL = f'{FAPI_BASE_URL}/fapi/v1/exchangeInfo'
+PING_URL = f'{FAPI_BASE_URL}/fapi/v1/ping'
 
-SET_LEVERAGE_URL = 'https://fapi.binance.com/fapi/v1/leverage'
-GET_POSITION_URL = 'https://fapi.binance.com/fapi/v2/positionRisk'
-SET_ORDER_URL = 'https://fapi.binance.com/fapi/v1/order'
-SET_ALGO_ORDER_URL = 'https://fapi.binance.com/fapi/v1/algoOrder'
-GET_KLINES_URL = 'https://fapi.binance.com/fapi/v1/klines'
-GET_TICKER_PRICE_URL = 'https://fapi.binance.com/fapi/v1/ticker/price'
-GET_ORDER = 'https://fapi.binance.com/fapi/v1/order'
-GET_TRADE = 'https://fapi.binance.com/fapi/v1/userTrades'
-GET_ORDER_BOOK_URL = 'https://fapi.binance.com/fapi/v1/depth'
-GET_EXCHANGE_INFO_URL = 'https://fapi.binance.com/fapi/v1/exchangeInfo'
+# Candles requested per incremental klines refresh: the largest limit still charged
+# the minimum klines weight. Longer gaps fall back to a full-window fetch.
+INCREMENTAL_KLINES_LIMIT = 99
+
+# Max orders per POST /fapi/v1/batchOrders request
+BATCH_ORDERS_MAX = 5
+
+# Binance error code for a client order id already used by an open order
+DUPLICATE_CLIENT_ORDER_ID_ERROR_CODE = -4116
 
 # Rate limit constants
-API_WEIGHT_LIMIT = 2000
 API_ORDER_10s_LIMIT = 50
 API_ORDER_1m_LIMIT = 1600
 
@@ -41,34 +73,83 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
         self.set_wait_time(wait_time_sec=20)
         self.set_running(running=True)
         
+        # Process-wide weight limiter shared by every client instance
+        self._rate_limiter = BinanceRateLimiter.get_instance()
+
         # Initialize session with connection pooling and retry strategy
         self.session = self._create_session()
+
+        # Encodes, signs and sends every request (keyed with credentials in init())
+        self._request_builder = BinanceRequestBuilder(logger=self.logger)
+
+        # Whether this thread's last order submission ended with its outcome still unknown
+        self._submission = threading.local()
         
         # Cache for exchange info to avoid repeated API calls
         self._exchange_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._symbol_filters: Dict[str, SymbolFilters] = {}
+        self._exchange_info_registry = BinanceExchangeInfoRegistry.get_instance()
+        
+        # Last klines frame per (symbol, timeframe), extended from its last open_time each tick
+        self._klines_frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+
+        # Streaming mode: serve klines from the shared websocket-fed buffers
+        self._kline_stream: Optional[BinanceKlineStreamManager] = None
+        if os.getenv('KLINE_STREAM_ENABLED', 'false').lower() == 'true':
+            self._kline_stream = BinanceKlineStreamManager.get_instance()
+
+        # Local order books: serve maker pricing from diff-depth-fed books
+        self._order_book_stream: Optional[BinanceOrderBookManager] = None
+        if os.getenv('ORDER_BOOK_STREAM_ENABLED', 'false').lower() == 'true':
+            self._order_book_stream = BinanceOrderBookManager.get_instance()
+
+        # positionRisk is account-wide; one snapshot serves every bot in the process
+        self._account_snapshot = BinanceAccountSnapshot.get_instance()
+
+        # Open orders / open algo orders of the account, one snapshot for every bot (TP/SL monitoring)
+        self._open_orders = BinanceOpenOrdersCache.get_instance()
+
+        # Last price per symbol, shared by every bot (aggTrade-fed when PRICE_STREAM_ENABLED=true)
+        self._price_cache = BinancePriceCache.get_instance()
+
+        # Event mode: order/position updates pushed over the user-data stream (started in init())
+        self._user_data_stream: Optional[BinanceUserDataStream] = None
     
     def _create_session(self) -> requests.Session:
         """Create requests session with connection pooling and retry strategy."""
         session = requests.Session()
         
-        # Configure retry strategy
+        # Configure retry strategy; only reads are retried here. A blind POST
+        # retry can duplicate an order: order submissions are retried by
+        # `_submit_order` after a lookup by client order id instead.
         retry_strategy = Retry(
             total=3,
             backoff_factor=0.5,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "DELETE"]
+            allowed_methods=["GET"]
         )
         
-        # Mount adapter with retry strategy
-        adapter = HTTPAdapter(
+        # Mount adapter with retry strategy; it also throttles through the shared limiter
+        adapter = BinanceRateLimitAdapter(
+            rate_limiter=self._rate_limiter,
             pool_connections=8,
             pool_maxsize=16,
             max_retries=retry_strategy
         )
         session.mount("https://", adapter)
+        session.mount("http://", adapter)
         
         return session
     
+    def get_rate_limit_state(self) -> Dict[str, Any]:
+        """
+        Get shared rate limiter state for monitoring.
+        
+        Returns:
+            Dictionary with tokens left, server-reported weight and wait statistics
+        """
+        return self._rate_limiter.get_state()
+
     def _log_rate_limits(self, response: requests.Response) -> None:
         """
         Log rate limit status with appropriate severity levels.
@@ -143,62 +224,130 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
     def init(self):
         """Initialize Binance credentials."""
         self.__creds = binance_auth.load_binance_cred()
+        self._request_builder.set_credentials(credentials=self.__creds)
+        if os.getenv('USER_DATA_STREAM_ENABLED', 'false').lower() == 'true':
+            self._user_data_stream = BinanceUserDataStream.get_instance(api_key=self.__creds.binance_api_key)
         self.logger.debug(message=f"Initialized {self.__class__.__name__}")
     
     def _get_timestamp(self) -> int:
-        """Get current timestamp in milliseconds."""
-        return int(time.time() * 1000)
+        """Get current Binance server timestamp in milliseconds."""
+        return self._request_builder.timestamp()
     
     def _make_request(
         self,
         method: str,
         url: str,
         params: Dict[str, Any],
-        operation: str
-    ) -> Dict[str, Any]:
+        operation: str,
+        signed: bool = True
+    ) -> Any:
         """
-        Make authenticated request to Binance API.
+        Make request to Binance API.
+        
+        Signed requests get a server-synced timestamp and recvWindow added by
+        the request builder, so callers do not pass `timestamp`.
         
         Args:
-            method: HTTP method ('GET', 'POST', 'DELETE')
+            method: HTTP method ('GET', 'POST', 'PUT', 'DELETE')
             url: API endpoint URL
             params: Request parameters
             operation: Description of operation for logging
+            signed: Whether the endpoint requires a signature
         
         Returns:
-            Response dictionary or empty dict on error
+            Decoded response or empty dict on error
         """
-        headers, signed_params = binance_auth.sign_request(
+        result = self._request_builder.send(
+            session=self.session,
+            method=method,
+            url=url,
             params=params,
-            binance_credential=self.__creds
+            operation=operation,
+            signed=signed,
+            response_hook=self._log_rate_limits
         )
+        return {} if result is None else result
+
+    def get_last_error_code(self) -> Optional[int]:
+        """Get the Binance error code of this thread's last failed request (e.g. -5022)."""
+        return self._request_builder.last_error.get('code')
+
+    def last_order_outcome_unknown(self) -> bool:
+        """Whether this thread's last order submission gave up without learning if the order was placed."""
+        return getattr(self._submission, 'outcome_unknown', False)
+
+    def _submit_order(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        operation: str,
+        client_order_id: str,
+        lookup: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        POST an order that carries a client order id, without ever placing it twice.
         
-        try:
-            response = None
-            if method == 'GET':
-                response = self.session.get(url=url, headers=headers, params=signed_params)
-            elif method == 'POST':
-                response = self.session.post(url=url, headers=headers, params=signed_params)
-            elif method == 'DELETE':
-                response = self.session.delete(url=url, headers=headers, params=signed_params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Monitor rate limits with appropriate severity
-            self._log_rate_limits(response)
-            response.raise_for_status()
-            return response.json()
-        
-        except requests.exceptions.HTTPError as e:
-            self.logger.error_e(message=f"HTTP error during {operation}", e=e)
-            self.logger.error(message=f"Response: {response.text}")
-            return {}
-        except requests.exceptions.RequestException as e:
-            self.logger.error_e(message=f"Network error during {operation}", e=e)
-            return {}
-        except Exception as e:
-            self.logger.error_e(message=f"Unexpected error during {operation}", e=e)
+        When the outcome of a submission is unknown (no response, 5xx, -1007)
+        or the client id is reported as a duplicate, the order is looked up by
+        client id: if it exists it is returned, otherwise the same request is
+        resubmitted at once, up to ORDER_SUBMIT_MAX_RETRIES times. An order
+        found by an unknown-outcome lookup must have been created after the
+        first submission, so an older order that used the same id is never
+        mistaken for this one.
+        
+        Args:
+            url: Order endpoint
+            params: Order parameters, including the client order id
+            operation: Description of operation for logging
+            client_order_id: Client order id carried by `params`
+            lookup: Fetches the order by client id ({} if it does not exist)
+        
+        Returns:
+            Order response, or empty dict if rejected or still unknown
+            (see `last_order_outcome_unknown`)
+        """
+        submitted_at = self._get_timestamp()
+        self._submission.outcome_unknown = False
+        result: Dict[str, Any] = {}
+        for attempt in range(ORDER_SUBMIT_MAX_RETRIES + 1):
+            result = self._make_request('POST', url, params, operation)
+            if result:
+                return result
+
+            duplicate = self.get_last_error_code() == DUPLICATE_CLIENT_ORDER_ID_ERROR_CODE
+            if not duplicate and not self._request_builder.outcome_unknown:
+                return result
+
+            existing = lookup()
+            created_at = int(existing.get('time') or existing.get('createTime') or 0) if existing else 0
+            if existing and (duplicate or created_at >= submitted_at - ORDER_LOOKUP_SKEW_MS):
+                self.logger.warning(message=f"{operation}: order {client_order_id} was accepted, using it instead of resubmitting")
+                return existing
+            if duplicate:
+                return result
+            if attempt < ORDER_SUBMIT_MAX_RETRIES:
+                self.logger.warning(message=f"{operation}: order {client_order_id} not found after unknown outcome, resubmitting")
+        # Every submission was lost; the last one may still reach the book
+        self._submission.outcome_unknown = True
+        return result
+
+    def warm_connection(self) -> None:
+        """Ping the API so a pooled keep-alive connection is ready (no TCP/TLS handshake on the next order)."""
+        self._make_request('GET', PING_URL, {}, "warm connection", signed=False)
+
+    def fetch_order_by_client_id(self, symbol: str, client_order_id: str, algo: bool = False) -> Dict[str, Any]:
+        """Fetch an order (or algo order) by the client order id it was placed with, {} if it does not exist."""
+        if not client_order_id:
             return {}
+        if algo:
+            result = self._make_request('GET', SET_ALGO_ORDER_URL, {'clientAlgoId': client_order_id}, "fetch algo order by client id")
+            return result if isinstance(result, dict) and result.get('algoId') else {}
+        params = {
+            'symbol': symbol.upper(),
+            'origClientOrderId': client_order_id
+        }
+        result = self._make_request('GET', GET_ORDER, params, "fetch order by client id")
+        return result if isinstance(result, dict) and result.get('orderId') else {}
 
     def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
         """
@@ -214,7 +363,6 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
         self.logger.debug(message=f"Setting leverage for {symbol} to {leverage}")
         
         params = {
-            "timestamp": self._get_timestamp(),
             "symbol": symbol.upper(),
             "leverage": leverage
         }
@@ -228,14 +376,19 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
         """
         Get the current futures position for a given symbol.
         
+        Served from the shared positionRisk snapshot, which is refetched at most
+        once per TTL and invalidated after any order placed through a client.
+        
         Args:
             symbol: Trading pair symbol
         
         Returns:
             Dictionary with position details or empty dict if no position
         """
-        params = {'timestamp': self._get_timestamp()}
-        positions = self._make_request('GET', GET_POSITION_URL, params, "fetch position")
+        positions = self._account_snapshot.get_positions(
+            symbol=symbol,
+            fetch_function=lambda: self._make_request('GET', GET_POSITION_URL, {}, "fetch position")
+        )
         
         if not positions:
             return {}
@@ -277,24 +430,31 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
         Returns:
             Current market price
         """
+        if use_cache:
+            cached_price = self._price_cache.get_price(symbol=symbol)
+            if cached_price is not None:
+                return cached_price
         
         # Fetch fresh price
-        params = {'symbol': symbol}
-        headers, signed_params = binance_auth.sign_request(params=params, binance_credential=self.__creds)
-        try:
-            response = self.session.get(url=GET_TICKER_PRICE_URL, headers=headers, params=signed_params)
-            response.raise_for_status()
-            current_price = float(response.json()["price"])
-
-            return current_price
-        except Exception as e:
-            self.logger.error_e(message=f"error getting price", e=e)
+        result = self._make_request('GET', GET_TICKER_PRICE_URL, {'symbol': symbol}, "fetch price", signed=False)
+        if not result:
             return 0.0
+        current_price = float(result["price"])
+        self._price_cache.update(symbol=symbol, price=current_price)
+        return current_price
 
-    def fetch_klines(self, symbol, timeframe, timeframe_limit=100):
-        df = None
-
-        # fetch klines
+    def _fetch_raw_klines(self, symbol: str, timeframe: str, timeframe_limit: int) -> Optional[list]:
+        """
+        Fetch raw klines rows from REST.
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe interval
+            timeframe_limit: Number of candles to fetch
+        
+        Returns:
+            List of raw kline rows, or None on error
+        """
         params = {
             'symbol': symbol,
             'interval': timeframe,
@@ -302,39 +462,117 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
         }
         # self.logger.debug(message=f'Fetching Klines of {params}')
 
-        headers, signed_params = binance_auth.sign_request(params=params, binance_credential=self.__creds)
-        try:
-            response = self.session.get(url=GET_KLINES_URL, headers=headers, params=signed_params)
-            response.raise_for_status()
-
-            # Monitor rate limits with appropriate severity
-            self._log_rate_limits(response)
-
-            data = response.json()
-            # Define column names for Binance klines data
-            klines_columns = [
-                'open_time', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'num_trades',
-                'taker_buy_base_volume', 'taker_buy_quote_volume', 'ignore'
-            ]
-            
-            # Create DataFrame - pass data as first positional arg, columns as keyword arg
-            df = pd.DataFrame(data, columns=klines_columns)  # type: ignore[call-overload]
-
-            df['open_time'] = pd.to_datetime(arg=df['open_time'], unit='ms').dt.tz_localize(tz='UTC').dt.tz_convert(tz='Asia/Bangkok') # type: ignore
-            df['close_time'] = pd.to_datetime(arg=df['close_time'], unit='ms').dt.tz_localize(tz='UTC').dt.tz_convert(tz='Asia/Bangkok') # type: ignore
-            df['high'] = df['high'].astype(dtype=float)
-            df['low'] = df['low'].astype(dtype=float)
-            df['close'] = df['close'].astype(dtype=float)
-            df['open'] = df['open'].astype(dtype=float)
-            # self.logger.debug(message=f"Fetched {len(df)} Klines for {symbol} at {timeframe} interval.")
-        except requests.exceptions.HTTPError as e:
-            self.logger.error_e(message=f"HTTP error getting Klines", e=e)
-            self.logger.error(message=f"Response: {response.text}") # type: ignore
-            return df
-        except requests.exceptions.RequestException as e:
-            self.logger.error_e(message=f"Network error getting Klines", e=e)
-            return df
+        data = self._make_request('GET', GET_KLINES_URL, params, "fetch klines", signed=False)
+        return data if data else None
+
+    def _klines_to_df(self, data: list) -> pd.DataFrame:
+        """
+        Build klines DataFrame from raw kline rows.
+        
+        Args:
+            data: Raw kline rows (REST layout)
+        
+        Returns:
+            DataFrame with converted time and price columns (see KLINE_COLUMNS)
+        """
+        return klines_to_dataframe(data)
+
+    def _plan_klines_request(self, symbol: str, timeframe: str, timeframe_limit: int) -> Dict[str, Any]:
+        """
+        Build klines request params for the next refresh.
+        
+        If a frame is cached and few enough candles opened since its last one,
+        only candles from the last known open_time onward are requested.
+        Otherwise (first call, restart, long gap) the full window is requested.
+        
+        Returns:
+            Request params; incremental requests carry 'startTime'
+        """
+        params: Dict[str, Any] = {
+            'symbol': symbol,
+            'interval': timeframe,
+            'limit': timeframe_limit
+        }
+        frame = self._klines_frames.get((symbol, timeframe))
+        interval_ms = TIMEFRAME_MS.get(timeframe)
+        if frame is None or not interval_ms or len(frame) < timeframe_limit:
+            return params
+
+        last_open_ms = frame['open_time'].iloc[-1].value // 1_000_000
+        candles_since = (self._get_timestamp() - last_open_ms) // interval_ms + 1
+        if candles_since < INCREMENTAL_KLINES_LIMIT:
+            params.update({'startTime': last_open_ms, 'limit': INCREMENTAL_KLINES_LIMIT})
+        return params
+
+    def _merge_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        timeframe_limit: int,
+        params: Dict[str, Any],
+        data: list
+    ) -> Optional[pd.DataFrame]:
+        """
+        Merge fetched rows into the cached frame.
+        
+        Incremental rows replace the cached in-progress candle and append any
+        newer ones; full-window rows replace the frame.
+        
+        Returns:
+            Copy of the merged frame trimmed to `timeframe_limit`, or None if
+            incremental rows do not line up with the cached frame
+        """
+        key = (symbol, timeframe)
+        df = self._klines_to_df(data)
+
+        if 'startTime' in params:
+            frame = self._klines_frames.get(key)
+            if frame is None or data[0][0] != params['startTime']:
+                return None
+            df = pd.concat([frame.iloc[:-1], df], ignore_index=True)
+            df = df.iloc[-max(timeframe_limit, len(frame)):].reset_index(drop=True)
+
+        self._klines_frames[key] = df
+        # Strategies add indicator columns; keep the cached frame clean
+        return df.iloc[-timeframe_limit:].reset_index(drop=True).copy()
+
+    def _fetch_klines_frame(self, symbol: str, timeframe: str, timeframe_limit: int) -> Optional[pd.DataFrame]:
+        """Fetch klines incrementally when possible, falling back to the full window."""
+        params = self._plan_klines_request(symbol=symbol, timeframe=timeframe, timeframe_limit=timeframe_limit)
+        if 'startTime' in params:
+            data = self._make_request('GET', GET_KLINES_URL, params, "fetch klines", signed=False)
+            df = self._merge_klines(symbol, timeframe, timeframe_limit, params, data) if data else None
+            if df is not None:
+                return df
+            self.logger.debug(message=f"Incremental klines for {symbol} {timeframe} did not line up, refetching window")
+            params = {'symbol': symbol, 'interval': timeframe, 'limit': timeframe_limit}
+
+        data = self._fetch_raw_klines(symbol=symbol, timeframe=timeframe, timeframe_limit=timeframe_limit)
+        if data is None:
+            return None
+        return self._merge_klines(symbol, timeframe, timeframe_limit, params, data)
+
+    def fetch_klines(self, symbol, timeframe, timeframe_limit=100):
+        # Streaming mode: serve from the in-memory buffer kept current by the kline stream.
+        # The last row is the live in-progress candle, so its close is the current price.
+        if self._kline_stream is not None:
+            data = self._kline_stream.get_klines(
+                symbol=symbol,
+                timeframe=timeframe,
+                limit=timeframe_limit,
+                seed_function=self._fetch_raw_klines
+            )
+            if data:
+                df = self._klines_to_df(data)
+                df["current_price"] = df["close"]
+                return df
+            self.logger.warning(message=f"Kline stream unavailable for {symbol} {timeframe}, falling back to REST")
+
+        # fetch klines (only candles since the last known open_time after the first call)
+        df = self._fetch_klines_frame(symbol=symbol, timeframe=timeframe, timeframe_limit=timeframe_limit)
+        if df is None:
+            return None
+        # self.logger.debug(message=f"Fetched {len(df)} Klines for {symbol} at {timeframe} interval.")
 
         # fetch current price
         current_price = self.fetch_price(symbol=symbol)
@@ -343,12 +581,49 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
 
         return df 
 
+    def _stream_is_healthy(self) -> bool:
+        """Check whether order state can be served from the user-data stream."""
+        return self._user_data_stream is not None and self._user_data_stream.is_healthy
+
+    def watch_symbol(self, symbol: str) -> None:
+        """Wake the bot whenever an order, algo order or position update arrives for `symbol`."""
+        if self._user_data_stream is not None:
+            self._user_data_stream.add_listener(
+                symbol=symbol.upper(),
+                listener=self._handle_account_event
+            )
+
+    def watch_price(self, symbol: str, listener: Callable[[str, float], None]) -> None:
+        """Deliver every price stored in the shared price cache (aggTrade stream or REST) to `listener`."""
+        self._price_cache.add_listener(symbol=symbol, listener=listener)
+
+    def _handle_account_event(self, event_type: str, symbol: str) -> None:
+        if event_type == 'ACCOUNT_UPDATE':
+            self._account_snapshot.invalidate()
+        self.wake()
+
+    def wait_for_order_update(self, symbol: str, order_id: str, timeout: float) -> Dict[str, Any]:
+        """
+        Wait for an order update pushed over the user-data stream, then return order details.
+        
+        Falls back to sleep + REST polling when the stream is disabled or down.
+        """
+        if not self._stream_is_healthy():
+            return super().wait_for_order_update(symbol=symbol, order_id=order_id, timeout=timeout)
+        self._user_data_stream.wait_for_order_change(order_id=order_id, timeout=timeout)  # type: ignore[union-attr]
+        return self.fetch_order(symbol=symbol, order_id=order_id)
+
     def fetch_order(self, symbol: str, order_id: str = '') -> Dict[str, Any]:
-        """Fetch order details by order ID."""
+        """Fetch order details by order ID (from the user-data stream when available)."""
+        if order_id and self._stream_is_healthy():
+            cached = self._user_data_stream.get_order(order_id=order_id)  # type: ignore[union-attr]
+            if cached:
+                self.logger.debug(message=f"Order status: {cached.get('status', 'UNKNOWN')} (stream)")
+                return cached
+
         params = {
             'symbol': symbol,
-            'orderId': order_id,
-            'timestamp': self._get_timestamp()
+            'orderId': order_id
         }
         result = self._make_request('GET', GET_ORDER, params, "fetch order")
         if result:
@@ -359,13 +634,36 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
         """Cancel an existing order."""
         params = {
             'symbol': symbol,
+            'orderId': order_id
+        }
+        result = self._make_request('DELETE', GET_ORDER, params, "cancel order")
+        self._account_snapshot.invalidate()
+        self._open_orders.note_closed(order_id=order_id)
+        return result
+
+    def modify_order(self, symbol: str, order_id: str, order_side: str, quantity: float, price: float) -> Dict[str, Any]:
+        """
+        Amend a resting LIMIT order with PUT /fapi/v1/order.
+
+        The order keeps its ID, time in force and fills so far; `quantity` is
+        the total order quantity. Binance rejects amends of orders that are no
+        longer open and of unchanged price/quantity.
+        """
+        params = {
+            'symbol': symbol.upper(),
             'orderId': order_id,
-            'timestamp': self._get_timestamp()
+            'side': order_side.upper(),
+            'quantity': quantity,
+            'price': price
         }
-        return self._make_request('DELETE', GET_ORDER, params, "cancel order")
+        result = self._make_request('PUT', SET_ORDER_URL, params, "modify order")
+        if result:
+            self.logger.debug(message=f"Order amended: ID={result.get('orderId')}, Price={result.get('price')}, Status={result.get('status')}")
+        return result
 
     def place_order(self, symbol: str, order_side: str, order_type: str, quantity: float,
-                    price: float = 0, reduce_only: bool = False, time_in_force: str = "GTC", close_position: bool = False, stop_price: float = -1) -> dict:
+                    price: float = 0, reduce_only: bool = False, time_in_force: str = "GTC", close_position: bool = False, stop_price: float = -1,
+                    client_order_id: str = '') -> dict:
         """
         Place a futures order on Binance USDT-Margined Futures.
 
@@ -377,6 +675,8 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
             price (float, optional): Required for LIMIT orders.
             reduce_only (bool): True will ensures your order will only reduce, close, or flatten an existing position.
             time_in_force (str, optional): Default is 'GTC' (Good Till Cancelled).
+            client_order_id (str, optional): newClientOrderId; makes retries of an
+                unknown outcome safe (see `_submit_order`).
 
         Returns:
             dict or None: Response from Binance API.
@@ -384,14 +684,42 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
 
         self.logger.debug(message=f"Placing order: {order_type} {order_side} {quantity} {symbol} (reduce_only={reduce_only})")
 
-        # Base parameters
+        params = self._order_params(
+            symbol=symbol,
+            order_side=order_side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            reduce_only=reduce_only,
+            time_in_force=time_in_force,
+            client_order_id=client_order_id
+        )
+
+        if client_order_id:
+            order_result = self._submit_order(
+                SET_ORDER_URL, params, "place order",
+                client_order_id=client_order_id,
+                lookup=lambda: self.fetch_order_by_client_id(symbol=symbol, client_order_id=client_order_id)
+            )
+        else:
+            order_result = self._make_request('POST', SET_ORDER_URL, params, "place order")
+        self._account_snapshot.invalidate()
+        if not order_result:
+            return False
+        self._open_orders.note_placed(order_id=order_result.get('orderId'))
+        self.logger.debug(message=f"Order placed: ID={order_result.get('orderId')}, Status={order_result.get('status')}")
+        return order_result
+
+    def _order_params(self, symbol: str, order_side: str, order_type: str, quantity: float,
+                      price: float = 0, reduce_only: bool = False, time_in_force: str = "GTC",
+                      client_order_id: str = '') -> Dict[str, Any]:
+        """Build POST /fapi/v1/order parameters (shared by single and batch placement)."""
         params = {
             'symbol': symbol.upper(),
             'side': order_side.upper(),
             'type': order_type.upper(),
             'reduceOnly': reduce_only,
-            'quantity': quantity,
-            'timestamp': int(time.time() * 1000)
+            'quantity': quantity
         }
 
         if order_type == OrderType.LIMIT.value:
@@ -401,60 +729,141 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
                 'price': price,
                 'timeInForce': time_in_force
             })
+        if client_order_id:
+            params['newClientOrderId'] = client_order_id
+        return params
 
-        headers, signed_params = binance_auth.sign_request(params=params, binance_credential=self.__creds)
-        try:
-            response = self.session.post(url=SET_ORDER_URL, headers=headers, params=signed_params)
-            response.raise_for_status()
-            order_result = response.json()
-            self.logger.debug(message=f"Order placed: ID={order_result.get('orderId')}, Status={order_result.get('status')}")
-            return order_result
-        except requests.exceptions.HTTPError as e:
-            self.logger.error_e(message=f"Error placing order", e=e)
-            self.logger.error(message=f"Response: {response.text}") # type: ignore
-            return False
-        except requests.exceptions.RequestException as e:
-            self.logger.error_e(message=f"Network error placing order", e=e)
-            return False
+    def _place_order_batch(self, symbol: str, legs: List[OrderLeg]) -> None:
+        """
+        Place regular-order legs with POST /fapi/v1/batchOrders.
+
+        Binance answers per order, in request order, with either the order or
+        a {code, msg} rejection. A single leg goes through POST /fapi/v1/order.
+        If the batch outcome is unknown, legs with a client order id are looked
+        up and only the missing ones are resubmitted, one by one.
+        """
+        if len(legs) == 1:
+            self._place_leg(symbol=symbol, leg=legs[0])
+            return
+
+        for start in range(0, len(legs), BATCH_ORDERS_MAX):
+            chunk = legs[start:start + BATCH_ORDERS_MAX]
+            try:
+                orders = []
+                for leg in chunk:
+                    params = self._order_params(
+                        symbol=symbol,
+                        order_side=leg.order_side,
+                        order_type=leg.order_type,
+                        quantity=leg.quantity,
+                        price=leg.price,
+                        reduce_only=leg.reduce_only,
+                        time_in_force=leg.time_in_force,
+                        client_order_id=leg.client_order_id
+                    )
+                    # Batch entries are JSON objects of string values
+                    orders.append({
+                        key: ('true' if value else 'false') if isinstance(value, bool) else str(value)
+                        for key, value in params.items()
+                    })
+            except ValueError as e:
+                for leg in chunk:
+                    leg.error = str(e)
+                continue
+
+            self.logger.debug(message=f"Placing batch of {len(chunk)} orders for {symbol}: {[leg.name for leg in chunk]}")
+            started = time.perf_counter()
+            results = self._make_request(
+                'POST', SET_BATCH_ORDERS_URL,
+                {'batchOrders': json.dumps(orders, separators=(',', ':'))},
+                "place batch orders"
+            )
+            for leg in chunk:
+                leg.elapsed = time.perf_counter() - started
+            outcome_unknown = not isinstance(results, list) and self._request_builder.outcome_unknown
+            if not isinstance(results, list):
+                results = []
+            for index, leg in enumerate(chunk):
+                result = results[index] if index < len(results) else {}
+                if outcome_unknown and leg.client_order_id:
+                    result = self.fetch_order_by_client_id(symbol=symbol, client_order_id=leg.client_order_id)
+                    if not result:
+                        self._place_leg(symbol=symbol, leg=leg)
+                        continue
+                elif result.get('code') == DUPLICATE_CLIENT_ORDER_ID_ERROR_CODE and leg.client_order_id:
+                    result = self.fetch_order_by_client_id(symbol=symbol, client_order_id=leg.client_order_id) or result
+                if result.get('orderId'):
+                    leg.result = result
+                    self._open_orders.note_placed(order_id=result['orderId'])
+                else:
+                    leg.error = result.get('msg', 'no response')
+
+    def place_batch_orders(self, symbol: str, legs: List[OrderLeg]) -> List[OrderLeg]:
+        """
+        Place several orders as one all-or-nothing unit.
+
+        Regular orders go out together in one batchOrders request while each
+        algo order (not accepted by batchOrders) is sent concurrently through
+        the shared I/O executor, so the whole set takes about one round trip.
+        If any leg fails or is not answered within ORDER_BATCH_DEADLINE_SECONDS,
+        the placed legs are cancelled and RuntimeError is raised.
+        """
+        regular_legs = [leg for leg in legs if not leg.is_algo]
+        units = [(lambda leg=leg: self._place_leg(symbol=symbol, leg=leg), [leg]) for leg in legs if leg.is_algo]
+        if regular_legs:
+            units.append((lambda: self._place_order_batch(symbol=symbol, legs=regular_legs), regular_legs))
+        self._place_legs_concurrently(symbol=symbol, units=units)
+
+        self._account_snapshot.invalidate()
+        self._raise_if_batch_failed(symbol=symbol, legs=legs)
+        self.logger.debug(message=f"Batch placed: {', '.join(f'{leg.name}={leg.order_id}' for leg in legs)}")
+        return legs
 
     def fetch_algorithmic_order(self, order_id: str) -> dict:
-        # Base parameters
-        params = {
-            'algoId': order_id,
-            'timestamp': int(time.time() * 1000)
-        }
+        if order_id and self._stream_is_healthy():
+            cached = self._user_data_stream.get_algo_order(algo_id=order_id)  # type: ignore[union-attr]
+            if cached:
+                self.logger.debug(message=f"Algo order ID={order_id}, Status={cached.get('algoStatus')} (stream)")
+                return cached
 
-        headers, signed_params = binance_auth.sign_request(params=params, binance_credential=self.__creds)
-        try:
-            response = self.session.get(url=SET_ALGO_ORDER_URL, headers=headers, params=signed_params)
-            response.raise_for_status()
-            algo_result = response.json()
-            self.logger.debug(message=f"Algo order ID={order_id}, Status={algo_result.get('algoStatus')}")
-            return algo_result
-        except requests.exceptions.HTTPError as e:
-            self.logger.error_e(message=f"Error getting algo order", e=e)
-            self.logger.error(message=f"Response: {response.text}") # type: ignore
-            return False
-        except requests.exceptions.RequestException as e:
-            self.logger.error_e(message=f"Network error getting algo order", e=e)
+        algo_result = self._make_request('GET', SET_ALGO_ORDER_URL, {'algoId': order_id}, "fetch algo order")
+        if not algo_result:
             return False
+        self.logger.debug(message=f"Algo order ID={order_id}, Status={algo_result.get('algoStatus')}")
+        return algo_result
+
+    def is_order_open(self, order_id: str, algo: bool = False) -> Optional[bool]:
+        """
+        Check whether an order still rests on the book without a per-order request.
+        
+        Uses the order's last status pushed over the user-data stream if known,
+        else the process-wide open orders snapshot (one openOrders and one
+        openAlgoOrders download per TTL for every bot).
+        """
+        if order_id and self._stream_is_healthy():
+            if algo:
+                cached = self._user_data_stream.get_algo_order(algo_id=order_id)  # type: ignore[union-attr]
+            else:
+                cached = self._user_data_stream.get_order(order_id=order_id)  # type: ignore[union-attr]
+            if cached:
+                return cached.get('algoStatus' if algo else 'status') in OPEN_ORDER_STATUSES
+
+        return self._open_orders.is_open(
+            order_id=order_id,
+            algo=algo,
+            fetch_orders=lambda: self._make_request('GET', GET_OPEN_ORDERS_URL, {}, "fetch open orders"),
+            fetch_algo_orders=lambda: self._make_request('GET', GET_OPEN_ALGO_ORDERS_URL, {}, "fetch open algo orders")
+        )
 
     def cancel_algorithmic_order(self, order_id: str):
-        params = {
-            'algoId': order_id,
-            'timestamp': int(time.time() * 1000)
-        }
-        headers, signed_params = binance_auth.sign_request(params=params, binance_credential=self.__creds)
-        try:
-            response = self.session.delete(url=SET_ALGO_ORDER_URL, headers= headers, params=signed_params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            self.logger.error_e(message=f"error canceling algo order", e=e)
-            return {}
+        result = self._make_request('DELETE', SET_ALGO_ORDER_URL, {'algoId': order_id}, "cancel algo order")
+        self._account_snapshot.invalidate()
+        self._open_orders.note_closed(order_id=order_id, algo=True)
+        return result
 
     def place_algorithmic_order(self, symbol: str, order_side: str, order_type: str,
-                                quantity: float, trigger_price: float, close_position: bool = False) -> Dict[str, Any]:
+                                quantity: float, trigger_price: float, close_position: bool = False,
+                                client_order_id: str = '') -> Dict[str, Any]:
         """
         Place an algorithmic order (conditional order) on Binance Futures.
         Args:
@@ -464,13 +873,13 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
             quantity: Order quantity (ignored if close_position=True)
             trigger_price: Price at which order triggers
             close_position: If True, closes entire position; if False, uses quantity
+            client_order_id: clientAlgoId; makes retries of an unknown outcome safe
         """
         params = {
             'algoType': 'CONDITIONAL',
             'symbol': symbol.upper(),
             'side': order_side.upper(),
             'type': order_type.upper(),
-            'timestamp': self._get_timestamp(),
             'triggerPrice': trigger_price
         }
 
@@ -485,14 +894,24 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
             params['reduceOnly'] = 'true'
             # IMPORTANT: Don't include closePosition when using quantity
 
-        result = self._make_request('POST', SET_ALGO_ORDER_URL, params, "place algo order")
+        if client_order_id:
+            params['clientAlgoId'] = client_order_id
+            result = self._submit_order(
+                SET_ALGO_ORDER_URL, params, "place algo order",
+                client_order_id=client_order_id,
+                lookup=lambda: self.fetch_order_by_client_id(symbol=symbol, client_order_id=client_order_id, algo=True)
+            )
+        else:
+            result = self._make_request('POST', SET_ALGO_ORDER_URL, params, "place algo order")
+        self._account_snapshot.invalidate()
         if result:
+            self._open_orders.note_placed(order_id=result.get('algoId'), algo=True)
             self.logger.debug(message=f"Algo order placed: {result}")
         return result
 
     def fetch_trades(self, symbol: str = '', order_id: str = '') -> Dict[str, Any]:
         """Fetch trade history for a symbol or specific order."""
-        params = {'timestamp': self._get_timestamp()}
+        params = {}
 
         if symbol:
             params['symbol'] = symbol
@@ -541,10 +960,25 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
             "side": trades[0]["side"]
         }
 
+    def _fetch_raw_order_book(self, symbol: str, limit: int) -> Dict[str, Any]:
+        """
+        Fetch raw depth snapshot from REST.
+        
+        Returns:
+            Raw response with 'lastUpdateId', 'bids' and 'asks', or empty dict on error
+        """
+        params = {
+            'symbol': symbol.upper(),
+            'limit': limit
+        }
+        return self._make_request('GET', GET_ORDER_BOOK_URL, params, f"fetch order book for {symbol}", signed=False)
+
     def fetch_order_book(self, symbol: str, limit: int = 5) -> Dict[str, Any]:
         """
         Fetch order book depth for a symbol.
         
+        Served from the local order book when ORDER_BOOK_STREAM_ENABLED=true.
+        
         Args:
             symbol: Trading pair symbol
             limit: Number of price levels to fetch (default: 5, max: 1000)
@@ -553,28 +987,40 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
             Dictionary with 'bids' and 'asks' arrays
             Example: {'bids': [[price, qty], ...], 'asks': [[price, qty], ...]}
         """
-        params = {
-            'symbol': symbol.upper(),
-            'limit': limit
+        if self._order_book_stream is not None:
+            book = self._order_book_stream.get_order_book(
+                symbol=symbol,
+                limit=limit,
+                snapshot_function=self._fetch_raw_order_book
+            )
+            if book:
+                return book
+            self.logger.warning(message=f"Local order book unavailable for {symbol}, falling back to REST")
+        
+        data = self._fetch_raw_order_book(symbol=symbol, limit=limit)
+        
+        # Convert string prices to floats for easier manipulation
+        bids = [[float(price), float(qty)] for price, qty in data.get('bids', [])]
+        asks = [[float(price), float(qty)] for price, qty in data.get('asks', [])]
+        
+        return {
+            'bids': bids,  # Sorted descending (highest bid first)
+            'asks': asks   # Sorted ascending (lowest ask first)
         }
+
+    def has_live_order_book(self, symbol: str) -> bool:
+        """Check whether the local order book for `symbol` is synced and streaming."""
+        return self._order_book_stream is not None and self._order_book_stream.is_live(symbol=symbol)
+
+    def wait_for_book_change(self, symbol: str, timeout: float) -> bool:
+        """
+        Wait for the best bid or ask of the local order book to change.
         
-        headers, signed_params = binance_auth.sign_request(params=params, binance_credential=self.__creds)
-        try:
-            response = self.session.get(url=GET_ORDER_BOOK_URL, headers=headers, params=signed_params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Convert string prices to floats for easier manipulation
-            bids = [[float(price), float(qty)] for price, qty in data.get('bids', [])]
-            asks = [[float(price), float(qty)] for price, qty in data.get('asks', [])]
-            
-            return {
-                'bids': bids,  # Sorted descending (highest bid first)
-                'asks': asks   # Sorted ascending (lowest ask first)
-            }
-        except Exception as e:
-            self.logger.error_e(message=f"Error fetching order book for {symbol}", e=e)
-            return {'bids': [], 'asks': []}
+        Falls back to sleeping the full timeout when the book is not live.
+        """
+        if not self.has_live_order_book(symbol=symbol):
+            return super().wait_for_book_change(symbol=symbol, timeout=timeout)
+        return self._order_book_stream.wait_for_change(symbol=symbol, timeout=timeout)  # type: ignore[union-attr]
 
     def has_exchange_info_cached(self, symbol: str) -> bool:
         """
@@ -600,57 +1046,52 @@ class BinanceLiveTradeClient(BaseLiveTradeClient):
         """
         return self._exchange_info_cache.get(symbol)
 
+    def get_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        """
+        Get the integer-scaled filters of a cached symbol.
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Cached SymbolFilters or None if exchange info is not cached
+        """
+        return self._symbol_filters.get(symbol)
+
     def fetch_exchange_info(self, symbol: str) -> Dict[str, Any]:
         """
         Fetch exchange trading rules for a symbol (with caching).
         
+        Symbol rules come from the shared exchange info registry, so the full
+        exchangeInfo document is downloaded at most once per TTL per machine.
+        
         Args:
             symbol: Trading pair symbol
         
         Returns:
-            Dictionary with trading rules including tickSize, stepSize, minQty, etc.
+            Dictionary with trading rules (tickSize, stepSize, minQty, maxQty, minNotional)
         """
         # Check cache first
         if symbol in self._exchange_info_cache:
             return self._exchange_info_cache[symbol]
         
-        params = {'symbol': symbol.upper()}
-        headers, signed_params = binance_auth.sign_request(params=params, binance_credential=self.__creds)
-        
-        try:
-            response = self.session.get(url=GET_EXCHANGE_INFO_URL, headers=headers, params=signed_params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Find the symbol in the response
-            for symbol_info in data.get('symbols', []):
-                if symbol_info['symbol'] == symbol.upper():
-                    # Extract relevant filters
-                    # Store tickSize and stepSize as strings to preserve precision
-                    # (avoid float scientific notation like 1e-05)
-                    filters = {}
-                    for filter_item in symbol_info.get('filters', []):
-                        filter_type = filter_item.get('filterType')
-                        if filter_type == 'PRICE_FILTER':
-                            filters['tickSize'] = filter_item.get('tickSize', '0.01')
-                            filters['minPrice'] = filter_item.get('minPrice', 0)
-                            filters['maxPrice'] = filter_item.get('maxPrice', 0)
-                        elif filter_type == 'LOT_SIZE':
-                            filters['stepSize'] = filter_item.get('stepSize', '0.001')
-                            filters['minQty'] = filter_item.get('minQty', 0)
-                            filters['maxQty'] = filter_item.get('maxQty', 0)
-                    
-                    # Cache the result
-                    self._exchange_info_cache[symbol] = filters
-                    self.logger.debug(message=f"Cached exchange info for {symbol}: {filters}")
-                    return filters
-            
+        symbol_info = self._exchange_info_registry.get_symbol_info(
+            symbol=symbol,
+            fetch_function=lambda: self._make_request('GET', GET_EXCHANGE_INFO_URL, {}, "fetch exchange info", signed=False)
+        )
+        if not symbol_info:
             self.logger.warning(message=f"Symbol {symbol} not found in exchange info")
             return {}
-            
-        except Exception as e:
-            self.logger.error_e(message=f"Error fetching exchange info for {symbol}", e=e)
-            return {}
+        
+        # Filters are kept as integer scale factors; the dict view is derived from them
+        symbol_filters = SymbolFilters.from_symbol_info(symbol_info=symbol_info)
+        filters = symbol_filters.to_exchange_info()
+        
+        # Cache the result
+        self._symbol_filters[symbol] = symbol_filters
+        self._exchange_info_cache[symbol] = filters
+        self.logger.debug(message=f"Cached exchange info for {symbol}: {filters}")
+        return filters
 
 
 if __name__ == "__main__":
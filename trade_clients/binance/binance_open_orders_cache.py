@@ -0,0 +1,147 @@
+"""
+Binance Open Orders Cache
+Process-wide snapshot of the account's open orders and open algo orders.
+
+GET /fapi/v1/openOrders and GET /fapi/v1/openAlgoOrders without a symbol
+return every open order of the account, so one download of each per TTL
+answers "is this TP/SL order still resting?" for every bot in the process.
+Only orders that left the book need a per-order request to learn how they
+ended (filled, cancelled, expired).
+
+Orders placed or cancelled through a client while a download is in flight
+are merged into its result, so an older fetch never reports a fresh order
+gone or a cancelled one open. The download runs outside the state lock, so
+recording an order never waits for another bot's download.
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+from commons.constants import OPEN_ORDERS_SNAPSHOT_TTL_SECONDS
+from commons.custom_logger import CustomLogger
+
+# Statuses of an order still resting on the book (regular orders; algo orders rest as NEW)
+OPEN_ORDER_STATUSES = ('NEW', 'PARTIALLY_FILLED')
+
+# Fetch function: () -> raw open orders list (None on error)
+OpenOrdersFetchFunction = Callable[[], Any]
+
+
+class BinanceOpenOrdersCache:
+    """
+    Indexed open orders / open algo orders snapshot with TTL.
+
+    - Concurrent callers on a stale snapshot wait for one in-flight download
+    - `note_placed` / `note_closed` keep the snapshot current between downloads
+      (thread-safe; they only take the state lock, never the download lock)
+    """
+
+    _instance: Optional['BinanceOpenOrdersCache'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ttl: float = OPEN_ORDERS_SNAPSHOT_TTL_SECONDS, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Initialize open orders cache.
+
+        Args:
+            ttl: Seconds a snapshot is served before refetching
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.ttl = ttl
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._order_ids: Set[str] = set()
+        self._algo_ids: Set[str] = set()
+        self._fetched_at: float = 0.0
+        self._generation: int = 0
+        self._placed: Dict[str, int] = {}  # 'order:<id>' / 'algo:<id>' -> generation when placed
+        self._closed: Dict[str, int] = {}  # 'order:<id>' / 'algo:<id>' -> generation when cancelled
+        self._lock = threading.Lock()  # Guards the snapshot state
+        self._refresh_lock = threading.Lock()  # One download in flight
+
+    @classmethod
+    def get_instance(cls) -> 'BinanceOpenOrdersCache':
+        """Get the process-wide cache, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                ttl = float(os.getenv('OPEN_ORDERS_SNAPSHOT_TTL_SECONDS', OPEN_ORDERS_SNAPSHOT_TTL_SECONDS))
+                cls._instance = cls(ttl=ttl)
+            return cls._instance
+
+    def note_placed(self, order_id: Any, algo: bool = False) -> None:
+        """Record an order placed through a client as open."""
+        if not order_id:
+            return
+        order_id = str(order_id)
+        key = f"{'algo' if algo else 'order'}:{order_id}"
+        with self._lock:
+            self._generation += 1
+            self._placed[key] = self._generation
+            self._closed.pop(key, None)
+            (self._algo_ids if algo else self._order_ids).add(order_id)
+
+    def note_closed(self, order_id: Any, algo: bool = False) -> None:
+        """Record an order cancelled through a client as no longer open."""
+        order_id = str(order_id)
+        key = f"{'algo' if algo else 'order'}:{order_id}"
+        with self._lock:
+            self._generation += 1
+            self._placed.pop(key, None)
+            self._closed[key] = self._generation
+            (self._algo_ids if algo else self._order_ids).discard(order_id)
+
+    def _refresh(self, fetch_orders: OpenOrdersFetchFunction, fetch_algo_orders: OpenOrdersFetchFunction) -> bool:
+        with self._lock:
+            generation = self._generation
+        orders = fetch_orders()
+        algo_orders = fetch_algo_orders()
+        if not isinstance(orders, list) or not isinstance(algo_orders, list):
+            return False
+
+        order_ids = {str(order['orderId']) for order in orders}
+        algo_ids = {str(order['algoId']) for order in algo_orders}
+
+        with self._lock:
+            # Orders placed or cancelled while downloading may be missing from / still in the response
+            self._placed = {key: noted_at for key, noted_at in self._placed.items() if noted_at > generation}
+            self._closed = {key: noted_at for key, noted_at in self._closed.items() if noted_at > generation}
+            for key in self._placed:
+                kind, order_id = key.split(':', 1)
+                (algo_ids if kind == 'algo' else order_ids).add(order_id)
+            for key in self._closed:
+                kind, order_id = key.split(':', 1)
+                (algo_ids if kind == 'algo' else order_ids).discard(order_id)
+
+            self._order_ids = order_ids
+            self._algo_ids = algo_ids
+            self._fetched_at = time.time()
+        self.logger.debug(message=f"Open orders snapshot refreshed ({len(order_ids)} orders, {len(algo_ids)} algo orders)")
+        return True
+
+    def is_open(
+        self,
+        order_id: Any,
+        algo: bool,
+        fetch_orders: OpenOrdersFetchFunction,
+        fetch_algo_orders: OpenOrdersFetchFunction
+    ) -> Optional[bool]:
+        """
+        Check whether an order is still open.
+
+        Args:
+            order_id: orderId, or algoId if `algo`
+            algo: Whether the order is an algo (conditional) order
+            fetch_orders: Callable that downloads open orders for all symbols
+            fetch_algo_orders: Callable that downloads open algo orders for all symbols
+
+        Returns:
+            True if open, False if it left the book, None if the snapshot is unavailable
+        """
+        with self._refresh_lock:
+            if time.time() - self._fetched_at >= self.ttl:
+                if not self._refresh(fetch_orders=fetch_orders, fetch_algo_orders=fetch_algo_orders):
+                    return None
+        with self._lock:
+            return str(order_id) in (self._algo_ids if algo else self._order_ids)
+
+# EOF
@@ -0,0 +1,302 @@
+"""
+Binance Order Book
+Process-wide local L2 order books kept current from the diff-depth stream.
+
+Each symbol's book is seeded from a REST depth snapshot and then updated from
+`<symbol>@depth@100ms` events following Binance's sync rules:
+- events older than the snapshot (u < lastUpdateId) are dropped
+- the first applied event must straddle the snapshot (U <= lastUpdateId <= u)
+- every later event's `pu` must equal the previous event's `u`
+A sequence gap, reconnect or silent stream marks the book for resync, and the
+next read reseeds it from REST. Reads of the top levels never touch the network.
+"""
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from commons.custom_logger import CustomLogger
+from trade_clients.binance.binance_websocket import (
+    BinanceWebSocketConnection,
+    FUTURES_STREAM_BASE_URL
+)
+
+# Depth of the REST snapshot used to seed a book
+ORDER_BOOK_SNAPSHOT_LIMIT = 1000
+
+# Book is considered stale if no stream message arrived for this long (seconds)
+ORDER_BOOK_STALE_SECONDS = 30
+
+# Max seconds a caller waits for the first connection before falling back to REST
+ORDER_BOOK_READY_TIMEOUT = 5
+
+# Events kept while waiting for a snapshot (about 100s of 100ms updates)
+ORDER_BOOK_MAX_PENDING_EVENTS = 1000
+
+# Snapshot function: (symbol, limit) -> raw GET /fapi/v1/depth response
+SnapshotFunction = Callable[[str, int], Optional[Dict[str, Any]]]
+
+
+class LocalOrderBook:
+    """L2 book for one symbol: price -> quantity per side plus sorted price lists."""
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self.bid_prices: List[float] = []  # ascending; best bid is last
+        self.ask_prices: List[float] = []  # ascending; best ask is first
+        self.last_update_id = 0
+        self.synced = False
+        self.needs_resync = False
+        self.awaiting_first_event = False
+        self.pending_events: List[Dict[str, Any]] = []  # events received before seed completed
+        self.version = 0  # bumped whenever the best bid or ask changes
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+
+    @staticmethod
+    def _apply_levels(levels: Dict[float, float], prices: List[float], updates: List[List[str]]) -> None:
+        for price_str, qty_str in updates:
+            price = float(price_str)
+            qty = float(qty_str)
+            if qty == 0:
+                if levels.pop(price, None) is not None:
+                    del prices[bisect.bisect_left(prices, price)]
+            else:
+                if price not in levels:
+                    bisect.insort(prices, price)
+                levels[price] = qty
+
+    def best(self) -> Tuple[Optional[float], Optional[float]]:
+        """Get (best bid, best ask)."""
+        return (
+            self.bid_prices[-1] if self.bid_prices else None,
+            self.ask_prices[0] if self.ask_prices else None
+        )
+
+    def seed(self, snapshot: Dict[str, Any]) -> None:
+        """Replace book content with a REST snapshot and replay queued events."""
+        self.bids, self.asks = {}, {}
+        self.bid_prices, self.ask_prices = [], []
+        self._apply_levels(self.bids, self.bid_prices, snapshot.get('bids', []))
+        self._apply_levels(self.asks, self.ask_prices, snapshot.get('asks', []))
+        self.last_update_id = int(snapshot['lastUpdateId'])
+        self.synced = True
+        self.needs_resync = False
+        self.awaiting_first_event = True
+        self.version += 1
+        self.changed.notify_all()
+
+        pending, self.pending_events = self.pending_events, []
+        for event in pending:
+            self.apply(event)
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """
+        Apply a depthUpdate event.
+
+        Marks the book for resync when the update sequence has a gap.
+        """
+        if not self.synced:
+            self.pending_events.append(event)
+            if len(self.pending_events) > ORDER_BOOK_MAX_PENDING_EVENTS:
+                del self.pending_events[0]
+            return
+        if self.needs_resync:
+            return
+
+        first_id, last_id = event['U'], event['u']
+        if last_id < self.last_update_id:
+            return
+        if self.awaiting_first_event:
+            if first_id > self.last_update_id:
+                self.needs_resync = True
+                return
+            self.awaiting_first_event = False
+        elif event.get('pu') != self.last_update_id:
+            self.needs_resync = True
+            return
+
+        before = self.best()
+        self._apply_levels(self.bids, self.bid_prices, event.get('b', []))
+        self._apply_levels(self.asks, self.ask_prices, event.get('a', []))
+        self.last_update_id = last_id
+        if self.best() != before:
+            self.version += 1
+            self.changed.notify_all()
+
+    def top(self, limit: int) -> Dict[str, List[List[float]]]:
+        """
+        Get the best `limit` levels per side.
+
+        Returns:
+            {'bids': [[price, qty], ...] descending, 'asks': [[price, qty], ...] ascending}
+        """
+        bid_prices = self.bid_prices[-limit:][::-1]
+        ask_prices = self.ask_prices[:limit]
+        return {
+            'bids': [[price, self.bids[price]] for price in bid_prices],
+            'asks': [[price, self.asks[price]] for price in ask_prices]
+        }
+
+
+class BinanceOrderBookManager:
+    """
+    Process-wide manager of local order books.
+
+    Shared by every BinanceLiveTradeClient instance so bots trading the same
+    symbol read the same book over a single connection.
+    """
+
+    _instance: Optional['BinanceOrderBookManager'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, base_url: str = FUTURES_STREAM_BASE_URL, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Initialize order book manager.
+
+        Args:
+            base_url: Websocket base URL (override to point at a local stand-in server)
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.base_url = base_url.rstrip('/')
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._books: Dict[str, LocalOrderBook] = {}
+        self._connections: Dict[str, BinanceWebSocketConnection] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'BinanceOrderBookManager':
+        """Get the process-wide manager, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _is_live(self, book: LocalOrderBook, connection: BinanceWebSocketConnection) -> bool:
+        return (
+            book.synced
+            and not book.needs_resync
+            and connection.is_connected
+            and time.time() - connection.last_message_time <= ORDER_BOOK_STALE_SECONDS
+        )
+
+    def get_order_book(
+        self,
+        symbol: str,
+        limit: int,
+        snapshot_function: SnapshotFunction
+    ) -> Optional[Dict[str, List[List[float]]]]:
+        """
+        Get the best `limit` levels per side from memory.
+
+        Subscribes and seeds on first use, and reseeds after a sequence gap,
+        reconnect or silent stream.
+
+        Args:
+            symbol: Trading pair symbol
+            limit: Number of levels per side
+            snapshot_function: Callable that fetches a REST depth snapshot
+
+        Returns:
+            {'bids': [[price, qty], ...], 'asks': [[price, qty], ...]}, or None
+            if the stream is not usable
+        """
+        symbol = symbol.upper()
+        book, connection = self._subscribe(symbol=symbol)
+
+        if not connection.wait_connected(timeout=ORDER_BOOK_READY_TIMEOUT):
+            self.logger.warning(message=f"Order book stream {symbol} not connected")
+            return None
+
+        with book.lock:
+            if not self._is_live(book, connection):
+                snapshot = snapshot_function(symbol, ORDER_BOOK_SNAPSHOT_LIMIT)
+                if not snapshot or 'lastUpdateId' not in snapshot:
+                    return None
+                book.seed(snapshot)
+                self.logger.debug(message=f"Seeded order book {symbol} at update {book.last_update_id}")
+            return book.top(limit)
+
+    def is_live(self, symbol: str) -> bool:
+        """Check whether a symbol's book is synced and its stream is flowing."""
+        symbol = symbol.upper()
+        book = self._books.get(symbol)
+        connection = self._connections.get(symbol)
+        if book is None or connection is None:
+            return False
+        with book.lock:
+            return self._is_live(book, connection)
+
+    def wait_for_change(self, symbol: str, timeout: float) -> bool:
+        """
+        Block until the best bid or ask changes.
+
+        Args:
+            symbol: Trading pair symbol
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the top of book changed (or the book needs a resync), False on timeout
+        """
+        book = self._books.get(symbol.upper())
+        if book is None:
+            return False
+        with book.changed:
+            version = book.version
+            book.changed.wait_for(lambda: book.version != version or book.needs_resync, timeout=timeout)
+            return book.version != version or book.needs_resync
+
+    def _subscribe(self, symbol: str) -> Tuple[LocalOrderBook, BinanceWebSocketConnection]:
+        """Create book and connection for a symbol on first use."""
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is None:
+                book = LocalOrderBook(symbol=symbol)
+                self._books[symbol] = book
+
+            connection = self._connections.get(symbol)
+            if connection is None:
+                stream_name = f"{symbol.lower()}@depth@100ms"
+                connection = BinanceWebSocketConnection(
+                    url=f"{self.base_url}/{stream_name}",
+                    on_message=lambda data, s=symbol: self._handle_message(s, data),
+                    on_open=lambda s=symbol: self._handle_open(s),
+                    name=stream_name,
+                    logger=self.logger
+                )
+                self._connections[symbol] = connection
+                connection.start()
+                self.logger.info(message=f"Subscribed order book stream {stream_name}")
+            return book, connection
+
+    def _handle_open(self, symbol: str) -> None:
+        """Events may have been missed while disconnected; force a resync."""
+        book = self._books.get(symbol)
+        if book:
+            with book.lock:
+                book.needs_resync = book.synced
+                book.changed.notify_all()
+
+    def _handle_message(self, symbol: str, data: Dict[str, Any]) -> None:
+        """Apply a depthUpdate event to its book."""
+        if data.get('e') != 'depthUpdate':
+            return
+        book = self._books.get(symbol)
+        if book is None:
+            return
+        with book.lock:
+            book.apply(data)
+            if book.needs_resync:
+                book.changed.notify_all()
+
+    def stop(self) -> None:
+        """Close all stream connections."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.stop()
+            self._connections.clear()
+            self._books.clear()
+
+# EOF
@@ -0,0 +1,213 @@
+"""
+Binance Price Cache
+Process-wide last-price cache per symbol shared by every live client.
+
+Prices fetched over REST are served for up to `max_age` seconds. With
+PRICE_STREAM_ENABLED=true each symbol is also subscribed to its
+`<symbol>@aggTrade` stream; every trade pushes its price, the same last
+trade price GET /fapi/v1/ticker/price returns (always on the tick grid),
+so a streamed price stays valid for as long as its connection is up.
+
+Listeners registered per symbol receive every stored price (streamed or
+REST), e.g. the price trigger engine firing client-side exits.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from commons.constants import PRICE_CACHE_MAX_AGE_SECONDS
+from commons.custom_logger import CustomLogger
+from trade_clients.binance.binance_websocket import (
+    BinanceWebSocketConnection,
+    FUTURES_STREAM_BASE_URL
+)
+
+# Listener: (symbol, price) -> None
+PriceListener = Callable[[str, float], None]
+
+
+@dataclass
+class _PriceEntry:
+    price: float
+    updated_at: float
+    from_stream: bool
+
+
+class BinancePriceCache:
+    """
+    Last trade price per symbol, fed by REST results and optionally by aggTrade.
+
+    - REST prices are fresh for `max_age` seconds
+    - Streamed prices (last aggregate trade) are fresh while the symbol's
+      stream is connected; after a disconnect they age out like REST prices
+    """
+
+    _instance: Optional['BinancePriceCache'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_age: float = PRICE_CACHE_MAX_AGE_SECONDS,
+        stream_enabled: bool = False,
+        base_url: str = FUTURES_STREAM_BASE_URL,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize price cache.
+
+        Args:
+            max_age: Seconds a REST price is served before refetching
+            stream_enabled: Subscribe each requested symbol to its aggTrade stream
+            base_url: Websocket base URL (override to point at a local stand-in server)
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.max_age = max_age
+        self.stream_enabled = stream_enabled
+        self.base_url = base_url.rstrip('/')
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._entries: Dict[str, _PriceEntry] = {}
+        self._connections: Dict[str, BinanceWebSocketConnection] = {}
+        self._listeners: Dict[str, List[PriceListener]] = {}
+        self._lock = threading.Lock()
+        self._listeners_lock = threading.Lock()
+
+        # Monitoring counters
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def get_instance(cls) -> 'BinancePriceCache':
+        """Get the process-wide cache, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    max_age=float(os.getenv('PRICE_CACHE_MAX_AGE_SECONDS', PRICE_CACHE_MAX_AGE_SECONDS)),
+                    stream_enabled=os.getenv('PRICE_STREAM_ENABLED', 'false').lower() == 'true'
+                )
+            return cls._instance
+
+    def _is_fresh(self, symbol: str, entry: _PriceEntry) -> bool:
+        if entry.from_stream:
+            connection = self._connections.get(symbol)
+            if connection is not None and connection.is_connected:
+                return True
+        return time.time() - entry.updated_at <= self.max_age
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """
+        Get a fresh cached price.
+
+        Subscribes the symbol's aggTrade stream on first use when streaming is
+        enabled; the first call still returns None so the caller fetches over REST.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Cached price, or None if missing or stale
+        """
+        symbol = symbol.upper()
+        if self.stream_enabled:
+            self._subscribe(symbol=symbol)
+
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and self._is_fresh(symbol, entry):
+                self._hits += 1
+                return entry.price
+            self._misses += 1
+            return None
+
+    def update(self, symbol: str, price: float) -> None:
+        """
+        Store a price fetched over REST.
+
+        A fresh streamed price is never overwritten by a REST result.
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and self._is_fresh(symbol, entry) and entry.from_stream:
+                return
+            self._entries[symbol] = _PriceEntry(price=price, updated_at=time.time(), from_stream=False)
+        self._notify(symbol=symbol, price=price)
+
+    def add_listener(self, symbol: str, listener: PriceListener) -> None:
+        """
+        Register a callback for price updates of a symbol.
+
+        Subscribes the symbol's aggTrade stream when streaming is enabled.
+        Registering the same listener twice has no effect.
+
+        Args:
+            symbol: Trading pair symbol
+            listener: Callable receiving (symbol, price)
+        """
+        symbol = symbol.upper()
+        with self._listeners_lock:
+            listeners = self._listeners.setdefault(symbol, [])
+            if listener in listeners:
+                return
+            listeners.append(listener)
+        if self.stream_enabled:
+            self._subscribe(symbol=symbol)
+
+    def _notify(self, symbol: str, price: float) -> None:
+        with self._listeners_lock:
+            listeners = list(self._listeners.get(symbol, []))
+        for listener in listeners:
+            try:
+                listener(symbol, price)
+            except Exception as e:
+                self.logger.error_e(message=f"Price listener failed for {symbol}", e=e)
+
+    def _subscribe(self, symbol: str) -> None:
+        """Open the aggTrade connection for a symbol on first use."""
+        with self._lock:
+            if symbol in self._connections:
+                return
+            stream_name = f"{symbol.lower()}@aggTrade"
+            connection = BinanceWebSocketConnection(
+                url=f"{self.base_url}/{stream_name}",
+                on_message=lambda data, s=symbol: self._handle_message(s, data),
+                name=stream_name,
+                logger=self.logger
+            )
+            self._connections[symbol] = connection
+        connection.start()
+        self.logger.info(message=f"Subscribed price stream {stream_name}")
+
+    def _handle_message(self, symbol: str, data: Dict[str, Any]) -> None:
+        """Store the trade price of an aggTrade event."""
+        if data.get('e') != 'aggTrade':
+            return
+        price = float(data['p'])
+        with self._lock:
+            self._entries[symbol] = _PriceEntry(price=price, updated_at=time.time(), from_stream=True)
+        self._notify(symbol=symbol, price=price)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage counters.
+
+        Returns:
+            Dictionary with symbol, stream, hit and miss counts
+        """
+        with self._lock:
+            return {
+                'symbols': len(self._entries),
+                'streams': len(self._connections),
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+    def stop(self) -> None:
+        """Close all stream connections."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.stop()
+            self._connections.clear()
+
+# EOF
@@ -0,0 +1,318 @@
+"""
+Binance Rate Limiter
+Process-wide request weight limiter for Binance Futures REST calls.
+
+A token bucket sized to the 1-minute IP weight limit is charged with each
+endpoint's weight before the request is sent and re-synced from the
+X-MBX-USED-WEIGHT-1M header after every response. Low-priority market data
+calls (klines, depth, price, exchange info) may not dip into the reserve kept
+for order-critical calls, so they are delayed first as the limit approaches.
+"""
+import asyncio
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from commons.custom_logger import CustomLogger
+
+# Binance Futures IP weight limit per minute (kept below the exchange's 2400)
+API_WEIGHT_LIMIT = 2000
+
+# Share of the bucket only order-critical calls may use
+LOW_PRIORITY_RESERVE_RATIO = 0.20
+
+# Requests delayed longer than this are logged as warnings (seconds)
+RATE_LIMIT_WAIT_WARNING_SECONDS = 1.0
+
+# Fallback pause after 429/418 without a Retry-After header (seconds)
+RATE_LIMIT_DEFAULT_BACKOFF_SECONDS = 60
+
+PRIORITY_HIGH = 'HIGH'
+PRIORITY_LOW = 'LOW'
+
+
+def _klines_weight(params: Dict[str, str]) -> int:
+    limit = int(params.get('limit', 500))
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def _depth_weight(params: Dict[str, str]) -> int:
+    limit = int(params.get('limit', 500))
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+def _open_orders_weight(params: Dict[str, str]) -> int:
+    # All symbols at once is 40, a single symbol 1
+    return 1 if params.get('symbol') else 40
+
+
+# (method, path) -> (weight or weight function of query params, priority)
+# Order placement has 0 IP weight (it counts against the order-count limits instead)
+ENDPOINT_WEIGHTS: Dict[Tuple[str, str], Tuple[Any, str]] = {
+    ('GET', '/fapi/v1/klines'): (_klines_weight, PRIORITY_LOW),
+    ('GET', '/fapi/v1/depth'): (_depth_weight, PRIORITY_LOW),
+    ('GET', '/fapi/v1/ticker/price'): (1, PRIORITY_LOW),
+    ('GET', '/fapi/v1/exchangeInfo'): (1, PRIORITY_LOW),
+    ('GET', '/fapi/v1/time'): (1, PRIORITY_HIGH),
+    ('GET', '/fapi/v1/ping'): (1, PRIORITY_LOW),
+    ('GET', '/fapi/v2/positionRisk'): (5, PRIORITY_HIGH),
+    ('GET', '/fapi/v1/userTrades'): (5, PRIORITY_HIGH),
+    ('GET', '/fapi/v1/order'): (1, PRIORITY_HIGH),
+    ('POST', '/fapi/v1/order'): (0, PRIORITY_HIGH),
+    ('PUT', '/fapi/v1/order'): (1, PRIORITY_HIGH),
+    ('DELETE', '/fapi/v1/order'): (1, PRIORITY_HIGH),
+    ('POST', '/fapi/v1/batchOrders'): (5, PRIORITY_HIGH),
+    ('GET', '/fapi/v1/openOrders'): (_open_orders_weight, PRIORITY_HIGH),
+    ('GET', '/fapi/v1/algoOrder'): (1, PRIORITY_HIGH),
+    ('GET', '/fapi/v1/openAlgoOrders'): (_open_orders_weight, PRIORITY_HIGH),
+    ('POST', '/fapi/v1/algoOrder'): (0, PRIORITY_HIGH),
+    ('DELETE', '/fapi/v1/algoOrder'): (1, PRIORITY_HIGH),
+    ('POST', '/fapi/v1/leverage'): (1, PRIORITY_HIGH),
+}
+DEFAULT_ENDPOINT_WEIGHT = (1, PRIORITY_HIGH)
+
+
+def get_endpoint_weight(method: str, url: str) -> Tuple[int, str]:
+    """
+    Look up request weight and priority for a URL.
+
+    Args:
+        method: HTTP method
+        url: Full request URL including query string
+
+    Returns:
+        Tuple of (weight, priority)
+    """
+    parsed = urllib.parse.urlsplit(url)
+    weight, priority = ENDPOINT_WEIGHTS.get((method.upper(), parsed.path), DEFAULT_ENDPOINT_WEIGHT)
+    if callable(weight):
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+        weight = weight(params)
+    return weight, priority
+
+
+class BinanceRateLimiter:
+    """
+    Thread-safe token bucket shared by every Binance client in the process.
+
+    - Refills continuously at capacity/60 tokens per second
+    - Server-reported used weight overrides the local estimate
+    - A 429/418 response pauses all calls until Retry-After elapses
+    """
+
+    _instance: Optional['BinanceRateLimiter'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        capacity: int = API_WEIGHT_LIMIT,
+        low_priority_reserve_ratio: float = LOW_PRIORITY_RESERVE_RATIO,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            capacity: Weight allowed per minute
+            low_priority_reserve_ratio: Share of capacity low-priority calls may not use
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.capacity = capacity
+        self.refill_rate = capacity / 60.0
+        self.reserve = capacity * low_priority_reserve_ratio
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._used_weight_1m = 0
+        self._lock = threading.Lock()
+
+        # Monitoring counters
+        self._requests = 0
+        self._delayed_requests = 0
+        self._total_wait_seconds = 0.0
+        self._last_wait_seconds = 0.0
+
+    @classmethod
+    def get_instance(cls) -> 'BinanceRateLimiter':
+        """Get the process-wide limiter, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+        self._last_refill = now
+
+    def _try_take(self, weight: int, floor: float, waited: float) -> float:
+        """
+        Take `weight` tokens if allowed.
+
+        Returns:
+            0 when tokens were taken, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._blocked_until and self._tokens - weight >= floor:
+                self._tokens -= weight
+                self._requests += 1
+                if waited > 0:
+                    self._delayed_requests += 1
+                    self._total_wait_seconds += waited
+                self._last_wait_seconds = waited
+                return 0.0
+            if now < self._blocked_until:
+                delay = self._blocked_until - now
+            else:
+                delay = (weight + floor - self._tokens) / self.refill_rate
+        return max(delay, 0.05)
+
+    def _log_wait(self, waited: float, priority: str, operation: str) -> None:
+        if waited >= RATE_LIMIT_WAIT_WARNING_SECONDS:
+            self.logger.warning(
+                message=f"Rate limiter delayed {priority.lower()}-priority {operation} by {waited:.1f}s"
+            )
+
+    def acquire(self, weight: int, priority: str = PRIORITY_HIGH, operation: str = '') -> float:
+        """
+        Block until `weight` tokens can be taken for a request.
+
+        Args:
+            weight: Request weight
+            priority: PRIORITY_HIGH or PRIORITY_LOW
+            operation: Description used in log messages
+
+        Returns:
+            Seconds spent waiting
+        """
+        floor = self.reserve if priority == PRIORITY_LOW else 0.0
+        waited = 0.0
+        while (delay := self._try_take(weight=weight, floor=floor, waited=waited)) > 0:
+            time.sleep(delay)
+            waited += delay
+        self._log_wait(waited=waited, priority=priority, operation=operation)
+        return waited
+
+    async def acquire_async(self, weight: int, priority: str = PRIORITY_HIGH, operation: str = '') -> float:
+        """
+        Asyncio variant of `acquire`; yields to the event loop while waiting.
+
+        Args:
+            weight: Request weight
+            priority: PRIORITY_HIGH or PRIORITY_LOW
+            operation: Description used in log messages
+
+        Returns:
+            Seconds spent waiting
+        """
+        floor = self.reserve if priority == PRIORITY_LOW else 0.0
+        waited = 0.0
+        while (delay := self._try_take(weight=weight, floor=floor, waited=waited)) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        self._log_wait(waited=waited, priority=priority, operation=operation)
+        return waited
+
+    def update_from_headers(self, headers: Mapping[str, str], status_code: int) -> None:
+        """
+        Re-sync the bucket from Binance rate limit headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            status_code: HTTP status code
+        """
+        used_weight = headers.get("X-MBX-USED-WEIGHT-1M")
+        is_limited = status_code in (418, 429)
+        backoff = 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            if used_weight is not None:
+                self._used_weight_1m = int(used_weight)
+                self._tokens = float(max(0, self.capacity - self._used_weight_1m))
+
+            if is_limited:
+                retry_after = headers.get("Retry-After")
+                backoff = float(retry_after) if retry_after else RATE_LIMIT_DEFAULT_BACKOFF_SECONDS
+                self._blocked_until = max(self._blocked_until, time.monotonic() + backoff)
+                self._tokens = 0.0
+
+        if is_limited:
+            self.logger.error(
+                message=f"🚨 Binance returned {status_code}, pausing requests for {backoff:.0f}s"
+            )
+
+    def update_from_response(self, response: requests.Response) -> None:
+        """
+        Re-sync the bucket from a `requests` response.
+
+        Args:
+            response: HTTP response from Binance
+        """
+        self.update_from_headers(headers=response.headers, status_code=response.status_code)
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get limiter state for monitoring.
+
+        Returns:
+            Dictionary with tokens left, server weight, pause and wait statistics
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'tokens': round(self._tokens, 1),
+                'capacity': self.capacity,
+                'low_priority_reserve': self.reserve,
+                'used_weight_1m': self._used_weight_1m,
+                'blocked_for_seconds': round(max(0.0, self._blocked_until - now), 1),
+                'requests': self._requests,
+                'delayed_requests': self._delayed_requests,
+                'total_wait_seconds': round(self._total_wait_seconds, 2),
+                'last_wait_seconds': round(self._last_wait_seconds, 2)
+            }
+
+
+class BinanceRateLimitAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that charges the shared limiter before every request and
+    re-syncs it from every response, so all calls made through a session are
+    throttled without touching each call site.
+    """
+
+    def __init__(self, rate_limiter: BinanceRateLimiter, *args: Any, **kwargs: Any) -> None:
+        self.rate_limiter = rate_limiter
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        weight, priority = get_endpoint_weight(method=request.method or 'GET', url=request.url or '')
+        self.rate_limiter.acquire(
+            weight=weight,
+            priority=priority,
+            operation=urllib.parse.urlsplit(request.url or '').path
+        )
+        response = super().send(request, *args, **kwargs)
+        self.rate_limiter.update_from_response(response)
+        return response
+
+# EOF
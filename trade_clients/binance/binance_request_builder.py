@@ -0,0 +1,376 @@
+"""
+Binance Request Builder
+Single request path for Binance Futures REST calls.
+
+- Signs with a pre-keyed HMAC-SHA256 copied per request instead of
+  re-deriving the key from the secret every call
+- URL-encodes parameters once; the signed query string is sent as-is
+- Stamps signed requests with a server-synced timestamp and `recvWindow`,
+  so local clock drift does not cause -1021 rejections
+- Owns the shared send / rate-limit / error-logging logic every client
+  method used to duplicate; responses are decoded with orjson when installed
+"""
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+
+from commons.custom_logger import CustomLogger
+from trade_clients.binance.binance_auth import BinanceCredentials
+from trade_clients.binance.binance_kline_decoder import loads
+from trade_clients.binance.binance_rate_limiter import BinanceRateLimiter
+
+# Override to point at a testnet or local mock exchange
+FAPI_BASE_URL = os.getenv('BINANCE_FAPI_BASE_URL', 'https://fapi.binance.com').rstrip('/')
+GET_SERVER_TIME_URL = f'{FAPI_BASE_URL}/fapi/v1/time'
+
+# Validity window of signed requests (milliseconds, Binance default is 5000)
+RECV_WINDOW_MS = 5000
+
+# Server time offset refresh interval (seconds)
+SERVER_TIME_SYNC_SECONDS = 300
+
+# Timeout of the server time request (seconds)
+SERVER_TIME_REQUEST_TIMEOUT_SECONDS = 5
+
+# Binance error code for a timestamp outside recvWindow
+TIMESTAMP_ERROR_CODE = -1021
+
+# Binance error code for a backend timeout: the request may or may not have been executed
+UNKNOWN_EXECUTION_ERROR_CODE = -1007
+
+# Called with every HTTP response before it is decoded (e.g. rate limit logging)
+ResponseHook = Callable[[requests.Response], None]
+
+
+class BinanceServerTime:
+    """
+    Process-wide offset between the local clock and Binance server time.
+
+    Synced once on first use, then refreshed every SERVER_TIME_SYNC_SECONDS
+    by a daemon thread; `timestamp()` itself never blocks on the network.
+    """
+
+    _instance: Optional['BinanceServerTime'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, sync_interval: float = SERVER_TIME_SYNC_SECONDS, logger: Optional[CustomLogger] = None) -> None:
+        """
+        Initialize server time tracker.
+
+        Args:
+            sync_interval: Seconds between offset refreshes
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.sync_interval = sync_interval
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._offset_ms: int = 0
+        self._synced_at: float = 0.0
+        self._sync_lock = threading.Lock()
+        self._sync_requested = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_instance(cls) -> 'BinanceServerTime':
+        """Get the process-wide tracker, syncing and starting its refresh thread on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+            return cls._instance
+
+    @property
+    def offset_ms(self) -> int:
+        return self._offset_ms
+
+    def start(self) -> None:
+        """Sync now and start the periodic refresh thread."""
+        self.sync()
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._sync_requested.wait(timeout=self.sync_interval)
+            self._sync_requested.clear()
+            self.sync()
+
+    def request_sync(self) -> None:
+        """Ask the refresh thread to resync without blocking the caller."""
+        self._sync_requested.set()
+
+    def sync(self) -> bool:
+        """
+        Measure the offset against /fapi/v1/time.
+
+        The server time is compared with the midpoint of the round trip.
+        On failure the previous offset is kept.
+
+        Returns:
+            True if the offset was updated
+        """
+        with self._sync_lock:
+            try:
+                sent_at = time.time()
+                response = requests.get(url=GET_SERVER_TIME_URL, timeout=SERVER_TIME_REQUEST_TIMEOUT_SECONDS)
+                received_at = time.time()
+                BinanceRateLimiter.get_instance().update_from_response(response)
+                response.raise_for_status()
+                server_time_ms = int(response.json()['serverTime'])
+            except Exception as e:
+                self.logger.warning(message=f"Server time sync failed, keeping offset {self._offset_ms}ms: {e}")
+                return False
+
+            previous_offset = self._offset_ms
+            self._offset_ms = server_time_ms - int((sent_at + received_at) / 2 * 1000)
+            self._synced_at = received_at
+            if abs(self._offset_ms - previous_offset) >= 100:
+                self.logger.info(message=f"Server time offset: {self._offset_ms}ms (round trip {(received_at - sent_at) * 1000:.0f}ms)")
+            return True
+
+    def timestamp(self) -> int:
+        """Get the current Binance server timestamp in milliseconds."""
+        return int(time.time() * 1000) + self._offset_ms
+
+
+class BinanceRequestSigner:
+    """HMAC-SHA256 signer keyed once per credential pair."""
+
+    def __init__(self, credentials: BinanceCredentials) -> None:
+        self._hmac = hmac.new(credentials.binance_secret_key.encode(), digestmod=hashlib.sha256)
+        self.headers = {"X-MBX-APIKEY": credentials.binance_api_key}
+
+    def sign(self, query_string: str) -> str:
+        """
+        Sign an encoded query string.
+
+        Args:
+            query_string: URL-encoded request parameters
+
+        Returns:
+            Hex signature
+        """
+        mac = self._hmac.copy()
+        mac.update(query_string.encode())
+        return mac.hexdigest()
+
+
+def is_timestamp_error(status_code: int, body: str) -> bool:
+    """Check whether a response is a -1021 timestamp rejection."""
+    if status_code != 400:
+        return False
+    try:
+        return json.loads(body).get('code') == TIMESTAMP_ERROR_CODE
+    except (ValueError, AttributeError):
+        return False
+
+
+class BinanceRequestBuilder:
+    """
+    Builds and sends Binance REST requests for one client.
+
+    Signed requests get `timestamp` (server-synced) and `recvWindow` added to a
+    copy of the caller's params; the caller's dict is never modified.
+    """
+
+    def __init__(
+        self,
+        credentials: Optional[BinanceCredentials] = None,
+        recv_window: int = RECV_WINDOW_MS,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize request builder.
+
+        Args:
+            credentials: API credentials; required for signed requests only
+            recv_window: recvWindow sent with signed requests (milliseconds)
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.recv_window = recv_window
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._signer: Optional[BinanceRequestSigner] = None
+        self._server_time: Optional[BinanceServerTime] = None
+        self._local = threading.local()  # last error per calling thread
+        if credentials is not None:
+            self.set_credentials(credentials=credentials)
+
+    def set_credentials(self, credentials: BinanceCredentials) -> None:
+        """Key the signer with loaded credentials."""
+        self._signer = BinanceRequestSigner(credentials=credentials)
+
+    @property
+    def server_time(self) -> BinanceServerTime:
+        # Resolved lazily so unsigned-only clients (backtest) never sync
+        if self._server_time is None:
+            self._server_time = BinanceServerTime.get_instance()
+        return self._server_time
+
+    def timestamp(self) -> int:
+        """Get the current Binance server timestamp in milliseconds."""
+        return self.server_time.timestamp()
+
+    @property
+    def last_error(self) -> Dict[str, Any]:
+        """Binance error body ({'code', 'msg'}) of this thread's last failed request, {} if it succeeded."""
+        return getattr(self._local, 'error', {})
+
+    def _set_last_error(self, response: Optional[requests.Response]) -> None:
+        error: Dict[str, Any] = {}
+        if response is not None:
+            try:
+                body = loads(response.content)
+                if isinstance(body, dict) and 'code' in body:
+                    error = body
+            except Exception:
+                pass
+        self._local.error = error
+
+    @property
+    def outcome_unknown(self) -> bool:
+        """
+        Whether this thread's last failed request may still have been executed
+        (no response, 5xx or -1007), as opposed to a definite rejection.
+        """
+        return getattr(self._local, 'outcome_unknown', False)
+
+    def build(self, params: Dict[str, Any], signed: bool = True) -> Tuple[Dict[str, str], str]:
+        """
+        Encode (and sign) request parameters.
+
+        Args:
+            params: Request parameters
+            signed: Whether to add timestamp, recvWindow and signature
+
+        Returns:
+            Tuple of (headers, encoded query string)
+
+        Raises:
+            RuntimeError: If a signed request is built before credentials are set
+        """
+        if not signed:
+            return {}, urllib.parse.urlencode(params)
+
+        if self._signer is None:
+            raise RuntimeError("Binance credentials not loaded; call init() first")
+
+        query_string = urllib.parse.urlencode({
+            **params,
+            'timestamp': self.timestamp(),
+            'recvWindow': self.recv_window
+        })
+        return self._signer.headers, f"{query_string}&signature={self._signer.sign(query_string)}"
+
+    def build_url(self, url: str, params: Dict[str, Any], signed: bool = True) -> Tuple[Dict[str, str], str]:
+        """
+        Build the full request URL.
+
+        Returns:
+            Tuple of (headers, URL with encoded query string)
+        """
+        headers, query_string = self.build(params=params, signed=signed)
+        return headers, f"{url}?{query_string}" if query_string else url
+
+    def send(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        params: Dict[str, Any],
+        operation: str,
+        signed: bool = True,
+        response_hook: Optional[ResponseHook] = None
+    ) -> Optional[Any]:
+        """
+        Send a request and decode its JSON response.
+
+        A -1021 rejection resyncs the server time offset and is retried once.
+
+        Args:
+            session: Session to send through (rate limiting is done by its adapter)
+            method: HTTP method
+            url: API endpoint URL
+            params: Request parameters
+            operation: Description of operation for logging
+            signed: Whether the endpoint requires a signature
+            response_hook: Optional callback run on every response
+
+        Returns:
+            Decoded JSON response, or None on error (details in `last_error` and `outcome_unknown`)
+        """
+        response = None
+        self._local.error = {}
+        self._local.outcome_unknown = False
+        try:
+            for attempt in range(2):
+                headers, request_url = self.build_url(url=url, params=params, signed=signed)
+                response = session.request(method=method, url=request_url, headers=headers)
+                if response_hook is not None:
+                    response_hook(response)
+
+                if signed and attempt == 0 and is_timestamp_error(response.status_code, response.text):
+                    self.logger.warning(message=f"Timestamp rejected during {operation}, resyncing server time")
+                    self.server_time.sync()
+                    continue
+                break
+
+            response.raise_for_status()  # type: ignore[union-attr]
+            return loads(response.content)  # type: ignore[union-attr]
+
+        except requests.exceptions.HTTPError as e:
+            self._set_last_error(response)
+            self._local.outcome_unknown = (
+                response.status_code >= 500  # type: ignore[union-attr]
+                or self.last_error.get('code') == UNKNOWN_EXECUTION_ERROR_CODE
+            )
+            self.logger.error_e(message=f"HTTP error during {operation}", e=e)
+            self.logger.error(message=f"Response: {response.text}")  # type: ignore[union-attr]
+            return None
+        except requests.exceptions.RequestException as e:
+            self._local.outcome_unknown = True
+            self.logger.error_e(message=f"Network error during {operation}", e=e)
+            return None
+        except Exception as e:
+            self.logger.error_e(message=f"Unexpected error during {operation}", e=e)
+            return None
+
+
+def _benchmark_signing(iterations: int = 100_000) -> None:
+    """Compare per-request signing cost of binance_auth.sign_request and BinanceRequestBuilder."""
+    import trade_clients.binance.binance_auth as binance_auth
+
+    credentials = BinanceCredentials(binance_api_key='k' * 64, binance_secret_key='s' * 64)
+    params = {
+        'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT', 'quantity': 0.001,
+        'price': 65000.1, 'timeInForce': 'GTC', 'reduceOnly': False
+    }
+
+    def legacy() -> str:
+        # sign_request signs, then requests encodes the params a second time
+        _, signed_params = binance_auth.sign_request(
+            params={**params, 'timestamp': int(time.time() * 1000)},
+            binance_credential=credentials
+        )
+        return urllib.parse.urlencode(signed_params)
+
+    builder = BinanceRequestBuilder(credentials=credentials)
+    builder._server_time = BinanceServerTime()  # no network sync for the benchmark
+
+    for name, function in (("binance_auth.sign_request", legacy), ("BinanceRequestBuilder.build", lambda: builder.build(params)[1])):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        elapsed = time.perf_counter() - started
+        print(f"{name:<30}{elapsed / iterations * 1e6:>8.2f} us/request")
+
+
+if __name__ == "__main__":
+    _benchmark_signing()
+
+# EOF
@@ -0,0 +1,370 @@
+"""
+Binance User Data Stream
+Process-wide futures user-data stream (listenKey) that tracks order, algo order
+and position updates pushed by the exchange.
+
+Events handled:
+- ORDER_TRADE_UPDATE: regular order status/fill updates (incl. liquidation orders)
+- ALGO_UPDATE: conditional (TP/SL) algo order status updates
+- ACCOUNT_UPDATE: position amount changes
+- listenKeyExpired: listenKey is recreated and the connection reopened
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from commons.custom_logger import CustomLogger
+from trade_clients.binance.binance_request_builder import FAPI_BASE_URL
+from trade_clients.binance.binance_websocket import (
+    BinanceWebSocketConnection,
+    FUTURES_STREAM_BASE_URL
+)
+
+LISTEN_KEY_URL = f'{FAPI_BASE_URL}/fapi/v1/listenKey'
+
+# Binance expires a listenKey 60 minutes after the last keepalive
+LISTEN_KEY_KEEPALIVE_SECONDS = 30 * 60
+
+# Order states after which no further updates are expected
+TERMINAL_ORDER_STATUSES = {'FILLED', 'CANCELED', 'EXPIRED', 'REJECTED', 'EXPIRED_IN_MATCH'}
+TERMINAL_ALGO_ORDER_STATUSES = {'FINISHED', 'CANCELED', 'EXPIRED', 'REJECTED'}
+
+# Seconds a finished (algo) order stays mirrored so its owner can read the outcome without REST
+TERMINAL_ORDER_RETENTION_SECONDS = 10 * 60
+
+# Listener: (event_type, symbol) -> None
+EventListener = Callable[[str, str], None]
+
+
+class BinanceUserDataStream:
+    """
+    Keeps a listenKey alive and mirrors order state pushed over the user-data stream.
+
+    One instance per API key is shared by every client in the process.
+    Order records are stored in the same shape `fetch_order` /
+    `fetch_algorithmic_order` return from REST, so callers can use either.
+    Records of finished orders are dropped TERMINAL_ORDER_RETENTION_SECONDS
+    after their final update; reads then fall back to REST.
+    """
+
+    _instances: Dict[str, 'BinanceUserDataStream'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = FUTURES_STREAM_BASE_URL,
+        listen_key_url: str = LISTEN_KEY_URL,
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize user data stream (not started).
+
+        Args:
+            api_key: Binance API key (listenKey endpoints need no signature)
+            base_url: Websocket base URL
+            listen_key_url: REST endpoint for listenKey create/keepalive
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+        self._api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.listen_key_url = listen_key_url
+        self.session = requests.Session()
+
+        self._listen_key: str = ''
+        self._connection: Optional[BinanceWebSocketConnection] = None
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stream_lock = threading.Lock()  # listenKeyExpired and keepalive may both recreate the stream
+
+        # Order state mirrors, keyed by str(orderId) / str(algoId)
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._algo_orders: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._finished_at: Dict[str, float] = {}  # version key -> time of the terminal update, oldest first
+        self._positions: Dict[str, Dict[str, Any]] = {}
+        self._condition = threading.Condition()
+
+        self._listeners: Dict[str, List[EventListener]] = {}
+        self._listeners_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, api_key: str) -> 'BinanceUserDataStream':
+        """Get (and start) the shared stream for an API key."""
+        with cls._instances_lock:
+            instance = cls._instances.get(api_key)
+            if instance is None:
+                instance = cls(api_key=api_key)
+                instance.start()
+                cls._instances[api_key] = instance
+            return instance
+
+    # ========== Lifecycle ==========
+
+    def start(self) -> None:
+        """Create listenKey, open the stream and start keepalive."""
+        self._stop_event.clear()
+        self._open_stream()
+        if not self._keepalive_thread or not self._keepalive_thread.is_alive():
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop,
+                name='listenkey-keepalive',
+                daemon=True
+            )
+            self._keepalive_thread.start()
+
+    def stop(self) -> None:
+        """Close the stream and stop keepalive."""
+        self._stop_event.set()
+        if self._connection:
+            self._connection.stop()
+        self._connection = None
+
+    @property
+    def is_healthy(self) -> bool:
+        """True when the stream is connected and state can be served from memory."""
+        return bool(self._listen_key) and self._connection is not None and self._connection.is_connected
+
+    def _listen_key_request(self, method: str) -> Optional[Dict[str, Any]]:
+        """Call the listenKey endpoint (POST create, PUT keepalive). Returns None on failure."""
+        try:
+            response = self.session.request(
+                method=method,
+                url=self.listen_key_url,
+                headers={'X-MBX-APIKEY': self._api_key},
+                timeout=10
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            self.logger.error_e(message=f"listenKey {method} failed", e=e)
+            return None
+
+    def _open_stream(self, stale_listen_key: Optional[str] = None) -> None:
+        """
+        Create a listenKey and (re)open the websocket on it.
+
+        Args:
+            stale_listen_key: listenKey being replaced; nothing is done if another
+                thread already replaced it
+        """
+        with self._stream_lock:
+            if stale_listen_key is not None and self._listen_key != stale_listen_key:
+                return
+            result = self._listen_key_request('POST')
+            listen_key = result.get('listenKey', '') if result else ''
+            if not listen_key:
+                self.logger.error(message="Could not create listenKey; order updates fall back to REST")
+                return
+
+            if self._connection:
+                self._connection.stop()
+            self._listen_key = listen_key
+            self._connection = BinanceWebSocketConnection(
+                url=f"{self.base_url}/{listen_key}",
+                on_message=self._handle_message,
+                on_open=self._handle_open,
+                name='user-data',
+                logger=self.logger
+            )
+            self._connection.start()
+        self.logger.info(message="User data stream started")
+
+    def _keepalive_loop(self) -> None:
+        """Extend the listenKey periodically; recreate it if keepalive fails."""
+        while not self._stop_event.wait(timeout=LISTEN_KEY_KEEPALIVE_SECONDS):
+            listen_key = self._listen_key
+            if not listen_key or self._listen_key_request('PUT') is None:
+                self.logger.warning(message="listenKey keepalive failed, recreating stream")
+                self._reset_state()
+                self._open_stream(stale_listen_key=listen_key)
+            else:
+                self.logger.debug(message="listenKey keepalive sent")
+
+    def _reset_state(self) -> None:
+        """Drop mirrored state; updates may have been missed, so REST is authoritative again."""
+        with self._condition:
+            self._orders.clear()
+            self._algo_orders.clear()
+            self._finished_at.clear()
+            self._positions.clear()
+            self._condition.notify_all()
+
+    # ========== Event handling ==========
+
+    def _handle_open(self) -> None:
+        # Anything that happened while disconnected is unknown
+        self._reset_state()
+
+    def _handle_message(self, data: Dict[str, Any]) -> None:
+        event_type = data.get('e', '')
+        if event_type == 'ORDER_TRADE_UPDATE':
+            self._handle_order_update(data.get('o', {}))
+        elif event_type == 'ALGO_UPDATE':
+            self._handle_algo_update(data.get('o', {}))
+        elif event_type == 'ACCOUNT_UPDATE':
+            self._handle_account_update(data.get('a', {}))
+        elif event_type == 'listenKeyExpired':
+            self.logger.warning(message="listenKey expired, recreating stream")
+            listen_key = self._listen_key
+            self._reset_state()
+            self._open_stream(stale_listen_key=listen_key)
+
+    def _handle_order_update(self, o: Dict[str, Any]) -> None:
+        order_id = str(o.get('i', ''))
+        symbol = o.get('s', '')
+        if not order_id:
+            return
+        record = {
+            'orderId': o.get('i'),
+            'symbol': symbol,
+            'clientOrderId': o.get('c', ''),
+            'side': o.get('S', ''),
+            'type': o.get('o', ''),
+            'status': o.get('X', ''),
+            'price': o.get('p', '0'),
+            'avgPrice': o.get('ap', '0'),
+            'origQty': o.get('q', '0'),
+            'executedQty': o.get('z', '0'),
+            'updateTime': o.get('T', 0)
+        }
+        with self._condition:
+            self._orders[order_id] = record
+            self._versions[order_id] = self._versions.get(order_id, 0) + 1
+            self._track_finished(key=order_id, terminal=record['status'] in TERMINAL_ORDER_STATUSES)
+            self._condition.notify_all()
+
+        if record['type'] == 'LIQUIDATION' or record['clientOrderId'].startswith('autoclose-'):
+            self.logger.warning(message=f"Liquidation order update for {symbol}: {record['status']}")
+        self._notify(event_type='ORDER_TRADE_UPDATE', symbol=symbol)
+
+    def _handle_algo_update(self, o: Dict[str, Any]) -> None:
+        algo_id = str(o.get('aid', ''))
+        symbol = o.get('s', '')
+        if not algo_id:
+            return
+        record = {
+            'algoId': o.get('aid'),
+            'symbol': symbol,
+            'clientAlgoId': o.get('caid', ''),
+            'side': o.get('S', ''),
+            'orderType': o.get('o', ''),
+            'algoStatus': o.get('X', ''),
+            'actualOrderId': o.get('ai', ''),
+            'triggerPrice': o.get('tp', '0')
+        }
+        with self._condition:
+            self._algo_orders[algo_id] = record
+            self._versions[f"algo:{algo_id}"] = self._versions.get(f"algo:{algo_id}", 0) + 1
+            self._track_finished(key=f"algo:{algo_id}", terminal=record['algoStatus'] in TERMINAL_ALGO_ORDER_STATUSES)
+            self._condition.notify_all()
+        self._notify(event_type='ALGO_UPDATE', symbol=symbol)
+
+    def _track_finished(self, key: str, terminal: bool) -> None:
+        """Note a terminal update and drop orders finished longer than the retention ago (under `_condition`)."""
+        now = time.time()
+        self._finished_at.pop(key, None)
+        if terminal:
+            self._finished_at[key] = now
+        cutoff = now - TERMINAL_ORDER_RETENTION_SECONDS
+        while self._finished_at:
+            oldest, finished_at = next(iter(self._finished_at.items()))
+            if finished_at > cutoff:
+                break
+            del self._finished_at[oldest]
+            self._versions.pop(oldest, None)
+            if oldest.startswith('algo:'):
+                self._algo_orders.pop(oldest[len('algo:'):], None)
+            else:
+                self._orders.pop(oldest, None)
+
+    def _handle_account_update(self, a: Dict[str, Any]) -> None:
+        symbols = []
+        with self._condition:
+            for p in a.get('P', []):
+                symbol = p.get('s', '')
+                self._positions[symbol] = {
+                    'symbol': symbol,
+                    'positionAmt': p.get('pa', '0'),
+                    'entryPrice': p.get('ep', '0'),
+                    'unRealizedProfit': p.get('up', '0')
+                }
+                symbols.append(symbol)
+            self._condition.notify_all()
+        for symbol in symbols:
+            self._notify(event_type='ACCOUNT_UPDATE', symbol=symbol)
+
+    # ========== Listeners ==========
+
+    def add_listener(self, symbol: str, listener: EventListener) -> None:
+        """
+        Register a callback for events on a symbol.
+
+        Args:
+            symbol: Trading pair symbol
+            listener: Callable receiving (event_type, symbol)
+        """
+        with self._listeners_lock:
+            self._listeners.setdefault(symbol, []).append(listener)
+
+    def _notify(self, event_type: str, symbol: str) -> None:
+        with self._listeners_lock:
+            listeners = list(self._listeners.get(symbol, []))
+        for listener in listeners:
+            try:
+                listener(event_type, symbol)
+            except Exception as e:
+                self.logger.error_e(message=f"User data listener failed for {symbol}", e=e)
+
+    # ========== State access ==========
+
+    def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Get mirrored order state, or None if no update was seen."""
+        with self._condition:
+            record = self._orders.get(str(order_id))
+            return dict(record) if record else None
+
+    def get_algo_order(self, algo_id: str) -> Optional[Dict[str, Any]]:
+        """Get mirrored algo order state, or None if no update was seen."""
+        with self._condition:
+            record = self._algo_orders.get(str(algo_id))
+            return dict(record) if record else None
+
+    def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get the last pushed position for a symbol, or None if no update was seen."""
+        with self._condition:
+            record = self._positions.get(symbol)
+            return dict(record) if record else None
+
+    def wait_for_order_change(self, order_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Block until an order gets a new update, or timeout.
+
+        Returns immediately if the order is already in a terminal state.
+
+        Args:
+            order_id: Order ID
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Latest mirrored order state, or None if never seen
+        """
+        key = str(order_id)
+        deadline = time.time() + timeout
+        with self._condition:
+            record = self._orders.get(key)
+            if record and record['status'] in TERMINAL_ORDER_STATUSES:
+                return dict(record)
+            start_version = self._versions.get(key, 0)
+            while self._versions.get(key, 0) == start_version:
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self.is_healthy:
+                    break
+                self._condition.wait(timeout=remaining)
+            record = self._orders.get(key)
+            return dict(record) if record else None
+
+# EOF
@@ -0,0 +1,161 @@
+"""
+Binance WebSocket Connection
+Reconnecting websocket wrapper shared by all Binance stream consumers.
+"""
+import json
+import threading
+import time
+from typing import Callable, Optional, Dict, Any
+
+import websocket
+
+from commons.custom_logger import CustomLogger
+
+FUTURES_STREAM_BASE_URL = 'wss://fstream.binance.com/ws'
+
+# Reconnect backoff (seconds)
+WS_RECONNECT_MIN_DELAY = 1
+WS_RECONNECT_MAX_DELAY = 30
+
+# Keep-alive ping interval (seconds); Binance pings every 3 minutes server side
+WS_PING_INTERVAL = 60
+WS_PING_TIMEOUT = 10
+
+
+class BinanceWebSocketConnection:
+    """
+    Runs a single websocket connection in a daemon thread.
+
+    - Decodes every text frame as JSON and hands it to `on_message`
+    - Calls `on_open` after every (re)connect so consumers can resync
+    - Reconnects with exponential backoff until `stop()` is called
+    """
+
+    def __init__(
+        self,
+        url: str,
+        on_message: Callable[[Dict[str, Any]], None],
+        on_open: Optional[Callable[[], None]] = None,
+        name: str = '',
+        logger: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Initialize websocket connection (not started).
+
+        Args:
+            url: Full websocket URL (e.g., 'wss://fstream.binance.com/ws/btcusdt@kline_1h')
+            on_message: Callback receiving each decoded JSON message
+            on_open: Optional callback invoked after each successful connect
+            name: Name used for the thread and log messages
+            logger: Optional logger. If None, creates own logger.
+        """
+        self.url = url
+        self.name = name if name else url.rsplit('/', 1)[-1]
+        self._on_message = on_message
+        self._on_open = on_open
+        self.logger = logger if logger else CustomLogger(name=self.__class__.__name__)
+
+        self._ws: Optional[websocket.WebSocketApp] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._connected = threading.Event()
+        self.last_message_time: float = 0.0
+
+    @property
+    def is_connected(self) -> bool:
+        """Check whether the websocket is currently connected."""
+        return self._connected.is_set()
+
+    def start(self) -> None:
+        """Start the connection thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"ws-{self.name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the connection and do not reconnect."""
+        self._stop_event.set()
+        if self._ws:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+
+    def wait_connected(self, timeout: float) -> bool:
+        """
+        Block until connected or timeout.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if connected, False on timeout
+        """
+        return self._connected.wait(timeout=timeout)
+
+    def _run(self) -> None:
+        """Connection loop with exponential backoff reconnect."""
+        delay = WS_RECONNECT_MIN_DELAY
+        while not self._stop_event.is_set():
+            connected_at = time.time()
+            self._ws = websocket.WebSocketApp(
+                self.url,
+                on_open=self._handle_open,
+                on_message=self._handle_message,
+                on_error=self._handle_error,
+                on_close=self._handle_close
+            )
+            try:
+                self._ws.run_forever(ping_interval=WS_PING_INTERVAL, ping_timeout=WS_PING_TIMEOUT)
+            except Exception as e:
+                self.logger.error_e(message=f"[WS {self.name}] run_forever crashed", e=e)
+            self._connected.clear()
+
+            if self._stop_event.is_set():
+                break
+
+            # Reset backoff when the connection lived long enough
+            if time.time() - connected_at > WS_RECONNECT_MAX_DELAY:
+                delay = WS_RECONNECT_MIN_DELAY
+            self.logger.warning(message=f"[WS {self.name}] disconnected, reconnecting in {delay}s")
+            self._stop_event.wait(timeout=delay)
+            delay = min(delay * 2, WS_RECONNECT_MAX_DELAY)
+
+    def _handle_open(self, ws) -> None:
+        self.last_message_time = time.time()
+        self.logger.debug(message=f"[WS {self.name}] connected")
+        # Run the resync callback before releasing `wait_connected` callers,
+        # so it cannot undo work they do right after connecting
+        if self._on_open:
+            try:
+                self._on_open()
+            except Exception as e:
+                self.logger.error_e(message=f"[WS {self.name}] on_open callback failed", e=e)
+        self._connected.set()
+
+    def _handle_message(self, ws, message: str) -> None:
+        self.last_message_time = time.time()
+        try:
+            data = json.loads(message)
+        except ValueError as e:
+            self.logger.warning_e(message=f"[WS {self.name}] invalid JSON message", e=e)
+            return
+        try:
+            self._on_message(data)
+        except Exception as e:
+            self.logger.error_e(message=f"[WS {self.name}] on_message callback failed", e=e)
+
+    def _handle_error(self, ws, error: Exception) -> None:
+        self.logger.warning(message=f"[WS {self.name}] error: {error}")
+
+    def _handle_close(self, ws, close_status_code, close_msg) -> None:
+        self._connected.clear()
+        self.logger.debug(message=f"[WS {self.name}] closed ({close_status_code}: {close_msg})")
+
+# EOF
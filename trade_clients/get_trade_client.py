@@ -24,8 +24,23 @@ TRADE_CLIENT_REGISTRY: Dict[Tuple[TradeClient, RunMode], Tuple[str, str, bool]]
     ),
 }
 
+# Native asyncio clients used in async run mode. Combinations not listed fall back
+# to TRADE_CLIENT_REGISTRY, whose clients run their blocking calls in an executor.
+ASYNC_TRADE_CLIENT_REGISTRY: Dict[Tuple[TradeClient, RunMode], Tuple[str, str, bool]] = {
+    (TradeClient.BINANCE, RunMode.LIVE): (
+        'trade_clients.binance.binance_async_live_trade_client',
+        'BinanceAsyncLiveTradeClient',
+        True  # Needs init() call
+    ),
+}
+
 
-def get_trade_client(run_mode: RunMode, trade_client: TradeClient, logger: Optional[CustomLogger] = None) -> BaseTradeClient:
+def get_trade_client(
+    run_mode: RunMode,
+    trade_client: TradeClient,
+    logger: Optional[CustomLogger] = None,
+    async_mode: bool = False
+) -> BaseTradeClient:
     """
     Factory function to create trade client instances.
     
@@ -33,6 +48,7 @@ def get_trade_client(run_mode: RunMode, trade_client: TradeClient, logger: Optio
         run_mode: Trading mode (LIVE, BACKTEST, etc.)
         trade_client: Client type (BINANCE, OFFLINE, etc.)
         logger: Optional logger to inherit from bot
+        async_mode: Prefer a native asyncio client when one is registered
         
     Returns:
         Initialized trade client instance
@@ -50,7 +66,10 @@ def get_trade_client(run_mode: RunMode, trade_client: TradeClient, logger: Optio
             f"Available: {', '.join(available)}"
         )
     
-    module_path, class_name, needs_init = TRADE_CLIENT_REGISTRY[registry_key]
+    if async_mode and registry_key in ASYNC_TRADE_CLIENT_REGISTRY:
+        module_path, class_name, needs_init = ASYNC_TRADE_CLIENT_REGISTRY[registry_key]
+    else:
+        module_path, class_name, needs_init = TRADE_CLIENT_REGISTRY[registry_key]
     
     try:
         # Dynamic import